@@ -0,0 +1,352 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+"""
+    Allocation and memory profiling of the cipher() and decipher() calls.
+
+    For each block processed it is measured:
+    - objects: instances built (python level constructors) grouped by the
+      module where their class is defined. An instance is counted once even
+      its __init__ chains the superclasses ones.
+    - peak: the maximum memory traced by tracemalloc during the call (over
+      the memory in use when the call starts).
+    - retained: memory allocated by the package that survives the call,
+      grouped by the source file that allocated it.
+    - gc: collections per generation triggered during the call and the time
+      spent on them (the pauses).
+
+    The averages per block can be saved as a reference and later checked
+    to fail when the allocations regress. By default they are checked
+    against AllocationReference.tsv (the DEFAULT_PARAMS ones), that is
+    updated with --save when an increase is intended.
+"""
+
+from datetime import datetime
+import gc
+from optparse import OptionParser
+import os
+from random import Random
+import sys
+import tracemalloc
+import gRijndael as _gRijndaelPackage
+from gRijndael import gRijndael
+from gRijndael.Logger import levelFromMeaning
+from gRijndaelTest import extractParams
+
+
+DEFAULT_PARAMS = [(10, 4, 4, 8, 4), (12, 4, 4, 8, 6), (14, 4, 4, 8, 8),
+                  (9, 2, 3, 5, 3), (10, 4, 4, 16, 4)]
+# averages of DEFAULT_PARAMS (with the default seed and blocks), checked
+# unless other file or --no-check is given
+DEFAULT_REFERENCE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 'AllocationReference.tsv')
+METRICS = ['objects', 'peak', 'gc0', 'gc1', 'gc2', 'gcTime']
+PACKAGE_FILTER = \
+    tracemalloc.Filter(True, os.path.join(os.path.dirname(
+        _gRijndaelPackage.__file__), '*'))
+
+
+class InstanceCounter(object):
+    '''Context manager that, using a profile hook, counts the instances
+       built grouped by the module of its class. The constructions are the
+       calls to the python level __init__, or to __new__ for the classes
+       that define it (like the field elements, that have no __init__ and
+       count their interned lookups too).
+    '''
+    def __init__(self):
+        super(InstanceCounter, self).__init__()
+        self._counts = {}
+        self._previous = None
+
+    def __enter__(self):
+        self._counts = {}
+        self._previous = sys.getprofile()
+        sys.setprofile(self._hook)
+        return self
+
+    def __exit__(self, *exc):
+        sys.setprofile(self._previous)
+
+    def _hook(self, frame, event, arg):
+        if event != 'call':
+            return
+        name = frame.f_code.co_name
+        if name not in ['__init__', '__new__'] or \
+                frame.f_code.co_argcount == 0:
+            return
+        first = frame.f_locals.get(frame.f_code.co_varnames[0])
+        if first is None:
+            return
+        caller = frame.f_back
+        if caller is not None and caller.f_code.co_name == name and \
+                caller.f_code.co_argcount > 0 and \
+                caller.f_locals.get(caller.f_code.co_varnames[0]) is first:
+            return  # superclass method of an already counted instance
+        if name == '__new__':
+            cls = first
+        else:
+            cls = type(first)
+            if hasNew(cls):
+                return  # already counted in its __new__
+        module = cls.__module__
+        self._counts[module] = self._counts.get(module, 0) + 1
+
+    @property
+    def counts(self):
+        return dict(self._counts)
+
+    @property
+    def total(self):
+        return sum(self._counts.values())
+
+
+def hasNew(cls):
+    '''If the class (or a superclass) defines a python level __new__.'''
+    for klass in cls.__mro__:
+        method = klass.__dict__.get('__new__')
+        if isinstance(method, staticmethod):
+            method = method.__func__
+        if hasattr(method, '__code__'):
+            return True
+    return False
+
+
+class GCMonitor(object):
+    '''Context manager that collects, using gc.callbacks, the number of
+       collections of each generation and the time spent on them.
+    '''
+    def __init__(self):
+        super(GCMonitor, self).__init__()
+        self._collections = [0, 0, 0]
+        self._time = 0.0
+        self._start = None
+
+    def __enter__(self):
+        self._collections = [0, 0, 0]
+        self._time = 0.0
+        gc.callbacks.append(self._callback)
+        return self
+
+    def __exit__(self, *exc):
+        gc.callbacks.remove(self._callback)
+
+    def _callback(self, phase, info):
+        if phase == 'start':
+            self._start = datetime.now()
+        elif phase == 'stop' and self._start is not None:
+            self._collections[info['generation']] += 1
+            self._time += (datetime.now()-self._start).total_seconds()
+            self._start = None
+
+    @property
+    def collections(self):
+        return self._collections[:]
+
+    @property
+    def time(self):
+        return self._time
+
+
+def measure(operation, argin):
+    '''Execute the operation once while collecting its allocations.
+       Output: <dict> with the metrics and the breakdowns by module.
+    '''
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces([PACKAGE_FILTER])
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        with GCMonitor() as gcMonitor:
+            with InstanceCounter() as counter:
+                argout = operation(argin)
+        _, peak = tracemalloc.get_traced_memory()
+        peak -= current
+        after = tracemalloc.take_snapshot().filter_traces([PACKAGE_FILTER])
+    finally:
+        tracemalloc.stop()
+    retained = {}
+    for stat in after.compare_to(before, 'filename'):
+        if stat.size_diff > 0:
+            retained[stat.traceback[0].filename] = stat.size_diff
+    collections = gcMonitor.collections
+    return argout, {'objects': counter.total, 'peak': peak,
+                    'gc0': collections[0], 'gc1': collections[1],
+                    'gc2': collections[2], 'gcTime': gcMonitor.time,
+                    'byModule': counter.counts, 'retained': retained}
+
+
+def profile(params, nBlocks, seed=None, loglevel=None):
+    '''Measure nBlocks cipher and decipher calls for a set of parameters.
+       Output: <dict> operation -> averages per block
+    '''
+    nRounds, nRows, nColumns, wordSize, nKeyColumns = params
+    random = Random(seed)
+    key = random.randint(0, 2**(nRows*nKeyColumns*wordSize)-1)
+    rijndael = gRijndael(key, *params, loglevel=levelFromMeaning(loglevel))
+    report = {}
+    for name in ['cipher', 'decipher']:
+        operation = getattr(rijndael, name)
+        operation(0)  # warm up the lazy parts (like the key expansion)
+        totals = dict((metric, 0) for metric in METRICS)
+        byModule = {}
+        retained = {}
+        for i in range(nBlocks):
+            block = random.randint(0, 2**rijndael.blockSize-1)
+            _, measures = measure(operation, block)
+            for metric in METRICS:
+                totals[metric] += measures[metric]
+            for module, n in measures['byModule'].items():
+                byModule[module] = byModule.get(module, 0) + n
+            for source, size in measures['retained'].items():
+                retained[source] = retained.get(source, 0) + size
+        averages = dict((metric, float(totals[metric])/nBlocks)
+                        for metric in METRICS)
+        averages['byModule'] = dict((module, float(n)/nBlocks)
+                                    for module, n in byModule.items())
+        averages['retained'] = dict((source, float(size)/nBlocks)
+                                    for source, size in retained.items())
+        report[name] = averages
+    return report
+
+
+def paramsStr(params):
+    return ",".join("%d" % each for each in params)
+
+
+def printReport(params, report):
+    print("gRijndael(%s)" % (paramsStr(params)))
+    for operation in ['cipher', 'decipher']:
+        averages = report[operation]
+        print("\t%-8s: %9.1f objects/block, peak %9.1f KiB, "
+              "gc %g/%g/%g collections (%.3f ms)"
+              % (operation, averages['objects'], averages['peak']/1024.,
+                 averages['gc0'], averages['gc1'], averages['gc2'],
+                 averages['gcTime']*1000))
+        modules = sorted(averages['byModule'].items(),
+                         key=lambda item: -item[1])
+        for module, n in modules:
+            print("\t\t%9.1f %s" % (n, module))
+        retained = sorted(averages['retained'].items(),
+                          key=lambda item: -item[1])
+        for source, size in retained[:5]:
+            print("\t\t%9.1f bytes retained by %s" % (size, source))
+
+
+def saveReference(fileName, reports):
+    with open(fileName, 'w') as f:
+        f.write("params\toperation\t%s\n" % ("\t".join(METRICS)))
+        for params, report in reports:
+            for operation in ['cipher', 'decipher']:
+                f.write("%s\t%s\t%s\n"
+                        % (paramsStr(params), operation,
+                           "\t".join("%g" % report[operation][metric]
+                                     for metric in METRICS)))
+
+
+def loadReference(fileName):
+    reference = {}
+    with open(fileName, 'r') as f:
+        header = f.readline().strip().split('\t')
+        for line in f:
+            fields = line.strip().split('\t')
+            if len(fields) != len(header):
+                continue
+            values = dict(zip(header[2:], [float(v) for v in fields[2:]]))
+            reference[(fields[0], fields[1])] = values
+    return reference
+
+
+def checkReference(reference, reports, tolerance):
+    '''Compare the objects and peak memory per block with the reference.
+       Output: <list> of regressions
+    '''
+    regressions = []
+    for params, report in reports:
+        for operation in ['cipher', 'decipher']:
+            key = (paramsStr(params), operation)
+            if key not in reference:
+                continue
+            for metric in ['objects', 'peak']:
+                limit = reference[key][metric]*(1+tolerance)
+                if report[operation][metric] > limit:
+                    regressions.append("gRijndael(%s) %s: %s per block %g > "
+                                       "%g" % (key[0], operation, metric,
+                                               report[operation][metric],
+                                               reference[key][metric]))
+    return regressions
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option('', "--log-level", default="error",
+                      help="Set log level: error, warning, info, debug, trace")
+    parser.add_option('', "--rijndael", type='str', action='append',
+                      help="Comma separated set of Rijndael's generalised"
+                      "parameters (nRounds, nRows, nColumns, wordSize[, "
+                      "nKeyColumns]). Can be used many times.")
+    parser.add_option('', "--blocks", type='int', default=3,
+                      help="Number of blocks to measure per operation.")
+    parser.add_option('', "--seed", type='str', default='gRijndael')
+    parser.add_option('', "--save", type='str',
+                      help="Store the averages as a reference file.")
+    parser.add_option('', "--check", type='str', default=DEFAULT_REFERENCE,
+                      help="Fail if the objects or the peak memory per "
+                      "block exceed the ones in this reference file "
+                      "(default %default).")
+    parser.add_option('', "--no-check", action="store_true", default=False,
+                      help="Don't compare with a reference file.")
+    parser.add_option('', "--tolerance", type='float', default=0.05,
+                      help="Allowed increase over the reference (ratio).")
+    (options, args) = parser.parse_args()
+    if options.rijndael:
+        paramsList = [extractParams(each) for each in options.rijndael]
+    else:
+        paramsList = DEFAULT_PARAMS
+    reports = []
+    for params in paramsList:
+        report = profile(params, options.blocks, options.seed,
+                         options.log_level)
+        printReport(params, report)
+        reports.append((params, report))
+    regressions = []
+    if not options.no_check:
+        if not os.path.exists(options.check):
+            print("No reference file %s (use --save or --no-check)"
+                  % (options.check))
+            sys.exit(-1)
+        regressions = checkReference(loadReference(options.check), reports,
+                                     options.tolerance)
+    if options.save:
+        saveReference(options.save, reports)
+    if len(regressions) > 0:
+        print("\n\tAllocations regression:")
+        for regression in regressions:
+            print("\t\t%s" % regression)
+        sys.exit(-1)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
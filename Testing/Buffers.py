@@ -0,0 +1,122 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+
+"""
+    The bytes (buffer protocol) interface of gRijndael against the integer
+    one: single blocks, many blocks into preallocated buffers of different
+    types and in place.
+"""
+
+import mmap
+from optparse import OptionParser
+from random import Random
+from gRijndael import gRijndael
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# (nRounds, nRows, nColumns, wordSize, nKeyColumns) with byte sized blocks
+DEFAULT_PARAMS = [(10, 4, 4, 8, 4), (14, 4, 4, 8, 8), (10, 2, 4, 4, 2),
+                  (10, 4, 4, 6, 4), (10, 4, 4, 16, 4)]
+
+
+def test_blocks(params, nBlocks, random):
+    nRounds, nRows, nColumns, wordSize, nKeyColumns = params
+    key = random.getrandbits(nRows*nKeyColumns*wordSize)
+    rijndael = gRijndael(key, nRounds, nRows, nColumns, wordSize,
+                         nKeyColumns)
+    blockBytes = rijndael.blockSize//8
+    plains = [random.getrandbits(rijndael.blockSize) for i in range(nBlocks)]
+    ciphers = [rijndael.cipher(plain) for plain in plains]
+    source = b"".join(plain.to_bytes(blockBytes, 'big') for plain in plains)
+    expected = b"".join(cipher.to_bytes(blockBytes, 'big')
+                        for cipher in ciphers)
+    if rijndael.cipherBlock(source[:blockBytes]) != expected[:blockBytes] or \
+            rijndael.decipherBlock(expected[:blockBytes]) != \
+            source[:blockBytes]:
+        print("ALERT: %s single block" % (rijndael))
+        return False
+    destinations = [bytearray(len(source)),
+                    memoryview(bytearray(len(source)+blockBytes))]
+    if numpy is not None:
+        destinations.append(numpy.zeros(len(source), dtype=numpy.uint8))
+    destinations.append(mmap.mmap(-1, len(source)))
+    for destination in destinations:
+        written = rijndael.cipherInto(memoryview(source), destination)
+        if written != len(source) or \
+                bytes(memoryview(destination)[:written]) != expected:
+            print("ALERT: %s cipherInto a %s" % (rijndael, type(destination)))
+            return False
+    inPlace = bytearray(expected)
+    rijndael.decipherInto(inPlace, inPlace)
+    if inPlace != source:
+        print("ALERT: %s decipherInto in place" % (rijndael))
+        return False
+    return True
+
+
+def test_errors():
+    rijndael = gRijndael(0, 11, 4, 5, 3, 3)  # 60 bits block
+    try:
+        rijndael.cipherBlock(bytes(8))
+    except AssertionError:
+        pass
+    else:
+        print("ALERT: %s block isn't a number of bytes" % (rijndael))
+        return False
+    rijndael = gRijndael(0)
+    for source, destination in [(bytes(15), bytearray(16)),
+                                (bytes(32), bytearray(16)),
+                                (bytes(16), bytes(16))]:
+        try:
+            rijndael.cipherInto(source, destination)
+        except AssertionError:
+            pass
+        else:
+            print("ALERT: wrong buffers (%d, %d) not detected"
+                  % (len(source), len(destination)))
+            return False
+    return True
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option('', "--blocks", type='int', default=4)
+    parser.add_option('', "--seed", type='str', default='gRijndael')
+    (options, args) = parser.parse_args()
+    import sys
+    random = Random(options.seed)
+    for params in DEFAULT_PARAMS:
+        if not test_blocks(params, options.blocks, random):
+            sys.exit(-1)
+    if not test_errors():
+        sys.exit(-1)
+    print("The bytes interface matches the integer one.")
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+
+from gRijndael.Polynomials import getBinaryExtensionFieldModulo
+from gRijndael.Polynomials.ConstantsSearch import circulant, isIrreducible
+from gRijndael.Polynomials.ConstantsSearch import isMDS, searchFieldModulo
+from gRijndael.Polynomials.ConstantsSearch import searchConstants
+from gRijndael.Polynomials.ConstantsSearch import searchedTables
+from gRijndael.Polynomials.ConstantsSearch import verifyConstants
+from gRijndael.Polynomials.FieldTables import getFieldOperations
+from gRijndael.Polynomials.FieldTables import getFieldTables
+from itertools import product
+from optparse import OptionParser
+from random import Random
+
+
+def test_irreducibility(maxDegree):
+    '''Both tests agree with the existence of a generator of the field.'''
+    for modulo in range(4, 1 << (maxDegree+1)):
+        expected = getFieldTables(modulo) is not None
+        for method in ['ben-or', 'rabin']:
+            if isIrreducible(modulo, method) != expected:
+                print("ALERT: %s test of %s" % (method, hex(modulo)))
+                return False
+    return True
+
+
+def test_fieldModulo():
+    '''The search reproduces the hard-coded field modulo.'''
+    for wordSize in range(2, 17):
+        if searchFieldModulo(wordSize) != \
+                getBinaryExtensionFieldModulo(wordSize):
+            print("ALERT: field modulo search for w=%d" % (wordSize))
+            return False
+    return True
+
+
+def branchNumber(lanes, fieldModulo):
+    '''Exhaustive min(wt(a)+wt(c*a)) for a != 0.'''
+    multiply, _ = getFieldOperations(fieldModulo)
+    matrix = circulant(lanes)
+    n = len(lanes)
+    branch = 2*n
+    for a in product(range(1 << (fieldModulo.bit_length()-1)), repeat=n):
+        if not any(a):
+            continue
+        b = [0]*n
+        for i in range(n):
+            for j in range(n):
+                b[i] ^= multiply(matrix[i][j], a[j])
+        branch = min(branch, n-a.count(0)+n-b.count(0))
+    return branch
+
+
+def test_mds(samples, random):
+    '''isMDS() is equivalent to a branch number n+1 (exhaustive in small
+       fields) and the Rijndael's c(x) is MDS.
+    '''
+    if not isMDS([0x2, 0x1, 0x1, 0x3], 0x11B):
+        print("ALERT: the Rijndael's c(x) not MDS")
+        return False
+    for wordSize, n in [(2, 3), (3, 3), (3, 4), (4, 3)]:
+        modulo = getBinaryExtensionFieldModulo(wordSize)
+        for i in range(samples):
+            lanes = [random.randint(0, (1 << wordSize)-1) for j in range(n)]
+            if isMDS(lanes, modulo) != \
+                    (branchNumber(lanes, modulo) == n+1):
+                print("ALERT: MDS check of %s in GF(2^%d)" % (lanes, wordSize))
+                return False
+    return True
+
+
+def test_searched():
+    '''The emitted constants satisfy the search criteria.'''
+    failures = verifyConstants(searchedTables(range(2, 17), range(2, 17)))
+    for subject, message in failures:
+        print("ALERT: %s: %s" % (subject, message))
+    return len(failures) == 0
+
+
+def test_cache():
+    '''The cached results are only reused for the same search arguments:
+       other field modulo or number of candidates search again, and the
+       c(x) found shall be valid in its field.
+    '''
+    cache = {}
+    fields = [0x25, 0x3d]  # two irreducible moduli for w=5
+    for fieldModulo, candidates in [(fields[0], 64), (fields[0], 64),
+                                    (fields[1], 64), (fields[1], 32)]:
+        known = {'FieldModulo': {5: fieldModulo}}
+        before = len(cache)
+        tables = searchConstants([5], [3], cache, processors=1,
+                                 candidates=candidates, known=known,
+                                 verbose=False)
+        repeated = (fieldModulo, candidates) == (fields[0], 64) and \
+            before > 0
+        if (len(cache) == before) != repeated:
+            print("ALERT: the cache %s the search with %#x and %d "
+                  "candidates" % ("repeats" if not repeated else "misses",
+                                  fieldModulo, candidates))
+            return False
+        tables['FieldModulo'] = {5: fieldModulo}
+        failures = verifyConstants(tables)
+        for subject, message in failures:
+            print("ALERT: cached %s: %s" % (subject, message))
+        if failures:
+            return False
+    return True
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option('', "--samples", type='int', default=20)
+    parser.add_option('', "--seed", type='str', default='gRijndael')
+    (options, args) = parser.parse_args()
+    import sys
+    random = Random(options.seed)
+    if not test_irreducibility(10) or not test_fieldModulo() or \
+            not test_mds(options.samples, random) or not test_searched() or \
+            not test_cache():
+        sys.exit(-1)
+    print("Constants search checks passed.")
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+
+"""
+    Import (and first use) time of the package in fresh interpreters, like
+    the short lived worker processes pay it. Each stage is measured in a
+    new python process, and the modules that shall stay out of the import
+    path are checked to not be loaded by "import gRijndael".
+"""
+
+from optparse import OptionParser
+import os
+import subprocess
+import sys
+
+
+STAGES = [('import', "import gRijndael"),
+          ('construct', "import gRijndael; gRijndael.gRijndael(0)"),
+          ('cipher', "import gRijndael; gRijndael.gRijndael(0).cipher(0)"),
+          ('decipher', "import gRijndael; "
+                       "gRijndael.gRijndael(0).decipher(0)")]
+# (console interface, tests and the tables pool)
+NOT_IMPORTED = ['optparse', 'random', 'multiprocessing',
+                'gRijndael.__main__', 'gRijndael.Polynomials.ConstantsSearch']
+_TIMER = "import time; t0 = time.perf_counter(); %s; " \
+         "print(time.perf_counter()-t0)"
+
+
+def _environment():
+    environment = dict(os.environ)
+    package = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    paths = [package]+[path for path in
+                       environment.get('PYTHONPATH', '').split(os.pathsep)
+                       if path]
+    environment['PYTHONPATH'] = os.pathsep.join(paths)
+    return environment
+
+
+def measure(statement, repetitions):
+    '''Seconds of the statement in new interpreters (the median of the
+       repetitions).
+    '''
+    samples = []
+    for i in range(repetitions):
+        output = subprocess.check_output([sys.executable, '-c',
+                                          _TIMER % (statement)],
+                                         env=_environment())
+        samples.append(float(output))
+    samples.sort()
+    return samples[len(samples)//2]
+
+
+def test_notImported():
+    '''The modules out of the import path shall not be loaded.'''
+    output = subprocess.check_output(
+        [sys.executable, '-c', "import sys; import gRijndael; "
+         "print(' '.join(sorted(sys.modules.keys())))"], env=_environment())
+    loaded = output.decode().split()
+    found = [module for module in NOT_IMPORTED if module in loaded]
+    if found:
+        print("ALERT: 'import gRijndael' loads %s" % (", ".join(found)))
+        return False
+    return True
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option('', "--repetitions", type='int', default=5,
+                      help="New interpreters per stage (the median is "
+                      "reported).")
+    (options, args) = parser.parse_args()
+    for name, statement in STAGES:
+        print("%-10s %8.3f ms" % (name,
+                                  measure(statement,
+                                          options.repetitions)*1e3))
+    if not test_notImported():
+        sys.exit(-1)
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main()
@@ -23,11 +23,14 @@ __license__ = "GPLv3+"
 __status__ = "development"
 
 
+from datetime import datetime
 from gRijndael import KeyExpansion
+from gRijndael import gRijndael
 from gRijndael.Logger import levelFromMeaning
 from gRijndael.ThirdLevel import Long as _Long
 from gRijndaelTest import extractParams
 from optparse import OptionParser
+from random import Random
 from _FIPS197_AES128 import *
 from _FIPS197_AES192 import *
 from _FIPS197_AES256 import *
@@ -82,6 +85,81 @@ def test_AES(loglevel, rounds, aes, aes_round, Nk):
     return True
 
 
+def test_rekey(loglevel):
+    '''The schedule after changing the key shall be the one of the new key
+       (from a partially expanded schedule of another key).
+    '''
+    keyExpansion = KeyExpansion(aes256['key'], 14, 4, 4, 8, nKeyWords=8,
+                                loglevel=loglevel)
+    keyExpansion.getSubKey(0, 12)
+    keyExpansion.rekey(aes256['key'] >> 128)
+    expected = KeyExpansion(aes256['key'] >> 128, 14, 4, 4, 8, nKeyWords=8,
+                            loglevel=loglevel).getKey()
+    if keyExpansion.getKey() != expected:
+        print("ALERT: the rekeyed schedule doesn't match")
+        return False
+    return True
+
+
+def test_rijndaelRekey(loglevel, samples=3, random=None):
+    '''A rekeyed gRijndael (after deciphering, with d(x) and the inverse
+       SBox built) shall cipher and decipher like a new one.
+    '''
+    random = random or Random('gRijndael')
+    for params in REKEY_PARAMS:
+        nRounds, nRows, nColumns, wordSize, nKeyColumns = params
+        keySize = nRows*nKeyColumns*wordSize
+        rijndael = gRijndael(random.getrandbits(keySize), *params,
+                             loglevel=loglevel)
+        rijndael.decipher(rijndael.cipher(0))
+        for i in range(samples):
+            key = random.getrandbits(keySize)
+            rijndael.rekey(key)
+            reference = gRijndael(key, *params, loglevel=loglevel)
+            block = random.getrandbits(reference.blockSize)
+            cipherText = reference.cipher(block)
+            if rijndael.cipher(block) != cipherText or \
+                    rijndael.decipher(cipherText) != block:
+                print("ALERT: the rekeyed %s doesn't match" % (reference))
+                return False
+    return True
+
+
+def benchmark(nKeys, params, sboxCalc, random):
+    '''Key agility: a block ciphered and deciphered with each new key,
+       building a new instance or changing the key of one. The setup (the
+       constructor or rekey()) is also given alone.
+    '''
+    nRounds, nRows, nColumns, wordSize, nKeyColumns = params
+    keySize = nRows*nKeyColumns*wordSize
+    keys = [random.getrandbits(keySize) for i in range(nKeys)]
+    results = []
+    for rekey in [False, True]:
+        setup = total = 0.0
+        for key in keys:
+            t0 = datetime.now()
+            if rekey:
+                rijndael.rekey(key)
+            else:
+                rijndael = gRijndael(key, *params, sboxCalc=sboxCalc)
+            t1 = datetime.now()
+            rijndael.decipher(rijndael.cipher(0))
+            t2 = datetime.now()
+            setup += (t1-t0).total_seconds()
+            total += (t2-t0).total_seconds()
+        results += [setup*1e3/nKeys, total*1e3/nKeys]
+    print("%s%s:\n\tnew instance %8.3f ms/key (%8.2f with the block)\n"
+          "\trekey        %8.3f ms/key (%8.2f with the block)"
+          % ((rijndael, "" if sboxCalc else " (tables)")+tuple(results)))
+
+
+# (nRounds, nRows, nColumns, wordSize, nKeyColumns)
+REKEY_PARAMS = [(10, 4, 4, 8, 4), (14, 4, 4, 8, 8), (11, 4, 5, 3, 3)]
+BENCHMARK_PARAMS = [((10, 4, 4, 8, 4), True), ((14, 4, 4, 8, 8), True),
+                    ((10, 4, 4, 8, 4), False), ((10, 2, 2, 16, 2), False),
+                    ((10, 2, 2, 32, 2), True)]
+
+
 def expandKey(key, rounds, nRows, nColumns, wordSize, nKeyColumns, loglevel):
     print(loglevel)
     keyExpansion = KeyExpansion(key, rounds, nRows, nColumns, wordSize,
@@ -111,9 +189,17 @@ def main():
     parser.add_option('', "--test", type='str')
     parser.add_option('', "--rounds", type='int', default=0)
     parser.add_option('', "--key", type='int', default=0)
+    parser.add_option('', "--benchmark", type='int', default=0,
+                      help="Keys to measure the key agility (a block "
+                      "ciphered and deciphered with each one).")
     import sys
     (options, args) = parser.parse_args()
     loglevel = levelFromMeaning(options.log_level)
+    if options.benchmark:
+        for params, sboxCalc in BENCHMARK_PARAMS:
+            benchmark(options.benchmark, params, sboxCalc,
+                      Random('gRijndael'))
+        sys.exit(0)
     if options.test:
         if options.test.lower() in ["aes128", "aes192", "aes256"]:
             if options.test.lower() == "aes128":
@@ -144,7 +230,9 @@ def main():
     else:
         for test in [test_AES128,
                      test_AES192,
-                     test_AES256]:
+                     test_AES256,
+                     test_rekey,
+                     test_rijndaelRekey]:
             if not test(levelFromMeaning(options.log_level)):
                 sys.exit(-1)
         sys.exit(0)
@@ -0,0 +1,503 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+"""
+    Known Answer Tests (KAT) for any set of generalised parameters.
+
+    The generator produces, for a (nRounds, nRows, nColumns, wordSize,
+    nKeyColumns) combination, a file with random keys and plaintexts
+    together with the intermediate state after each operation of each round
+    (like the fips-197 appendix does for the AES). The verifier checks a
+    (potentially big) set of those files in parallel and reports each file
+    as soon as it has been processed.
+
+    File format (all integers big endian):
+        header: 'gRKAT' + format version (1 byte) +
+                nRounds, nRows, nColumns, wordSize, nKeyColumns (2 bytes each)
+                + number of vectors (4 bytes)
+        records: one fixed size record per vector, with the key and the
+                 input followed by the round fields described in
+                 roundFields(). The states are stored with ceil(blockSize/8)
+                 bytes, the key with ceil(keySize/8) and the round keys
+                 with the nColumns words packed (see keyWordSize()).
+                 Having fixed size records, the file is indexed: the
+                 vector i is at header + i * recordSize.
+"""
+
+from datetime import datetime
+import multiprocessing
+from optparse import OptionParser
+import os
+from random import Random
+import struct
+import sys
+from traceback import format_exc
+from gRijndael import gRijndael
+from gRijndael.AddRoundKey import AddRoundKey as _AddRoundKey
+from gRijndael.KeyExpansion import KeyExpansion as _KeyExpansion
+from gRijndael.Logger import levelFromMeaning
+from gRijndael.MixColumns import MixColumns as _MixColumns
+from gRijndael.SubBytes import SubBytes as _SubBytes
+from gRijndael.ShiftRows import ShiftRows as _ShiftRows
+from gRijndael.ThirdLevel import Long as _Long
+from gRijndael.ThirdLevel import State as _State
+from gRijndaelTest import extractParams
+
+
+MAGIC = b'gRKAT'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('>5sB5HI')
+EXTENSION = 'kat'
+
+
+def roundFields(nRounds):
+    '''List of (round, field) pairs that are stored, in order, after the key
+       and the input of each vector. The 'start' of each round is not stored
+       because it is the 'end' of the previous one.
+    '''
+    fields = [(0, 'k_sch'), (0, 'end')]
+    for round in range(1, nRounds):
+        for field in ['s_box', 's_row', 'm_col', 'k_sch', 'end']:
+            fields.append((round, field))
+    for field in ['s_box', 's_row', 'k_sch', 'end']:
+        fields.append((nRounds, field))
+    return fields
+
+
+def nBytes(nBits):
+    return (nBits+7)//8
+
+
+def keyWordSize(nRows, wordSize):
+    '''Bits of each word in the key expansion. The round constants are 8
+       bits wide, then with word sizes smaller than 8 they can exceed the
+       nRows*wordSize bits.
+    '''
+    return max(nRows*wordSize, wordSize*(nRows-1)+8)
+
+
+def fieldSizes(params):
+    '''Output: <integer> key bytes, <integer> state bytes,
+               <integer> round key bytes
+    '''
+    nRounds, nRows, nColumns, wordSize, nKeyColumns = params
+    return (nBytes(nRows*nKeyColumns*wordSize),
+            nBytes(nRows*nColumns*wordSize),
+            nBytes(nColumns*keyWordSize(nRows, wordSize)))
+
+
+def fileName(nRounds, nRows, nColumns, wordSize, nKeyColumns):
+    return "%d_%d_%d_%d_%d.%s" % (nRounds, nRows, nColumns, wordSize,
+                                  nKeyColumns, EXTENSION)
+
+
+class KATFile(object):
+    '''Read access to a KAT file. Vectors are returned as a pair of
+       dictionaries with the same structure than the ones from the fips-197
+       (like aes128 and aes128_round in _FIPS197_AES128.py).
+    '''
+    def __init__(self, name):
+        super(KATFile, self).__init__()
+        self._name = name
+        self._file = open(name, 'rb')
+        header = self._file.read(HEADER.size)
+        if len(header) != HEADER.size:
+            raise AssertionError("%s: truncated header" % (name))
+        magic, version, nRounds, nRows, nColumns, wordSize, nKeyColumns, \
+            nVectors = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise AssertionError("%s: not a KAT file (bad magic %r)"
+                                 % (name, magic))
+        if version != FORMAT_VERSION:
+            raise AssertionError("%s: unsupported KAT file version %d "
+                                 "(expected %d)"
+                                 % (name, version, FORMAT_VERSION))
+        self._params = (nRounds, nRows, nColumns, wordSize, nKeyColumns)
+        self._nVectors = nVectors
+        self._sizes = fieldSizes(self._params)
+        self._fields = roundFields(nRounds)
+        self._recordSize = recordSize(self._sizes, self._fields)
+        expected = HEADER.size + self._recordSize*nVectors
+        if os.fstat(self._file.fileno()).st_size != expected:
+            raise AssertionError("%s: size doesn't correspond with %d "
+                                 "vectors" % (name, nVectors))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    @property
+    def params(self):
+        return self._params
+
+    def __len__(self):
+        return self._nVectors
+
+    def __iter__(self):
+        for i in range(self._nVectors):
+            yield self[i]
+
+    def __getitem__(self, i):
+        if not 0 <= i < self._nVectors:
+            raise IndexError("vector %d out of range" % (i))
+        self._file.seek(HEADER.size + i*self._recordSize)
+        record = self._file.read(self._recordSize)
+        return unpackRecord(record, self._sizes, self._fields)
+
+
+def recordSize(sizes, fields):
+    keyBytes, blockBytes, subkeyBytes = sizes
+    nSubkeys = len([field for _, field in fields if field == 'k_sch'])
+    return keyBytes + blockBytes*(1+len(fields)-nSubkeys) + \
+        subkeyBytes*nSubkeys
+
+
+def packRecord(vector, rounds, sizes, fields):
+    keyBytes, blockBytes, subkeyBytes = sizes
+    record = [vector['key'].to_bytes(keyBytes, 'big'),
+              vector['input'].to_bytes(blockBytes, 'big')]
+    for round, field in fields:
+        size = subkeyBytes if field == 'k_sch' else blockBytes
+        record.append(rounds[round][field].to_bytes(size, 'big'))
+    return b''.join(record)
+
+
+def unpackRecord(record, sizes, fields):
+    keyBytes, blockBytes, subkeyBytes = sizes
+    vector = {'key': int.from_bytes(record[:keyBytes], 'big'),
+              'input': int.from_bytes(record[keyBytes:keyBytes+blockBytes],
+                                      'big')}
+    rounds = {}
+    start = vector['input']
+    position = keyBytes+blockBytes
+    for round, field in fields:
+        if round not in rounds:
+            rounds[round] = {'start': start}
+        size = subkeyBytes if field == 'k_sch' else blockBytes
+        value = int.from_bytes(record[position:position+size], 'big')
+        rounds[round][field] = value
+        if field == 'end':
+            start = value
+        position += size
+    vector['output'] = start
+    return vector, rounds
+
+
+def writeKATFile(name, params, vectors):
+    '''The content is prepared before open the file to not leave a partial
+       file if any of the vectors cannot be packed.
+    '''
+    sizes = fieldSizes(params)
+    fields = roundFields(params[0])
+    content = [HEADER.pack(MAGIC, FORMAT_VERSION, *(params+(len(vectors),)))]
+    for vector, rounds in vectors:
+        content.append(packRecord(vector, rounds, sizes, fields))
+    with open(name, 'wb') as f:
+        f.write(b''.join(content))
+
+
+class RoundByRound(object):
+    '''Execute the cipher operation by operation, using the same components
+       than the gRijndael object, to collect the intermediate states.
+       The components that doesn't depend on the key are build only once.
+    '''
+    def __init__(self, nRounds, nRows, nColumns, wordSize, nKeyColumns,
+                 loglevel=None):
+        super(RoundByRound, self).__init__()
+        self._nRounds = nRounds
+        self._nRows = nRows
+        self._nColumns = nColumns
+        self._wordSize = wordSize
+        self._nKeyColumns = nKeyColumns
+        self._blockSize = nRows*nColumns*wordSize
+        self._loglevel = levelFromMeaning(loglevel)
+        self._subBytesObj = _SubBytes(wordSize, loglevel=self._loglevel)
+        self._shiftRowsObj = _ShiftRows(nRows, loglevel=self._loglevel)
+        self._mixColumnsObj = _MixColumns(nRows, nColumns, wordSize,
+                                          loglevel=self._loglevel)
+        self._addRoundKeyObj = _AddRoundKey(nRows, nColumns, wordSize,
+                                            loglevel=self._loglevel)
+
+    @property
+    def params(self):
+        return (self._nRounds, self._nRows, self._nColumns, self._wordSize,
+                self._nKeyColumns)
+
+    def int2matrix(self, argin):
+        return _State(self._nRows, self._nColumns).\
+            fromArray(_Long(self._wordSize).toArray(argin, self._blockSize))
+
+    def matrix2int(self, argin):
+        return _Long(self._wordSize).\
+            fromArray(_State(self._nRows, self._nColumns).toArray(argin),
+                      self._blockSize)
+
+    def subkey2int(self, argin):
+        size = keyWordSize(self._nRows, self._wordSize)
+        return _Long(size).fromArray(argin, self._nColumns*size)
+
+    def cipher(self, key, plain):
+        '''Returns a pair of dictionaries, the vector (key, input and output)
+           and the rounds with the intermediate states.
+        '''
+        keyExpansion = _KeyExpansion(key, self._nRounds, self._nRows,
+                                     self._nColumns, self._wordSize,
+                                     self._nKeyColumns,
+                                     loglevel=self._loglevel)
+        rounds = {}
+        state = self.int2matrix(plain)
+        for round in range(self._nRounds+1):
+            rounds[round] = {'start': self.matrix2int(state)}
+            if round > 0:
+                state = self._subBytesObj.do(state)
+                rounds[round]['s_box'] = self.matrix2int(state)
+                state = self._shiftRowsObj.do(state)
+                rounds[round]['s_row'] = self.matrix2int(state)
+                if round < self._nRounds:
+                    state = self._mixColumnsObj.do(state)
+                    rounds[round]['m_col'] = self.matrix2int(state)
+            subkey = keyExpansion.getSubKey(round*self._nColumns,
+                                            (round+1)*self._nColumns)
+            rounds[round]['k_sch'] = self.subkey2int(subkey)
+            state = self._addRoundKeyObj.do(state, subkey)
+            rounds[round]['end'] = self.matrix2int(state)
+        vector = {'key': key, 'input': plain,
+                  'output': rounds[self._nRounds]['end']}
+        return vector, rounds
+
+
+# Generation ----
+
+
+def generate(params, nVectors, directory, seed=None, loglevel=None):
+    '''Build the KAT file for the given parameters. Each vector is checked
+       against the gRijndael object (cipher and decipher) before it is
+       stored, because the goal is to lock down a correct behaviour.
+       Output: <string> file name
+    '''
+    nRounds, nRows, nColumns, wordSize, nKeyColumns = params
+    random = Random("%s:%s" % (seed, params) if seed is not None else None)
+    builder = RoundByRound(*params, loglevel=loglevel)
+    keySize = nRows*nKeyColumns*wordSize
+    blockSize = nRows*nColumns*wordSize
+    vectors = []
+    for i in range(nVectors):
+        key = random.randint(0, 2**keySize-1)
+        plain = random.randint(0, 2**blockSize-1)
+        vector, rounds = builder.cipher(key, plain)
+        rijndael = gRijndael(key, *params, loglevel=builder._loglevel)
+        if rijndael.cipher(plain) != vector['output']:
+            raise AssertionError("gRijndael%s: cipher doesn't correspond "
+                                 "with the round by round calculation"
+                                 % (str(params)))
+        if rijndael.decipher(vector['output']) != plain:
+            raise AssertionError("gRijndael%s: decipher doesn't recover "
+                                 "the input" % (str(params)))
+        vectors.append((vector, rounds))
+    name = os.path.join(directory, fileName(*params))
+    writeKATFile(name, params, vectors)
+    return name
+
+
+def _generateTask(task):
+    params, nVectors, directory, seed, loglevel = task
+    try:
+        name = generate(params, nVectors, directory, seed, loglevel)
+    except Exception as e:
+        return (params, False, "%s" % (e))
+    return (params, True, name)
+
+
+def allParams():
+    for nRows in range(2, 9):
+        for nColumns in range(2, 9):
+            for wordSize in range(3, 17):
+                for nKeyColumns in range(2, 8):
+                    nRounds = max(nKeyColumns, nColumns) + 6
+                    yield (nRounds, nRows, nColumns, wordSize, nKeyColumns)
+
+
+def doGenerate(paramsList, nVectors, directory, seed, processors, loglevel):
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    tasks = [(params, nVectors, directory, seed, loglevel)
+             for params in paramsList]
+    return streamResults(_generateTask, tasks, processors, "generated")
+
+
+# Verification ----
+
+
+def verify(name, intermediates=True, loglevel=None):
+    '''Check all the vectors in a KAT file. With 'intermediates' each of the
+       round states are also compared, that locates where a change of
+       behaviour has been introduced.
+       Output: <integer> number of vectors checked
+    '''
+    errors = []
+    with KATFile(name) as katFile:
+        params = katFile.params
+        if intermediates:
+            builder = RoundByRound(*params, loglevel=loglevel)
+        for i, (vector, rounds) in enumerate(katFile):
+            if intermediates:
+                _, calculated = builder.cipher(vector['key'], vector['input'])
+                for round in rounds:
+                    for field in rounds[round]:
+                        if calculated[round][field] != rounds[round][field]:
+                            errors.append("vector %d: round%d %s" % (i, round,
+                                                                     field))
+            rijndael = gRijndael(vector['key'], *params,
+                                 loglevel=levelFromMeaning(loglevel))
+            if rijndael.cipher(vector['input']) != vector['output']:
+                errors.append("vector %d: cipher" % (i))
+            if rijndael.decipher(vector['output']) != vector['input']:
+                errors.append("vector %d: decipher" % (i))
+        if len(errors) > 0:
+            raise AssertionError(errors)
+        return len(katFile)
+
+
+def _verifyTask(task):
+    name, intermediates, loglevel = task
+    try:
+        n = verify(name, intermediates, loglevel)
+    except AssertionError as e:
+        return (name, False, "; ".join("%s" % error for error in e.args[0])
+                if len(e.args) and type(e.args[0]) == list else "%s" % e)
+    except Exception as e:
+        return (name, False, "Unmanaged exception: %s" % (format_exc()))
+    return (name, True, "%d vectors" % (n))
+
+
+def katFiles(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith('.'+EXTENSION):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def doVerify(paths, intermediates, processors, loglevel):
+    tasks = [(name, intermediates, loglevel) for name in katFiles(paths)]
+    return streamResults(_verifyTask, tasks, processors, "verified")
+
+
+# Common ----
+
+
+def nProcessors(processors):
+    maxParallelprocesses = multiprocessing.cpu_count()
+    if processors is None or processors == 'max':
+        return maxParallelprocesses
+    processors = int(processors)
+    if processors <= 0:
+        processors = maxParallelprocesses + processors
+    return max(processors, 1)
+
+
+def streamResults(task, arguments, processors, action):
+    '''Distribute the tasks in a pool of processes and print each result
+       when it is available (not in the submission order).
+       Output: <integer> number of failures
+    '''
+    t0 = datetime.now()
+    failures = 0
+    processors = min(nProcessors(processors), max(len(arguments), 1))
+    if processors == 1:
+        results = (task(argument) for argument in arguments)
+    else:
+        pool = multiprocessing.Pool(processors)
+        results = pool.imap_unordered(task, arguments)
+    for subject, ok, message in results:
+        if not ok:
+            failures += 1
+        print("%s\t%s\t%s" % ("PASS" if ok else "FAIL", subject, message))
+        sys.stdout.flush()
+    if processors != 1:
+        pool.close()
+        pool.join()
+    print("%d %s, %d failed (%s)" % (len(arguments)-failures, action,
+                                     failures, datetime.now()-t0))
+    return failures
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option('', "--log-level", default="error",
+                      help="Set log level: error, warning, info, debug, trace")
+    parser.add_option('', "--generate", type='str',
+                      help="Comma separated set of Rijndael's generalised "
+                      "parameters (nRounds, nRows, nColumns, wordSize[, "
+                      "nKeyColumns]) or 'all' to iterate the generalised "
+                      "parameters.")
+    parser.add_option('', "--vectors", type='int', default=10,
+                      help="Number of vectors to generate per file.")
+    parser.add_option('', "--seed", type='str',
+                      help="Seed to generate reproducible files.")
+    parser.add_option('', "--directory", type='str', default='KAT',
+                      help="Directory where the generated files are stored.")
+    parser.add_option('', "--verify", action="store_true", default=False,
+                      help="Verify the KAT files (or directories) given as "
+                      "arguments.")
+    parser.add_option('', "--only-output", action="store_true",
+                      default=False,
+                      help="On verification, don't check the per round "
+                      "intermediate states (only the cipher and decipher).")
+    parser.add_option('', "--processors", type="str",
+                      help="Number of parallel jobs. With 'max' (default) "
+                      "uses all the available cores, a negative number "
+                      "decreases from the maximum.")
+    (options, args) = parser.parse_args()
+    if options.generate is not None:
+        if options.generate.lower() == 'all':
+            paramsList = list(allParams())
+        else:
+            paramsList = [extractParams(options.generate)]
+        failures = doGenerate(paramsList, options.vectors, options.directory,
+                              options.seed, options.processors,
+                              options.log_level)
+    elif options.verify:
+        failures = doVerify(args or [options.directory],
+                            not options.only_output, options.processors,
+                            options.log_level)
+    else:
+        print("\n\tNo default action, check help to know what can be done.\n")
+        sys.exit(-1)
+    if failures > 0:
+        sys.exit(-1)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
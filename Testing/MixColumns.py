@@ -26,6 +26,7 @@ __status__ = "development"
 from gRijndael import MixColumns
 from gRijndael.Logger import levelFromMeaning
 from optparse import OptionParser
+from threading import Thread
 
 
 def test_base(loglevel):
@@ -65,6 +66,35 @@ def test_aes128_round1(loglevel):
     return False
 
 
+def test_lazyInverse(loglevel):
+    '''d(x) is built on the first inverse operation, once even when many
+       threads invert at the same time.
+    '''
+    stateMatrix = [[0x00, 0x01, 0x02, 0x03],
+                   [0x10, 0x11, 0x12, 0x13],
+                   [0x20, 0x21, 0x22, 0x23],
+                   [0x30, 0x31, 0x32, 0x33]]
+    mixcolumns = MixColumns(4, 4, 8, loglevel=levelFromMeaning(loglevel))
+    print("Testing the lazy d(x) of %s" % (mixcolumns))
+    if mixcolumns._MixColumns__dx is not None:
+        print("ALERT: d(x) built before it is needed")
+        return False
+    stateConverted = mixcolumns.do(stateMatrix)
+    results = []
+
+    def invert():
+        results.append(mixcolumns.invert(stateConverted))
+    threads = [Thread(target=invert) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if results == [stateMatrix]*len(threads):
+        return True
+    print("ALERT:\n\t%s\n!=\n\t%s" % (stateMatrix, results))
+    return False
+
+
 def main():
     parser = OptionParser()
     parser.add_option('', "--log-level", default="info",
@@ -72,7 +102,8 @@ def main():
     (options, args) = parser.parse_args()
     import sys
     for test in [test_base,
-                 test_aes128_round1]:
+                 test_aes128_round1,
+                 test_lazyInverse]:
         if not test(options.log_level):
             sys.exit(-1)
     sys.exit(0)
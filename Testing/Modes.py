@@ -0,0 +1,258 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+
+"""
+    Modes of operation: the first block of the NIST SP 800-38A vectors
+    (AES-128) and round trips with non byte aligned blocks, with the data
+    split in random update() calls, and random reads of the CTRReader.
+"""
+
+from datetime import datetime
+from io import BufferedReader
+from mmap import mmap, ACCESS_READ
+from optparse import OptionParser
+from random import Random
+from tempfile import TemporaryFile
+from gRijndael import gRijndael
+from gRijndael.Modes import ECB, CBC, CFB, OFB, CTR
+from gRijndael.Modes import ParallelCTR, ParallelCBC, ParallelCFB
+from gRijndael.Modes import CTRReader
+
+
+SP800_38A_KEY = 0x2b7e151628aed2a6abf7158809cf4f3c
+SP800_38A_PLAIN = "6bc1bee22e409f96e93d7e117393172a"
+SP800_38A_IV = 0x000102030405060708090a0b0c0d0e0f
+SP800_38A_COUNTER = 0xf0f1f2f3f4f5f6f7f8f9fafbfcfdfeff
+SP800_38A = [('ECB', lambda r, **kw: ECB(r, padding=False, **kw),
+              "3ad77bb40d7a3660a89ecaf32466ef97"),
+             ('CBC', lambda r, **kw: CBC(r, SP800_38A_IV, padding=False,
+                                         **kw),
+              "7649abac8119b246cee98e9b12e9197d"),
+             ('CFB', lambda r, **kw: CFB(r, SP800_38A_IV, **kw),
+              "3b3fd92eb72dad20333449f8e83cfb4a"),
+             ('OFB', lambda r, **kw: OFB(r, SP800_38A_IV, **kw),
+              "3b3fd92eb72dad20333449f8e83cfb4a"),
+             ('CTR', lambda r, **kw: CTR(r, SP800_38A_COUNTER, **kw),
+              "874d6191b620e3261bef6864990db6ce")]
+# (nRounds, nRows, nColumns, wordSize, nKeyColumns): 60, 24 and 27 bits
+DEFAULT_PARAMS = [(11, 4, 5, 3, 3), (9, 2, 3, 4, 2), (9, 3, 3, 3, 3)]
+
+
+def run(mode, data, random):
+    '''update() with random pieces of the data and finalize().'''
+    output = b""
+    start = 0
+    while start < len(data):
+        end = start+random.randint(0, 2*len(data)//3+1)
+        output += mode.update(data[start:end])
+        start = end
+    return output+mode.finalize()
+
+
+def test_sp800_38a(random):
+    rijndael = gRijndael(SP800_38A_KEY)
+    plain = bytes.fromhex(SP800_38A_PLAIN)
+    for name, build, cipher in SP800_38A:
+        if run(build(rijndael), plain, random).hex() != cipher or \
+                run(build(rijndael, decipher=True), bytes.fromhex(cipher),
+                    random) != plain:
+            print("ALERT: %s doesn't match the SP 800-38A vector" % (name))
+            return False
+    return True
+
+
+def test_roundTrip(params, samples, random):
+    nRounds, nRows, nColumns, wordSize, nKeyColumns = params
+    rijndael = gRijndael(random.getrandbits(nRows*nKeyColumns*wordSize),
+                         nRounds, nRows, nColumns, wordSize, nKeyColumns)
+    blockSize = rijndael.blockSize
+    iv = random.getrandbits(blockSize)
+    modes = [('ECB', lambda **kw: ECB(rijndael, **kw), True),
+             ('CBC', lambda **kw: CBC(rijndael, iv, **kw), True),
+             ('CFB', lambda **kw: CFB(rijndael, iv, **kw), False),
+             ('OFB', lambda **kw: OFB(rijndael, iv, **kw), False),
+             ('CTR', lambda **kw: CTR(rijndael, (1 << blockSize)-2, **kw),
+              False)]
+    for i in range(samples):
+        data = bytes(random.getrandbits(8)
+                     for j in range(random.randint(0, 6*blockSize//8)))
+        for name, build, padding in modes:
+            cipherText = run(build(), data, random)
+            if padding:
+                expected = -(-(len(data)*8//blockSize+1)*blockSize//8)
+            else:
+                expected = len(data)
+            if len(cipherText) != expected or \
+                    run(build(decipher=True), cipherText, random) != data:
+                print("ALERT: %s round trip of %d bytes with %s"
+                      % (name, len(data), rijndael))
+                return False
+    return True
+
+
+def test_parallelCTR(params, processors, random):
+    '''The key stream from the pool shall be the one of CTR.'''
+    nRounds, nRows, nColumns, wordSize, nKeyColumns = params
+    rijndael = gRijndael(random.getrandbits(nRows*nKeyColumns*wordSize),
+                         nRounds, nRows, nColumns, wordSize, nKeyColumns)
+    counter = random.getrandbits(rijndael.blockSize)
+    data = bytes(random.getrandbits(8)
+                 for j in range(random.randint(20, 40)*rijndael.blockSize//8))
+    expected = run(CTR(rijndael, counter), data, random)
+    with ParallelCTR(rijndael, counter, processors=processors,
+                     chunkBlocks=4) as parallel:
+        if run(parallel, data, random) != expected:
+            print("ALERT: ParallelCTR doesn't match CTR with %s"
+                  % (rijndael))
+            return False
+    return True
+
+
+def test_parallelDecipher(params, processors, random):
+    '''The CBC and CFB decryption in the pool shall match the sequential
+       one (and ciphering with them shall be the sequential ciphering).
+    '''
+    nRounds, nRows, nColumns, wordSize, nKeyColumns = params
+    rijndael = gRijndael(random.getrandbits(nRows*nKeyColumns*wordSize),
+                         nRounds, nRows, nColumns, wordSize, nKeyColumns)
+    iv = random.getrandbits(rijndael.blockSize)
+    data = bytes(random.getrandbits(8)
+                 for j in range(random.randint(20, 40)*rijndael.blockSize//8))
+    for name, serial, parallel in \
+            [('CBC', CBC, ParallelCBC), ('CFB', CFB, ParallelCFB)]:
+        cipherText = run(serial(rijndael, iv), data, random)
+        with parallel(rijndael, iv, processors=processors,
+                      chunkBlocks=4) as encryptor:
+            if run(encryptor, data, random) != cipherText:
+                print("ALERT: %s doesn't cipher like %s with %s"
+                      % (parallel.__name__, name, rijndael))
+                return False
+        with parallel(rijndael, iv, decipher=True, processors=processors,
+                      chunkBlocks=4) as decryptor:
+            if run(decryptor, cipherText, random) != data:
+                print("ALERT: %s doesn't decipher like %s with %s"
+                      % (parallel.__name__, name, rijndael))
+                return False
+    return True
+
+
+def test_ctrReader(params, samples, random):
+    '''Random reads of a CTRReader over the cipher text in memory, in a
+       file and in a mmap of the file shall give the plain text bytes.
+    '''
+    nRounds, nRows, nColumns, wordSize, nKeyColumns = params
+    rijndael = gRijndael(random.getrandbits(nRows*nKeyColumns*wordSize),
+                         nRounds, nRows, nColumns, wordSize, nKeyColumns)
+    counter = random.getrandbits(rijndael.blockSize)
+    data = bytes(random.getrandbits(8) for j in range(random.randint(50, 99)))
+    cipherText = run(CTR(rijndael, counter), data, random)
+    with TemporaryFile() as source:
+        source.write(cipherText)
+        source.flush()
+        with mmap(source.fileno(), 0, access=ACCESS_READ) as mapped:
+            for name, origin, cacheBlocks in [('bytes', cipherText, 4),
+                                              ('file', source, 0),
+                                              ('mmap', mapped, 64)]:
+                with CTRReader(rijndael, counter, origin,
+                               cacheBlocks=cacheBlocks) as reader:
+                    if reader.read() != data or \
+                            not ctrRandomReads(reader, data, samples,
+                                               random):
+                        print("ALERT: CTRReader over %s with %s"
+                              % (name, rijndael))
+                        return False
+                    reader.seek(0)
+                    if BufferedReader(reader, 16).read(len(data)) != data:
+                        print("ALERT: BufferedReader over a CTRReader "
+                              "with %s" % (rijndael))
+                        return False
+    return True
+
+
+def ctrRandomReads(reader, data, samples, random):
+    for i in range(4*samples):
+        start = random.randint(0, len(data)+2)
+        size = random.randint(0, 20)
+        if reader.seek(start) != start or \
+                reader.read(size) != data[start:start+size] or \
+                reader.tell() != min(start+size, max(len(data), start)):
+            return False
+    return True
+
+
+def benchmark(blocks, processorsList):
+    '''Throughput of CTR, and CBC and CFB deciphering, against their
+       parallel versions (AES-128 parameters).
+    '''
+    rijndael = gRijndael(0)
+    data = bytes(blocks*rijndael.blockSize//8)
+    for name, serial, parallel in \
+            [('CTR', CTR, ParallelCTR), ('CBC', CBC, ParallelCBC),
+             ('CFB', CFB, ParallelCFB)]:
+        t0 = datetime.now()
+        serial(rijndael, 0, decipher=True).update(data)
+        serialSeconds = (datetime.now()-t0).total_seconds()
+        print("%s:\t\t\t%8.1f blocks/s" % (name, blocks/serialSeconds))
+        for processors in processorsList:
+            t0 = datetime.now()
+            with parallel(rijndael, 0, decipher=True,
+                          processors=processors) as mode:
+                mode.update(data)
+            seconds = (datetime.now()-t0).total_seconds()
+            print("%s(%2d):\t%8.1f blocks/s (x%.2f)"
+                  % (parallel.__name__, processors, blocks/seconds,
+                     serialSeconds/seconds))
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option('', "--samples", type='int', default=5)
+    parser.add_option('', "--seed", type='str', default='gRijndael')
+    parser.add_option('', "--processors", type='int', default=2)
+    parser.add_option('', "--benchmark", type='int', default=0,
+                      help="Blocks to measure the parallel modes (they "
+                      "use 1 to --processors processes).")
+    (options, args) = parser.parse_args()
+    import sys
+    random = Random(options.seed)
+    if options.benchmark:
+        benchmark(options.benchmark, range(1, options.processors+1))
+        sys.exit(0)
+    if not test_sp800_38a(random):
+        sys.exit(-1)
+    for params in DEFAULT_PARAMS:
+        if not test_roundTrip(params, options.samples, random):
+            sys.exit(-1)
+        if not test_parallelCTR(params, options.processors, random):
+            sys.exit(-1)
+        if not test_parallelDecipher(params, options.processors, random):
+            sys.exit(-1)
+        if not test_ctrReader(params, options.samples, random):
+            sys.exit(-1)
+    print("The modes of operation pass.")
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main()
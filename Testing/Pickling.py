@@ -0,0 +1,126 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+"""
+    Pickling: the copies of a gRijndael (in this process and in the
+    workers of a process pool) shall cipher like the original, and the
+    SBox tables shared in memory shall be attached by the workers.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from optparse import OptionParser
+from pickle import dumps, loads
+from random import Random
+from gRijndael import gRijndael
+
+
+# (nRounds, nRows, nColumns, wordSize, nKeyColumns, sboxCalc): AES-128, a
+# 60 bits block and 16 bits words with the SBox tables
+DEFAULT_PARAMS = [(10, 4, 4, 8, 4, True), (11, 4, 5, 3, 3, True),
+                  (10, 2, 2, 16, 2, False)]
+
+
+def workerCipher(rijndael, blocks):
+    '''Task for the pool: the blocks ciphered and deciphered by the
+       received copy, and if its SBox table is shared memory.
+    '''
+    cipherTexts = [rijndael.cipher(block) for block in blocks]
+    return (cipherTexts, [rijndael.decipher(block) for block in cipherTexts],
+            type(rijndael.sbox.SBox._sbox) == memoryview)
+
+
+def test_copies(params, samples, random):
+    '''A copy pickled after deciphering (with all the lazy parts built)
+       and one before.
+    '''
+    nRounds, nRows, nColumns, wordSize, nKeyColumns, sboxCalc = params
+    rijndael = gRijndael(random.getrandbits(nRows*nKeyColumns*wordSize),
+                         nRounds, nRows, nColumns, wordSize, nKeyColumns,
+                         sboxCalc=sboxCalc)
+    blocks = [random.getrandbits(rijndael.blockSize) for i in range(samples)]
+    fresh = loads(dumps(rijndael))
+    expected = [rijndael.cipher(block) for block in blocks]
+    for block in expected:
+        rijndael.decipher(block)
+    built = loads(dumps(rijndael))
+    for name, copy in [('fresh', fresh), ('built', built)]:
+        if [copy.cipher(block) for block in blocks] != expected or \
+                [copy.decipher(block) for block in expected] != blocks:
+            print("ALERT: the %s copy of %s doesn't match" % (name, rijndael))
+            return False
+    return True
+
+
+def test_workers(params, samples, processors, random):
+    '''The copies in a pool of processes, with the SBox tables shared when
+       there are tables.
+    '''
+    nRounds, nRows, nColumns, wordSize, nKeyColumns, sboxCalc = params
+    rijndael = gRijndael(random.getrandbits(nRows*nKeyColumns*wordSize),
+                         nRounds, nRows, nColumns, wordSize, nKeyColumns,
+                         sboxCalc=sboxCalc)
+    blocks = [random.getrandbits(rijndael.blockSize) for i in range(samples)]
+    expected = [rijndael.cipher(block) for block in blocks]
+    sbox = rijndael.sbox.SBox
+    if not sboxCalc:
+        sbox.shareTable()
+    try:
+        with ProcessPoolExecutor(processors) as executor:
+            results = list(executor.map(workerCipher,
+                                        [rijndael]*processors,
+                                        [blocks]*processors))
+    finally:
+        sbox.releaseTable()
+    for cipherTexts, plainTexts, shared in results:
+        if cipherTexts != expected or plainTexts != blocks:
+            print("ALERT: a worker copy of %s doesn't match" % (rijndael))
+            return False
+        if shared == sboxCalc:
+            print("ALERT: the worker SBox table of %s is%s shared"
+                  % (rijndael, "" if shared else " not"))
+            return False
+    if type(sbox._sbox) != list and not sboxCalc:
+        print("ALERT: the table is still shared after releaseTable()")
+        return False
+    return True
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option('', "--samples", type='int', default=3)
+    parser.add_option('', "--processors", type='int', default=2)
+    parser.add_option('', "--seed", type='str', default='gRijndael')
+    (options, args) = parser.parse_args()
+    import sys
+    random = Random(options.seed)
+    for params in DEFAULT_PARAMS:
+        if not test_copies(params, options.samples, random) or \
+                not test_workers(params, options.samples,
+                                 options.processors, random):
+            sys.exit(-1)
+    print("The pickled copies match.")
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main()
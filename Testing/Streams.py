@@ -0,0 +1,232 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+"""
+    Streams: round trips of files through cipherFile() with small chunks,
+    the progress callback, the read ahead bounded to one chunk and the
+    errors of the source, and the asyncio cipherStream() with the event
+    loop free while it works.
+"""
+
+from asyncio import StreamReader, ensure_future, run, sleep as asyncSleep
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+from optparse import OptionParser
+from random import Random
+from threading import enumerate as threads
+from time import sleep
+from gRijndael import gRijndael
+from gRijndael.Modes import CBC, CTR
+from gRijndael.Streams import cipherFile, cipherStream, readChunks
+
+
+# (nRounds, nRows, nColumns, wordSize, nKeyColumns): 60 and 24 bits
+DEFAULT_PARAMS = [(11, 4, 5, 3, 3), (9, 2, 3, 4, 2)]
+
+
+class CountingSource(object):
+    '''Binary file that counts the read() calls and can fail on one.'''
+    def __init__(self, data, failOn=None):
+        self._file = BytesIO(data)
+        self._failOn = failOn
+        self.reads = 0
+
+    def read(self, size):
+        self.reads += 1
+        if self.reads == self._failOn:
+            raise IOError("read %d fails" % (self.reads))
+        return self._file.read(size)
+
+
+def readerThreads():
+    return [thread for thread in threads()
+            if thread.name == "gRijndael readChunks"]
+
+
+def test_roundTrip(params, samples, random):
+    '''cipherFile() and back, with the progress reaching the whole input.'''
+    nRounds, nRows, nColumns, wordSize, nKeyColumns = params
+    rijndael = gRijndael(random.getrandbits(nRows*nKeyColumns*wordSize),
+                         nRounds, nRows, nColumns, wordSize, nKeyColumns)
+    iv = random.getrandbits(rijndael.blockSize)
+    for i in range(samples):
+        data = bytes(random.getrandbits(8)
+                     for j in range(random.randint(0, 60)))
+        chunkSize = random.randint(1, 16)
+        for name, build in [('CBC', lambda **kw: CBC(rijndael, iv, **kw)),
+                            ('CTR', lambda **kw: CTR(rijndael, iv, **kw))]:
+            calls = []
+            cipherText = BytesIO()
+            written = cipherFile(build(), BytesIO(data), cipherText,
+                                 chunkSize,
+                                 lambda *args: calls.append(args))
+            plainText = BytesIO()
+            cipherFile(build(decipher=True), BytesIO(cipherText.getvalue()),
+                       plainText, chunkSize)
+            if written != len(cipherText.getvalue()) or \
+                    plainText.getvalue() != data:
+                print("ALERT: %s round trip of %d bytes with %s"
+                      % (name, len(data), rijndael))
+                return False
+            if calls[-1][:2] != (len(data), written) or \
+                    calls != sorted(calls):
+                print("ALERT: %s progress %s" % (name, calls))
+                return False
+    return True
+
+
+def test_readAhead():
+    '''The reader thread shall be only one chunk ahead of the consumer,
+       and closing the generator shall stop it.
+    '''
+    source = CountingSource(bytes(100))
+    chunks = readChunks(source, 1)
+    for consumed in range(1, 20):
+        next(chunks)
+        sleep(0.01)
+        # the chunk consumed, the one in the queue and the one read
+        if source.reads > consumed+2:
+            print("ALERT: %d reads with %d chunks consumed"
+                  % (source.reads, consumed))
+            return False
+    chunks.close()
+    if readerThreads():
+        print("ALERT: the reader thread is alive after close()")
+        return False
+    return True
+
+
+def test_sourceError():
+    '''An error reading shall come out of cipherFile().'''
+    rijndael = gRijndael(0, 9, 2, 3, 4, 2)
+    try:
+        cipherFile(CTR(rijndael, 0), CountingSource(bytes(50), failOn=3),
+                   BytesIO(), 4)
+    except IOError:
+        pass
+    else:
+        print("ALERT: the error of the source has been lost")
+        return False
+    if readerThreads():
+        print("ALERT: the reader thread is alive after an error")
+        return False
+    return True
+
+
+class Writer(object):
+    '''StreamWriter that keeps what is written.'''
+    def __init__(self):
+        self.data = b""
+        self.drains = 0
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        self.drains += 1
+
+
+async def chunksOf(data, size):
+    for start in range(0, len(data), size):
+        yield data[start:start+size]
+
+
+async def asyncRoundTrip(rijndael, iv, data, executor):
+    '''CBC ciphering from a StreamReader and deciphering from an async
+       iterable, with the ticks a coroutine made meanwhile.
+    '''
+    ticks = [0]
+
+    async def ticker():
+        while True:
+            ticks[0] += 1
+            await asyncSleep(0.001)
+    task = ensure_future(ticker())
+    reader = StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    cipherText = Writer()
+    calls = []
+    await cipherStream(CBC(rijndael, iv), reader, cipherText, 16, executor,
+                       lambda *args: calls.append(args))
+    plainText = Writer()
+    await cipherStream(CBC(rijndael, iv, decipher=True),
+                       chunksOf(cipherText.data, 7), plainText,
+                       executor=executor)
+    task.cancel()
+    return plainText.data, cipherText, calls, ticks[0]
+
+
+def test_async(samples, random):
+    '''cipherStream() shall match cipherFile(), drain the writer and let
+       the other coroutines work.
+    '''
+    rijndael = gRijndael(random.getrandbits(36), 11, 4, 5, 3, 3)
+    iv = random.getrandbits(rijndael.blockSize)
+    with ThreadPoolExecutor(1) as executor:
+        for i in range(samples):
+            data = bytes(random.getrandbits(8)
+                         for j in range(random.randint(40, 80)))
+            expected = BytesIO()
+            cipherFile(CBC(rijndael, iv), BytesIO(data), expected)
+            plainText, cipherText, calls, ticks = \
+                run(asyncRoundTrip(rijndael, iv, data, executor))
+            if plainText != data or cipherText.data != expected.getvalue():
+                print("ALERT: asyncio round trip of %d bytes" % (len(data)))
+                return False
+            if cipherText.drains == 0 or calls[-1][0] != len(data) or \
+                    ticks < 2:
+                print("ALERT: %d drains, progress %s and %d ticks"
+                      % (cipherText.drains, calls, ticks))
+                return False
+    try:
+        with ProcessPoolExecutor(1) as executor:
+            run(cipherStream(CTR(rijndael, 0), chunksOf(b"data", 2),
+                             Writer(), executor=executor))
+    except AssertionError:
+        pass
+    else:
+        print("ALERT: a mode has been sent to a process executor")
+        return False
+    return True
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option('', "--samples", type='int', default=5)
+    parser.add_option('', "--seed", type='str', default='gRijndael')
+    (options, args) = parser.parse_args()
+    import sys
+    random = Random(options.seed)
+    for params in DEFAULT_PARAMS:
+        if not test_roundTrip(params, options.samples, random):
+            sys.exit(-1)
+    if not test_readAhead() or not test_sourceError() or \
+            not test_async(options.samples, random):
+        sys.exit(-1)
+    print("The streams pass.")
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main()
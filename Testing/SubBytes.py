@@ -25,7 +25,12 @@ __status__ = "development"
 
 from gRijndael import SubBytes
 from gRijndael.Logger import levelFromMeaning
+from gRijndael.Polynomials import BinaryExtensionModulo
+from gRijndael.Polynomials import getBinaryExtensionFieldModulo
+from gRijndael.SBox import SBox
 from optparse import OptionParser
+from random import Random
+from threading import Thread
 
 
 def test_standard(loglevel):
@@ -43,15 +48,87 @@ def test_standard(loglevel):
     return False
 
 
+def test_tables(wordSize, processors):
+    '''The SBox tables (built with the batch inversion) shall match the
+       calculations cell by cell.
+    '''
+    values = list(range(2**wordSize))
+    tables = SBox(wordSize, useCalc=False, processors=processors)
+    calculated = SBox(wordSize)
+    images = tables.transform(values)
+    if images != calculated.transform(values) or \
+            tables.transform(images, invert=True) != values:
+        print("ALERT: SBox tables for %d bits" % (wordSize))
+        return False
+    return True
+
+
+def test_lazyInverse(wordSize):
+    '''The inverse table is built on the first inverse transformation,
+       once even with many threads inverting at the same time.
+    '''
+    sbox = SBox(wordSize, useCalc=False)
+    if sbox._sbox_inverted is not None:
+        print("ALERT: inverse SBox built before it is needed")
+        return False
+    values = list(range(2**wordSize))
+    images = sbox.transform(values)
+    results = []
+
+    def invert():
+        results.append(sbox.transform(images, invert=True))
+    threads = [Thread(target=invert) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if results != [values]*len(threads):
+        print("ALERT: concurrent inverse SBox for %d bits" % (wordSize))
+        return False
+    return True
+
+
+def test_batchInverse(wordSize, samples, random):
+    '''Montgomery's batch inversion against the element by element one.'''
+    field = BinaryExtensionModulo(getBinaryExtensionFieldModulo(wordSize))
+    values = [random.randint(0, 2**wordSize-1) for i in range(samples)]+[0]
+    random.shuffle(values)
+    expected = [(~field(value)).coefficients for value in values]
+    obtained = [element.coefficients
+                for element in field.batchInverse(values)]
+    if expected != obtained:
+        print("ALERT: batch inversion in GF(2^%d)" % (wordSize))
+        return False
+    sbox = SBox(wordSize)
+    state = [values[i:i+4] for i in range(0, len(values)-3, 4)]
+    if sbox.transform(sbox.transform(state), invert=True) != state:
+        print("ALERT: SBox with batch inversion for %d bits" % (wordSize))
+        return False
+    return True
+
+
 def main():
     parser = OptionParser()
     parser.add_option('', "--log-level", default="info",
                       help="Set log level: error, warning, info, debug, trace")
+    parser.add_option('', "--processors", type='int', default=1,
+                      help="Processes to build the SBox tables (0 for all)")
+    parser.add_option('', "--samples", type='int', default=50)
+    parser.add_option('', "--seed", type='str', default='gRijndael')
     (options, args) = parser.parse_args()
     import sys
-    if test_standard(options.log_level):
-        sys.exit(0)
-    sys.exit(-1)
+    random = Random(options.seed)
+    if not test_standard(options.log_level):
+        sys.exit(-1)
+    for wordSize in range(3, 13):
+        if not test_tables(wordSize, options.processors):
+            sys.exit(-1)
+    if not test_lazyInverse(12):
+        sys.exit(-1)
+    for wordSize in [8, 16, 17, 32, 64]:
+        if not test_batchInverse(wordSize, options.samples, random):
+            sys.exit(-1)
+    sys.exit(0)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,143 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+"""
+    Threads: one gRijndael instance shared by many threads that cipher and
+    decipher at the same time shall give the results of a single thread,
+    and the xors counters shall not lose increments.
+"""
+
+from optparse import OptionParser
+from random import Random
+from threading import Barrier, Thread
+from gRijndael import gRijndael
+from gRijndael.Logger import XORctr
+from gRijndael.Polynomials import BinaryExtensionModulo
+from gRijndael.Polynomials import getBinaryExtensionFieldModulo
+
+
+# (nRounds, nRows, nColumns, wordSize, nKeyColumns): AES-128 and 24 bits
+DEFAULT_PARAMS = [(10, 4, 4, 8, 4), (9, 2, 3, 4, 2)]
+
+
+def runThreads(nThreads, target):
+    '''Start the threads together (on a barrier) and wait for them.
+       Output: <list> with the return of each target(index)
+    '''
+    barrier = Barrier(nThreads)
+    results = [None]*nThreads
+
+    def worker(index):
+        barrier.wait()
+        results[index] = target(index)
+    threads = [Thread(target=worker, args=(i,)) for i in range(nThreads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_sharedInstance(params, nThreads, nBlocks, random):
+    '''Each thread ciphers and deciphers its blocks (some through
+       cipherInto()) with the shared instance.
+    '''
+    nRounds, nRows, nColumns, wordSize, nKeyColumns = params
+    key = random.getrandbits(nRows*nKeyColumns*wordSize)
+    reference = gRijndael(key, nRounds, nRows, nColumns, wordSize,
+                          nKeyColumns)
+    shared = gRijndael(key, nRounds, nRows, nColumns, wordSize, nKeyColumns)
+    blocks = [[random.getrandbits(reference.blockSize)
+               for j in range(nBlocks)] for i in range(nThreads)]
+    expected = [[reference.cipher(block) for block in thread]
+                for thread in blocks]
+
+    def work(index):
+        cipherTexts = [shared.cipher(block) for block in blocks[index]]
+        plainTexts = [shared.decipher(block) for block in cipherTexts]
+        if shared.blockSize % 8 == 0:
+            blockBytes = shared.blockSize//8
+            data = b"".join(block.to_bytes(blockBytes, 'big')
+                            for block in blocks[index])
+            output = bytearray(len(data))
+            shared.cipherInto(data, output)
+            if output != b"".join(block.to_bytes(blockBytes, 'big')
+                                  for block in cipherTexts):
+                return None, None
+        return cipherTexts, plainTexts
+    for index, (cipherTexts, plainTexts) in \
+            enumerate(runThreads(nThreads, work)):
+        if cipherTexts != expected[index] or plainTexts != blocks[index]:
+            print("ALERT: thread %d has wrong blocks with %s"
+                  % (index, shared))
+            return False
+    return True
+
+
+def test_counters(nThreads, random):
+    '''The xors counted by many threads shall be the sum of all of them.'''
+    counter = XORctr()
+    field = BinaryExtensionModulo(getBinaryExtensionFieldModulo(8))
+    values = [(field(random.getrandbits(8)), field(random.getrandbits(8)))
+              for i in range(200)]
+    field.reset()
+    for a, b in values:
+        a*b
+    fieldXors = field.xors
+    field.reset()
+
+    def work(index):
+        for i in range(10000):
+            counter.xors = 1
+        for a, b in values:
+            a*b
+    runThreads(nThreads, work)
+    if counter.xors != 10000*nThreads or field.xors != fieldXors*nThreads:
+        print("ALERT: lost xors (%d of %d and %d of %d)"
+              % (counter.xors, 10000*nThreads, field.xors,
+                 fieldXors*nThreads))
+        return False
+    return True
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option('', "--threads", type='int', default=8)
+    parser.add_option('', "--blocks", type='int', default=4,
+                      help="Blocks for each thread")
+    parser.add_option('', "--seed", type='str', default='gRijndael')
+    (options, args) = parser.parse_args()
+    import sys
+    random = Random(options.seed)
+    for params in DEFAULT_PARAMS:
+        if not test_sharedInstance(params, options.threads, options.blocks,
+                                   random):
+            sys.exit(-1)
+    if not test_counters(options.threads, random):
+        sys.exit(-1)
+    print("A shared instance works with %d threads." % (options.threads))
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main()
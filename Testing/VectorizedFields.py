@@ -0,0 +1,147 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+
+from gRijndael.Polynomials import BinaryExtensionModulo
+from gRijndael.Polynomials import getBinaryExtensionFieldModulo
+from gRijndael.Polynomials import getPolynomialRingWithBinaryCoefficients
+from gRijndael.Polynomials.VectorizedFields import getVectorizedField
+from gRijndael.Polynomials.VectorizedFields import VectorizedField
+from numpy import array, array_equal
+from optparse import OptionParser
+from random import Random
+
+
+def test_field(wordSize, samples, random):
+    '''Compare the vectorized operations with the BinaryExtensionModulo
+       elements.
+    '''
+    field = BinaryExtensionModulo(getBinaryExtensionFieldModulo(wordSize))
+    vectorized = getVectorizedField(wordSize)
+    a = [random.randint(0, 2**wordSize-1) for i in range(samples)]
+    b = [random.randint(0, 2**wordSize-1) for i in range(samples)]
+    n = [random.randint(-5, 5) for i in range(samples)]
+    expected = {'add': [(field(x)+field(y)).coefficients
+                        for x, y in zip(a, b)],
+                'multiply': [(field(x)*field(y)).coefficients
+                             for x, y in zip(a, b)],
+                'inverse': [(~field(x)).coefficients for x in a],
+                'power': [power(field, x, e) for x, e in zip(a, n)]}
+    obtained = {'add': vectorized.add(a, b),
+                'multiply': vectorized.multiply(a, b),
+                'inverse': vectorized.inverse(a),
+                'power': vectorized.power(a, n)}
+    for operation in sorted(expected.keys()):
+        if not array_equal(array(expected[operation]), obtained[operation]):
+            print("ALERT: GF(2^%d) %s" % (wordSize, operation))
+            return False
+    return True
+
+
+def power(field, value, exponent):
+    element = field(value)
+    if exponent < 0:
+        element = ~element
+        exponent = -exponent
+    result = field.one
+    for i in range(exponent):
+        result = result*element
+    return result.coefficients
+
+
+def test_ring(nRows, wordSize, samples, random):
+    '''Compare the vectorized ring product and the circulant matrix product
+       with the MixColumns c(x) in the packed ring.
+    '''
+    c_x, ring, field = \
+        getPolynomialRingWithBinaryCoefficients(nRows, wordSize, packed=True)
+    vectorized = getVectorizedField(wordSize)
+    columns = [ring(random.randint(0, 2**(nRows*wordSize)-1))
+               for i in range(samples)]
+    expected = array([(c_x*column).lanes for column in columns])
+    lanes = array([column.lanes for column in columns])
+    convolution = vectorized.ringMultiply(array(c_x.lanes), lanes)
+    matrix = vectorized.matrixVector(vectorized.circulant(c_x.lanes), lanes)
+    if not array_equal(expected, convolution) or \
+            not array_equal(expected, matrix):
+        print("ALERT: ring of %d coefficients in GF(2^%d)"
+              % (nRows, wordSize))
+        return False
+    return True
+
+
+def test_wideRejected(wordSize):
+    '''Over the field tables the vectorized field must be refused with a
+       ValueError, not with an ArithmeticError about the modulo.
+    '''
+    try:
+        getVectorizedField(wordSize)
+    except ValueError:
+        return True
+    except Exception as e:
+        print("ALERT: GF(2^%d) raised %s: %s"
+              % (wordSize, e.__class__.__name__, e))
+        return False
+    print("ALERT: GF(2^%d) was built over the tables limit" % (wordSize))
+    return False
+
+
+def test_badModulo():
+    '''A reducible modulo and one too big for the tables are told apart.
+    '''
+    for modulo, error in [(0x11a, ArithmeticError),  # z divides it
+                          ((1 << 17) | 0x9, ValueError)]:
+        try:
+            VectorizedField(modulo)
+        except error:
+            continue
+        except Exception as e:
+            print("ALERT: modulo %s raised %s: %s"
+                  % (hex(modulo), e.__class__.__name__, e))
+            return False
+        print("ALERT: modulo %s was accepted" % (hex(modulo)))
+        return False
+    return True
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option('', "--samples", type='int', default=50)
+    parser.add_option('', "--seed", type='str', default='gRijndael')
+    (options, args) = parser.parse_args()
+    import sys
+    random = Random(options.seed)
+    for wordSize in range(2, 17):
+        if not test_field(wordSize, options.samples, random):
+            sys.exit(-1)
+        for nRows in range(2, 9):
+            if not test_ring(nRows, wordSize, options.samples, random):
+                sys.exit(-1)
+    if not test_wideRejected(17) or not test_badModulo():
+        sys.exit(-1)
+    print("Vectorized fields and rings match the polynomial objects.")
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main()
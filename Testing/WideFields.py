@@ -0,0 +1,213 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+"""
+    Checks of the word sizes over 16 bits (the fields without log/antilog
+    tables): the windowed product, the reductions, the Itoh-Tsujii inverse
+    and a cipher round trip. With --benchmark it measures the time per
+    block and per inversion (Itoh-Tsujii against the egcd), and the product
+    in the big fields (against the bit serial product and long division).
+"""
+
+from datetime import datetime
+from gRijndael import gRijndael
+from gRijndael.Polynomials import BinaryExtensionModulo
+from gRijndael.Polynomials import getBinaryExtensionFieldModulo
+from gRijndael.Polynomials.FieldTables import _carrylessMultiply
+from gRijndael.Polynomials.FieldTables import _polynomialModulo
+from gRijndael.Polynomials.FieldTables import getReduction
+from gRijndael.Polynomials.FieldTables import getWideFieldOperations
+from gRijndaelTest import extractParams
+from optparse import OptionParser
+from random import Random
+
+
+DEFAULT_WORDSIZES = [17, 24, 32, 48, 64]
+# the NIST binary fields (sparse moduli) and a dense one
+LARGE_MODULI = [(1 << 163) | (1 << 7) | (1 << 6) | (1 << 3) | 1,
+                (1 << 233) | (1 << 74) | 1,
+                (1 << 283) | (1 << 12) | (1 << 7) | (1 << 5) | 1,
+                (1 << 409) | (1 << 87) | 1,
+                (1 << 571) | (1 << 10) | (1 << 5) | (1 << 2) | 1,
+                0x1FEDCBA9876543211]
+
+
+def test_field(wordSize, samples, random):
+    '''Windowed product and Itoh-Tsujii inverse against the bit serial
+       product and the egcd.
+    '''
+    modulo = getBinaryExtensionFieldModulo(wordSize)
+    product, inverse = getWideFieldOperations(modulo)
+    field = BinaryExtensionModulo(modulo)
+    for i in range(samples):
+        a = random.randint(1, 2**wordSize-1)
+        b = random.randint(0, 2**wordSize-1)
+        if product(a, b) != _carrylessMultiply(a, b, modulo):
+            print("ALERT: GF(2^%d) product %s * %s" % (wordSize, hex(a),
+                                                      hex(b)))
+            return False
+        _, egcdInverse, _ = field(a).__egcd__(a, modulo)
+        if inverse(a) != egcdInverse or (~field(a)).coefficients != \
+                egcdInverse:
+            print("ALERT: GF(2^%d) inverse of %s" % (wordSize, hex(a)))
+            return False
+    return True
+
+
+def test_largeModulo(modulo, samples, random):
+    '''Products, reductions and inverses of BinaryExtensionModulo with big
+       moduli.
+    '''
+    degree = modulo.bit_length()-1
+    field = BinaryExtensionModulo(modulo)
+    reduce = getReduction(modulo)
+    isField = getWideFieldOperations(modulo) is not None
+    for i in range(samples):
+        a = random.randint(1, 2**degree-1)
+        b = random.randint(0, 2**degree-1)
+        c = random.randint(0, 2**(2*degree-1)-1)
+        if (field(a)*field(b)).coefficients != \
+                _carrylessMultiply(a, b, modulo) or \
+                reduce(c) != _polynomialModulo(c, modulo) or \
+                field(c).coefficients != _polynomialModulo(c, modulo):
+            print("ALERT: product or reduction modulo %s" % (hex(modulo)))
+            return False
+        if isField and (field(a)*~field(a)) != field.one:
+            print("ALERT: inverse of %s modulo %s" % (hex(a), hex(modulo)))
+            return False
+    return True
+
+
+def test_cipher(params, samples, random):
+    nRounds, nRows, nColumns, wordSize, nKeyColumns = params
+    key = random.randint(0, 2**(nRows*nKeyColumns*wordSize)-1)
+    rijndael = gRijndael(key, *params)
+    for i in range(samples):
+        block = random.randint(0, 2**(nRows*nColumns*wordSize)-1)
+        if rijndael.decipher(rijndael.cipher(block)) != block:
+            print("ALERT: gRijndael%s round trip of %s" % (params,
+                                                           hex(block)))
+            return False
+    return True
+
+
+def benchmark(wordSize, blocks, random):
+    params = (10, 4, 4, wordSize, 4)
+    modulo = getBinaryExtensionFieldModulo(wordSize)
+    field = BinaryExtensionModulo(modulo)
+    elements = [random.randint(1, 2**wordSize-1) for i in range(1000)]
+    t0 = datetime.now()
+    for a in elements:
+        field(a).__multiplicativeInverse__()
+    itohTsujii = (datetime.now()-t0).total_seconds()/len(elements)
+    t0 = datetime.now()
+    for a in elements:
+        field(a).__egcd__(a, modulo)
+    egcd = (datetime.now()-t0).total_seconds()/len(elements)
+    key = random.randint(0, 2**(16*wordSize)-1)
+    rijndael = gRijndael(key, *params)
+    block = random.randint(0, 2**(16*wordSize)-1)
+    t0 = datetime.now()
+    for i in range(blocks):
+        block = rijndael.cipher(block)
+    cipher = (datetime.now()-t0).total_seconds()/blocks
+    t0 = datetime.now()
+    for i in range(blocks):
+        block = rijndael.decipher(block)
+    decipher = (datetime.now()-t0).total_seconds()/blocks
+    print("w=%2d: inverse %7.1f us (egcd %7.1f us), cipher %7.2f ms/block "
+          "(%7.1f KiB/s), decipher %7.2f ms/block"
+          % (wordSize, itohTsujii*1e6, egcd*1e6, cipher*1e3,
+             16*wordSize/8./1024/cipher, decipher*1e3))
+
+
+def benchmarkLargeModulo(modulo, random):
+    degree = modulo.bit_length()-1
+    field = BinaryExtensionModulo(modulo)
+    elements = [field(random.randint(1, 2**degree-1)) for i in range(201)]
+    t0 = datetime.now()
+    for a, b in zip(elements[:-1], elements[1:]):
+        a*b
+    product = (datetime.now()-t0).total_seconds()/(len(elements)-1)
+    t0 = datetime.now()
+    for a, b in zip(elements[:-1], elements[1:]):
+        field.__division__(_bitSerialProduct(a, b), modulo)
+    bitSerial = (datetime.now()-t0).total_seconds()/(len(elements)-1)
+    print("w=%3d (%d terms): product %7.1f us (bit serial and long division "
+          "%7.1f us)" % (degree, bin(modulo).count('1'), product*1e6,
+                         bitSerial*1e6))
+
+
+def _bitSerialProduct(a, b):
+    a = a.coefficients
+    b = b.coefficients
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        b >>= 1
+        a <<= 1
+    return result
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option('', "--samples", type='int', default=50)
+    parser.add_option('', "--seed", type='str', default='gRijndael')
+    parser.add_option('', "--wordsize", type='int', action='append',
+                      help="Word size to check (can be used many times).")
+    parser.add_option('', "--rijndael", type='str', action='append',
+                      help="Comma separated set of Rijndael's generalised"
+                      "parameters for the round trip checks.")
+    parser.add_option('', "--benchmark", action="store_true", default=False)
+    parser.add_option('', "--blocks", type='int', default=10,
+                      help="Blocks per benchmark operation.")
+    (options, args) = parser.parse_args()
+    import sys
+    random = Random(options.seed)
+    wordSizes = options.wordsize or DEFAULT_WORDSIZES
+    if options.benchmark:
+        for wordSize in wordSizes:
+            benchmark(wordSize, options.blocks, random)
+        for modulo in LARGE_MODULI:
+            benchmarkLargeModulo(modulo, random)
+        sys.exit(0)
+    if options.rijndael:
+        paramsList = [extractParams(each) for each in options.rijndael]
+    else:
+        paramsList = [(10, 4, 4, wordSize, 4) for wordSize in wordSizes]
+    for wordSize in wordSizes:
+        if not test_field(wordSize, options.samples, random):
+            sys.exit(-1)
+    for modulo in LARGE_MODULI:
+        if not test_largeModulo(modulo, options.samples, random):
+            sys.exit(-1)
+    for params in paramsList:
+        if not test_cipher(params, max(options.samples//10, 1), random):
+            sys.exit(-1)
+    print("Wide word sizes operations match and the cipher round trips.")
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,7 @@ __copyright__ = "Copyright 2013 Sergi Blanch-Torne"
 __license__ = "GPLv3+"
 __status__ = "development"
 
+from threading import Lock as _Lock
 from .Logger import Logger as _Logger
 from .Logger import XORctr as _XORctr
 from .SBox import SBox as _SBox
@@ -40,7 +41,6 @@ class KeyExpansion(_Logger, _XORctr):
                  nRounds=10, nRows=4, nColumns=4, wordSize=8,  # stardard aes
                  nKeyWords=None, loglevel=_Logger._info, *args, **kwargs):
         super(KeyExpansion, self).__init__(loglevel, *args, **kwargs)
-        self.__key = key
         self.__nRounds = nRounds
         self.__nRows = nRows
         self.__nColumns = nColumns
@@ -52,21 +52,20 @@ class KeyExpansion(_Logger, _XORctr):
         self.__sbox = _SBox(self.__wordSize, loglevel=loglevel)
         self.includeInstance(self.__sbox)
         self.__word = _Word(self.__nRows, self.__wordSize)
-        self.__keyExpanded = [None]*self.__nKeyWords
-        self._debug_stream("key", key, operation="keyExpansion()\t")
-        try:
-            key = _Long(self.__wordSize).toArray(key,
-                                                 self.__nKeyWords *
-                                                 self.__nRows *
-                                                 self.__wordSize)
-        except:
-            raise Exception("Key length doesn't fit with the matrix size")
-        self._debug_stream("key array", key, operation="keyExpansion()\t")
-        self.__initialize(key)
-        self._debug_stream("keyExpanded", self.__keyExpanded,
-                           operation="keyExpansion()\t")
-        self._debug_stream("size of key expanded %d"
-                           % (len(self.__keyExpanded)))
+        # the subkeys are expanded on demand (the last ones only when
+        # deciphering), and concurrent calls shall not expand twice
+        self.__expandLock = _Lock()
+        self.__keyExpanded = self.__initialize(key)
+
+    def rekey(self, key):
+        '''Change the key: the subkeys are expanded again (on demand, like
+           with the first key) reusing everything else (the SBox). Calls
+           using the subkeys while rekeying shall be avoided.
+           Input: <integer> key
+        '''
+        keyExpanded = self.__initialize(key)
+        with self.__expandLock:
+            self.__keyExpanded = keyExpanded
 
     def __str__(self):
         parentesis = "%d, %d, %d, %d" % (self.__nRounds, self.__nRows,
@@ -79,11 +78,36 @@ class KeyExpansion(_Logger, _XORctr):
     def __repr__(self):
         return "%s" % (self.__str__())
 
+    def __getstate__(self):
+        '''Pickle the parameters and the subkeys expanded so far (then they
+           are not expanded again when unpickled).
+        '''
+        state = self.__dict__.copy()
+        del state['_KeyExpansion__expandLock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__expandLock = _Lock()
+
     def __initialize(self, key):
+        '''The first nKeyWords words of the key schedule: the key itself.'''
+        self._debug_stream("key", key, operation="keyExpansion()\t")
+        try:
+            key = _Long(self.__wordSize).toArray(key,
+                                                 self.__nKeyWords *
+                                                 self.__nRows *
+                                                 self.__wordSize)
+        except:
+            raise Exception("Key length doesn't fit with the matrix size")
+        self._debug_stream("key array", key, operation="keyExpansion()\t")
+        keyExpanded = []
         for i in range(self.__nKeyWords):
             subkey = key[(self.__nRows*i):(self.__nRows*i)+self.__nRows]
-            self.__keyExpanded[i] = \
-                _Word(self.__nRows, self.__wordSize).fromList(subkey)
+            keyExpanded.append(self.__word.fromList(subkey))
+        self._debug_stream("keyExpanded", keyExpanded,
+                           operation="keyExpansion()\t")
+        return keyExpanded
 
     def __expand(self, end):
         i = len(self.__keyExpanded)
@@ -115,17 +139,21 @@ class KeyExpansion(_Logger, _XORctr):
             i += 1
 
     def getKey(self):
-        if len(self.__keyExpanded) < self.__nKeyWords*(self.__nRounds+1):
-            self.__expand(self.__nKeyWords*(self.__nRounds+1))
+        self.__expandUpTo(self.__nKeyWords*(self.__nRounds+1))
         return self.__keyExpanded
 
+    def __expandUpTo(self, end):
+        if len(self.__keyExpanded) < end:
+            with self.__expandLock:
+                if len(self.__keyExpanded) < end:
+                    self.__expand(end)
+
     def getSubKey(self, start, end):
         subkey = self.__keyExpanded[start:end]
         ashexlist = ["%s" % hex(each) for each in subkey]
         self._debug_stream("Requested part of the key expanded. k[%d:%d] = %s"
                            % (start, end, ashexlist))
-        if len(self.__keyExpanded) < end:
-            self.__expand(end)
+        self.__expandUpTo(end)
         return self.__keyExpanded[start:end]
 
     def __rotWord(self, w):
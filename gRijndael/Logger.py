@@ -22,14 +22,15 @@ __copyright__ = "Copyright 2013 Sergi Blanch-Torne"
 __license__ = "GPLv3+"
 __status__ = "development"
 
-import bz2
-import gzip
 from datetime import datetime as _datetime
 from threading import Lock as _Lock
 from sys import version_info
 
 global lock
 lock = _Lock()
+# the increments of the xors counters are read-modify-write operations,
+# that lose counts when threads share the counter without it
+_xorsLock = _Lock()
 
 if version_info.major == 3:
     long = int
@@ -225,6 +226,9 @@ class Logger(object):
                 msg += "%s" % (data)
         if self._log2file:
             fileName = self.getLogFileName()
+            # the compression modules are only needed logging to files
+            import bz2
+            import gzip
             if self._file_compression == 'bz2':
                 with bz2.BZ2File(fileName, 'at', compresslevel=9) as logfile:
                     logfile.write(msg+"\n")
@@ -289,7 +293,8 @@ class XORctr(object):
         self._instances = []
 
     def reset(self):
-        self._ctr = 0
+        with _xorsLock:
+            self._ctr = 0
 
     @property
     def xors(self):
@@ -304,15 +309,31 @@ class XORctr(object):
 
     @xors.setter
     def xors(self, value):
-        # print("adding ", value)
-        self._ctr += value
-        # print("accum: %s" % self._ctr)
+        with _xorsLock:
+            self._ctr += value
 
     def includeInstance(self, instance):
         if hasattr(instance, 'xors') or type(instance) in [list]:
             self._instances.append(instance)
 
 
+class ClassXORctr(object):
+    '''Descriptor for the 'xors' attribute of classes with many small
+       instances (like the field elements) where a per instance counter is
+       too expensive. The xors are accumulated in the class: reading it
+       (from the class or from any instance) returns the accumulation of all
+       the instances, and assigning in an instance adds to it (like XORctr).
+       To count the xors of some operations, use the difference between
+       two readings.
+    '''
+    def __get__(self, instance, owner):
+        return owner._xorsCtr
+
+    def __set__(self, instance, value):
+        with _xorsLock:
+            type(instance)._xorsCtr += value
+
+
 def debug(decoratedMethod):
     def magic(self, *args, **kwargs):
         try:
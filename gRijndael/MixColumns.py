@@ -23,6 +23,7 @@ __license__ = "GPLv3+"
 __status__ = "development"
 
 from copy import deepcopy as _deepcopy
+from threading import Lock as _Lock
 from .Logger import Logger as _Logger
 from .Logger import XORctr as _XORctr
 from .Polynomials import BinaryExtensionModulo as _BinaryExtensionModulo
@@ -48,16 +49,43 @@ class MixColumns(_Logger, _XORctr):
         self.__nRows = nRows
         self.__nColumns = nColumns
         self.__wordSize = wordSize
-        if (2 <= self.__nRows <= 16) and (2 <= self.__wordSize <= 16):
+        self.__build()
+        # d(x) = c(x)^-1 is only needed to decipher, then it is built
+        # on the first inverse operation
+        self.__dx = None
+
+    def __build(self):
+        '''The ring, its field and c(x) (what doesn't pickle).'''
+        try:
+            # the constants over 8 rows or 16 bits word size are the
+            # SearchedConstants ones
             self.__cx, self.__ring, self.__field = \
                 _getPolynomialRingWithBinaryCoefficients(self.__nRows,
-                                                         self.__wordSize)
-            self.__dx = ~self.__cx
-        else:
+                                                         self.__wordSize,
+                                                         packed=True)
+        except KeyError:
             raise Exception("(__init__)", "There is no MixColumns for the pair"
                             " %d degree ring (number of rows) "
                             "with %d degree coefficients (word size)"
                             % (self.__nRows, self.__wordSize))
+        self.__dxLock = _Lock()
+
+    def __getstate__(self):
+        '''Pickle the parameters, and d(x) (if it has been built) as its
+           packed integer to not repeat its inversion when unpickled.
+        '''
+        state = self.__dict__.copy()
+        for name in ['__cx', '__ring', '__field', '__dxLock']:
+            del state['_MixColumns'+name]
+        if self.__dx is not None:
+            state['_MixColumns__dx'] = self.__dx._packed
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__build()
+        if self.__dx is not None:
+            self.__dx = self.__ring(self.__dx)
 
     def __str__(self):
         parentesis = "%d, %d, %d" % (self.__nRows, self.__nColumns,
@@ -73,7 +101,7 @@ class MixColumns(_Logger, _XORctr):
 
     @property
     def SubfieldModulo(self):
-        return _deepcopy(self.__cx._coefficients[0].modulo)
+        return self.__field.zero.modulo
 
     @property
     def Cx(self):
@@ -81,13 +109,21 @@ class MixColumns(_Logger, _XORctr):
 
     @property
     def Dx(self):
-        return self.__dx.__hex__()
+        return self.__getDx().__hex__()
+
+    def __getDx(self):
+        if self.__dx is None:
+            with self.__dxLock:
+                if self.__dx is None:
+                    self.__dx = ~self.__cx
+        return self.__dx
 
     def do(self, input):
         return self.__product(input, self.__cx, operation="mixColumns")
 
     def invert(self, input):
-        return self.__product(input, self.__dx, operation="InvMixColumns")
+        return self.__product(input, self.__getDx(),
+                              operation="InvMixColumns")
 
     def __product(self, input, polynomial, operation):
         self._debug_stream("input: %s" % (printlist(input)),
@@ -115,26 +151,19 @@ class MixColumns(_Logger, _XORctr):
     def __matrix2Polynomials(self, input):
         columns = []
         for c in range(self.__nColumns):
-            column = []
-            for r in range(self.__nRows):
-                column.append(self.__field(input[r][c]))
             # s(r-1,c)*x^(r-1) + s(r-2,c)*x^(r-2) + ... + s(0,c)*x^(r-r)
-            columns.append(self.__ring(column))
+            # packed with the coefficient of degree r in the bits [r*w,(r+1)*w)
+            packed = 0
+            for r in range(self.__nRows-1, -1, -1):
+                packed = (packed << self.__wordSize) | input[r][c]
+            columns.append(self.__ring(packed))
         return columns
 
     def _polynomials2matrix(self, input):
-        # FIXME: this undo the __matrix2Polynomials(), but can it be optimized?
-        matrix = []
-        for r in range(self.__nRows):
-            matrix.append([])
-            for c in range(self.__nColumns):
-                matrix[r].append(None)
+        matrix = [[None]*self.__nColumns for r in range(self.__nRows)]
         for c, column in enumerate(input):
-            column = column.coefficients
-            while len(column) < self.__nRows:
-                column.append(self.__field(0))
-            for r, cell in enumerate(column):
-                matrix[r][c] = cell.coefficients
+            for r, cell in enumerate(column.lanes):
+                matrix[r][c] = cell
         return matrix
 
 
@@ -0,0 +1,605 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+"""
+    Modes of operation (ECB, CBC, CFB, OFB and CTR) over any gRijndael
+    instance, with an incremental interface:
+
+    >>> from gRijndael import gRijndael
+    >>> from gRijndael.Modes import CBC
+    >>> rijndael = gRijndael(key, 11, 4, 5, 3, 3)  # 60 bits blocks
+    >>> encryptor = CBC(rijndael, iv)
+    >>> cipherText = encryptor.update(data) + encryptor.finalize()
+    >>> decryptor = CBC(rijndael, iv, decipher=True)
+    >>> decryptor.update(cipherText) + decryptor.finalize() == data
+    True
+
+    The data is a string of bytes, seen as a string of bits (most
+    significant first) that is cut in blocks of the cipher block size.
+    As the block size doesn't need to be a multiple of 8, the data is
+    processed in groups of lcm(blockSize, 8) bits, that are whole blocks
+    and whole bytes at the same time.
+    - ECB and CBC pad the last block with a 1 bit followed by 0 bits (the
+      bit padding of ISO/IEC 9797-1, method 2), and the padded bits are
+      completed with 0 bits to a whole number of bytes.
+    - CFB (with full block feedback), OFB and CTR produce as many bytes as
+      they receive.
+    The IVs and the initial counter are integers (like the blocks in
+    gRijndael.cipher()) or bytes-like objects of the same bits.
+"""
+
+
+from collections import OrderedDict as _OrderedDict
+from io import RawIOBase as _RawIOBase
+
+
+# Blocks per task sent to a worker of the parallel modes pools (a block
+# costs milliseconds in pure python, then the IPC of a task is negligible
+# and smaller tasks balance better the workers).
+PARALLEL_CHUNK_BLOCKS = 64
+# Key stream blocks kept by a CTRReader (the most recently used ones).
+CTR_READER_CACHE_BLOCKS = 64
+# the instance of each worker process (see _initWorker())
+_workerRijndael = None
+
+
+def _initWorker(rijndael):
+    '''Initializer of the pool processes: each one receives (pickled, with
+       the key already expanded) its own copy of the gRijndael.
+    '''
+    global _workerRijndael
+    _workerRijndael = rijndael
+
+
+def _ctrKeystream(counter, nBlocks):
+    '''Task of the ParallelCTR workers: the key stream of nBlocks counters
+       from the given one.
+       Output: <list> of blocks
+    '''
+    cipher = _workerRijndael.cipher
+    mask = (1 << _workerRijndael.blockSize)-1
+    return [cipher((counter+i) & mask) for i in range(nBlocks)]
+
+
+def _blocksTask(decipher, blocks):
+    '''Task of the parallel CBC and CFB workers: cipher (or decipher) a
+       shard of blocks.
+       Output: <list> of blocks
+    '''
+    if decipher:
+        operation = _workerRijndael.decipher
+    else:
+        operation = _workerRijndael.cipher
+    return [operation(block) for block in blocks]
+
+
+def _toBlock(value, blockSize, name):
+    '''The integer of an iv or counter given as integer or bytes.'''
+    if type(value) != int:
+        value = int.from_bytes(value, 'big')
+    if value < 0 or value >> blockSize:
+        raise AssertionError("The %s doesn't fit in a block of %d bits"
+                             % (name, blockSize))
+    return value
+
+
+def _gcd(a, b):
+    while b:
+        a, b = b, a % b
+    return a
+
+
+class _Mode(object):
+    '''Common part of the modes: the groups of blocks cut from the input
+       bytes, the pending bytes between update() calls and the conversions.
+       The subclasses implement _processBlocks() (and _finalBlocks() when
+       the last group is special).
+    '''
+    _padding = False
+
+    def __init__(self, rijndael, iv=None, decipher=False):
+        super(_Mode, self).__init__()
+        self._rijndael = rijndael
+        self._decipher = decipher
+        self._blockSize = rijndael.blockSize
+        self._mask = (1 << self._blockSize)-1
+        groupBits = self._blockSize*8//_gcd(self._blockSize, 8)
+        self._groupBytes = groupBits//8
+        self._groupBlocks = groupBits//self._blockSize
+        self._iv = None if iv is None else self._block(iv, "iv")
+        self._pending = bytearray()
+        self._finalized = False
+
+    @property
+    def rijndael(self):
+        return self._rijndael
+
+    @property
+    def blockSize(self):
+        return self._blockSize
+
+    @property
+    def iv(self):
+        return self._iv
+
+    def _block(self, value, name):
+        return _toBlock(value, self._blockSize, name)
+
+    def _split(self, value, nBlocks):
+        '''Cut an integer of nBlocks*blockSize bits in blocks.'''
+        return [(value >> (self._blockSize*(nBlocks-1-i))) & self._mask
+                for i in range(nBlocks)]
+
+    def _join(self, blocks):
+        value = 0
+        for block in blocks:
+            value = (value << self._blockSize) | block
+        return value
+
+    def update(self, data):
+        '''Process the data (any bytes-like object) and return the output
+           of the complete groups of blocks. What is left waits for the
+           next update() or the finalize().
+           Input: <bytes-like> data
+           Output: <bytes>
+        '''
+        if self._finalized:
+            raise AssertionError("update() after finalize()")
+        self._pending += data
+        groupBytes = self._groupBytes
+        # the padding modes keep the last group to undo the padding
+        if self._padding and self._decipher:
+            processable = max(len(self._pending)-1, 0)//groupBytes*groupBytes
+        else:
+            processable = len(self._pending)//groupBytes*groupBytes
+        view = memoryview(self._pending)
+        blocks = []
+        for start in range(0, processable, groupBytes):
+            value = int.from_bytes(view[start:start+groupBytes], 'big')
+            blocks += self._split(value, self._groupBlocks)
+        view.release()
+        blocks = self._processBlocks(blocks)
+        output = bytearray(processable)
+        groupBlocks = self._groupBlocks
+        for group, start in enumerate(range(0, processable, groupBytes)):
+            value = self._join(blocks[group*groupBlocks:
+                                      (group+1)*groupBlocks])
+            output[start:start+groupBytes] = value.to_bytes(groupBytes,
+                                                            'big')
+        del self._pending[:processable]
+        return bytes(output)
+
+    def finalize(self):
+        '''Process the pending data (with the padding of the mode).
+           Output: <bytes>
+        '''
+        if self._finalized:
+            raise AssertionError("finalize() called twice")
+        self._finalized = True
+        pending = bytes(self._pending)
+        self._pending = bytearray()
+        return self._finalBlocks(pending)
+
+    def _finalBlocks(self, pending):
+        '''Stream modes: the pending bits are completed with zeros to whole
+           blocks and the output is truncated to the input length.
+        '''
+        if len(pending) == 0:
+            return b""
+        bits = 8*len(pending)
+        nBlocks = -(-bits//self._blockSize)
+        filler = nBlocks*self._blockSize-bits
+        blocks = self._processBlocks(
+            self._split(int.from_bytes(pending, 'big') << filler, nBlocks))
+        return (self._join(blocks) >> filler).to_bytes(len(pending), 'big')
+
+    def _processBlocks(self, blocks):
+        raise NotImplementedError("Subclass responsibility")
+
+
+class _PaddingMode(_Mode):
+    '''Modes that need whole blocks: the input is padded with a 1 bit and 0
+       bits to complete the last block (always, then there is at least one
+       bit of padding) unless padding=False, when the input shall be a
+       whole number of blocks.
+    '''
+    def __init__(self, rijndael, iv=None, decipher=False, padding=True):
+        super(_PaddingMode, self).__init__(rijndael, iv, decipher)
+        self._padding = padding
+
+    def _finalBlocks(self, pending):
+        bits = 8*len(pending)
+        blockSize = self._blockSize
+        if not self._padding:
+            if bits % blockSize != 0:
+                raise AssertionError("Without padding the data shall be a "
+                                     "whole number of %d bits blocks"
+                                     % (blockSize))
+            if bits == 0:
+                return b""
+            blocks = self._processBlocks(
+                self._split(int.from_bytes(pending, 'big'),
+                            bits//blockSize))
+            return self._join(blocks).to_bytes(len(pending), 'big')
+        if not self._decipher:
+            nBlocks = bits//blockSize+1
+            filler = nBlocks*blockSize-bits-1
+            value = ((int.from_bytes(pending, 'big') << 1) | 1) << filler
+            value = self._join(self._processBlocks(self._split(value,
+                                                               nBlocks)))
+            outputBytes = -(-nBlocks*blockSize//8)
+            return (value << (8*outputBytes-nBlocks*blockSize)).\
+                to_bytes(outputBytes, 'big')
+        nBlocks = bits//blockSize
+        if nBlocks == 0 or bits-nBlocks*blockSize >= 8:
+            raise AssertionError("The cipher text is truncated")
+        value = int.from_bytes(pending, 'big') >> (bits-nBlocks*blockSize)
+        value = self._join(self._processBlocks(self._split(value, nBlocks)))
+        # remove the padding: the last 1 bit and the 0 bits after it
+        if value == 0:
+            raise AssertionError("Wrong padding")
+        dataBits = nBlocks*blockSize-(value & -value).bit_length()
+        if dataBits % 8 != 0:
+            raise AssertionError("Wrong padding")
+        return (value >> (nBlocks*blockSize-dataBits)).\
+            to_bytes(dataBits//8, 'big')
+
+
+class ECB(_PaddingMode):
+    '''Electronic codebook: each block ciphered independently.'''
+    def __init__(self, rijndael, decipher=False, padding=True):
+        super(ECB, self).__init__(rijndael, None, decipher, padding)
+        if decipher:
+            self._operation = rijndael.decipher
+        else:
+            self._operation = rijndael.cipher
+
+    def _processBlocks(self, blocks):
+        operation = self._operation
+        return [operation(block) for block in blocks]
+
+
+class CBC(_PaddingMode):
+    '''Cipher block chaining: C_i = E(P_i ^ C_{i-1}), with C_{-1} = iv.'''
+    def __init__(self, rijndael, iv, decipher=False, padding=True):
+        super(CBC, self).__init__(rijndael, iv, decipher, padding)
+        self._previous = self._iv
+
+    def _processBlocks(self, blocks):
+        output = []
+        previous = self._previous
+        if self._decipher:
+            decipher = self._rijndael.decipher
+            for block in blocks:
+                output.append(decipher(block) ^ previous)
+                previous = block
+        else:
+            cipher = self._rijndael.cipher
+            for block in blocks:
+                previous = cipher(block ^ previous)
+                output.append(previous)
+        self._previous = previous
+        return output
+
+
+class CFB(_Mode):
+    '''Cipher feedback (of the full block): C_i = P_i ^ E(C_{i-1}), with
+       C_{-1} = iv.
+    '''
+    def __init__(self, rijndael, iv, decipher=False):
+        super(CFB, self).__init__(rijndael, iv, decipher)
+        self._previous = self._iv
+
+    def _processBlocks(self, blocks):
+        output = []
+        previous = self._previous
+        cipher = self._rijndael.cipher
+        for block in blocks:
+            result = block ^ cipher(previous)
+            output.append(result)
+            previous = block if self._decipher else result
+        self._previous = previous
+        return output
+
+
+class OFB(_Mode):
+    '''Output feedback: the key stream is O_i = E(O_{i-1}), with
+       O_{-1} = iv (the same for ciphering and deciphering).
+    '''
+    def __init__(self, rijndael, iv, decipher=False):
+        super(OFB, self).__init__(rijndael, iv, decipher)
+        self._previous = self._iv
+
+    def _processBlocks(self, blocks):
+        output = []
+        previous = self._previous
+        cipher = self._rijndael.cipher
+        for block in blocks:
+            previous = cipher(previous)
+            output.append(block ^ previous)
+        self._previous = previous
+        return output
+
+
+class CTR(_Mode):
+    '''Counter: the key stream is E(counter+i) (modulo 2^blockSize), the
+       same for ciphering and deciphering. The counters of a group are
+       built together before ciphering them.
+    '''
+    def __init__(self, rijndael, counter, decipher=False):
+        super(CTR, self).__init__(rijndael, counter, decipher)
+        self._counter = self._iv
+
+    @property
+    def counter(self):
+        '''Counter of the next block.'''
+        return self._counter
+
+    def _processBlocks(self, blocks):
+        cipher = self._rijndael.cipher
+        mask = self._mask
+        counters = [(self._counter+i) & mask for i in range(len(blocks))]
+        self._counter = (self._counter+len(blocks)) & mask
+        return [block ^ cipher(counter)
+                for block, counter in zip(blocks, counters)]
+
+
+class _ParallelMode(object):
+    '''Pool of processes for the modes where the blocks of an update() can
+       be processed independently. The blocks are split in chunks of up to
+       PARALLEL_CHUNK_BLOCKS (smaller if needed to give work to all the
+       processes), the workers (each one with its own gRijndael) process
+       them and the results are put together in order. finalize() shuts
+       down the pool, like close() or leaving a "with" block.
+    '''
+    def _startPool(self, rijndael, processors, chunkBlocks):
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import cpu_count
+        if processors <= 0:
+            processors += cpu_count()
+        self._processors = max(processors, 1)
+        self._chunkBlocks = max(chunkBlocks, 1)
+        self._executor = ProcessPoolExecutor(self._processors,
+                                             initializer=_initWorker,
+                                             initargs=(rijndael,))
+
+    @property
+    def processors(self):
+        return self._processors
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def finalize(self):
+        try:
+            return super(_ParallelMode, self).finalize()
+        finally:
+            self.close()
+
+    def _chunks(self, nBlocks):
+        '''(start, length) of the chunks of nBlocks blocks.'''
+        size = max(min(self._chunkBlocks, nBlocks//self._processors), 1)
+        return [(start, min(size, nBlocks-start))
+                for start in range(0, nBlocks, size)]
+
+    def _parallel(self, decipher, blocks):
+        '''Cipher (or decipher) the blocks in the pool.'''
+        chunks = self._chunks(len(blocks))
+        results = self._executor.map(
+            _blocksTask, [decipher]*len(chunks),
+            [blocks[start:start+length] for start, length in chunks])
+        return [block for result in results for block in result]
+
+
+class ParallelCTR(_ParallelMode, CTR):
+    '''CTR with the key stream generated in a pool of processes: the
+       workers receive only the first counter and the length of their
+       chunk, and return its key stream.
+    '''
+    def __init__(self, rijndael, counter, decipher=False, processors=0,
+                 chunkBlocks=PARALLEL_CHUNK_BLOCKS):
+        CTR.__init__(self, rijndael, counter, decipher)
+        self._startPool(rijndael, processors, chunkBlocks)
+
+    def _processBlocks(self, blocks):
+        if self._executor is None:  # finalize()
+            return CTR._processBlocks(self, blocks)
+        chunks = self._chunks(len(blocks))
+        keystreams = self._executor.map(
+            _ctrKeystream,
+            [(self._counter+start) & self._mask for start, length in chunks],
+            [length for start, length in chunks])
+        self._counter = (self._counter+len(blocks)) & self._mask
+        keystream = [block for result in keystreams for block in result]
+        return [block ^ key for block, key in zip(blocks, keystream)]
+
+
+class ParallelCBC(_ParallelMode, CBC):
+    '''CBC with the decryption in a pool of processes: P_i = D(C_i) ^
+       C_{i-1} only needs cipher texts, then the D(C_i) of the shards are
+       independent. The encryption is sequential (and made here).
+    '''
+    def __init__(self, rijndael, iv, decipher=False, padding=True,
+                 processors=0, chunkBlocks=PARALLEL_CHUNK_BLOCKS):
+        CBC.__init__(self, rijndael, iv, decipher, padding)
+        self._startPool(rijndael, processors, chunkBlocks)
+
+    def _processBlocks(self, blocks):
+        if not self._decipher or self._executor is None or not blocks:
+            return CBC._processBlocks(self, blocks)
+        deciphered = self._parallel(True, blocks)
+        previous = [self._previous]+blocks[:-1]
+        self._previous = blocks[-1]
+        return [block ^ chained
+                for block, chained in zip(deciphered, previous)]
+
+
+class ParallelCFB(_ParallelMode, CFB):
+    '''CFB with the decryption in a pool of processes: P_i = C_i ^
+       E(C_{i-1}) only needs cipher texts, then the E(C_{i-1}) of the
+       shards are independent. The encryption is sequential (and made
+       here).
+    '''
+    def __init__(self, rijndael, iv, decipher=False, processors=0,
+                 chunkBlocks=PARALLEL_CHUNK_BLOCKS):
+        CFB.__init__(self, rijndael, iv, decipher)
+        self._startPool(rijndael, processors, chunkBlocks)
+
+    def _processBlocks(self, blocks):
+        if not self._decipher or self._executor is None or not blocks:
+            return CFB._processBlocks(self, blocks)
+        keystream = self._parallel(False, [self._previous]+blocks[:-1])
+        self._previous = blocks[-1]
+        return [block ^ key for block, key in zip(blocks, keystream)]
+
+
+class CTRReader(_RawIOBase):
+    '''Read only file over a CTR cipher text with random access: reading
+       a range of bytes only ciphers the key stream blocks that cover it,
+       the block of the bit b being the counter + b//blockSize (then the
+       counter of the byte offset o is counter + 8*o//blockSize). The
+       most recently used key stream blocks are cached (up to cacheBlocks)
+       for the small reads around the same place.
+       The source can be a bytes-like object (bytes, mmap, ...), that is
+       sliced, or a binary file with seek() and read(). Closing the
+       reader doesn't close the source.
+
+       >>> with open(fileName, 'rb') as source:
+       ...     reader = CTRReader(rijndael, counter, source)
+       ...     reader.seek(2**30)
+       ...     plainText = reader.read(100)
+    '''
+    def __init__(self, rijndael, counter, source,
+                 cacheBlocks=CTR_READER_CACHE_BLOCKS):
+        super(CTRReader, self).__init__()
+        self._rijndael = rijndael
+        self._blockSize = rijndael.blockSize
+        self._mask = (1 << self._blockSize)-1
+        self._counter = _toBlock(counter, self._blockSize, "counter")
+        self._cache = _OrderedDict()
+        self._cacheBlocks = max(cacheBlocks, 0)
+        try:
+            self._view = memoryview(source).cast('B')
+            self._source = None
+            self._length = len(self._view)
+        except TypeError:
+            self._view = None
+            self._source = source
+            self._length = source.seek(0, 2)
+        self._position = 0
+
+    @property
+    def rijndael(self):
+        return self._rijndael
+
+    @property
+    def counter(self):
+        '''Counter of the first block.'''
+        return self._counter
+
+    def __len__(self):
+        return self._length
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        return self._position
+
+    def seek(self, offset, whence=0):
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        if whence == 1:
+            offset += self._position
+        elif whence == 2:
+            offset += self._length
+        elif whence != 0:
+            raise ValueError("Invalid whence (%r)" % (whence))
+        if offset < 0:
+            raise ValueError("Negative seek position %d" % (offset))
+        self._position = offset
+        return offset
+
+    def readinto(self, buffer):
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        destination = memoryview(buffer).cast('B')
+        offset = self._position
+        nBytes = max(min(len(destination), self._length-offset), 0)
+        if nBytes == 0:
+            return 0
+        if self._view is not None:
+            data = self._view[offset:offset+nBytes]
+        else:
+            self._source.seek(offset)
+            data = self._source.read(nBytes)
+            nBytes = len(data)
+        value = int.from_bytes(data, 'big') ^ self._keystream(offset, nBytes)
+        destination[:nBytes] = value.to_bytes(nBytes, 'big')
+        self._position += nBytes
+        return nBytes
+
+    def close(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        self._cache.clear()
+        super(CTRReader, self).close()
+
+    def _keystream(self, offset, nBytes):
+        '''Key stream bits of the bytes from the offset.'''
+        blockSize = self._blockSize
+        firstBit = 8*offset
+        endBit = 8*(offset+nBytes)
+        first = firstBit//blockSize
+        end = -(-endBit//blockSize)
+        value = 0
+        for index in range(first, end):
+            value = (value << blockSize) | self._keystreamBlock(index)
+        return (value >> (end*blockSize-endBit)) & ((1 << 8*nBytes)-1)
+
+    def _keystreamBlock(self, index):
+        cache = self._cache
+        if index in cache:
+            cache.move_to_end(index)
+            return cache[index]
+        block = self._rijndael.cipher((self._counter+index) & self._mask)
+        if self._cacheBlocks:
+            cache[index] = block
+            if len(cache) > self._cacheBlocks:
+                cache.popitem(last=False)
+        return block
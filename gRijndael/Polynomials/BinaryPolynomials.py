@@ -23,15 +23,32 @@ __license__ = "GPLv3+"
 __status__ = "development"
 
 
-from copy import copy as _copy
-from copy import deepcopy as _deepcopy
 from sys import version_info
+from threading import Lock as _Lock
 
 from ..Logger import Logger as _Logger
-from ..Logger import XORctr as _XORctr
-
-
-def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
+from ..Logger import ClassXORctr as _ClassXORctr
+from ..Logger import _xorsLock
+from . import SearchedConstants as _SearchedConstants
+from .FieldTables import TABLES_MAX_WORDSIZE as _TABLES_MAX_WORDSIZE
+from .FieldTables import _itohTsujiiChain
+from .FieldTables import _windowedProduct
+from .FieldTables import batchInverse as _batchInverse
+from .FieldTables import getReduction as _getReduction
+from .FieldTables import getWideFieldOperations as _getWideFieldOperations
+
+
+# The factory returns the same class for the same (modulo, variable,
+# loglevel), then elements built from different places (like the SBox and
+# the MixColumns) are of the same type and can be compared by identity.
+_binaryExtensionModuloClasses = {}
+# Up to this word size the elements can be interned (flyweights).
+INTERNING_MAX_WORDSIZE = 16
+_binaryExtensionModuloLock = _Lock()
+
+
+def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info,
+                          interning=True):
     '''
         BinaryExtensionModulo is a builder for \mathbb{F}_{2^w} (or GF(2^w) in
         another notation) elements. Finite field or ring with characteristic 2
@@ -50,10 +67,19 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
           strings representing the polynomials.
         - loglevel: by default info, based on the superclass Logger
           enumeration.
+        - interning: by default True, and only applies when the word size is
+          up to INTERNING_MAX_WORDSIZE. Each value is then built once and
+          the constructor returns the same immutable instance (with the
+          inverse and the hamming weight cached in it).
+
+        The classes are memoized: building again with the same arguments
+        returns the same class.
 
         Example:
         >>> import Polynomials
         >>> field = Polynomials.BinaryExtensionModulo('z^8+z^4+z^3+z+1')
+        >>> field is Polynomials.BinaryExtensionModulo(0x11B)
+        True
     '''
     # This help is shown when
     # >>> Polynomials.BinaryExtensionModulo?
@@ -69,8 +95,76 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
         raise Exception("modulo %s is not defined over %s variable"
                         % (modulo, variable))
 
-    class BinaryExtensionModuloConstructor(_Logger, _XORctr):
-        def __init__(self, value, *args, **kwargs):
+    # the modulo is interpreted once, when the class is built
+    if type(modulo) == int:
+        moduloBits = modulo
+    elif type(modulo) == str:
+        moduloBits = _interpretFromStr(modulo, variable)
+    else:
+        try:  # Do a last try to interpret the modulo
+            moduloBits = int(modulo)
+        except Exception as e:
+            raise AssertionError("The given modulo type '%s'"
+                                 "is not interpretable" % (type(modulo)))
+    interning = bool(interning) and \
+        moduloBits.bit_length()-1 <= INTERNING_MAX_WORDSIZE
+    key = (moduloBits, variable, loglevel, interning)
+    with _binaryExtensionModuloLock:
+        if key not in _binaryExtensionModuloClasses:
+            _binaryExtensionModuloClasses[key] = \
+                _buildBinaryExtensionModulo(moduloBits, variable, loglevel,
+                                            interning)
+        return _binaryExtensionModuloClasses[key]
+
+
+def _buildBinaryExtensionModulo(moduloBits, indeterminate, loglevel,
+                                interning):
+    '''Build the element class of BinaryExtensionModulo (that memoizes it).
+       Input: <integer> moduloBits
+              <str> indeterminate (the variable)
+              <integer> loglevel
+              <boolean> interning
+       Output: <class>
+    '''
+    # 'variable' and 'modulo' are properties in the class body, then the
+    # arguments use other names.
+    class BinaryExtensionModuloConstructor(object):
+        # The elements are immutable and only store its coefficients. What is
+        # common to all of them (modulo, variable, logger and xor counter)
+        # lives in the class, that is built once by the factory.
+        # With interning, '_elements' is the table of the already built
+        # elements (indexed by its coefficients) and the constructor
+        # returns them instead of a new instance.
+        __slots__ = ('_coefficients', '_hammingWeight', '_inverse')
+        _variable = indeterminate
+        _modulo = moduloBits
+        _modulodegree = moduloBits.bit_length()
+        _logger = _Logger(loglevel)
+        _xorsCtr = 0
+        xors = _ClassXORctr()
+        if interning:
+            _elements = [None]*(1 << (moduloBits.bit_length()-1))
+        else:
+            _elements = None
+        # Over the tables word size the products are windowed and the
+        # reductions use the shape of the modulo (see FieldTables).
+        if moduloBits.bit_length()-1 > _TABLES_MAX_WORDSIZE:
+            _reduce = staticmethod(_getReduction(moduloBits))
+        else:
+            _reduce = None
+        # Fields without tables (see FieldTables) invert by Itoh-Tsujii
+        # that, unlike the egcd, has a fixed sequence of operations.
+        if moduloBits.bit_length()-1 > _TABLES_MAX_WORDSIZE and \
+                _getWideFieldOperations(moduloBits) is not None:
+            _wideInverse = staticmethod(
+                _getWideFieldOperations(moduloBits)[1])
+            _wideInverseXors = \
+                (len(_itohTsujiiChain(moduloBits.bit_length()-2))+1) * \
+                (moduloBits.bit_length()-1)**2
+        else:
+            _wideInverse = None
+
+        def __new__(cls, value, *args, **kwargs):
             '''
                 Once have the builder of elements it can be used to generate
                 objects that represents and have operations defined. The allow
@@ -90,45 +184,65 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
             '''
             # This help is shown when, from the last one
             # >>> field?
-            # FIXME: improve the logging on this class
-            super(BinaryExtensionModuloConstructor, self).__init__(*args,
-                                                                   **kwargs)
-            self._variable = variable
-            if type(value) == BinaryExtensionModuloConstructor or \
-               value.__class__ == BinaryExtensionModuloConstructor:
-                self._coefficients = value.coefficients
-            elif type(value) == int:
-                self._coefficients = abs(value)
+            if type(value) == int:
+                coefficients = abs(value)
+            elif type(value) is cls:
+                return value  # immutable
+            elif type(value) == BinaryExtensionModuloConstructor:
+                coefficients = value._coefficients
             elif type(value) == str:
-                self._coefficients = self.__interpretFromStr__(value)
+                coefficients = _interpretFromStr(value, cls._variable)
             else:
                 try:  # Do a last try to interpret the coefficients
-                    self._coefficients = int(value)
+                    coefficients = int(value)
                 except Exception as e:
                     raise AssertionError("The given coefficients type '%s'"
                                          "is not interpretable"
                                          % (type(value)))
-            self._gcd = None
-            self._multinv = None
-            self._debug_stream("coefficients", self._coefficients)
-            if type(modulo) == int:
-                self._modulo = modulo
-            elif type(modulo) == str:
-                self._modulo = self.__interpretFromStr__(modulo)
-            else:
-                try:  # Do a last try to interpret the coefficients
-                    self._modulo = int(modulo)
-                except Exception as e:
-                    raise AssertionError("The given modulo type '%s'"
-                                         "is not interpretable"
-                                         % (type(modulo)))
-            self._debug_stream("modulo", self._modulo)
             # if the degree of coefficients > degree of modulo,
             # do the reduction
-            if self.degree >= len("{0:b}".format(self._modulo)):
-                q, r = self.__division__(self._coefficients, self._modulo)
-                self._coefficients = r
-                self._debug_stream("reduced coefficients", self._coefficients)
+            if coefficients.bit_length() >= cls._modulodegree:
+                if cls._reduce is not None and \
+                        coefficients.bit_length() < 2*cls._modulodegree-2:
+                    # counted like the long division
+                    with _xorsLock:
+                        cls._xorsCtr += (cls._modulodegree-1) * \
+                            (coefficients.bit_length()-cls._modulodegree+1)
+                    coefficients = cls._reduce(coefficients)
+                else:
+                    q, coefficients = cls.__division__(coefficients,
+                                                       cls._modulo)
+            if cls._elements is not None:
+                self = cls._elements[coefficients]
+                if self is not None:
+                    return self
+            self = object.__new__(cls)
+            self._coefficients = coefficients
+            self._hammingWeight = None
+            self._inverse = None
+            if cls._elements is not None:
+                cls._elements[coefficients] = self
+            return self
+
+        @classmethod
+        def reset(cls):
+            '''Restart the xor counter of the class.'''
+            with _xorsLock:
+                cls._xorsCtr = 0
+
+        @property
+        def logLevel(self):
+            return self._logger.logLevel
+
+        @classmethod
+        def _isDebugging(cls):
+            return cls._logger._logLevel >= _Logger._debug
+
+        @classmethod
+        def _debug_stream(cls, logtext, data=None, round=None,
+                          operation=None):
+            if cls._logger._logLevel >= _Logger._debug:
+                cls._logger._debug_stream(logtext, data, round, operation)
 
         @property
         def coefficients(self):
@@ -148,7 +262,7 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
         @property
         def degree(self):
             """Get the degree of the polynomial"""
-            return len("{0:b}".format(self._coefficients))
+            return self._coefficients.bit_length() or 1
 
         @property
         def hammingWeight(self):
@@ -156,14 +270,16 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
                Hamming weight is defined as the number of non null elements. In
                the binary case, the number of ones.
             """
-            return bin(self._coefficients).count('1')
+            if self._hammingWeight is None:
+                self._hammingWeight = bin(self._coefficients).count('1')
+            return self._hammingWeight
 
         @property
         def modulodegree(self):
             """Get the degree of the modulo polynomial. That is the maximum
                that the elements on the field/ring defined could have.
             """
-            return len("{0:b}".format(self._modulo))
+            return self._modulodegree
 
         @property
         def isZero(self):
@@ -180,10 +296,8 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
             '''Show if the element is invertible modulo for the product
                operation.
             '''
-            if self._gcd is None:
-                self._gcd, self._multinv, _ = self.__egcd__(self._coefficients,
-                                                            self._modulo)
-            if self._gcd == 1:
+            gcd, _, _ = self.__egcd__(self._coefficients, self._modulo)
+            if gcd == 1:
                 return True
             return False
 
@@ -203,14 +317,25 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
         def __type__(self):
             return self.__class__
 
+        def __hash__(self):
+            return hash(self._coefficients)
+
+        def __copy__(self):
+            return self  # immutable
+
+        def __deepcopy__(self, memo):
+            return self  # immutable
+
         def checkTypes(function):
             '''Decorator to precheck the input parameters on some of the
                operations.
             '''
             def comparator(self, other):
-                if other.__class__ in [type(None), int]:
+                # the classes are memoized, then the usual case is identity
+                if other.__class__ is self.__class__ or \
+                        other.__class__ in [type(None), int]:
                     return function(self, other)
-                if str(other.__class__) != str(self.__class__):
+                if other.__class__.__name__ != self.__class__.__name__:
                     raise EnvironmentError("Cannot compare with non "
                                            "polynomials (%s,%s)"
                                            % (type(other), other.__class__))
@@ -247,57 +372,21 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
             return hex(self._coefficients)
 
         def __interpretToStr__(self, value):
-            if value == 0:
-                return '0'  # FIXME: the neutral element of the first operation
-            else:
-                terms = []  # coefficients representations list
-                bitlist = "{0:b}".format(value)
-                # FIXME: Improve this dirtied casuistry... Not efficient.
-                for idx, coefficient in enumerate(bitlist):
-                    exponent = len(bitlist)-idx-1
-                    if coefficient == '0':
-                        terms.append('')
-                    elif exponent == 0:  # and coefficient == '1'
-                        terms.append('+1')
-                    elif exponent == 1:  # and coefficient == '1'
-                        # equiv to z^1 but short
-                        terms.append('+%s' % (self._variable))
-                    else:
-                        terms.append('+%s^%d' % (self._variable, exponent))
-                collect = ''.join(["%s" % (r) for r in terms])
-                if collect[0] == '+':  # remove the first sign if present
-                    collect = collect[1:]
-                return collect
+            return _interpretToStr(value, self._variable)
 
         def __interpretFromStr__(self, string):
-            terms = string.strip().split('+')
-            value = 0
-            for i in range(len(terms)):
-                if terms[i] == '%s' % self._variable:
-                    value |= 1 << 1  # z^1
-                elif terms[i] == '1':
-                    value |= 1
-                elif terms[i].count(self._variable):
-                    exponent = int(terms[i].split('%s^' % self._variable)[1])
-                    value |= 1 << exponent
-                else:
-                    raise SyntaxError("the term %s cannot be interpreted"
-                                      % (terms[i]))
-            return value
+            return _interpretFromStr(string, self._variable)
 
         def __abs__(self):
-            abs = BinaryExtensionModuloConstructor(abs(self._coefficients))
-            abs.xors = self.xors
-            return abs
+            return BinaryExtensionModuloConstructor(abs(self._coefficients))
 
         def __len__(self):
-            bits = "{0:b}".format(self._coefficients)
-            if bits[0] == '-':
-                bits = bits[1:]
-            return len(bits)
+            return self._coefficients.bit_length() or 1
 
         @checkTypes
         def __eq__(self, other):  # => a == b
+            if other is self:  # the usual case when interning
+                return True
             if other is None:
                 return False
             if self._coefficients == other._coefficients:
@@ -328,18 +417,12 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
 
         @checkTypes
         def __add__(self, other):  # => a+b
-            a = _copy(self.coefficients)
-            b = _copy(other.coefficients)
-            s = BinaryExtensionModuloConstructor(a ^ b)
-            self.xors = other.xors + self.modulodegree-1
-            s.xors = self.xors
-            return s
+            self.xors = self._modulodegree-1
+            return BinaryExtensionModuloConstructor(self._coefficients ^
+                                                    other._coefficients)
 
         def __iadd__(self, other):  # => a += b
-            bar = self + other
-            s = BinaryExtensionModuloConstructor(bar._coefficients)
-            s.xors = self.xors
-            return s
+            return self + other
 
         def __pos__(self):  # => +a
             return self
@@ -351,18 +434,12 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
 
         def __sub__(self, other):  # => a-b
             # bar = -other it is itself
-            a = _copy(self.coefficients)
-            b = _copy(other.coefficients)
-            s = BinaryExtensionModuloConstructor(a ^ b)
-            self.xors = other.xors + self.modulodegree-1
-            s.xors = self.xors
-            return s
+            self.xors = self._modulodegree-1
+            return BinaryExtensionModuloConstructor(self._coefficients ^
+                                                    other._coefficients)
 
         def __isub__(self, other):  # => a-=b
-            bar = self - other
-            s = BinaryExtensionModuloConstructor(bar._coefficients)
-            s.xors = self.xors
-            return s
+            return self - other
 
         # * Product ----
 
@@ -371,26 +448,19 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
             '''
             '''
             if type(other) == int:  # a * n = [a, a,..., a]
-                res = []
-                for i in range(other):
-                    res.append(_deepcopy(self))
-                return res
-            a = _copy(self._coefficients)
-            b = _copy(other._coefficients)
+                return [self]*other
+            a = self._coefficients
+            b = other._coefficients
             res = self.__multiply__(a, b)
-            self._debug_stream("c = a * b = %s * %s = %s"
-                               % (self.__interpretToStr__(a),
-                                  self.__interpretToStr__(b),
-                                  self.__interpretToStr__(res)))
-            p = BinaryExtensionModuloConstructor(res)
-            p.xors = self.xors
-            return p
+            if self._isDebugging():
+                self._debug_stream("c = a * b = %s * %s = %s"
+                                   % (self.__interpretToStr__(a),
+                                      self.__interpretToStr__(b),
+                                      self.__interpretToStr__(res)))
+            return BinaryExtensionModuloConstructor(res)
 
         def __imul__(self, other):  # => a*=b
-            bar = self * other
-            p = BinaryExtensionModuloConstructor(bar._coefficients)
-            p.xors = self.xors + other.xors
-            return p
+            return self * other
 
         def xtimes(self):
             return self << 1
@@ -409,8 +479,14 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
                       <integer> b (multiplier)
                Output: <integer> (result of the polynomial product).
             '''
-            self._debug_stream("a %s" % self.__interpretToStr__(a))
-            self._debug_stream("b %s" % self.__interpretToStr__(b))
+            if self._isDebugging():
+                self._debug_stream("a %s" % self.__interpretToStr__(a))
+                self._debug_stream("b %s" % self.__interpretToStr__(b))
+            if self._reduce is not None:
+                # big moduli: windowed product (with the xors counted like
+                # the bit serial one)
+                self.xors = self._modulodegree*(self._modulodegree-1)
+                return _windowedProduct(a, b, self._modulodegree-1)
             result = 0
             mask = 1
             i = 0
@@ -419,11 +495,14 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
                 result = self.__multiplicationStep__(a, bit, i, result)
                 mask <<= 1
                 i += 1
+            # the xors of all the steps are counted at once
+            self.xors = (self._modulodegree-1)*i
             return result
 
         def __multiplicationStep__(self, a, bit, i, accum):
             '''Constant time function to calculate one of the steps in the
                multiplication.
+               Each step has modulodegree-1 xors (counted by __multiply__).
                Input: <integer> a (the first element of the product)
                       <boolean> bit (the bit of b on the step)
                       <integer> i (the exponent where 'bit' is located)
@@ -431,11 +510,8 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
                Output: <integer> (the accumulated result of the product)
             '''
             aShifted = a << i
-            self.xors = self.modulodegree-1
             newerAccum = accum ^ aShifted
             if bit:
-                self._debug_stream("aShifted: %s"
-                                   % self.__interpretToStr__(aShifted))
                 return newerAccum
             else:
                 return accum
@@ -507,7 +583,8 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
 
         # /% Division ----
 
-        def __division__(self, divident, divisor):
+        @classmethod
+        def __division__(cls, divident, divisor):
             '''
                Given two polynomials, divide them and return its quotient
                and rest.
@@ -516,71 +593,51 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
             '''
             if divisor == 0:
                 raise ZeroDivisionError
-            self._debug_stream("\n<division>")
-            gr_divident = len("{0:b}".format(divident))-1
-            gr_divisor = len("{0:b}".format(divisor))-1
+            debugging = cls._isDebugging()
+            if debugging:
+                cls._debug_stream("\n<division>")
+                cls._debug_stream("divident", divident)
+                cls._debug_stream("divisor", divisor)
+            gr_divident = divident.bit_length()-1
+            gr_divisor = divisor.bit_length()-1
             quotient = 0
             rest = divident
-            self._debug_stream("divident", divident)
-            self._debug_stream("divisor", divisor)
-            self._debug_stream("quotient", quotient)
-            self._debug_stream("rest", rest)
             shift = gr_divident-gr_divisor
-            while len("{0:b}".format(rest)) >= len("{0:b}".format(divisor)) \
-                    and shift >= 0:
-                # FIXME: this means deg(rest) >= deg(divisor),
-                #        but it's horrible
-                gr_rest = len("{0:b}".format(rest))-1
-                if shift > 0:
-                    temp = int("{0:b}".format(rest)[0:-shift], 2) << shift
-                else:
-                    temp = rest
-                self._debug_stream("temp", temp)
-                subs = divisor << shift
-                self._debug_stream("subs", subs)
-                if len("{0:b}".format(temp)) == len("{0:b}".format(subs)):
-                    self.xors = self.modulodegree-1
-                    bar = temp ^ subs
-                    self._debug_stream("temp ^ subs", bar)
-                    if shift > 0:
-                        mask = int('1'*shift, 2)
-                        quotient = quotient | 1 << (shift)
-                        rest = bar | (divident & mask)
-                    else:
-                        quotient |= 1
-                        rest = bar
-                self._debug_stream("quotient", quotient)
-                self._debug_stream("rest", rest)
+            xors = 0
+            while rest.bit_length() > gr_divisor and shift >= 0:
+                # deg(rest) >= deg(divisor)
+                if rest.bit_length() == gr_divident+1:
+                    xors += cls._modulodegree-1
+                    rest ^= divisor << shift
+                    quotient |= 1 << shift
+                    if debugging:
+                        cls._debug_stream("quotient", quotient)
+                        cls._debug_stream("rest", rest)
                 gr_divident -= 1
                 shift = gr_divident-gr_divisor
-            self._debug_stream("<\\division>\n")
+            with _xorsLock:
+                cls._xorsCtr += xors
+            if debugging:
+                cls._debug_stream("<\\division>\n")
             return (quotient, rest)
 
         def __div__(self, other):  # => a/b
             q, r = self.__division__(self._coefficients, other._coefficients)
-            q = BinaryExtensionModuloConstructor(q)
-            q.xors = self.xors
-            return q
+            return BinaryExtensionModuloConstructor(q)
             # FIXME: the constructor will reduce it having the rest
             #        and not the quotient
 
         def __idiv__(self, other):  # => a/=b
             q, r = self.__division__(self._coefficients, other._coefficients)
-            q = BinaryExtensionModuloConstructor(q)
-            q.xors = self.xors
-            return q
+            return BinaryExtensionModuloConstructor(q)
 
         def __mod__(self, other):  # => a%b
             q, r = self.__division__(self._coefficients, other._coefficients)
-            r = BinaryExtensionModuloConstructor(r)
-            r.xors = self.xors
-            return r
+            return BinaryExtensionModuloConstructor(r)
 
         def _imod__(self, other):  # => a%=b
             q, r = self.__division__(self._coefficients, other._coefficients)
-            r = BinaryExtensionModuloConstructor(r)
-            r.xors = self.xors
-            return r
+            return BinaryExtensionModuloConstructor(r)
 
         # ~ Multiplicative inverse ----
         # - operator.__inv__(a) => ~a
@@ -596,17 +653,10 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
                        <integer> y (polynomial bit representation)
             '''
             u, v = a, b
-            self._debug_stream("u", u)
-            self._debug_stream("v", v)
             g1, g2, h1, h2 = 1, 0, 0, 1
-            self._debug_stream("g1", g1)
-            self._debug_stream("g2", g2)
-            self._debug_stream("h1", h1)
-            self._debug_stream("h2", h2)
             while u != 0:
-                j = len("{0:b}".format(u))-len("{0:b}".format(v))
+                j = u.bit_length()-v.bit_length()
                 if j < 0:
-                    self._debug_stream("%d < 0" % j)
                     # u <-> v
                     u, v = v, u
                     # g1 <-> g2
@@ -617,14 +667,12 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
                 u = u ^ (v << j)
                 g1 = g1 ^ (g2 << j)
                 h1 = h1 ^ (h2 << j)
-                self.xors = (self.modulodegree-1)*3
-                self._debug_stream("\tu", u)
-                self._debug_stream("\tg1", g1)
-                self._debug_stream("\th1", h1)
+                self.xors = (self._modulodegree-1)*3
             d, g, h = v, g2, h2
-            self._debug_stream("d", d)
-            self._debug_stream("g", g)
-            self._debug_stream("h", h)
+            if self._isDebugging():
+                self._debug_stream("d", d)
+                self._debug_stream("g", g)
+                self._debug_stream("h", h)
             return d, g, h
 
         @checkTypes
@@ -637,14 +685,14 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
         # ~ Multiplicative inverse: ----
         #        - operator.__inv__(a) => ~a
         def __invert__(self):  # => ~a, that means like a^-1
-            if self._multinv is None:
-                self._multinv = self.__multiplicativeInverse__()
-            inv = BinaryExtensionModuloConstructor(self._multinv)
-            inv.xors = self.xors
-            return inv
+            if self._inverse is None:
+                self._inverse = BinaryExtensionModuloConstructor(
+                    self.__multiplicativeInverse__())
+            return self._inverse
 
         def __multiplicativeInverse__(self):
-            '''Multiplicative inverse based on ...
+            '''Multiplicative inverse based on the egcd (or Itoh-Tsujii for
+               the fields bigger than the FieldTables.TABLES_MAX_WORDSIZE).
                Input: <integer> a (polynomial bit representation)
                       <integer> m (modulo polynomial)
                Output: <integer> a^-1: a*a^-1 = 1 (mod m)
@@ -653,54 +701,64 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
             '''
             if self._coefficients == 0:  # FIXME: is this true?
                 return self
-            if self._gcd is None:
-                self._gcd, self._multinv, _ = self.__egcd__(self._coefficients,
-                                                            self._modulo)
-            self._debug_stream("gcd", self._gcd)
-            self._debug_stream("multiplicative inverse", self._multinv)
-            if self._gcd != 1:
+            if self._wideInverse is not None:
+                self.xors = self._wideInverseXors
+                return self._wideInverse(self._coefficients)
+            gcd, multinv, _ = self.__egcd__(self._coefficients, self._modulo)
+            if gcd != 1:
                 bar = self.__interpretToStr__(self._coefficients)
                 foo = self.__interpretToStr__(self._modulo)
                 raise ArithmeticError("The inverse of %s modulo %s "
                                       "doens't exist!"
                                       % (bar, foo))
             else:
-                return self._multinv  # % self._modulo
+                return multinv  # % self._modulo
+
+        @classmethod
+        def batchInverse(cls, values):
+            '''Multiplicative inverses of many elements with Montgomery's
+               trick (see FieldTables.batchInverse()): three products per
+               element and a single inversion. It pays when the inversion
+               is much more expensive than a product (like the Itoh-Tsujii
+               of the fields over the tables word size). As in
+               __multiplicativeInverse__(), the zero maps to zero.
+               Input: <list> of elements (or their representations)
+               Output: <list> of elements
+            '''
+            def product(a, b):
+                return (cls(a)*cls(b))._coefficients
+
+            def inverse(a):
+                return cls(a).__multiplicativeInverse__()
+
+            inverses = _batchInverse([cls(value)._coefficients
+                                      for value in values], product, inverse)
+            return [cls(inverse) for inverse in inverses]
 
         # <<>> Shifts ----
         def __lshift__(self, n):  # => <<
-            s = BinaryExtensionModuloConstructor(self._coefficients << n)
-            s.xors = self.xors
-            return s
+            return BinaryExtensionModuloConstructor(self._coefficients << n)
 
         def __rshift__(self, n):  # => >>
-            s = BinaryExtensionModuloConstructor(self._coefficients >> n)
-            s.xors = self.xors
-            return s
+            return BinaryExtensionModuloConstructor(self._coefficients >> n)
 
         def __ilshift__(self, n):  # => <<=
-            s = BinaryExtensionModuloConstructor(self._coefficients << n)
-            s.xors = self.xors
-            return s
+            return self << n
 
         def __irshift__(self, n):  # => >>=
-            s = BinaryExtensionModuloConstructor(self._coefficients >> n)
-            s.xors = self.xors
-            return s
+            return self >> n
 
         def _cyclic_lshift_(self, n):
             '''
             '''
-            s = BinaryExtensionModuloConstructor(self._bit_lshift_(n))
-            s.xors = self.xors
-            return s
+            return BinaryExtensionModuloConstructor(self._bit_lshift_(n))
 
         def _bit_lshift_(self, n):
             '''Using the polynomial coefficients as a bit string, return a bit
                string with a left side cyclic shift. It uses the modulo degree
                to do this shift within this length.
             '''
-            maxbits = self.modulodegree-1
+            maxbits = self._modulodegree-1
             first = (self._coefficients << n % maxbits) & 2**maxbits-1
             second = (self._coefficients >> (maxbits-(n % maxbits))
                       & 2**maxbits-1)
@@ -709,30 +767,84 @@ def BinaryExtensionModulo(modulo, variable='z', loglevel=_Logger._info):
         def _cyclic_rshift_(self, n):
             '''
             '''
-            s = BinaryExtensionModuloConstructor(self._bit_rshift_(n))
-            s.xors = self.xors
-            return s
+            return BinaryExtensionModuloConstructor(self._bit_rshift_(n))
 
         def _bit_rshift_(self, n):
             '''Using the polynomial coefficients as a bit string, return a bit
                string with a right side cyclic shift. It uses the modulo
                degree to do this shift within this length.
             '''
-            maxbits = self.modulodegree-1
+            maxbits = self._modulodegree-1
             first = (self._coefficients >> n % maxbits) & 2**maxbits-1
             second = (self._coefficients << (maxbits-(n % maxbits))
                       & 2**maxbits-1)
             return first | second
         # End class BinaryExtensionModuloConstructor ----
+    # neutral elements (singletons when interning)
+    BinaryExtensionModuloConstructor.zero = BinaryExtensionModuloConstructor(0)
+    BinaryExtensionModuloConstructor.one = BinaryExtensionModuloConstructor(1)
     return BinaryExtensionModuloConstructor
 
 
+def _interpretToStr(value, variable):
+    '''Polynomial notation of the bits in an integer.
+       Input: <integer> value
+              <str> variable
+       Output: <str>
+    '''
+    if value == 0:
+        return '0'  # FIXME: the neutral element of the first operation
+    else:
+        terms = []  # coefficients representations list
+        bitlist = "{0:b}".format(value)
+        # FIXME: Improve this dirtied casuistry... Not efficient.
+        for idx, coefficient in enumerate(bitlist):
+            exponent = len(bitlist)-idx-1
+            if coefficient == '0':
+                terms.append('')
+            elif exponent == 0:  # and coefficient == '1'
+                terms.append('+1')
+            elif exponent == 1:  # and coefficient == '1'
+                # equiv to z^1 but short
+                terms.append('+%s' % (variable))
+            else:
+                terms.append('+%s^%d' % (variable, exponent))
+        collect = ''.join(["%s" % (r) for r in terms])
+        if collect[0] == '+':  # remove the first sign if present
+            collect = collect[1:]
+        return collect
+
+
+def _interpretFromStr(string, variable):
+    '''Bits in an integer from a polynomial notation.
+       Input: <str> string
+              <str> variable
+       Output: <integer>
+    '''
+    terms = string.strip().split('+')
+    value = 0
+    for i in range(len(terms)):
+        if terms[i] == '%s' % variable:
+            value |= 1 << 1  # z^1
+        elif terms[i] == '1':
+            value |= 1
+        elif terms[i].count(variable):
+            exponent = int(terms[i].split('%s^' % variable)[1])
+            value |= 1 << exponent
+        else:
+            raise SyntaxError("the term %s cannot be interpreted"
+                              % (terms[i]))
+    return value
+
+
 def getBinaryExtensionFieldModulo(wordSize):
     '''Who is chosen m(z)? [1] z^8+z^4+z^3+z+1 is the first that those the job
        (build a polynomial field), and that is the rule for the other sizes
        under study here.
        [1] "http://crypto.stackexchange.com/questions/16017/"\
            "about-the-rijndael-aes-sbox-polynomial-subbytes"
+       Other sizes are taken from the SearchedConstants (see
+       ConstantsSearch.py).
     '''
     BinaryExtensionFieldModulo = {
         2: 0x07,  # z^2+z+1
@@ -750,8 +862,10 @@ def getBinaryExtensionFieldModulo(wordSize):
         14: 0x4021,  # z^14+z^5+1
         15: 0x8003,  # z^15+z+1
         16: 0x1002B,  # z^16+z^5+z^3+z+1
-    }[wordSize]
-    return BinaryExtensionFieldModulo
+    }
+    if wordSize not in BinaryExtensionFieldModulo:
+        return _SearchedConstants.FieldModulo[wordSize]
+    return BinaryExtensionFieldModulo[wordSize]
 
 
 def getBinaryExtensionRingModulo(wordSize):
@@ -777,8 +891,12 @@ def getBinaryExtensionRingModulo(wordSize):
         14: 0x4001,  # z^14+1
         15: 0x8001,  # z^15+1
         16: 0x10001,  # z^16+1
-    }[wordSize]
-    return BinaryExtensionRingModulo
+    }
+    if wordSize not in BinaryExtensionRingModulo:
+        if wordSize not in _SearchedConstants.FieldModulo:
+            raise KeyError(wordSize)
+        return (1 << wordSize) | 1
+    return BinaryExtensionRingModulo[wordSize]
 
 
 def getMu(wordSize, official=True):
@@ -805,8 +923,10 @@ def getMu(wordSize, official=True):
         14: 0x3CC2,  # z^13+z^12+z^11+z^10+z^7+z^6+z
         15: 0x79A0,  # z^14+z^13+z^12+z^11+z^8+z^7+z^5
         16: 0xFAE0,  # $z^15+z^14+z^13+z^12+z^11+z^9+z^7+z^6+z^5
-    }[wordSize]
-    return Mu
+    }
+    if wordSize not in Mu:
+        return _SearchedConstants.Mu[wordSize]
+    return Mu[wordSize]
 
 
 def getNu(wordSize, official=True):
@@ -833,5 +953,7 @@ def getNu(wordSize, official=True):
         14: 0x38CC,  # z^13+z^12+z^11+z^7+z^6+z^3+z^2
         15: 0x9D9,  # z^11+z^8+z^7+z^6+z^4+z^3+1
         16: 0x30FA,  # z^13+z^12+z^7+z^6+z^5+z^4+z^3+z
-    }[wordSize]
-    return Mu
+    }
+    if wordSize not in Mu:
+        return _SearchedConstants.Nu[wordSize]
+    return Mu[wordSize]
@@ -0,0 +1,622 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+"""
+    Search of the constants for parameter sizes without them in the
+    hard-coded tables:
+    - m(z): the field modulo, the first irreducible binary polynomial of
+      degree w (the rule of getBinaryExtensionFieldModulo()). The
+      irreducibility is tested with the Ben-Or (or Rabin) algorithm.
+    - mu(z) and nu(z) of the SBox affine transformation: mu(z) must be
+      invertible in the ring modulo z^w+1, and nu(z) is chosen to avoid
+      fixed points (S(a) = a) and opposite fixed points (S(a) = ~a).
+    - c(x) of the MixColumns: invertible in the ring modulo x^n+1 and MDS
+      (all the square submatrices of its circulant matrix are non
+      singular, that is, branch number n+1). The MDS check is exhaustive,
+      then it is only done up to a number of rows (over it the c(x) is only
+      checked to be invertible without zero coefficients).
+
+    The searches are distributed in a pool of processes, the results are
+    cached in a json file (with all the arguments and the seed of each
+    search in its key, a search is not repeated unless the cache is
+    discarded), and the new constants are emitted as a python module
+    (SearchedConstants.py) that the getters use as a fallback.
+
+    python -m gRijndael.Polynomials.ConstantsSearch --wordsizes 17-32
+"""
+
+from datetime import datetime
+from itertools import combinations
+import json
+import multiprocessing
+from optparse import OptionParser
+import os
+from random import Random
+import re
+import sys
+
+from .FieldTables import _polynomialGcd
+from .FieldTables import getFieldOperations as _getFieldOperations
+from .FieldTables import isIrreducible
+from .FieldTables import ringInverse as _ringInverse
+
+
+# Up to this number of rows the MDS property of c(x) is checked (the
+# number of minors grows like binomial(2n-1, n)).
+MDS_MAX_ROWS = 8
+# Up to this word size the SBox fixed points are checked for all the
+# elements, over it only a sample.
+FIXED_POINTS_MAX_WORDSIZE = 16
+FIXED_POINTS_SAMPLES = 1 << 12
+_TERM = re.compile(r'^(0x[0-9A-Fa-f]+|1)?(x(?:\^(\d+))?)?$')
+DEFAULT_CANDIDATES = 1000
+DEFAULT_CACHE = "ConstantsSearch.json"
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              "SearchedConstants.py")
+_HEADER = '''# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+"""
+    Constants found by ConstantsSearch.py for the parameters that are not
+    in the hard-coded tables (the getters use them as a fallback).
+"""
+'''
+
+
+# field modulo ----
+
+def searchFieldModulo(wordSize, method='ben-or'):
+    '''The first (smaller as integer) irreducible binary polynomial of
+       degree w.
+       Input: <integer> wordSize
+       Output: <integer> modulo
+    '''
+    for candidate in range((1 << wordSize)+1, 1 << (wordSize+1), 2):
+        # with even weight z+1 divides it
+        if bin(candidate).count('1') % 2 == 1 and \
+                isIrreducible(candidate, method):
+            return candidate
+    return None
+
+
+# SBox affine transformation ----
+
+def isRingInvertible(element, modulo):
+    '''An element of the binary polynomial ring is invertible when it is
+       coprime with the modulo.
+    '''
+    return element != 0 and _polynomialGcd(modulo, element) == 1
+
+
+def _rotationsProduct(mu, a, wordSize):
+    '''mu(z)*a(z) modulo z^w+1, that is the xor of the rotations of a(z).'''
+    mask = (1 << wordSize)-1
+    result = 0
+    shift = 0
+    while mu:
+        if mu & 1:
+            result ^= ((a << shift) | (a >> (wordSize-shift))) & mask
+        mu >>= 1
+        shift += 1
+    return result
+
+
+def sboxFixedPoints(wordSize, fieldModulo, mu, nu, random=None):
+    '''Number of fixed points (S(a) = a) and opposite fixed points
+       (S(a) = ~a) of the SBox S(a) = mu(z)*a^-1(z)+nu(z).
+       Input: <integer> wordSize, fieldModulo, mu, nu
+              <Random> random (used when the elements are sampled)
+       Output: <integer> fixed points found
+    '''
+    mask = (1 << wordSize)-1
+    _, inverse = _getFieldOperations(fieldModulo)
+    if wordSize <= FIXED_POINTS_MAX_WORDSIZE:
+        elements = range(1 << wordSize)
+    else:
+        random = random or Random(wordSize)
+        elements = [random.randint(0, mask)
+                    for i in range(FIXED_POINTS_SAMPLES)]
+    found = 0
+    for a in elements:
+        b = _rotationsProduct(mu, inverse(a) or 0, wordSize) ^ nu
+        if b == a or b == a ^ mask:
+            found += 1
+    return found
+
+
+def searchAffine(wordSize, fieldModulo, random, candidates):
+    '''Random mu(z) invertible in the ring modulo z^w+1 (that is not a
+       monomial, a rotation) and a nu(z) without SBox fixed points.
+       Output: (<integer> mu, <integer> nu) or None
+    '''
+    ringModulo = (1 << wordSize) | 1
+    mask = (1 << wordSize)-1
+    for i in range(candidates):
+        mu = random.randint(1, mask)
+        if bin(mu).count('1') > 1 and isRingInvertible(mu, ringModulo):
+            break
+    else:
+        return None
+    for i in range(candidates):
+        nu = random.randint(1, mask)
+        if sboxFixedPoints(wordSize, fieldModulo, mu, nu, random) == 0:
+            return mu, nu
+    return None
+
+
+# MixColumns polynomial ----
+
+def circulant(lanes):
+    '''Matrix of the product by c(x) in the ring modulo x^n+1.'''
+    n = len(lanes)
+    return [[lanes[(i-j) % n] for j in range(n)] for i in range(n)]
+
+
+def _isSingular(matrix, product, inverse):
+    matrix = [row[:] for row in matrix]
+    n = len(matrix)
+    for c in range(n):
+        pivot = c
+        while pivot < n and matrix[pivot][c] == 0:
+            pivot += 1
+        if pivot == n:
+            return True
+        matrix[c], matrix[pivot] = matrix[pivot], matrix[c]
+        factor = inverse(matrix[c][c])
+        for r in range(c+1, n):
+            if matrix[r][c] != 0:
+                k = product(matrix[r][c], factor)
+                matrix[r] = [v ^ product(k, p)
+                             for v, p in zip(matrix[r], matrix[c])]
+    return False
+
+
+def isMDS(lanes, fieldModulo):
+    '''Check if the circulant matrix of c(x) is MDS: all its square
+       submatrices are non singular. As the matrix is circulant, the
+       simultaneous rotation of rows and columns doesn't change it, then
+       only the row sets that include the first row are checked.
+       Input: <list> lanes (integer coefficients of c(x), LSC first)
+              <integer> fieldModulo
+       Output: <boolean>
+    '''
+    product, inverse = _getFieldOperations(fieldModulo)
+    n = len(lanes)
+    if 0 in lanes:
+        return False
+    if _ringInverse(lanes, [1]+[0]*(n-1)+[1], fieldModulo) is None:
+        return False
+    matrix = circulant(lanes)
+    for size in range(2, n):
+        for others in combinations(range(1, n), size-1):
+            rows = [matrix[0]]+[matrix[r] for r in others]
+            for columns in combinations(range(n), size):
+                submatrix = [[row[c] for c in columns] for row in rows]
+                if _isSingular(submatrix, product, inverse):
+                    return False
+    return True
+
+
+def searchMixColumnsPolynomial(nRows, wordSize, fieldModulo, random,
+                               candidates, mdsMaxRows=MDS_MAX_ROWS):
+    '''Random c(x) in the ring (GF(2^w))[x]/(x^n+1), MDS if n is not over
+       mdsMaxRows or only invertible without zero coefficients if it is.
+       Output: (<list> lanes, <boolean> mds) or None
+    '''
+    mask = (1 << wordSize)-1
+    modulo = [1]+[0]*(nRows-1)+[1]
+    for i in range(candidates):
+        lanes = [random.randint(1, mask) for j in range(nRows)]
+        if nRows <= mdsMaxRows:
+            if isMDS(lanes, fieldModulo):
+                return lanes, True
+        elif _ringInverse(lanes, modulo, fieldModulo) is not None:
+            return lanes, False
+    return None
+
+
+def lanesToStr(lanes):
+    '''String representation of c(x) like the ones in the tables.'''
+    terms = []
+    for degree in range(len(lanes)-1, -1, -1):
+        coefficient = lanes[degree]
+        if coefficient == 0:
+            continue
+        if degree == 0:
+            terms.append('1' if coefficient == 1 else '0x%X' % coefficient)
+            continue
+        term = '' if coefficient == 1 else '0x%X' % coefficient
+        term += 'x' if degree == 1 else 'x^%d' % degree
+        terms.append(term)
+    return '+'.join(terms) or '0'
+
+
+def strToLanes(string):
+    '''Integer coefficients (LSC first) of a c(x) string representation.'''
+    lanes = {}
+    for term in string.split('+'):
+        match = _TERM.match(term)
+        if match is None:
+            raise SyntaxError("the term %s cannot be interpreted" % (term))
+        coefficient, variable, power = match.groups()
+        degree = 0 if not variable else int(power) if power else 1
+        lanes[degree] = int(coefficient, 16) if coefficient else 1
+    return [lanes.get(i, 0) for i in range(max(lanes.keys())+1)]
+
+
+# parallel search and cache ----
+
+def _searchTask(task):
+    '''Worker of the pool (at module level to be picklable).
+       Input: (<string> key, <tuple> arguments, <string> seed)
+       Output: (<string> key, result, <float> seconds)
+    '''
+    key, arguments, seed = task
+    t0 = datetime.now()
+    random = Random("%s/%s" % (seed, key))
+    kind = key.split('/')[0]
+    if kind == 'field':
+        wordSize, method = arguments
+        result = searchFieldModulo(wordSize, method)
+    elif kind == 'affine':
+        wordSize, fieldModulo, candidates = arguments
+        result = searchAffine(wordSize, fieldModulo, random, candidates)
+    elif kind == 'cx':
+        nRows, wordSize, fieldModulo, candidates, mdsMaxRows = arguments
+        result = searchMixColumnsPolynomial(nRows, wordSize, fieldModulo,
+                                            random, candidates, mdsMaxRows)
+    else:
+        raise NameError("Unknown search '%s'" % (key))
+    return key, result, (datetime.now()-t0).total_seconds()
+
+
+def nProcessors(processors):
+    maxParallelprocesses = multiprocessing.cpu_count()
+    if processors <= 0:
+        processors = maxParallelprocesses + processors
+    return max(processors, 1)
+
+
+def cacheKey(task):
+    '''Key of a search in the cache: the name with all the arguments and
+       the seed (a result is only valid for the same search).
+       Input: (<string> name, <tuple> arguments, <string> seed)
+       Output: <string>
+    '''
+    name, arguments, seed = task
+    return "%s %s %s" % (name, json.dumps(list(arguments)), seed)
+
+
+def runSearches(tasks, cache, processors=0, verbose=True):
+    '''Execute, in a pool of processes, the tasks that are not in the cache
+       and store there the results.
+       Input: <list> of (name, arguments, seed)
+              <dict> cache (cacheKey(task) -> result)
+              <integer> processors (0 for all, negative to leave some free)
+    '''
+    tasks = [task for task in tasks if cacheKey(task) not in cache]
+    if len(tasks) == 0:
+        return
+    processors = min(nProcessors(processors), len(tasks))
+    if processors == 1:
+        results = (_searchTask(task) for task in tasks)
+    else:
+        pool = multiprocessing.Pool(processors)
+        results = pool.imap_unordered(_searchTask, tasks)
+    arguments = dict((task[0], task) for task in tasks)
+    for key, result, seconds in results:
+        cache[cacheKey(arguments[key])] = result
+        if verbose:
+            print("%s\t%s\t(%.3f s)" % (key, result, seconds))
+            sys.stdout.flush()
+    if processors != 1:
+        pool.close()
+        pool.join()
+
+
+def loadCache(fileName):
+    if fileName is None or not os.path.exists(fileName):
+        return {}
+    with open(fileName, 'r') as f:
+        return json.load(f)
+
+
+def saveCache(fileName, cache):
+    if fileName is None:
+        return
+    with open(fileName, 'w') as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+
+
+def searchConstants(wordSizes, rowsList, cache, seed='gRijndael',
+                    processors=0, candidates=DEFAULT_CANDIDATES,
+                    mdsMaxRows=MDS_MAX_ROWS, method='ben-or', known=None,
+                    verbose=True):
+    '''Search (or take from the cache) the constants for the word sizes and
+       number of rows given. The field modulo is needed by the other
+       searches, then they are done in two rounds.
+       Input: <list> wordSizes, rowsList
+              <dict> cache (updated with the new results)
+              <dict> known: constants already available, with the format
+                     of the output (those are not searched).
+       Output: <dict> with 'FieldModulo', 'Mu', 'Nu', 'Cx' and 'CxMDS'
+    '''
+    known = known or {}
+    tables = {'FieldModulo': {}, 'Mu': {}, 'Nu': {}, 'Cx': {}, 'CxMDS': {}}
+    knownFields = known.get('FieldModulo', {})
+    runSearches([('field/%d' % w, (w, method), seed) for w in wordSizes
+                 if w not in knownFields], cache, processors, verbose)
+    fields = {}
+    for w in wordSizes:
+        if w in knownFields:
+            fields[w] = knownFields[w]
+        else:
+            fields[w] = tables['FieldModulo'][w] = \
+                cache[cacheKey(('field/%d' % w, (w, method), seed))]
+    tasks = []
+    for w in wordSizes:
+        if w not in known.get('Mu', {}):
+            tasks.append(('affine/%d' % w, (w, fields[w], candidates), seed))
+        for n in rowsList:
+            if (n, w) not in known.get('Cx', {}):
+                tasks.append(('cx/%d/%d' % (n, w),
+                              (n, w, fields[w], candidates, mdsMaxRows),
+                              seed))
+    runSearches(tasks, cache, processors, verbose)
+    for key, arguments, seed in tasks:
+        result = cache[cacheKey((key, arguments, seed))]
+        if result is None:
+            print("WARNING: %s not found in %d candidates" % (key, candidates))
+            continue
+        if key.startswith('affine'):
+            w = arguments[0]
+            tables['Mu'][w], tables['Nu'][w] = result
+        else:
+            n, w = arguments[:2]
+            lanes, mds = result
+            tables['Cx'][(n, w)] = lanesToStr(lanes)
+            tables['CxMDS'][(n, w)] = mds
+    return tables
+
+
+def knownConstants(wordSizes, rowsList):
+    '''The constants in the hard-coded tables (without the already searched
+       ones).
+    '''
+    from . import SearchedConstants
+    from .BinaryPolynomials import getBinaryExtensionFieldModulo, getMu, getNu
+    from .PolynomialRing import getPolynomialRingWithBinaryCoefficients
+    known = {'FieldModulo': {}, 'Mu': {}, 'Nu': {}, 'Cx': {}}
+    for w in wordSizes:
+        if w in SearchedConstants.FieldModulo:
+            continue
+        try:
+            known['FieldModulo'][w] = getBinaryExtensionFieldModulo(w)
+        except KeyError:
+            continue
+        try:
+            known['Mu'][w] = getMu(w, official=False)
+            known['Nu'][w] = getNu(w, official=False)
+        except KeyError:
+            pass
+        for n in rowsList:
+            if (n, w) in SearchedConstants.Cx:
+                continue
+            try:
+                c_x, ring, field = \
+                    getPolynomialRingWithBinaryCoefficients(n, w, packed=True)
+            except KeyError:
+                continue
+            known['Cx'][(n, w)] = lanesToStr(c_x.lanes)
+    return known
+
+
+def verifyConstants(known):
+    '''Check the constants with the same criteria used in the searches.
+       Output: <list> of (<string> subject, <string> message) failures
+    '''
+    from .BinaryPolynomials import getBinaryExtensionFieldModulo
+    failures = []
+    for w, modulo in sorted(known.get('FieldModulo', {}).items()):
+        if not isIrreducible(modulo):
+            failures.append(("m(z) w=%d" % w, "%#x is reducible" % modulo))
+    for w, mu in sorted(known.get('Mu', {}).items()):
+        if not isRingInvertible(mu, (1 << w) | 1):
+            failures.append(("mu(z) w=%d" % w, "%#x is not invertible" % mu))
+    for (n, w), c_x in sorted(known.get('Cx', {}).items()):
+        lanes = strToLanes(c_x)
+        lanes += [0]*(n-len(lanes))
+        fieldModulo = known['FieldModulo'].get(w) or \
+            getBinaryExtensionFieldModulo(w)
+        if n <= MDS_MAX_ROWS and not isMDS(lanes, fieldModulo):
+            failures.append(("c(x) n=%d w=%d" % (n, w),
+                             "%s is not MDS" % (c_x)))
+        elif _ringInverse(lanes, [1]+[0]*(n-1)+[1], fieldModulo) is None:
+            failures.append(("c(x) n=%d w=%d" % (n, w),
+                             "%s is not invertible" % (c_x)))
+    return failures
+
+
+def emitTables(tables, fileName):
+    '''Write the tables as the SearchedConstants python module.'''
+    lines = [_HEADER]
+    for name in ['FieldModulo', 'Mu', 'Nu']:
+        lines.append('%s = {' % name)
+        for w, value in sorted(tables[name].items()):
+            line = '    %d: 0x%X,' % (w, value)
+            comment = '  # %s' % (_polynomialToStr(value))
+            lines.append(line+comment if len(line+comment) <= 79 else line)
+        lines.append('}')
+    lines.append('Cx = {')
+    for (n, w), c_x in sorted(tables['Cx'].items()):
+        # split the long ones (before a term) to fit in the lines
+        chunks = ['']
+        for i, term in enumerate(c_x.split('+')):
+            term = term if i == 0 else '+'+term
+            if len(chunks[-1])+len(term) > 60:
+                chunks.append('')
+            chunks[-1] += term
+        prefix = "    (%d, %d): " % (n, w)
+        for i, chunk in enumerate(chunks):
+            suffix = "," if i == len(chunks)-1 else ""
+            lines.append("%s'%s'%s" % (prefix, chunk, suffix))
+            prefix = " "*len(prefix)
+    lines.append('}')
+    lines.append('# c(x) with the MDS property checked (False: only checked '
+                 'to be invertible).')
+    lines.append('CxMDS = {')
+    for (n, w), mds in sorted(tables['CxMDS'].items()):
+        lines.append("    (%d, %d): %s," % (n, w, mds))
+    lines.append('}')
+    with open(fileName, 'w') as f:
+        f.write('\n'.join(lines)+'\n')
+
+
+def _polynomialToStr(value):
+    terms = []
+    for degree in range(value.bit_length()-1, -1, -1):
+        if (value >> degree) & 1:
+            terms.append('1' if degree == 0 else
+                         'z' if degree == 1 else 'z^%d' % degree)
+    return '+'.join(terms) or '0'
+
+
+def mergeTables(old, new):
+    merged = {}
+    for name in ['FieldModulo', 'Mu', 'Nu', 'Cx', 'CxMDS']:
+        merged[name] = dict(old.get(name, {}))
+        merged[name].update(new.get(name, {}))
+    return merged
+
+
+def searchedTables(wordSizes=None, rowsList=None):
+    '''The constants in SearchedConstants (for the word sizes and rows
+       given or all).
+    '''
+    from . import SearchedConstants
+    tables = {}
+    for name in ['FieldModulo', 'Mu', 'Nu']:
+        tables[name] = dict((w, value) for w, value in
+                            getattr(SearchedConstants, name).items()
+                            if wordSizes is None or w in wordSizes)
+    for name in ['Cx', 'CxMDS']:
+        tables[name] = dict(((n, w), value) for (n, w), value in
+                            getattr(SearchedConstants, name).items()
+                            if (wordSizes is None or w in wordSizes) and
+                            (rowsList is None or n in rowsList))
+    return tables
+
+
+def extractRange(string):
+    '''"2-8,12" -> [2, 3, 4, 5, 6, 7, 8, 12]'''
+    values = []
+    for part in string.split(','):
+        if '-' in part:
+            first, last = part.split('-')
+            values += list(range(int(first), int(last)+1))
+        else:
+            values.append(int(part))
+    return values
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option('', "--wordsizes", type='str', default='2-16',
+                      help="Word sizes to search (like '17-32' or '2,4,8').")
+    parser.add_option('', "--rows", type='str', default='2-16',
+                      help="Number of rows (the c(x) degree) to search.")
+    parser.add_option('', "--processors", type='int', default=0,
+                      help="Processes in the pool (0 for all the cores, "
+                      "negative to leave some free).")
+    parser.add_option('', "--seed", type='str', default='gRijndael')
+    parser.add_option('', "--candidates", type='int',
+                      default=DEFAULT_CANDIDATES,
+                      help="Maximum random candidates per search.")
+    parser.add_option('', "--mds-max-rows", type='int', default=MDS_MAX_ROWS,
+                      help="Over this number of rows the c(x) is not "
+                      "checked to be MDS (only invertible).")
+    parser.add_option('', "--method", type='choice',
+                      choices=['ben-or', 'rabin'], default='ben-or',
+                      help="Irreducibility test.")
+    parser.add_option('', "--cache", type='str', default=DEFAULT_CACHE,
+                      help="Json file with the results of the searches.")
+    parser.add_option('', "--no-cache", action="store_true", default=False)
+    parser.add_option('', "--output", type='str', default=DEFAULT_OUTPUT,
+                      help="Python module where the tables are emitted.")
+    parser.add_option('', "--dry-run", action="store_true", default=False,
+                      help="Search but don't emit the tables.")
+    parser.add_option('', "--verify", action="store_true", default=False,
+                      help="Check the hard-coded (and the already searched) "
+                      "constants instead of searching.")
+    (options, args) = parser.parse_args()
+    wordSizes = extractRange(options.wordsizes)
+    rowsList = extractRange(options.rows)
+    known = knownConstants(wordSizes, rowsList)
+    if options.verify:
+        known = mergeTables(known, searchedTables(wordSizes, rowsList))
+        failures = verifyConstants(known)
+        for subject, message in failures:
+            print("FAIL\t%s\t%s" % (subject, message))
+        print("%d constants checked, %d failed"
+              % (sum(len(v) for v in known.values()), len(failures)))
+        sys.exit(-1 if failures else 0)
+    cacheFile = None if options.no_cache else options.cache
+    cache = loadCache(cacheFile)
+    t0 = datetime.now()
+    try:
+        tables = searchConstants(wordSizes, rowsList, cache, options.seed,
+                                 options.processors, options.candidates,
+                                 options.mds_max_rows, options.method, known)
+    finally:
+        saveCache(cacheFile, cache)
+    print("Search done in %s" % (datetime.now()-t0))
+    if not options.dry_run:
+        emitTables(mergeTables(searchedTables(), tables), options.output)
+        print("Tables written in %s" % (options.output))
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,482 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+
+"""
+    Integer level arithmetic of the binary extension fields (using log and
+    antilog tables) and of the polynomial rings over them, shared by the
+    ring representations.
+    Over TABLES_MAX_WORDSIZE, where the 2^w tables are not feasible, the
+    fields use a windowed product, a reduction for the shape of the modulo
+    (see getReduction()) and the Itoh-Tsujii inversion (with Frobenius
+    tables), see getWideFieldOperations().
+"""
+
+from threading import Lock as _Lock
+
+
+_fieldTables = {}
+_fieldTablesLock = _Lock()
+# Up to this word size the coefficients products use log/antilog tables.
+TABLES_MAX_WORDSIZE = 16
+_wideFieldOperations = {}
+_wideFieldOperationsLock = _Lock()
+# Bits of b(z) processed per step in the windowed product.
+WINDOW_BITS = 4
+# Moduli with up to this number of terms (the leading one included) are
+# reduced by folding (see getReduction()).
+SPARSE_MAX_TERMS = 5
+
+
+def _carrylessMultiply(a, b, modulo):
+    '''Binary polynomials product modulo.
+       Input: <integer> a
+              <integer> b
+              <integer> modulo
+       Output: <integer>
+    '''
+    degree = modulo.bit_length()-1
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        b >>= 1
+        a <<= 1
+        if a >> degree:
+            a ^= modulo
+    return result
+
+
+def _power(a, exponent, modulo):
+    result = 1
+    while exponent:
+        if exponent & 1:
+            result = _carrylessMultiply(result, a, modulo)
+        a = _carrylessMultiply(a, a, modulo)
+        exponent >>= 1
+    return result
+
+
+def _primeFactors(n):
+    factors = []
+    p = 2
+    while p*p <= n:
+        if n % p == 0:
+            factors.append(p)
+            while n % p == 0:
+                n //= p
+        p += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def _polynomialModulo(a, modulo):
+    degree = modulo.bit_length()-1
+    while a.bit_length()-1 >= degree:
+        a ^= modulo << (a.bit_length()-1-degree)
+    return a
+
+
+def _polynomialGcd(a, b):
+    while b:
+        a, b = b, _polynomialModulo(a, b)
+    return a
+
+
+def isIrreducible(modulo, method='ben-or'):
+    '''Irreducibility test of a binary polynomial of degree w.
+       - Ben-Or: gcd(z^(2^i)-z, m(z)) = 1 for i in [1, w/2]. A reducible
+         polynomial has a factor of degree i <= w/2 and it is found in the
+         i-th step, then most of the candidates are discarded very soon.
+       - Rabin: z^(2^w) = z (mod m(z)) and gcd(z^(2^(w/p))-z, m(z)) = 1
+         for each prime p dividing w.
+       Input: <integer> modulo
+              <string> method ('ben-or' or 'rabin')
+       Output: <boolean>
+    '''
+    degree = modulo.bit_length()-1
+    if degree < 1:
+        return False
+    if degree == 1:
+        return True
+    if modulo & 1 == 0:
+        return False  # z divides it
+    z = _polynomialModulo(2, modulo)
+    if method == 'ben-or':
+        power = z
+        for i in range(degree//2):
+            power = _carrylessMultiply(power, power, modulo)
+            if _polynomialGcd(modulo, power ^ z) != 1:
+                return False
+        return True
+    elif method == 'rabin':
+        powers = [z]
+        for i in range(degree):
+            powers.append(_carrylessMultiply(powers[-1], powers[-1], modulo))
+        if powers[degree] != z:
+            return False
+        for p in _primeFactors(degree):
+            if _polynomialGcd(modulo, powers[degree//p] ^ z) != 1:
+                return False
+        return True
+    raise NameError("Unknown irreducibility test '%s'" % (method))
+
+
+def getFieldTables(modulo):
+    '''Logarithm and antilogarithm tables (with respect to a generator of
+       the multiplicative group) of a binary extension field.
+       Input: <integer> modulo
+       Output: (<list> log, <list> exp) or None when the modulo doesn't
+               produce a field (or it is bigger than TABLES_MAX_WORDSIZE).
+               The exp table is doubled to avoid the modulo 2^w-1 of the
+               logarithms addition.
+    '''
+    with _fieldTablesLock:
+        if modulo in _fieldTables:
+            return _fieldTables[modulo]
+        degree = modulo.bit_length()-1
+        order = (1 << degree)-1
+        tables = None
+        if degree <= TABLES_MAX_WORDSIZE:
+            factors = _primeFactors(order)
+            for generator in range(2, order+1):
+                if _power(generator, order, modulo) != 1:
+                    break  # not a field
+                if all(_power(generator, order//p, modulo) != 1
+                       for p in factors):
+                    exp = [0]*(2*order)
+                    log = [0]*(order+1)
+                    value = 1
+                    for i in range(order):
+                        exp[i] = exp[i+order] = value
+                        log[value] = i
+                        value = _carrylessMultiply(value, generator, modulo)
+                    tables = (log, exp)
+                    break
+        _fieldTables[modulo] = tables
+        return tables
+
+
+def getFieldOperations(modulo):
+    '''Product and inverse functions, over integers, for the elements of
+       a binary extension field.
+       Input: <integer> modulo
+       Output: (<function> product(a, b), <function> inverse(a))
+               The inverse returns None when there isn't.
+    '''
+    tables = getFieldTables(modulo)
+    if tables is None:
+        wide = getWideFieldOperations(modulo)
+        if wide is not None:
+            return wide
+    if tables is not None:
+        log, exp = tables
+        order = len(log)-1
+
+        def product(a, b):
+            if a == 0 or b == 0:
+                return 0
+            return exp[log[a]+log[b]]
+
+        def inverse(a):
+            if a == 0:
+                return None
+            return exp[order-log[a]]
+    else:
+        order = (1 << (modulo.bit_length()-1))-1
+
+        def product(a, b):
+            return _carrylessMultiply(a, b, modulo)
+
+        def inverse(a):
+            candidate = _power(a, order-1, modulo)
+            if _carrylessMultiply(a, candidate, modulo) != 1:
+                return None
+            return candidate
+    return product, inverse
+
+
+def batchInverse(values, product, inverse):
+    '''Montgomery's simultaneous inversion: with the prefix products
+       p_i = a_0*...*a_i, only p_{n-1} is inverted and walking back
+       a_i^-1 = p_{n-1}^-1*...*a_{i+1}*p_{i-1}. That is 3(n-1) products and
+       a single inversion. The zeros are skipped (and mapped to 0, like the
+       SBox does).
+       Input: <list> values (integers)
+              <function> product(a, b), <function> inverse(a) (like the
+              ones from getFieldOperations())
+       Output: <list> of integers, or None if some element has no inverse.
+    '''
+    nonZero = [value for value in values if value != 0]
+    if len(nonZero) == 0:
+        return [0]*len(values)
+    prefix = [nonZero[0]]
+    for value in nonZero[1:]:
+        prefix.append(product(prefix[-1], value))
+    accumulated = inverse(prefix[-1])
+    if accumulated is None:
+        return None
+    inverses = [0]*len(nonZero)
+    for i in range(len(nonZero)-1, 0, -1):
+        inverses[i] = product(accumulated, prefix[i-1])
+        accumulated = product(accumulated, nonZero[i])
+    inverses[0] = accumulated
+    inverses = iter(inverses)
+    return [next(inverses) if value != 0 else 0 for value in values]
+
+
+def _windowedProduct(a, b, bits):
+    '''Binary polynomials product (without reduction) processing b(z) in
+       windows of WINDOW_BITS bits with the precomputed products of a(z)
+       by all the polynomials of degree less than WINDOW_BITS. The number
+       of windows only depends on the bits of b(z) given (not on its
+       value).
+    '''
+    table = [0]*(1 << WINDOW_BITS)
+    for i in range(1, 1 << WINDOW_BITS):
+        if i & 1:
+            table[i] = table[i-1] ^ a
+        else:
+            table[i] = table[i >> 1] << 1
+    mask = (1 << WINDOW_BITS)-1
+    shift = (bits+WINDOW_BITS-1)//WINDOW_BITS*WINDOW_BITS
+    result = 0
+    while shift > 0:
+        shift -= WINDOW_BITS
+        result = (result << WINDOW_BITS) ^ table[(b >> shift) & mask]
+    return result
+
+
+def _byteTables(images):
+    '''Tables of a linear map (over GF(2)) given the images of the bits:
+       the image of a value is the xor of the images of each of its bytes
+       (in their positions).
+       Output: <list> of 256 entries lists (one per byte)
+    '''
+    images = images+[0]*(-len(images) % 8)
+    tables = []
+    for byte in range(len(images)//8):
+        table = [0]*256
+        for value in range(1, 256):
+            low = value & -value
+            table[value] = table[value ^ low] ^ \
+                images[8*byte+low.bit_length()-1]
+        tables.append(table)
+    return tables
+
+
+def _frobeniusTable(power, modulo, tables=None):
+    '''Byte tables of the map a(z) -> a(z)^(2^power) (mod m(z)), that is
+       linear over GF(2). When the tables of the power//2 (and 1) maps are
+       given, the images are built composing them (instead of squaring
+       power times).
+    '''
+    degree = modulo.bit_length()-1
+    images = []
+    for i in range(degree):
+        image = 1 << i
+        if tables is not None and power//2 in tables and 1 in tables:
+            image = _applyByteTables(tables[power//2], image)
+            image = _applyByteTables(tables[power//2], image)
+            if power % 2:
+                image = _applyByteTables(tables[1], image)
+        else:
+            for j in range(power):
+                image = _carrylessMultiply(image, image, modulo)
+        images.append(image)
+    return _byteTables(images)
+
+
+def _applyByteTables(tables, value):
+    result = 0
+    for table in tables:
+        result ^= table[value & 0xFF]
+        value >>= 8
+    return result
+
+
+def _reductionTable(modulo):
+    '''Byte tables of the reduction of the bits over the degree of m(z),
+       the product of two elements has up to 2w-1 bits.
+    '''
+    degree = modulo.bit_length()-1
+    images = [_polynomialModulo(1 << (degree+i), modulo)
+              for i in range(degree-1)]
+    return _byteTables(images)
+
+
+def getReduction(modulo):
+    '''Reduction modulo m(z) of the polynomials with up to 2w-1 bits (like
+       the product of two reduced ones):
+       - sparse moduli (trinomials, pentanomials, or like the rings
+         z^w+1): z^w = m_k*z^k+...+m_0, then the bits over the degree are
+         folded with shifts, as many times as the terms, until there is
+         no bit over the degree (with k < w/2, two folds).
+       - other moduli: byte tables of the reduction of z^(w+i).
+       Input: <integer> modulo
+       Output: <function> reduce(c)
+    '''
+    degree = modulo.bit_length()-1
+    mask = (1 << degree)-1
+    terms = [i for i in range(degree) if (modulo >> i) & 1]
+    if len(terms) < SPARSE_MAX_TERMS:  # without the leading one
+
+        def reduce(c):
+            high = c >> degree
+            while high:
+                c &= mask
+                for term in terms:
+                    c ^= high << term
+                high = c >> degree
+            return c
+    else:
+        reduction = _reductionTable(modulo)
+
+        def reduce(c):
+            high = c >> degree
+            c &= mask
+            for table in reduction:
+                c ^= table[high & 0xFF]
+                high >>= 8
+            return c
+    return reduce
+
+
+def _itohTsujiiChain(exponent):
+    '''Addition chain of the exponent from its binary representation: the
+       steps are ('double', k), that builds a^(2^2k-1) from a^(2^k-1), and
+       ('increment', k), that builds a^(2^(k+1)-1).
+    '''
+    chain = []
+    k = 1
+    for bit in bin(exponent)[3:]:
+        chain.append(('double', k))
+        k *= 2
+        if bit == '1':
+            chain.append(('increment', k))
+            k += 1
+    return chain
+
+
+def getWideFieldOperations(modulo):
+    '''Product and inverse functions, over integers, for the fields too big
+       for the log/antilog tables.
+       - product: windowed product (see _windowedProduct()) and reduction
+         (see getReduction()).
+       - inverse: Itoh-Tsujii, a^-1 = a^(2^w-2) = (a^(2^(w-1)-1))^2, with
+         the a^(2^k-1) built following an addition chain of w-1 where
+         a^(2^2k-1) = (a^(2^k-1))^(2^k)*a^(2^k-1). The 2^k powers are
+         Frobenius maps, resolved with byte tables, then an inversion
+         costs about log2(w) products.
+       Input: <integer> modulo
+       Output: (<function> product(a, b), <function> inverse(a)) or None
+               if the modulo is not irreducible or it is small enough to
+               use the tables.
+    '''
+    with _wideFieldOperationsLock:
+        if modulo in _wideFieldOperations:
+            return _wideFieldOperations[modulo]
+        degree = modulo.bit_length()-1
+        operations = None
+        if degree > TABLES_MAX_WORDSIZE and isIrreducible(modulo):
+            operations = _buildWideFieldOperations(modulo)
+        _wideFieldOperations[modulo] = operations
+        return operations
+
+
+def _buildWideFieldOperations(modulo):
+    degree = modulo.bit_length()-1
+    chain = _itohTsujiiChain(degree-1)
+    frobenius = {1: _frobeniusTable(1, modulo)}
+    for step, k in chain:
+        if step == 'double' and k not in frobenius:
+            frobenius[k] = _frobeniusTable(k, modulo, frobenius)
+    reduce = getReduction(modulo)
+
+    def product(a, b):
+        return reduce(_windowedProduct(a, b, degree))
+
+    def frobeniusMap(a, power):
+        return _applyByteTables(frobenius[power], a)
+
+    def inverse(a):
+        if a == 0:
+            return None
+        beta = a  # a^(2^k-1) with k = 1
+        for step, k in chain:
+            if step == 'double':
+                beta = product(frobeniusMap(beta, k), beta)
+            else:
+                beta = product(frobeniusMap(beta, 1), a)
+        return frobeniusMap(beta, 1)
+    return product, inverse
+
+
+def ringInverse(lanes, moduloLanes, fieldModulo):
+    '''Inverse of a polynomial ring element by Gauss-Jordan elimination.
+       The product by a(x) is the linear map with the matrix whose column j
+       is a(x)*x^j (mod m(x)) (a circulant matrix when m(x) = x^n+1). Then
+       the inverse u(x) is the solution of M*u = (1, 0, ..., 0).
+       Input: <list> lanes (integer coefficients of a(x), LSC first)
+              <list> moduloLanes (integer coefficients of m(x), LSC first)
+              <integer> fieldModulo (of the coefficients)
+       Output: <list> integer coefficients of a(x)^-1 (with n elements) or
+               None if a(x) is not invertible.
+    '''
+    product, inverse = getFieldOperations(fieldModulo)
+    moduloLanes = moduloLanes[:]
+    while len(moduloLanes) > 1 and moduloLanes[-1] == 0:
+        moduloLanes.pop()
+    n = len(moduloLanes)-1
+    leading = inverse(moduloLanes[-1])
+    reduction = [product(m, leading) for m in moduloLanes[:-1]]
+    column = (list(lanes)+[0]*n)[:n]
+    columns = []
+    for j in range(n):
+        columns.append(column)
+        # next column: multiply by x and reduce x^n
+        top = column[-1]
+        column = [0]+column[:-1]
+        for i in range(n):
+            column[i] ^= product(top, reduction[i])
+    # augmented rows [M | e_0]
+    rows = [[columns[j][i] for j in range(n)]+[1 if i == 0 else 0]
+            for i in range(n)]
+    for c in range(n):
+        pivot = c
+        while pivot < n and rows[pivot][c] == 0:
+            pivot += 1
+        if pivot == n:
+            return None
+        rows[c], rows[pivot] = rows[pivot], rows[c]
+        factor = inverse(rows[c][c])
+        if factor is None:
+            return None
+        rows[c] = [product(factor, v) for v in rows[c]]
+        for r in range(n):
+            if r != c and rows[r][c] != 0:
+                k = rows[r][c]
+                rows[r] = [v ^ product(k, p) for v, p in zip(rows[r], rows[c])]
+    return [rows[i][n] for i in range(n)]
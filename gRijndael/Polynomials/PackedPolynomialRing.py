@@ -0,0 +1,311 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+
+from threading import Lock as _Lock
+from ..Logger import Logger as _Logger
+from .FieldTables import getFieldOperations as _getFieldOperations
+from .FieldTables import ringInverse as _ringInverse
+from .PolynomialRing import PolynomialRingModulo as _PolynomialRingModulo
+
+
+_packedPolynomialRingModuloClasses = {}
+_packedPolynomialRingModuloLock = _Lock()
+
+
+def PackedPolynomialRingModulo(modulo, coefficients_class, variable='x',
+                               loglevel=_Logger._info):
+    '''
+        PackedPolynomialRingModulo is an alternative builder for the same
+        (\mathbb{F}_{2^w})^l elements than PolynomialRingModulo. The l
+        coefficients are packed in a single integer of l*w bits (the
+        coefficient of degree i in the bits [i*w, (i+1)*w), like the
+        PolynomialRingModulo __int__() does). Then the addition is a single
+        xor, the comparison a single integer comparison and the product is
+        made lane by lane with table driven products in the coefficients
+        field.
+
+        Arguments are the ones of PolynomialRingModulo, and the elements can
+        be built from the same representations (list of coefficients and
+        strings) as well as from the packed integer.
+
+        Example:
+        >>> import Polynomials
+        >>> field = Polynomials.BinaryExtensionModulo('z^8+z^4+z^3+z+1')
+        >>> ring = Polynomials.PackedPolynomialRingModulo('x^4+1', field)
+        >>> ring('0x3x^3+x^2+x+0x2') * ring(0x01020304)
+        (z^3+z^2+z+1)*x^3+(z^2+1)*x+(z^3+z^2+z) (mod x^4+1)
+    '''
+    # the list representation validates the arguments and, as it is
+    # memoized, identifies them
+    unpacked = _PolynomialRingModulo(modulo, coefficients_class, variable,
+                                     loglevel)
+    with _packedPolynomialRingModuloLock:
+        if unpacked not in _packedPolynomialRingModuloClasses:
+            _packedPolynomialRingModuloClasses[unpacked] = \
+                _buildPackedPolynomialRingModulo(unpacked, coefficients_class)
+        return _packedPolynomialRingModuloClasses[unpacked]
+
+
+def _buildPackedPolynomialRingModulo(unpacked, coefficients_class):
+    '''Build the element class of PackedPolynomialRingModulo.
+       Input: <class> unpacked (the PolynomialRingModulo equivalent)
+              <class> coefficients_class
+       Output: <class>
+    '''
+    wordSize = coefficients_class._modulodegree-1
+    mask = (1 << wordSize)-1
+    moduloElement = unpacked([coefficients_class.zero])
+    moduloLanes = [c.coefficients for c in moduloElement._modulo]
+    while len(moduloLanes) > 1 and moduloLanes[-1] == 0:
+        moduloLanes.pop()
+    nLanes = len(moduloLanes)-1
+    # x^l = -(m_{l-1}*x^{l-1}+...+m_0)/m_l, and in characteristic 2 the
+    # sign doesn't matter.
+    leading = ~coefficients_class(moduloLanes[-1])
+    reductionLanes = [(coefficients_class(m)*leading).coefficients
+                      for m in moduloLanes[:-1]]
+    # with a modulo x^l+1 the reduction is a wraparound (cyclic convolution)
+    cyclic = reductionLanes == [1]+[0]*(nLanes-1)
+    lanesProduct, lanesInverse = \
+        _getFieldOperations(coefficients_class._modulo)
+
+    class PackedPolynomialRingModuloConstructor(object):
+        # The state is the packed integer and the xors counter of the
+        # operation that has produced it.
+        __slots__ = ('_packed', '_ctr')
+        _unpacked = unpacked
+        _coefficientClass = coefficients_class
+        _wordSize = wordSize
+        _nLanes = nLanes
+        _modulo = moduloElement.modulo
+        _inverses = {}  # memoized inverses (packed integers)
+
+        def __init__(self, value, *args, **kwargs):
+            '''
+                Argument:
+                - value: (mandatory) packed integer, list of coefficients
+                  (Less Significant Coefficient First), string
+                  representation or other element of this ring (packed or
+                  not).
+            '''
+            self._ctr = 0
+            if type(value) == int:
+                if value >> (nLanes*wordSize):
+                    raise AssertionError("The packed value exceeds the %d "
+                                         "coefficients" % (nLanes))
+                self._packed = value
+            elif type(value) == PackedPolynomialRingModuloConstructor:
+                self._packed = value._packed
+            else:
+                # other representations are interpreted (and reduced) by the
+                # list based ring
+                self._packed = int(unpacked(value))
+
+        @property
+        def xors(self):
+            return self._ctr
+
+        @xors.setter
+        def xors(self, value):
+            self._ctr += value
+
+        def reset(self):
+            self._ctr = 0
+
+        @property
+        def lanes(self):
+            '''Integer coefficients list (Less Significant Coefficient First)
+               with all the l coefficients.
+            '''
+            packed = self._packed
+            return [(packed >> (i*wordSize)) & mask for i in range(nLanes)]
+
+        @property
+        def coefficients(self):
+            lanes = self.lanes
+            while len(lanes) > 1 and lanes[-1] == 0:
+                lanes.pop()
+            return [coefficients_class(lane) for lane in lanes]
+
+        @property
+        def modulo(self):
+            return self._modulo
+
+        @property
+        def degree(self):
+            if self._packed == 0:
+                return 0
+            return (self._packed.bit_length()-1)//wordSize
+
+        @property
+        def modulodegree(self):
+            return nLanes
+
+        @property
+        def hammingWeight(self):
+            return bin(self._packed).count('1')
+
+        @property
+        def hammingWeightPerCoefficient(self):
+            return [bin(lane).count('1') for lane in self.lanes]
+
+        @property
+        def isZero(self):
+            return self._packed == 0
+
+        @property
+        def isOne(self):
+            return self._packed == 1
+
+        def unpack(self):
+            '''Equivalent element in the list based representation.'''
+            return unpacked(self.coefficients)
+
+        def __int__(self):
+            return self._packed
+
+        def __hash__(self):
+            return hash(self._packed)
+
+        def __str__(self):
+            return str(self.unpack())
+
+        def __repr__(self):
+            return repr(self.unpack())
+
+        def __hex__(self):
+            return self.unpack().__hex__()
+
+        def __iter__(self):
+            return iter(self.coefficients)
+
+        def __getitem__(self, n):
+            if n < nLanes:
+                return coefficients_class((self._packed >> (n*wordSize)) &
+                                          mask)
+            raise OverflowError("No coefficient with this degree")
+
+        def __type__(self):
+            return self.__class__
+
+        def __eq__(self, other):  # => a == b
+            if other is None:
+                return False
+            return self._packed == other._packed
+
+        def __ne__(self, other):  # => a!=b
+            return not self.__eq__(other)
+
+        # #Operations ----
+        # + Addition and - Substraction: ----
+        def __add__(self, other):  # => a+b
+            s = PackedPolynomialRingModuloConstructor(self._packed ^
+                                                      other._packed)
+            s.xors = nLanes*wordSize
+            return s
+
+        def __sub__(self, other):  # => a-b
+            return self + other
+
+        def __iadd__(self, other):  # => a+=b
+            return self + other
+
+        def __isub__(self, other):  # => a-=b
+            return self + other
+
+        def __pos__(self):  # => +a
+            return self
+
+        def __neg__(self):  # => -a
+            return self
+
+        # * Product ----
+        def __mul__(self, other):  # => a*b
+            '''Lane by lane product (schoolbook) followed by the reduction
+               modulo, or the cyclic convolution when the modulo is x^l+1.
+               The coefficients products use the log/antilog tables of the
+               field (that are not constant time).
+               Input: Two elements of this ring.
+               Output: The product between them.
+            '''
+            a = self.lanes
+            b = other.lanes
+            xors = nLanes*nLanes*wordSize
+            if cyclic:
+                product = [0]*nLanes
+                for i in range(nLanes):
+                    for j in range(nLanes):
+                        product[(i+j) % nLanes] ^= lanesProduct(a[i], b[j])
+            else:
+                product = [0]*(2*nLanes-1)
+                for i in range(nLanes):
+                    for j in range(nLanes):
+                        product[i+j] ^= lanesProduct(a[i], b[j])
+                for degree in range(2*nLanes-2, nLanes-1, -1):
+                    coefficient = product[degree]
+                    shift = degree-nLanes
+                    for i, lane in enumerate(reductionLanes):
+                        product[shift+i] ^= lanesProduct(coefficient, lane)
+                xors += (nLanes-1)*nLanes*wordSize
+            packed = 0
+            for i in range(nLanes-1, -1, -1):
+                packed = (packed << wordSize) | product[i]
+            p = PackedPolynomialRingModuloConstructor(packed)
+            p.xors = xors
+            return p
+
+        def __imul__(self, other):  # => a*=b
+            return self * other
+
+        # ~ Multiplicative inverse: ----
+        def __invert__(self):  # => ~a, that means like a^-1
+            inverse = self.__multiplicativeInverse__()
+            if inverse is None:
+                raise ArithmeticError("The inverse of %s modulo %s doens't "
+                                      "exist!" % (self, self._modulo))
+            return PackedPolynomialRingModuloConstructor(inverse)
+
+        def __multiplicativeInverse__(self):
+            '''Gauss-Jordan elimination (see FieldTables.ringInverse()),
+               memoized in the class.
+               Output: <integer> packed a^-1 or None if it doesn't exist.
+            '''
+            if self._packed not in self._inverses:
+                lanes = _ringInverse(self.lanes, moduloLanes,
+                                     coefficients_class._modulo)
+                if lanes is None:
+                    inverse = None
+                else:
+                    inverse = 0
+                    for lane in reversed(lanes):
+                        inverse = (inverse << wordSize) | lane
+                self._inverses[self._packed] = inverse
+            return self._inverses[self._packed]
+
+        @property
+        def isInvertible(self):
+            return self.__multiplicativeInverse__() is not None
+        # End class PackedPolynomialRingModuloConstructor ----
+    return PackedPolynomialRingModuloConstructor
@@ -24,10 +24,19 @@ __status__ = "development"
 
 
 from copy import deepcopy as _deepcopy
+from threading import Lock as _Lock
 from ..Logger import Logger as _Logger
 from ..Logger import XORctr as _XORctr
 from ..ThirdLevel import shift as _shift
 from .BinaryPolynomials import *
+from .FieldTables import ringInverse as _ringInverse
+from . import SearchedConstants as _SearchedConstants
+
+
+# Like with the BinaryExtensionModulo, the classes are memoized by
+# (modulo, coefficients class, variable).
+_polynomialRingModuloClasses = {}
+_polynomialRingModuloLock = _Lock()
 
 
 def PolynomialRingModulo(modulo, coefficients_class, variable='x',
@@ -51,6 +60,9 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
         - loglevel: by default info, based on the superclass Logger
         enumeration.
 
+        The classes are memoized: building again with the same arguments
+        returns the same class.
+
         Example:
         >>> import Polynomials
         >>> field = Polynomials.BinaryExtensionModulo('z^8+z^4+z^3+z+1')
@@ -70,7 +82,25 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
     if type(modulo) == str and modulo.count(variable) == 0:
         raise Exception("modulo %s is not defined over %s variable"
                         % (modulo, variable))
-
+    if type(modulo) == list:
+        key = (tuple(modulo), coefficients_class, variable)
+    else:
+        key = (modulo, coefficients_class, variable)
+    with _polynomialRingModuloLock:
+        if key not in _polynomialRingModuloClasses:
+            _polynomialRingModuloClasses[key] = \
+                _buildPolynomialRingModulo(modulo, coefficients_class,
+                                           variable)
+        return _polynomialRingModuloClasses[key]
+
+
+def _buildPolynomialRingModulo(modulo, coefficients_class, variable):
+    '''Build the element class of PolynomialRingModulo (that memoizes it).
+       Input: modulo (string or coefficients list)
+              <class> coefficients_class
+              <str> variable
+       Output: <class>
+    '''
     class PolynomialRingModuloConstructor(_Logger, _XORctr):
         '''
             Once have the builder of elements it can be used to generate
@@ -98,14 +128,25 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
         # TODOs summary:
         # - isInvertible()
         # - refactoring interpreter methods
+        # The modulo is interpreted by the first instance and stored in the
+        # class, together with if it is like x^n+1 (a cyclic ring).
+        _moduloCoefficients = None
+        _cyclic = False
+        _inverses = {}  # memoized inverses by the coefficients
+
         def __init__(self, value, *args, **kwargs):
             super(PolynomialRingModuloConstructor,
                   self).__init__(*args, **kwargs)
             self._coefficientClass = coefficients_class
             self._variable = variable
             self._coefficients = self.__interpretCoefficients(value)
-            self.includeInstance(self._coefficients)
-            self._modulo = self.__interpretCoefficients(modulo)
+            cls = PolynomialRingModuloConstructor
+            if cls._moduloCoefficients is None:
+                m = self.__interpretCoefficients(modulo)
+                cls._cyclic = len(m) > 1 and m[0].isOne and m[-1].isOne and \
+                    all([coefficient.isZero for coefficient in m[1:-1]])
+                cls._moduloCoefficients = m
+            self._modulo = cls._moduloCoefficients[:]
             self.reduce()
             self._gcd = None
             self._multinv = None
@@ -158,8 +199,11 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
                 return value.coefficients
             elif type(value) == list:
                 if len(value) == 0:
-                    return [self._coefficientClass(0)]
-                if all([type(coefficient) == int for coefficient in value]):
+                    return [self._coefficientClass.zero]
+                if all([type(coefficient) is self._coefficientClass
+                        for coefficient in value]):
+                    pass  # memoized class: same field by identity
+                elif all([type(coefficient) == int for coefficient in value]):
                     for i in range(len(value)):
                         value[i] = self._coefficientClass(value[i])
                 elif all([str(type(coefficient)).
@@ -196,9 +240,9 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
                     exponent = idx
                     # FIXME: those nested 'ifs' can be simplified
                     if exponent == 0:
-                        if coefficient == self._coefficientClass(0):
+                        if coefficient.isZero:
                             terms.append("")
-                        elif coefficient == self._coefficientClass(1):
+                        elif coefficient.isOne:
                             terms.append("+1")
                         else:
                             if hexSubfield:
@@ -207,9 +251,9 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
                             else:
                                 terms.append("+(%s)" % (coefficient))
                     elif exponent == 1:
-                        if coefficient == self._coefficientClass(0):
+                        if coefficient.isZero:
                             terms.append("")
-                        elif coefficient == self._coefficientClass(1):
+                        elif coefficient.isOne:
                             terms.append("+%s" % (self._variable))
                         else:
                             if hexSubfield:
@@ -220,9 +264,9 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
                                 terms.append("+(%s)*%s"
                                              % (coefficient, self._variable))
                     else:
-                        if coefficient == self._coefficientClass(0):
+                        if coefficient.isZero:
                             terms.append("")
-                        elif coefficient == self._coefficientClass(1):
+                        elif coefficient.isOne:
                             terms.append("+%s^%d" % (self._variable, exponent))
                         else:
                             if hexSubfield:
@@ -352,7 +396,7 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
                 else:
                     self._trace_stream("Processing degree %d without term"
                                        % (i))
-                    coefficients.append(self._coefficientClass(0))
+                    coefficients.append(self._coefficientClass.zero)
             return coefficients
 
         @property
@@ -364,12 +408,11 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
         def expandedCoefficients(self):
             coefficients = self._coefficients[:]
             zerosNeeded = self.modulodegree-len(coefficients)
-            coefficients += [self._coefficientClass(0)]*zerosNeeded
+            coefficients += [self._coefficientClass.zero]*zerosNeeded
             return coefficients
 
         def __normalizePolynomial__(self, v):
-            zero = self._coefficientClass(0)
-            while len(v) > 1 and v[-1] == zero:
+            while len(v) > 1 and v[-1].isZero:
                 # Remember is little endian: the most significant coefficient
                 # is one in the highest position of the list
                 removed = v.pop()
@@ -413,7 +456,7 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
         def __coefficientsDegree(self, coeffList):
             degree = len(coeffList)-1
             while degree > 0:
-                if coeffList[degree] != self._coefficientClass(0):
+                if not coeffList[degree].isZero:
                     break
                 degree -= 1
             return degree
@@ -422,14 +465,14 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
         def isZero(self):
             '''Neutral element of the first operation, addition.'''
             for coefficient in self.coefficients:
-                if coefficient != self._coefficientClass(0):
+                if not coefficient.isZero:
                     return False
                     # FIXME: would be good to make it time constant
                     #        because its for cryptography.
             return True
 
         def __zero(self):
-            zero = [self._coefficientClass(0)]*self.modulodegree
+            zero = [self._coefficientClass.zero]*self.modulodegree
             return PolynomialRingModuloConstructor(zero,
                                                    loglevel=self.logLevel)
 
@@ -438,15 +481,15 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
             '''Neutral element of the second operation, product.'''
             for degree, coefficient in enumerate(self.coefficients):
                 search = 1 if degree == 0 else 0
-                if coefficient != self._coefficientClass(search):
+                if coefficient.coefficients != search:
                     return False
                 # FIXME: would be good to make it time constant
                 #        because its for cryptography.
             return True
 
         def __one(self):
-            zeros = [self._coefficientClass(0)]*(self.modulodegree-1)
-            one = [self._coefficientClass(1)] + zeros
+            zeros = [self._coefficientClass.zero]*(self.modulodegree-1)
+            one = [self._coefficientClass.one] + zeros
             return PolynomialRingModuloConstructor(one, loglevel=self.logLevel)
 
         @property
@@ -454,13 +497,11 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
             '''Show if the element is invertible modulo for the product
                operation.
             '''
-            if self._gcd is None or self._multinv is None:
-                self._gcd, _, self._multinv = \
-                    self.__egcd__(self._modulo, self.coefficients)
-            if self._gcd == [self._coefficientClass(1)]:
+            try:
+                self.__multiplicativeInverse__()
                 return True
-            print("...")
-            return False
+            except ArithmeticError:
+                return False
 
         def __iter__(self):
             return iter(self.coefficients)
@@ -512,48 +553,47 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
         # #Operations ----
         # + Addition: ----
         def __add__(self, other):  # => a+b
+            xors = self._coefficientClass.xors
             result = self.__addition__(self.coefficients, other.coefficients)
-            return PolynomialRingModuloConstructor(result,
-                                                   loglevel=self.logLevel)
+            s = PolynomialRingModuloConstructor(result, loglevel=self.logLevel)
+            s.xors = self._coefficientClass.xors - xors
+            return s
 
         def __iadd__(self, other):  # => a+=b
-            result = self.__addition__(self.coefficients, other.coefficients)
-            return PolynomialRingModuloConstructor(result,
-                                                   loglevel=self.logLevel)
+            return self + other
 
         def __addition__(self, addend1, addend2):
             size = max(self.modulodegree, len(addend1))
             size = max(size, len(addend2))
-            result = [self._coefficientClass(0)]*size
+            result = [self._coefficientClass.zero]*size
             addend1 = addend1 +\
-                [self._coefficientClass(0)]*(size-len(addend1))
+                [self._coefficientClass.zero]*(size-len(addend1))
             addend2 = addend2 +\
-                [self._coefficientClass(0)]*(size-len(addend2))
+                [self._coefficientClass.zero]*(size-len(addend2))
             for i in range(size):
                 result[i] = addend1[i] + addend2[i]
             result = self.__normalizePolynomial__(result)
             return result
 
         def __sub__(self, other):  # => a-b
+            xors = self._coefficientClass.xors
             result = self.__substraction__(self.coefficients,
                                            other.coefficients)
-            return PolynomialRingModuloConstructor(result,
-                                                   loglevel=self.logLevel)
+            s = PolynomialRingModuloConstructor(result, loglevel=self.logLevel)
+            s.xors = self._coefficientClass.xors - xors
+            return s
 
         def __isub__(self, other):  # => a-=b
-            result = self.__substraction__(self.coefficients,
-                                           other.coefficients)
-            return PolynomialRingModuloConstructor(result,
-                                                   loglevel=self.logLevel)
+            return self - other
 
         def __substraction__(self, remainded, substractor):
             size = max(self.modulodegree, len(remainded))
             size = max(size, len(substractor))
-            result = [self._coefficientClass(0)]*size
+            result = [self._coefficientClass.zero]*size
             remainded = remainded +\
-                [self._coefficientClass(0)]*(size-len(remainded))
+                [self._coefficientClass.zero]*(size-len(remainded))
             substractor = substractor +\
-                [self._coefficientClass(0)] * (size-len(substractor))
+                [self._coefficientClass.zero] * (size-len(substractor))
             for i in range(size):
                 result[i] = remainded[i] - substractor[i]
             result = self.__normalizePolynomial__(result)
@@ -568,13 +608,19 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
                       same binary polynomial ring.
                Output: The product between the two input pylinomials
             '''
+            # the coefficients count their xors in its class
+            xors = self._coefficientClass.xors
             a = self.coefficients
             b = other.coefficients
             self._debug_stream("a * b, where:\n\ta = %s\n\tb = %s"
                                % (self.__interpretToStr__(a),
                                   self.__interpretToStr__(b)))
-            res = self.__multiply__(a, b)
+            if self._cyclic:
+                res = self.__cyclicConvolution__(a, b)
+            else:
+                res = self.__multiply__(a, b)
             p = PolynomialRingModuloConstructor(res, loglevel=self.logLevel)
+            p.xors = self._coefficientClass.xors - xors
             self._debug_stream("c = %s" % (p))
             return p
 
@@ -592,7 +638,7 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
             '''
             size = max(self.modulodegree*2, len(multiplicand)*2)
             size = max(size, len(multiplier)*2)
-            result = [self._coefficientClass(0)]*size
+            result = [self._coefficientClass.zero]*size
             self._debug_stream("multiplicand: %s" % multiplicand)
             self._debug_stream("multiplier: %s" % multiplier)
             for i, coefficient in enumerate(multiplier):
@@ -604,6 +650,22 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
             self._debug_stream("Result: %s" % result)
             return result
 
+        def __cyclicConvolution__(self, multiplicand, multiplier):
+            '''When the modulo is x^n+1, x^n = 1 and the reduction is only a
+               wraparound of the degrees. Then the product is the cyclic
+               convolution of the coefficients (without any division).
+               Input: <coefficients list> multiplicand
+                      <coefficients list> multiplier
+               Output: <coefficients list> result (already reduced)
+            '''
+            n = self.modulodegree
+            result = [self._coefficientClass.zero]*n
+            for i, a_i in enumerate(multiplicand):
+                for j, b_j in enumerate(multiplier):
+                    k = (i+j) % n
+                    result[k] = result[k] + a_i*b_j
+            return self.__normalizePolynomial__(result)
+
         def __multiplicationStep__(self, multiplicant, coefficient, degree):
             '''Constant time function to calculate one of the steps in the
                multiplication.
@@ -612,7 +674,7 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
                       <integer> degree (the exponent where the coefficient is)
                Output: <coefficients list> product line
             '''
-            line = [self._coefficientClass(0)]*(len(multiplicant)+degree)
+            line = [self._coefficientClass.zero]*(len(multiplicant)+degree)
             for i in range(len(multiplicant)):
                 # shift: i+ degree
                 line[i+degree] = multiplicant[i] * coefficient
@@ -638,13 +700,13 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
             return PolynomialRingModuloConstructor(r, loglevel=self.logLevel)
 
         def __divideBy__(self, numerator, denominator):
-            zero = self._coefficientClass(0)
+            zero = self._coefficientClass.zero
             a = self.__normalizePolynomial__(numerator)
             b = self.__normalizePolynomial__(denominator)
             # with this, dividend and divisor are lists
             # where the index in the table of each of the coefficients
             # say the corresponding degree.
-            if b == [self._coefficientClass(0)]:
+            if b == [self._coefficientClass.zero]:
                 raise ZeroDivisionError
             gr_a = len(a)-1
             gr_b = len(b)-1
@@ -676,7 +738,7 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
         # FIXME ---
         # two loops inside the division step! This shall be improved!
         def __divisionStep__(self, a, gr_a, b, gr_b):
-            zero = self._coefficientClass(0)
+            zero = self._coefficientClass.zero
             # 1.- quotient
             q = a[-1]*~b[-1]
             self._debug_stream("Quotient step: a[%d]/b[%d] = %s / %s = "
@@ -698,37 +760,35 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
         def __invert__(self):  # => ~a, that means like a^-1
             if self._multinv is None:
                 self._multinv = self.__multiplicativeInverse__()
-            return PolynomialRingModuloConstructor(self._multinv)
+            return PolynomialRingModuloConstructor(self._multinv[:])
 
         def __multiplicativeInverse__(self):
-            '''Multiplicative inverse based on ...
+            '''Multiplicative inverse by Gauss-Jordan elimination over the
+               matrix of the product by this element (that is circulant when
+               the modulo is x^n+1), using table arithmetic for the
+               coefficients. See FieldTables.ringInverse(). The results are
+               memoized in the class.
                Input: <coefficients list> a (polynomial to invert)
                       <coefficients list> m (modulo)
-               Output: <integer> a^-1: a*a^-1 = 1 (mod m)
+               Output: <coefficients list> a^-1: a*a^-1 = 1 (mod m)
                "coefficients list" means "little endian list of coefficients"
-               This it the first of the two transformations for the SBoxes
-               in the subBytes operation, the one called called g.
             '''
-            self._debug_stream("__multiplicativeInverse__: %s"
-                               % self.coefficients)
-            if self._coefficients == 0:  # FIXME: is this true?
-                return self
-            if self._gcd is None or self._multinv is None:
-                self._gcd, _, self._multinv = \
-                    self.__egcd__(self._modulo, self._coefficients)
-            gcd = PolynomialRingModuloConstructor(self._gcd)
-            multinv = PolynomialRingModuloConstructor(self._multinv)
-            self._debug_stream("gcd = %s" % gcd)
-            self._debug_stream("multiplicative inverse = %s" % multinv)
-            if gcd != self.__one():
+            key = tuple([coefficient.coefficients
+                         for coefficient in self._coefficients])
+            if key not in self._inverses:
+                moduloLanes = [coefficient.coefficients
+                               for coefficient in self._modulo]
+                self._inverses[key] = \
+                    _ringInverse(list(key), moduloLanes,
+                                 self._coefficientClass._modulo)
+            lanes = self._inverses[key]
+            if lanes is None:
                 bar = self.__interpretToStr__(self._coefficients)
                 foo = self.__interpretToStr__(self._modulo)
                 raise ArithmeticError("The inverse of %s modulo %s "
-                                      "doens't exist! (gcd = %s = %s, "
-                                      "candidate = %s = %s)"
-                                      % (bar, foo, self._gcd, hex(gcd),
-                                         self._multinv, hex(multinv)))
-            return self._multinv  # % self._modulo
+                                      "doens't exist!" % (bar, foo))
+            return self.__normalizePolynomial__(
+                [self._coefficientClass(lane) for lane in lanes])
 
         def __gcd__(self, other):
             a = self.coefficients
@@ -780,7 +840,7 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
             mul = self.__multiply__
             div_mod = self.__divideBy__
             # --- The algorithm itself
-            zero = [self._coefficientClass(0)]
+            zero = [self._coefficientClass.zero]
             a = self.__normalizePolynomial__(a)
             b = self.__normalizePolynomial__(b)
             printAsStrings([["a", a], ["b", b]])
@@ -793,7 +853,7 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
                 c = ~leading_coefficient(b)
                 d, u, v = self.__multiply__(c, b), zero, [c]
             else:
-                (u, d, v1, v3) = ([self._coefficientClass(1)], a, zero, b)
+                (u, d, v1, v3) = ([self._coefficientClass.one], a, zero, b)
                 printAsStrings([["u", u], ["d", d], ["v1", v1], ["v3", v3]], 1)
                 i = 1
                 while v3 != zero:
@@ -817,7 +877,7 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
         def __lshift__(self, n):  # => a << n
             shifted = \
                 PolynomialRingModuloConstructor(self.coefficients +
-                                                [self._coefficientClass(0)]*n,
+                                                [self._coefficientClass.zero]*n,
                                                 loglevel=self.logLevel)
             self._debug_stream("%s << %d = %s" % (self, n, shifted))
             return shifted
@@ -833,7 +893,7 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
         def __ilshift__(self, n):  # => <<=
             shifted = \
                 PolynomialRingModuloConstructor(self.coefficients +
-                                                [self._coefficientClass(0)]*n,
+                                                [self._coefficientClass.zero]*n,
                                                 loglevel=self.logLevel)
             self._debug_stream("%s <<= %d = %s" % (self, n, shifted))
             return shifted
@@ -913,10 +973,22 @@ def PolynomialRingModulo(modulo, coefficients_class, variable='x',
 #         return res
 
 
-def getPolynomialRingWithBinaryCoefficients(ringDegree, coefficientsDegree):
+def getPolynomialRingWithBinaryCoefficients(ringDegree, coefficientsDegree,
+                                            packed=False):
+    '''Build the ring (with the c(x) used in the MixColumns) for a number of
+       rows and a word size.
+       Input: <integer> ringDegree
+              <integer> coefficientsDegree
+              <boolean> packed (use the PackedPolynomialRingModulo)
+       Output: (c(x), <class> ring, <class> field)
+    '''
     fieldModulo = getBinaryExtensionFieldModulo(coefficientsDegree)
     field = BinaryExtensionModulo(fieldModulo, variable='z')
-    ring = PolynomialRingModulo('x^%d+1' % ringDegree, field)
+    if packed:
+        from .PackedPolynomialRing import PackedPolynomialRingModulo
+        ring = PackedPolynomialRingModulo('x^%d+1' % ringDegree, field)
+    else:
+        ring = PolynomialRingModulo('x^%d+1' % ringDegree, field)
     c_x = {2: {2: '0x3x+0x2',
                3: '0x6x+0x4',
                4: '0x5x+0x6',
@@ -1036,5 +1108,9 @@ def getPolynomialRingWithBinaryCoefficients(ringDegree, coefficientsDegree):
                    '+0xAC7x+0x1F16',
                16: '0x3B16x^7+0x84B7x^6+0x6794x^5+0xC1D3x^4+0xB4Fx^3+0xC157x^2'
                    '+0x879Ax+0x4E87'}
-           }[ringDegree][coefficientsDegree]
-    return (ring(c_x), ring, field)
+           }
+    if coefficientsDegree not in c_x.get(ringDegree, {}):
+        # searched ones (see ConstantsSearch.py)
+        return (ring(_SearchedConstants.Cx[(ringDegree, coefficientsDegree)]),
+                ring, field)
+    return (ring(c_x[ringDegree][coefficientsDegree]), ring, field)
@@ -0,0 +1,3518 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+"""
+    Constants found by ConstantsSearch.py for the parameters that are not
+    in the hard-coded tables (the getters use them as a fallback).
+"""
+
+FieldModulo = {
+    17: 0x20009,  # z^17+z^3+1
+    18: 0x40009,  # z^18+z^3+1
+    19: 0x80027,  # z^19+z^5+z^2+z+1
+    20: 0x100009,  # z^20+z^3+1
+    21: 0x200005,  # z^21+z^2+1
+    22: 0x400003,  # z^22+z+1
+    23: 0x800021,  # z^23+z^5+1
+    24: 0x100001B,  # z^24+z^4+z^3+z+1
+    25: 0x2000009,  # z^25+z^3+1
+    26: 0x400001B,  # z^26+z^4+z^3+z+1
+    27: 0x8000027,  # z^27+z^5+z^2+z+1
+    28: 0x10000003,  # z^28+z+1
+    29: 0x20000005,  # z^29+z^2+1
+    30: 0x40000003,  # z^30+z+1
+    31: 0x80000009,  # z^31+z^3+1
+    32: 0x10000008D,  # z^32+z^7+z^3+z^2+1
+    33: 0x20000004B,  # z^33+z^6+z^3+z+1
+    34: 0x40000001B,  # z^34+z^4+z^3+z+1
+    35: 0x800000005,  # z^35+z^2+1
+    36: 0x1000000035,  # z^36+z^5+z^4+z^2+1
+    37: 0x200000003F,  # z^37+z^5+z^4+z^3+z^2+z+1
+    38: 0x4000000063,  # z^38+z^6+z^5+z+1
+    39: 0x8000000011,  # z^39+z^4+1
+    40: 0x10000000039,  # z^40+z^5+z^4+z^3+1
+    41: 0x20000000009,  # z^41+z^3+1
+    42: 0x40000000027,  # z^42+z^5+z^2+z+1
+    43: 0x80000000059,  # z^43+z^6+z^4+z^3+1
+    44: 0x100000000021,  # z^44+z^5+1
+    45: 0x20000000001B,  # z^45+z^4+z^3+z+1
+    46: 0x400000000003,  # z^46+z+1
+    47: 0x800000000021,  # z^47+z^5+1
+    48: 0x100000000002D,  # z^48+z^5+z^3+z^2+1
+    49: 0x2000000000071,  # z^49+z^6+z^5+z^4+1
+    50: 0x400000000001D,  # z^50+z^4+z^3+z^2+1
+    51: 0x800000000004B,  # z^51+z^6+z^3+z+1
+    52: 0x10000000000009,  # z^52+z^3+1
+    53: 0x20000000000047,  # z^53+z^6+z^2+z+1
+    54: 0x4000000000007D,  # z^54+z^6+z^5+z^4+z^3+z^2+1
+    55: 0x80000000000047,  # z^55+z^6+z^2+z+1
+    56: 0x100000000000095,  # z^56+z^7+z^4+z^2+1
+    57: 0x200000000000011,  # z^57+z^4+1
+    58: 0x400000000000063,  # z^58+z^6+z^5+z+1
+    59: 0x80000000000007B,  # z^59+z^6+z^5+z^4+z^3+z+1
+    60: 0x1000000000000003,  # z^60+z+1
+    61: 0x2000000000000027,  # z^61+z^5+z^2+z+1
+    62: 0x4000000000000069,  # z^62+z^6+z^5+z^3+1
+    63: 0x8000000000000003,  # z^63+z+1
+    64: 0x1000000000000001B,  # z^64+z^4+z^3+z+1
+}
+Mu = {
+    17: 0xA90D,  # z^15+z^13+z^11+z^8+z^3+z^2+1
+    18: 0x3F256,  # z^17+z^16+z^15+z^14+z^13+z^12+z^9+z^6+z^4+z^2+z
+    19: 0x6108E,  # z^18+z^17+z^12+z^7+z^3+z^2+z
+    20: 0x3FEAA,  # z^17+z^16+z^15+z^14+z^13+z^12+z^11+z^10+z^9+z^7+z^5+z^3+z
+    21: 0x12FEBE,
+    22: 0x348466,  # z^21+z^20+z^18+z^15+z^10+z^6+z^5+z^2+z
+    23: 0x3F4CF0,
+    24: 0xF1FAD7,
+    25: 0x1DB45E0,
+    26: 0x3EF83B5,
+    27: 0x3E51023,  # z^25+z^24+z^23+z^22+z^21+z^18+z^16+z^12+z^5+z+1
+    28: 0xCB5E4F5,
+    29: 0x2AB9BCC,
+    30: 0x33A6EA47,
+    31: 0x71AEA3F9,
+    32: 0x93D0A9B2,
+    33: 0xE27DF6AB,
+    34: 0x9A1B5C1C,
+    35: 0x211BC95EC,
+    36: 0x2FE156A03,
+    37: 0x334BB14AF,
+    38: 0xBA6C81B94,
+    39: 0x72737B1F3E,
+    40: 0x792678F48E,
+    41: 0x1BB2B376908,
+    42: 0x23E0628213E,
+    43: 0x9B29537982,
+    44: 0x1E36C729008,
+    45: 0x3BC2F62C02D,
+    46: 0x1BC23B6603DA,
+    47: 0x45F23FD96219,
+    48: 0xEE2BF7821AB9,
+    49: 0x868A0968E304,
+    50: 0x13A7C042586E4,
+    51: 0xFE2AEB4C959A,
+    52: 0x14807794AAE47,
+    53: 0x28AD9274D844E,
+    54: 0x30083E2D3A6AEF,
+    55: 0x69B4E83DFA0327,
+    56: 0xF9B3B2119E7BF2,
+    57: 0x9933CF398D3EDB,
+    58: 0x1C55B80F492A8E6,
+    59: 0x289E35327A34B1B,
+    60: 0xBC44ABA162B6328,
+    61: 0x16512BC44BDAC640,
+    62: 0x3AB64D1C77E6FA8E,
+    63: 0x8279DC90C19A73B,
+    64: 0xE796C5C1B7448983,
+}
+Nu = {
+    17: 0xDBA8,  # z^15+z^14+z^12+z^11+z^9+z^8+z^7+z^5+z^3
+    18: 0x360B3,  # z^17+z^16+z^14+z^13+z^7+z^5+z^4+z+1
+    19: 0x5123B,  # z^18+z^16+z^12+z^9+z^5+z^4+z^3+z+1
+    20: 0x9380B,  # z^19+z^16+z^13+z^12+z^11+z^3+z+1
+    21: 0xF310E,  # z^19+z^18+z^17+z^16+z^13+z^12+z^8+z^3+z^2+z
+    22: 0x1638A,  # z^16+z^14+z^13+z^9+z^8+z^7+z^3+z
+    23: 0x2C4CF3,  # z^21+z^19+z^18+z^14+z^11+z^10+z^7+z^6+z^5+z^4+z+1
+    24: 0x7C60B5,  # z^22+z^21+z^20+z^19+z^18+z^14+z^13+z^7+z^5+z^4+z^2+1
+    25: 0x1554504,  # z^24+z^22+z^20+z^18+z^16+z^14+z^10+z^8+z^2
+    26: 0x3A2CF15,
+    27: 0x5F2DE6,
+    28: 0x1F41F90,
+    29: 0x1207FAD4,
+    30: 0x32DA0A1E,
+    31: 0x292736EE,
+    32: 0xA4503CC,  # z^27+z^25+z^22+z^18+z^16+z^9+z^8+z^7+z^6+z^3+z^2
+    33: 0x1AD63D041,
+    34: 0x26BF738B6,
+    35: 0x28DE8D4CC,
+    36: 0x3CAE212AC,
+    37: 0x18B2CB7730,
+    38: 0x38A6EDB17E,
+    39: 0x4D5A344508,
+    40: 0x6A0F5B7C1,
+    41: 0x173EC8FEFD6,
+    42: 0x52CE798795,
+    43: 0x344F99E2264,
+    44: 0xFCADA9AA133,
+    45: 0x13968D84E6F9,
+    46: 0x282EF5D0A7E3,
+    47: 0x2A868453266,
+    48: 0x6BF06F04E269,
+    49: 0x18237D19D7068,
+    50: 0x3268360355253,
+    51: 0x34D15B7EBDDF2,
+    52: 0xE495A873AD315,
+    53: 0x12C274E2213D67,
+    54: 0x293F38624849C5,
+    55: 0x685B0B509F4CC,
+    56: 0x5A8C57166B36B4,
+    57: 0x9E2ADC3C18F9E4,
+    58: 0x304DE608F1E6425,
+    59: 0x49DE512004B0239,
+    60: 0xF10D2838D9064B8,
+    61: 0x15ED3F31CE53AEC5,
+    62: 0x12C46454275C76AE,
+    63: 0x6918D8B38A3A3F8E,
+    64: 0xD9CFF84FF7C15A1D,
+}
+Cx = {
+    (2, 17): '0x49D4x+0x571E',
+    (2, 18): '0x2E20Ex+0x2FFA4',
+    (2, 19): '0x19715x+0x13363',
+    (2, 20): '0xFE6C7x+0x95445',
+    (2, 21): '0x17FA96x+0xC9458',
+    (2, 22): '0x241D21x+0x3FB3A2',
+    (2, 23): '0x2B2298x+0x3D3BC1',
+    (2, 24): '0x8B0307x+0xE92493',
+    (2, 25): '0x1439F22x+0x14A21E1',
+    (2, 26): '0x1C15A9Ex+0x4E6F85',
+    (2, 27): '0x29D3AE3x+0x6FFC66D',
+    (2, 28): '0xEAC123Bx+0xC4CDEC',
+    (2, 29): '0x4EF6006x+0x12C4DFFF',
+    (2, 30): '0x2BCBBC02x+0x10816B44',
+    (2, 31): '0x400B15D9x+0x3E7AF4AC',
+    (2, 32): '0xD7AB3F00x+0xD4779348',
+    (2, 33): '0x14D6AD7C4x+0x344B7EB1',
+    (2, 34): '0x3C117BB4Cx+0x17C1059CC',
+    (2, 35): '0x7902CFA01x+0x5E8143AEE',
+    (2, 36): '0x95A26DD4x+0x99D51CCC7',
+    (2, 37): '0xF0D3F768Ex+0xC0529CD27',
+    (2, 38): '0x8D1BBBD24x+0x264649E06F',
+    (2, 39): '0x2BE8032818x+0x79240607BD',
+    (2, 40): '0x2F42A6FD5Fx+0x1811B68AF3',
+    (2, 41): '0x165B497F3EBx+0x120298AAEAD',
+    (2, 42): '0x2C57C24F3Ax+0x20B99622E5F',
+    (2, 43): '0x623DE8D5999x+0x16272CA7C76',
+    (2, 44): '0xA047CE42E9Fx+0x8A149A23586',
+    (2, 45): '0x7B81319803Ex+0x32721BF24D5',
+    (2, 46): '0x3DFBE103AF2Cx+0x3212B5577C9F',
+    (2, 47): '0x674B3BD367FCx+0x99E06EFC666',
+    (2, 48): '0xB62122E98AB9x+0x756C9BC6E775',
+    (2, 49): '0x567D2295A44Ex+0x25590C9E140C',
+    (2, 50): '0x2F32664C50519x+0x318FE17EA93C5',
+    (2, 51): '0x44C810AE73071x+0xC3900BD4611E',
+    (2, 52): '0x91E165CF44D22x+0xBDCF009EF51E9',
+    (2, 53): '0x158A589B0E50ECx+0x878B05F819BF3',
+    (2, 54): '0x357268A00113D1x+0x97C16D0C14209',
+    (2, 55): '0x913A855318D0Cx+0x59616FB65D9018',
+    (2, 56): '0x9936D0001876BDx+0xC27D80AD41D486',
+    (2, 57): '0x19B7CB5BEA5AC27x+0x9E5A3E179968B1',
+    (2, 58): '0x37171C0DFB9A2C9x+0x294C94FF7AD6897',
+    (2, 59): '0x249A610A9F74C6Fx+0x6FFA4D2752876C8',
+    (2, 60): '0xAD23FB3D1368E1Bx+0x101CEF86FE9DFC6',
+    (2, 61): '0xF829006390A125Fx+0xD2D02AECB5B1E40',
+    (2, 62): '0x2FF2039185130BC8x+0x3082C4090571BC71',
+    (2, 63): '0x7507D6584D701319x+0x6ED8542AF20567BF',
+    (2, 64): '0xB2BD455DA59D3520x+0x49F9EA418D70EDFC',
+    (3, 17): '0x12462x^2+0x142B0x+0x11695',
+    (3, 18): '0x38D8x^2+0x5978x+0x3E811',
+    (3, 19): '0x47E7Ax^2+0x5B4C8x+0x47585',
+    (3, 20): '0x3AFA7x^2+0x84C3Dx+0xAB54A',
+    (3, 21): '0x44494x^2+0x1C7A66x+0x650AA',
+    (3, 22): '0x3241EEx^2+0x1ADF85x+0x18BE98',
+    (3, 23): '0x28E5AEx^2+0x751DDCx+0x22818E',
+    (3, 24): '0x21D05x^2+0xA97280x+0xB96B3C',
+    (3, 25): '0xF8AC9Fx^2+0x1F8FBA5x+0x1015376',
+    (3, 26): '0x14F54CFx^2+0x332D451x+0x22E7B9B',
+    (3, 27): '0x9CFBC0x^2+0x56B879Bx+0x6E85882',
+    (3, 28): '0xEBBAA79x^2+0x9E20608x+0xD41DBE8',
+    (3, 29): '0x1DB78CDEx^2+0xA6CFF87x+0xF6760D',
+    (3, 30): '0x388B1EBx^2+0x3C4189F3x+0x24716A99',
+    (3, 31): '0x2B3CFEE6x^2+0x701D3079x+0x56AFA858',
+    (3, 32): '0x609EA57x^2+0xCCF7E039x+0x3028CFF',
+    (3, 33): '0x2082B01Fx^2+0x140D40B5Fx+0x1DD00FB83',
+    (3, 34): '0x2A2B8D698x^2+0x195C40A0Ax+0x2E5322802',
+    (3, 35): '0xBAFF8BCAx^2+0x237C34009x+0xA29337E9',
+    (3, 36): '0x1942716A4x^2+0x78FC9246Dx+0xF5BD77DD3',
+    (3, 37): '0x19A2521170x^2+0x1F45829699x+0x5F69B03AD',
+    (3, 38): '0x1118928661x^2+0x2248A950A7x+0xA39F84DE6',
+    (3, 39): '0x696BDFD7FDx^2+0x6A654DDFC9x+0x2F6075EA28',
+    (3, 40): '0x4E8867C8EEx^2+0x9133521B3Ex+0x2133CDB199',
+    (3, 41): '0x1346834D966x^2+0x10B10C532C6x+0x1D03AF4E024',
+    (3, 42): '0x1C92DF2105Bx^2+0x370B0AAF9ABx+0x8821EE96E0',
+    (3, 43): '0x38030A97884x^2+0x98724E2A91x+0x3AF3B906CD',
+    (3, 44): '0xE4E35F95F35x^2+0x4093E8CD24Fx+0xF560D051C00',
+    (3, 45): '0x18218036BD1Ax^2+0xFF682DBD9ABx+0x5DA0FA66D6',
+    (3, 46): '0x15F04ABD3564x^2+0x4048CDDC163x+0x46136589EDB',
+    (3, 47): '0x173DC09FCC79x^2+0x3CCF3A294448x+0x376C1FFF61E8',
+    (3, 48): '0x183B43D4DF7Ax^2+0xEF659EFC1FAEx+0x361EB5F818A9',
+    (3, 49): '0x73F200E4DAD3x^2+0x3F6218352D7Fx+0x38E70B5A8815',
+    (3, 50): '0x237015846483Cx^2+0x201EC8D60B1C7x+0x2AF3CC8504AD3',
+    (3, 51): '0x181251D1F41D8x^2+0x15102ADABD457x+0x1030EE6973382',
+    (3, 52): '0xFF24FAE2D7612x^2+0x1AAC6C4220986x+0xA94CCF1BB6F9F',
+    (3, 53): '0x1C3439D1CA9048x^2+0xCAACEDF577051x+0x1843271B873825',
+    (3, 54): '0xFE2C40D8C3D15x^2+0x1A70754A5B6298x+0x97A9EE1F05AF7',
+    (3, 55): '0x7E4FE2B1D4333Fx^2+0x5F9BAAF25AD44Dx+0x3852896C6C502C',
+    (3, 56): '0x85E865CBDBEA25x^2+0x1CFB7BF01E767x+0xA3ABD60A091B3E',
+    (3, 57): '0xFC76D42A07E208x^2+0x340139BCBF9631x+0x160477718A790C4',
+    (3, 58): '0x90C4BA90981BDAx^2+0x398EDE137DDD54Dx+0x14CF9D05A096F9F',
+    (3, 59): '0x67EB4C198BB01CBx^2+0x1B4B1A58462EEBFx+0x373A978618098EA',
+    (3, 60): '0x70EFCCD9A8C1330x^2+0x2EBC34452451E9Bx+0x17ABE16DC0650EC',
+    (3, 61): '0x1B55F0B6D4669213x^2+0x1165ECFB05DE36CBx+0x1CBB53D17EB21F5A',
+    (3, 62): '0x214569FF060A17C1x^2+0x2E21E9139E963C89x+0x211233AE62A9091D',
+    (3, 63): '0x85FD6473EC106B8x^2+0x7089A4599F666C28x+0x53F810882CEE2750',
+    (3, 64): '0xB11F7C850E80AD28x^2+0x2A042359B94FC7BBx+0x2F09370784699868',
+    (4, 17): '0x4044x^3+0x10F03x^2+0x1F060x+0x65F4',
+    (4, 18): '0x389B5x^3+0x3C875x^2+0x39DBBx+0x3A337',
+    (4, 19): '0x17D88x^3+0x683B4x^2+0x628CBx+0x62EDE',
+    (4, 20): '0x6EB49x^3+0x2FBF3x^2+0x98EB8x+0x76E17',
+    (4, 21): '0x1CEAC4x^3+0xB1CA1x^2+0x6F7F0x+0x79FAB',
+    (4, 22): '0x17E9B3x^3+0x3A456Dx^2+0xFA5E3x+0x9D7C4',
+    (4, 23): '0x2B7B32x^3+0x492BE9x^2+0x742BE8x+0x3C4B24',
+    (4, 24): '0x81EDEx^3+0xAAAF16x^2+0xE947Ex+0xC0891F',
+    (4, 25): '0x19317B3x^3+0x106F54Ex^2+0x356178x+0x1136BDC',
+    (4, 26): '0x3DEFAFCx^3+0x8F9B04x^2+0x3FDCC5Bx+0x3AC9573',
+    (4, 27): '0x57BD261x^3+0x1919D2Bx^2+0x2078553x+0x32B8CB9',
+    (4, 28): '0x4A97989x^3+0xFD796F0x^2+0x6AC4A8Dx+0x7AD0A19',
+    (4, 29): '0x1FEBEAEEx^3+0x9DB92C1x^2+0x171B6B22x+0x18539298',
+    (4, 30): '0x39A48FC2x^3+0x22B43C59x^2+0x676CB80x+0x120F0079',
+    (4, 31): '0x33F80546x^3+0x15F2D75x^2+0x74F5171Fx+0x606A3483',
+    (4, 32): '0xE2B37B1Ax^3+0xBD060EC8x^2+0xC37E42A4x+0xD864FA39',
+    (4, 33): '0x38C5F698x^3+0xFB189EBx^2+0x703875A7x+0x1E030FC71',
+    (4, 34): '0x1A7134FE6x^3+0x45BFE697x^2+0x2FC8341F5x+0x2E7A3EABC',
+    (4, 35): '0x54068309x^3+0x42AF4E511x^2+0x6C6C69656x+0x50625DC27',
+    (4, 36): '0x7DB34FCB0x^3+0xA54048701x^2+0x145B22573x+0x82495585',
+    (4, 37): '0x1B99E9E924x^3+0x199641C82Ex^2+0x1B027FE21Cx+0x764726196',
+    (4, 38): '0x32328FBE62x^3+0x29D0DA7121x^2+0xB346260E2x+0x3E8BE76096',
+    (4, 39): '0x13F4E4F90Ex^3+0x4C3F21FC27x^2+0x678788014Cx+0x50C2C9BCEB',
+    (4, 40): '0xC1FCEFB9A4x^3+0x2F1908AF02x^2+0x89D5E55413x+0x99FBECA683',
+    (4, 41): '0xB86A92FA65x^3+0x1E1D0E98D9Ax^2+0x18AA339A2AFx+0xA1C6C98E58',
+    (4, 42): '0xAA46987187x^3+0x1F9F0A82D5Cx^2+0xD90C56C655x+0x4B90CF40F4',
+    (4, 43): '0x782815F48C9x^3+0x285FB6B9689x^2+0x3CE1BC54A6x'
+             '+0x2E20834EF7C',
+    (4, 44): '0xB7E1F3BDDA6x^3+0xF4B7F65DEEFx^2+0x2BE0D0FF2B9x'
+             '+0xB446C926139',
+    (4, 45): '0xE008D9E777Dx^3+0xBABFD8B3A0Fx^2+0x6B2E53C3532x'
+             '+0x165A025932A0',
+    (4, 46): '0x1CEC0A1660BFx^3+0x2311CEC3084Bx^2+0x1BE8CC147342x'
+             '+0xE920E1B339A',
+    (4, 47): '0x955EDC1C72Bx^3+0x4DA813424F85x^2+0xCD614857289x'
+             '+0x7C6F7E75E17F',
+    (4, 48): '0xFFB5CFC3F39Bx^3+0xAD3E2539366Ax^2+0xD091626FD764x'
+             '+0xE6C315BE94F',
+    (4, 49): '0x1BFD4A2E1783Fx^3+0xED729DBBE29Cx^2+0x118BFEDB7436Cx'
+             '+0xBBC07E20EC20',
+    (4, 50): '0xA35163A1D655x^3+0x24AA71C3E3495x^2+0x336BFC2221505x'
+             '+0x3372DCA100C4C',
+    (4, 51): '0x74708588997AFx^3+0x7086A5671F37Fx^2+0xF07EE5B40B69x'
+             '+0x601B5899EBA0B',
+    (4, 52): '0xD804EF7B3EC61x^3+0x6316EAA22426Ex^2+0xEB80FAF869602x'
+             '+0x256D15CB1F9F5',
+    (4, 53): '0xB454134DCF179x^3+0x126F25DE2236A4x^2+0x1EAC03FFEDA168x'
+             '+0x132CFC709E4830',
+    (4, 54): '0x1756366C5BDED6x^3+0x169E65EDCEBCD4x^2+0x2A686CB0506246x'
+             '+0x23E13328A166DD',
+    (4, 55): '0x3E1FDB3FFCD0D5x^3+0x4F7CE5CCE35C21x^2+0x5C92599BADF65Dx'
+             '+0x212684994714F3',
+    (4, 56): '0xE46C3BEDEB468Ax^3+0xD125BC484C1C8Dx^2+0x96C812C55031F6x'
+             '+0xF03E4B1870B6CE',
+    (4, 57): '0x19838F5253D43F8x^3+0x18B3766F0B54F26x^2+0x1334F75E5F596C5x'
+             '+0x3641D595BE6DBF',
+    (4, 58): '0x1AB5E0EA8A2AAF0x^3+0x8137D5EBF705E5x^2+0x38FC3079269FA19x'
+             '+0xD7EA896C75748D',
+    (4, 59): '0x4FEA0DA9F89D053x^3+0x3E31DBD585A3879x^2+0x1DE84C1DE9F1059x'
+             '+0x660CE7BFB3B98D6',
+    (4, 60): '0xC2F5C1A849D4248x^3+0x378262E2D90621Cx^2+0x79BE120EFDED65Dx'
+             '+0xEC95C666C008BC8',
+    (4, 61): '0x70D40479FF12D2Dx^3+0xA942333B21EEC74x^2'
+             '+0x1EAD18339C65EDC5x+0xB8B7F55EB40E0AF',
+    (4, 62): '0x79CC2BB9BFDECDDx^3+0x9F4E564C3FE6AA4x^2'
+             '+0x3D28AC0DC4D2AF76x+0x16103CB0371B955E',
+    (4, 63): '0x28680971201A0F34x^3+0x74CCD9260B855E99x^2'
+             '+0x3CF9A49EF389EE2Dx+0x503BCC2E0D636E79',
+    (4, 64): '0x1D9226E8193759A0x^3+0xFD5344C54A3671B0x^2'
+             '+0xBE5055492A12973Fx+0x4C6774B9CD7B7509',
+    (5, 17): '0x19230x^4+0x17E61x^3+0x7E27x^2+0x348Ex+0x153B1',
+    (5, 18): '0x1696Dx^4+0x9C17x^3+0x1017Ex^2+0x13A61x+0x2197B',
+    (5, 19): '0x1E790x^4+0x3CF0Dx^3+0x637C6x^2+0xE667x+0x499C1',
+    (5, 20): '0x9FAE7x^4+0xF8B4Ex^3+0x567FBx^2+0x30716x+0x2EC80',
+    (5, 21): '0x18D48Ex^4+0x1B101Ax^3+0x8CD54x^2+0xBBFADx+0xEEFD3',
+    (5, 22): '0x2FD3C2x^4+0xAC526x^3+0x19599Dx^2+0x7EF5Ax+0x31903E',
+    (5, 23): '0x1D02B1x^4+0x39D2C4x^3+0x1168B0x^2+0x7C2AA0x+0x6AD1A0',
+    (5, 24): '0xF27B07x^4+0x7B3F91x^3+0xCE42F9x^2+0x44728Ex+0xD8DB31',
+    (5, 25): '0x1E76C14x^4+0x8764CBx^3+0x1C868EEx^2+0xCABFFx+0x171CD40',
+    (5, 26): '0xABD4C5x^4+0x2557B43x^3+0x2B3DDEDx^2+0x2D6AF9Dx+0x3527D63',
+    (5, 27): '0x71B4B8x^4+0x30662EAx^3+0x38E6C26x^2+0x68C7399x+0x1B3DCF2',
+    (5, 28): '0x975AD85x^4+0xDC743F9x^3+0xA181AFx^2+0xEF6A5D6x+0x7A40860',
+    (5, 29): '0x128C4B1Cx^4+0xD6AB63x^3+0xCE5AE7Fx^2+0xEAABB70x+0x1189270D',
+    (5, 30): '0x63A5C74x^4+0x30118C98x^3+0x38E3E118x^2+0x30C71622x'
+             '+0xCDED7F9',
+    (5, 31): '0x26F2ECx^4+0xBC04665x^3+0x30AC412Ex^2+0x4BD5E5BAx'
+             '+0x6E2B6CAB',
+    (5, 32): '0xC96D1C14x^4+0x8B86E5Ax^3+0x8C07AC3Bx^2+0x43D992A0x'
+             '+0x5B8C9AA0',
+    (5, 33): '0x27C48901x^4+0x182288E09x^3+0x1D703CD92x^2+0x6AC45D1Fx'
+             '+0x1337F761E',
+    (5, 34): '0x2336B1CE6x^4+0x3A7BF5B2x^3+0x3582F0912x^2+0x2B86C3856x'
+             '+0x6879F21A',
+    (5, 35): '0x63CC5B637x^4+0x7594020EAx^3+0x144E5C48Ax^2+0x387004BB9x'
+             '+0x325DF1FF7',
+    (5, 36): '0xA41C89849x^4+0xEB08B4CCFx^3+0xF12280A89x^2+0xC136F270x'
+             '+0xD87F6C548',
+    (5, 37): '0x37F4FCC58x^4+0xFCA66FFF8x^3+0x3DA973493x^2+0xBB9D05CCBx'
+             '+0x33CC2CEE0',
+    (5, 38): '0x18EEFCFEA8x^4+0xF2C7118D8x^3+0x3E05D11DDCx^2+0x38EF6D22AFx'
+             '+0x251951FA04',
+    (5, 39): '0x73125862D3x^4+0x41E507EE94x^3+0x714E4FA93Bx^2'
+             '+0x32E1525353x+0x19D441C230',
+    (5, 40): '0x22D9413241x^4+0xA5ABE6478Cx^3+0x3663AE8608x^2'
+             '+0x558CA605DCx+0x884FB75270',
+    (5, 41): '0xDFFD8A9C65x^4+0xD31A4BBA8Ax^3+0x9915A7E295x^2'
+             '+0xD02DD16422x+0x1FD74F60870',
+    (5, 42): '0x370BF7C7E34x^4+0x1DA069CAA24x^3+0x11D85CDC55Bx^2'
+             '+0x24CCD9B1DEFx+0x2EA034B671F',
+    (5, 43): '0xEED9BED09Cx^4+0xF03E68029x^3+0x1BC3E183059x^2'
+             '+0x17C27B3ED2Fx+0x44625EA64C4',
+    (5, 44): '0x9DDD69634A3x^4+0x5FCDD6AE16Ex^3+0x357ED4096C6x^2'
+             '+0x83DACA39CBDx+0xD517F208E63',
+    (5, 45): '0x19291620193Bx^4+0xD331EE07A0Ex^3+0xF721EA091E1x^2'
+             '+0x1E344EF3BDAx+0x1E283B7C67E9',
+    (5, 46): '0x102C9402508Bx^4+0x2CFF244E567Fx^3+0x2140A6B6DB1Ax^2'
+             '+0x353C27079E56x+0x14E61D66B576',
+    (5, 47): '0x39B2FD5D9D84x^4+0x246DEE2AE19Dx^3+0xFFF69CF4F74x^2'
+             '+0x1D5EA421179x+0x2A95142A1CC7',
+    (5, 48): '0xD6F08A89EF30x^4+0xEAB2B23DA12Dx^3+0x6908AD63C83Fx^2'
+             '+0x9EC830361321x+0xC943E8FE58DD',
+    (5, 49): '0xB7DF3D66E5B9x^4+0x607D5A3E84FEx^3+0x409627C9007Ex^2'
+             '+0x37B330F32CBFx+0x11BC30B89E5A4',
+    (5, 50): '0x1329D64443663x^4+0x1FFB1F40595BEx^3+0x1148C434CD8A3x^2'
+             '+0x3B8A81A7032F8x+0x207E6CCEF9BAE',
+    (5, 51): '0x3E85C3BC8CA3Ex^4+0x5194E5422E27Fx^3+0x75FEABA4A05BCx^2'
+             '+0x3416120BCA18Dx+0x2EE6D25693BA9',
+    (5, 52): '0x8440EA8613677x^4+0x20F2A486B3425x^3+0x9AE1AEAEA7B02x^2'
+             '+0xF0607F151245x+0xF7D3C636D2567',
+    (5, 53): '0x7828E57D4A211x^4+0x181309912E186Ex^3+0xFAC9F3F721669x^2'
+             '+0x1414F211034D57x+0xA52E784DABC14',
+    (5, 54): '0x3CFFFBF52A460Cx^4+0x3FA69A2C870A98x^3+0x7B0CA3445C951x^2'
+             '+0x163FB682FDE4E1x+0x30EF0169590AFE',
+    (5, 55): '0xE4B85E4E7EAE3x^4+0x7CBF8EA88F3214x^3+0x66B23F4A7023C1x^2'
+             '+0x19C499672BB4Ex+0x7B5CB5DDA8D598',
+    (5, 56): '0x34C257DB3EA9EFx^4+0xD5A77B6F710F69x^3+0x8D697C4D3985B3x^2'
+             '+0x7A9B09A2D79D13x+0xC889C0EF9C82D4',
+    (5, 57): '0x16DC31578A45112x^4+0x1564FC2C0415991x^3'
+             '+0x1CD69F7B3C5C632x^2+0x4BD8F4D6082A57x+0x8C07FDC9C2DAFF',
+    (5, 58): '0x4AA162DFBBEC71x^4+0x322DC5BEC163C1Cx^3'
+             '+0x255AC6F31EE5C4Ex^2+0x3ABBCEB429790F7x+0x3C49E63FF3935A0',
+    (5, 59): '0x318C654310F7569x^4+0x28F4884F162D123x^3'
+             '+0xF5EFB217BB033Ax^2+0x7B71A873496ED5Fx+0x3D699B990239135',
+    (5, 60): '0xBDA14B2DD9DBDD6x^4+0x875CDC1F29375A4x^3'
+             '+0xFFE9442DDF38901x^2+0x4E8AD2AFC2FBC06x+0xF86A4B5CE8A65CF',
+    (5, 61): '0x7DF65941DFA1BCDx^4+0x17D2E8F0A3B0298Fx^3'
+             '+0x1F0C9FB285D07622x^2+0x1F8ACAB751510DEAx+0x92115FA8F88FAE8',
+    (5, 62): '0x2385573902E2904Dx^4+0x3A9F4B48D72EFEBBx^3'
+             '+0x1DE4FFB317B52D8Bx^2+0x1E0648B21A4E8A9x+0x21A4669425F0F39C',
+    (5, 63): '0x52BB97595724EA18x^4+0x5DA9FB38FA4AE27Fx^3'
+             '+0x2009045C54AF22D8x^2+0x3D35F123F25ACF5x+0x14D192C384C4F839',
+    (5, 64): '0x2F649FA1B948F15Cx^4+0x7ABED8E12118D5D5x^3'
+             '+0xC38B254A39457791x^2+0xEAA24331259F8885x'
+             '+0xB495AAD9782D19DD',
+    (6, 17): '0xA4A8x^5+0x4DABx^4+0x1D5B0x^3+0x1DCD5x^2+0x1F832x+0xF71A',
+    (6, 18): '0x6D52x^5+0x1DE59x^4+0x17A75x^3+0x11F57x^2+0x339AEx+0x1CD2B',
+    (6, 19): '0x95ABx^5+0x6D25Fx^4+0x50D82x^3+0x52EBDx^2+0x36F72x+0x1383',
+    (6, 20): '0xECDC4x^5+0x724E4x^4+0xCF057x^3+0xEDBACx^2+0x43B02x+0x85BDC',
+    (6, 21): '0x18BA30x^5+0x1DFE3Cx^4+0x96A23x^3+0xB676Bx^2+0x167158x'
+             '+0x13C5EE',
+    (6, 22): '0x168C17x^5+0x213800x^4+0x3855DDx^3+0x338501x^2+0x32FFC0x'
+             '+0x3235CD',
+    (6, 23): '0x58E814x^5+0x5B4F3Ax^4+0x4F5FB4x^3+0x97293x^2+0x35EB4Bx'
+             '+0x4A40BD',
+    (6, 24): '0x9E15C5x^5+0x56BE20x^4+0x95C28x^3+0x692B3Ex^2+0x7BBEE9x'
+             '+0x68356E',
+    (6, 25): '0x972836x^5+0x2D0A60x^4+0xB6C34Cx^3+0x471872x^2+0x15F9C61x'
+             '+0x1C2361F',
+    (6, 26): '0x3C3F7F4x^5+0x1093024x^4+0x3DC5ADEx^3+0x36456D7x^2'
+             '+0x259F882x+0x31B0B39',
+    (6, 27): '0x3ADA387x^5+0x1D2EBB2x^4+0x86BE4Fx^3+0x667AC4Dx^2'
+             '+0x1A0C851x+0x7D0042A',
+    (6, 28): '0x3F74CC0x^5+0xA7A974Cx^4+0xEEDE817x^3+0x692DD17x^2'
+             '+0xDE1950Fx+0x5EE80FA',
+    (6, 29): '0x879EF40x^5+0x1B505EB9x^4+0x13BF5848x^3+0x1C2FB278x^2'
+             '+0x1B519BBDx+0x1B79F7BA',
+    (6, 30): '0x24E6624x^5+0x39C37349x^4+0x3B96D929x^3+0x2D6AC33x^2'
+             '+0x3331A35Bx+0x3EA68E71',
+    (6, 31): '0x75DFFA7Bx^5+0x7288C1A7x^4+0x7F51DC8x^3+0x6B170998x^2'
+             '+0x3D0ADB87x+0x5EE40B13',
+    (6, 32): '0xB15118A4x^5+0xF1807F56x^4+0x284075BFx^3+0xC3DBDB41x^2'
+             '+0x41FFCBA9x+0xF9A05008',
+    (6, 33): '0x15AD41BBAx^5+0x8A5CA71x^4+0x118E34669x^3+0x18E1EDE87x^2'
+             '+0x193D21BD0x+0x1F8A237AA',
+    (6, 34): '0x174F537EAx^5+0x17923C6B4x^4+0x1B70AAEEFx^3+0x3CB427020x^2'
+             '+0x11ABB084Ax+0x15D120CBA',
+    (6, 35): '0x190A74EB1x^5+0x5BDECC1A0x^4+0x377C75F65x^3+0xC39B2212x^2'
+             '+0x7A455CD4x+0x324EFA2EB',
+    (6, 36): '0x89346CD17x^5+0xD41F3B195x^4+0xF67D0A34Cx^3+0x4B8794399x^2'
+             '+0x7CEE3862Fx+0x9E9E79670',
+    (6, 37): '0x6BA1C1942x^5+0x56E686BE6x^4+0x18385DF1E4x^3'
+             '+0x14F68ACF4Fx^2+0x528FBE56Ax+0x73BAE8C0B',
+    (6, 38): '0xFD99F3BA7x^5+0x2DA33B025Cx^4+0x26DC0F8D7Fx^3'
+             '+0x19FE8C5758x^2+0xC13C9527Ax+0x2776C9FB08',
+    (6, 39): '0x3E24D48CE4x^5+0x1618F59A5x^4+0x151811E74Ax^3'
+             '+0x2660F70107x^2+0xAB7EA2AEFx+0x14394AC09',
+    (6, 40): '0xEBDDBA0021x^5+0xD2DF454B94x^4+0x2C3D9F0271x^3'
+             '+0xFDB2A1C489x^2+0xC3241CC46Cx+0xE572B38E45',
+    (6, 41): '0x1CFAEE92FDAx^5+0x1AB3251DBDx^4+0x1B745932482x^3'
+             '+0xAF5B4A01BDx^2+0x1D5734C2589x+0xA02F681A17',
+    (6, 42): '0x6FD8E51998x^5+0x25A6379AB69x^4+0x301C7E9582Ex^3'
+             '+0x3F997D10277x^2+0x38CB23B38FCx+0xD4D112EC8D',
+    (6, 43): '0x69632B5C61Ex^5+0x4A5B33B3E4x^4+0x42A3D49A58Fx^3'
+             '+0x3D4278630D8x^2+0x725F64A60ACx+0x5B1B87FBFAC',
+    (6, 44): '0xF7B224CE090x^5+0x27A832FBC59x^4+0x9251A5C6EB2x^3'
+             '+0x62C2BF4EAB3x^2+0xF9CA10CC1x+0x12E1A778895',
+    (6, 45): '0x16E14D83A1FAx^5+0xFEC9CFF8124x^4+0xABB8ABBE0AFx^3'
+             '+0x14EEB74AD90Cx^2+0x10634532DFB9x+0x1E2F23782A82',
+    (6, 46): '0x259CFDC33DE6x^5+0x4BDD40EC0C7x^4+0x1DB5DF747159x^3'
+             '+0x253026C00B31x^2+0x1554FE1A7C72x+0x13B8226F491',
+    (6, 47): '0x32E8F389D25Ax^5+0xE425C4A77EDx^4+0x2875BBEE514Cx^3'
+             '+0x759B422D86BEx^2+0x6ED3378B7505x+0x5F50DB507472',
+    (6, 48): '0x1C68CF82627Ax^5+0x7637CFDC69F3x^4+0x4AADFFC6F9E6x^3'
+             '+0xD952121959A8x^2+0x404342B54645x+0xB98A810F4F08',
+    (6, 49): '0xCD586EED022Cx^5+0x345055CE6DF2x^4+0x161F84666056Cx^3'
+             '+0x3DC51E60C473x^2+0x1F2301279058Bx+0x4E9C703B2984',
+    (6, 50): '0x21FF17F344BC0x^5+0x23620B0074A51x^4+0x650B377D6542x^3'
+             '+0x452972C07BABx^2+0x20F84C1F49132x+0xC522C4616082',
+    (6, 51): '0x58F1B68EC1BCFx^5+0x5EDF318FBEC33x^4+0x14D90A00A7E10x^3'
+             '+0x25E9B54F83D69x^2+0x7EB2A5FD5A4DCx+0x1EDC29363401F',
+    (6, 52): '0xFBD7285CC0A61x^5+0x56D687CEC2584x^4+0x23401246EF24Bx^3'
+             '+0x4B36BA9802B9Ex^2+0x12A897310EA61x+0x34D382B88D559',
+    (6, 53): '0xC05B01F346A08x^5+0x1008107181DBC7x^4+0x1698B1DCAF428Ax^3'
+             '+0x79ED707B98D37x^2+0x2291F519B09B0x+0x17969C8C915B7B',
+    (6, 54): '0x19EF964EB9FE29x^5+0x3A27E9E70D3Ex^4+0x3211F02AEC29A2x^3'
+             '+0x3D63F3D8AFABB2x^2+0x16500DD8941AABx+0xBFA16BEAE291',
+    (6, 55): '0x679B140F33464Fx^5+0x5F6C656B53D3C3x^4+0x5AF5EEB042E510x^3'
+             '+0x141FCA88929CCx^2+0x6B882FAC3FBD73x+0x3B08CB2F80FBB4',
+    (6, 56): '0x51ACA1E297193Dx^5+0xDA4D33D7D3604Ex^4+0x7B69BEF23C1029x^3'
+             '+0x33F055845B8FEEx^2+0x602C97C53E3788x+0xE1DFC8B271FF09',
+    (6, 57): '0x1DB64E87170855x^5+0x1F210107963CD3Dx^4+0xA0B69F69127851x^3'
+             '+0xC50804C3D6F39Bx^2+0x12FBCD6E48AF0E6x+0x12155D54BF857EF',
+    (6, 58): '0x30C05EBD5A769FEx^5+0x31E8B08BBA3DF67x^4'
+             '+0x37F71452D3F8BADx^3+0x13ECA87D68F7D62x^2'
+             '+0x380D22FA4206124x+0x21E9F64A16FEF05',
+    (6, 59): '0x62F0D5B15092093x^5+0x15E353F95D0AAEEx^4'
+             '+0x2306D73245B0F87x^3+0x772BD638145FBAEx^2'
+             '+0x124848F59F13F05x+0x6D946242A9DA33D',
+    (6, 60): '0x5CB41253295BB38x^5+0x458C5D30735DCABx^4'
+             '+0xC92338DA1CBD211x^3+0xBD0746D1A1908FCx^2'
+             '+0xB81F631247FC77Cx+0x9228701781962A8',
+    (6, 61): '0x5C24173E3D1CE7Fx^5+0x214028D033DDD44x^4'
+             '+0x1075019EAFC7E612x^3+0x1B607E6E61BCD233x^2'
+             '+0x837CD339C4E52DFx+0x1AB0811178F4C78B',
+    (6, 62): '0x2CBA6CDA71711BE3x^5+0x1B2CC6BCAE11A226x^4'
+             '+0x34DA3FDAFDDA08CDx^3+0x26B6ECE90C5A273Bx^2'
+             '+0x10F4E8A10832969Cx+0x602DE68A8432035',
+    (6, 63): '0xBC791BE89BE2508x^5+0x20F704E3C84C6A69x^4'
+             '+0x680D98055B6955AEx^3+0x43E26202D764308Dx^2'
+             '+0x493A242C209D043Cx+0x203E6AE20056AB17',
+    (6, 64): '0x2A90C2651CA8F6CCx^5+0x94A821581929A1CEx^4'
+             '+0xE2F92942DCBE6826x^3+0x9C0E438D7B6A2985x^2'
+             '+0xCDBAAF5CECE43AA8x+0x9CB199BE7465D6E7',
+    (7, 17): '0xB34Cx^6+0xC9B4x^5+0xCAF9x^4+0x4242x^3+0x511Ax^2+0xDECDx'
+             '+0x1396A',
+    (7, 18): '0x21791x^6+0x2BBD4x^5+0x3FE0Ex^4+0x3E074x^3+0x368BFx^2'
+             '+0x8188x+0x11BB0',
+    (7, 19): '0x2282x^6+0x14B25x^5+0x51FB7x^4+0x53FA4x^3+0x106Cx^2'
+             '+0x26C47x+0x69A33',
+    (7, 20): '0xD34D5x^6+0x606BEx^5+0xB49FFx^4+0xCE732x^3+0xA4433x^2'
+             '+0xC539Fx+0xD7F80',
+    (7, 21): '0x10451Ax^6+0x9B11x^5+0x218DDx^4+0x1235A7x^3+0xE00x^2'
+             '+0x72697x+0x1172A1',
+    (7, 22): '0x287E9Bx^6+0x2F54D0x^5+0x5899x^4+0x1DC801x^3+0x140767x^2'
+             '+0x3EDE03x+0x4B6DD',
+    (7, 23): '0x314FA8x^6+0x3F5EAEx^5+0xD2ECEx^4+0x360C12x^3+0x276F94x^2'
+             '+0x5ED84Dx+0x66820C',
+    (7, 24): '0xE70Ex^6+0x246DE2x^5+0x27344Dx^4+0x5BC666x^3+0x28803Ex^2'
+             '+0xC16C3Dx+0x25F405',
+    (7, 25): '0x1E11571x^6+0xCFB21Dx^5+0x1A89D84x^4+0x87DDE9x^3'
+             '+0xC79C66x^2+0x1F90F96x+0x1F5CA3E',
+    (7, 26): '0x51898Ax^6+0x1D001A8x^5+0x2065B1Cx^4+0x26DDAC1x^3'
+             '+0x3BD478Ax^2+0x1B62C7Dx+0x2DD2345',
+    (7, 27): '0x3EEED72x^6+0xB15842x^5+0x6CDFB91x^4+0x3ACE6BEx^3'
+             '+0x69788A2x^2+0x1F66BB2x+0x491BB88',
+    (7, 28): '0xB964C97x^6+0x659E2Fx^5+0xE1ABF8x^4+0x468951Fx^3'
+             '+0xC35FB7Ex^2+0xB86D81Cx+0xB71AE04',
+    (7, 29): '0x1AA9C92Cx^6+0x1D42188Ax^5+0x1A8ABA71x^4+0x1D9609A0x^3'
+             '+0x1D6D6F6Ex^2+0x3CC5AF5x+0x72782E2',
+    (7, 30): '0x19B9E2BDx^6+0xB31067Bx^5+0x33B898E2x^4+0x82D18D8x^3'
+             '+0x292BA381x^2+0x1E30FA84x+0x1659BB34',
+    (7, 31): '0x402E68D3x^6+0x1D70A77x^5+0x5B73B6EDx^4+0x4C2CA829x^3'
+             '+0x7D01D506x^2+0x7312CCBCx+0x4053DF18',
+    (7, 32): '0xAA13FEF5x^6+0x300C3976x^5+0x330C7D82x^4+0x5BDFDFA4x^3'
+             '+0xF0FD3CB0x^2+0x632CC54Ex+0x9EA91B6B',
+    (7, 33): '0x159574BBAx^6+0x106762FE0x^5+0x45B6C2Ax^4+0x1A9DE73Dx^3'
+             '+0x3C28CB18x^2+0x2276DE73x+0x15A3F04B4',
+    (7, 34): '0x15B9D0F56x^6+0x152553EAAx^5+0x166A8AD32x^4+0x21FE8EA79x^3'
+             '+0x2A8892830x^2+0x16C18728x+0x334211E02',
+    (7, 35): '0x5A0F5F351x^6+0x58D08C924x^5+0x7A926389Dx^4+0x41588B6A6x^3'
+             '+0x5563594F0x^2+0x73AE8F631x+0x70535415C',
+    (7, 36): '0x127813267x^6+0x211713E78x^5+0x32E5952BBx^4+0x3BB428159x^3'
+             '+0x9372AEFBFx^2+0x91DE49634x+0x92EB87BBF',
+    (7, 37): '0x1500110720x^6+0x1FA4B2FD82x^5+0xE6E5FCA36x^4'
+             '+0x10DCA74BCAx^3+0x1CD182D5x^2+0x2DEF96CADx+0xF5874AC03',
+    (7, 38): '0x6569C88D3x^6+0x1B95589687x^5+0x6B5AED686x^4'
+             '+0x374562B913x^3+0x95C978DC4x^2+0x303B4013C9x+0x3EB4358D24',
+    (7, 39): '0x3F607DBFFEx^6+0x120EC01F4x^5+0x69CCF4281x^4'
+             '+0x37DAFAFBAFx^3+0x61436E3413x^2+0x2223CCDF33x+0x35849C458',
+    (7, 40): '0x8C35F8836Bx^6+0xA7A6292601x^5+0x576416EF45x^4'
+             '+0x48391CF5E3x^3+0xA1C255D8DFx^2+0xB646F23CE3x+0x5BB67C40B9',
+    (7, 41): '0x1338C6C75EFx^6+0x1795BD15B42x^5+0x3761EB0320x^4'
+             '+0x16866EC3C37x^3+0x777AB58D4Dx^2+0x1390C75481Bx'
+             '+0xC7027609D5',
+    (7, 42): '0x26780000AB9x^6+0x6D14343B54x^5+0x26AAD8AF831x^4'
+             '+0x185A514CB82x^3+0x844048126Ax^2+0x107912754B2x'
+             '+0x14A08C74BE9',
+    (7, 43): '0x60D4C86425Dx^6+0x118328ABB8Ax^5+0x2107FC10995x^4'
+             '+0x54E07943C17x^3+0x298361785x^2+0x493DE8CB4D1x+0xB90022A464',
+    (7, 44): '0x411057A7B95x^6+0x16A0E743630x^5+0xBDF7306145Ax^4'
+             '+0xC380CB3A095x^3+0x5BB1245618Dx^2+0x4D2345F5F0Cx'
+             '+0x162488A569D',
+    (7, 45): '0xD408AF9D2C2x^6+0xFF13D3B581Ex^5+0x16EFEDBE92A7x^4'
+             '+0xBD5F1163FB2x^3+0x13C894E68E58x^2+0x7FCA9323112x'
+             '+0x1DBDCE9B0045',
+    (7, 46): '0x3C205C74F648x^6+0x8F9B9422A7x^5+0x24525416949Fx^4'
+             '+0x2574553AEFBAx^3+0x25FA9F75C5B6x^2+0x12D071F84AC4x'
+             '+0x316E6B5E11',
+    (7, 47): '0x7FE7C43ADD99x^6+0x82890D7FBF1x^5+0x4353FD6E424Cx^4'
+             '+0x23265E98B9DFx^3+0x6BCB2CAC668Ex^2+0x17DAD6BDAD08x'
+             '+0x79CC31E3680D',
+    (7, 48): '0xA033EDBDEA7x^6+0xE1DABABE2997x^5+0xF898F1302066x^4'
+             '+0xB797CB9E063Cx^3+0xAFD5258C11FCx^2+0x84FACE9D50BEx'
+             '+0xA713B7E70BFE',
+    (7, 49): '0xF58ACF1D35A1x^6+0xD4D7F138449Cx^5+0x13B9DD5BF7EE7x^4'
+             '+0x1DB8C72C3B2ECx^3+0x11104C240312Bx^2+0x1D62343CDB1BDx'
+             '+0x7D7D4830260B',
+    (7, 50): '0x3EC5E6EAB6CF7x^6+0x2B2EF8E9863C1x^5+0x39AFB236373D2x^4'
+             '+0x18957C7FB59F9x^3+0x1CCCD3F93791Bx^2+0x3AD8A474BD10Bx'
+             '+0x3DADC3CDA9262',
+    (7, 51): '0xCC90BDD8BABCx^6+0x482D1E38E6629x^5+0x6D03F1A429F96x^4'
+             '+0x7FF8942AFD9CBx^3+0x7F2509B796790x^2+0x7C05AE8DCF20Bx'
+             '+0x67C297BF3DC2F',
+    (7, 52): '0x92CE9143115AAx^6+0xCD433D767AE42x^5+0x8DB3283382D58x^4'
+             '+0x7A85F0999C84Bx^3+0x2BD15C91522x^2+0xC0ADA825BCE30x'
+             '+0xEE54A02AC41B2',
+    (7, 53): '0xF4651F3FC04Dx^6+0x1B686184381EC9x^5+0x684D0103A5643x^4'
+             '+0x199262CF1BC9FAx^3+0xA7A11EE191957x^2+0xFF50715F8E18Fx'
+             '+0x8989E59EF513A',
+    (7, 54): '0x31A7D27704AB56x^6+0x1A5DDBF4AEE179x^5+0x155A4EBE9E9AA5x^4'
+             '+0x2ACCB910B56C71x^3+0x7B090427769A6x^2+0x33F3B3C878563Fx'
+             '+0x24AE0A582E4D23',
+    (7, 55): '0x78E28FF6C7A0E7x^6+0x682656DCE54926x^5+0x76E2E6EDC20FC8x^4'
+             '+0x4C6D645E6C5BF4x^3+0xA0EE20621D8A5x^2+0x3990D20BE2C272x'
+             '+0x6F5145524735B6',
+    (7, 56): '0xC8C780FFDFF4C1x^6+0x9477604BDADFFAx^5+0x421D055725D027x^4'
+             '+0xEF442608EB730Bx^3+0xD74451DA6AC43Bx^2+0xCEE9B0AE2A2798x'
+             '+0xE280D84521216F',
+    (7, 57): '0x1E382286EECC59x^6+0x1903C0EC04B6301x^5+0xA86DEE7FA920FAx^4'
+             '+0x8C0DF059DB6A23x^3+0xFBF9C2D02B2DA9x^2+0x127BA73171C05DAx'
+             '+0xC8E2F7B4FCBDD',
+    (7, 58): '0x1CDF7415B069F04x^6+0x1DDD87874C771A8x^5'
+             '+0x1E43B90C5617314x^4+0x250F0E4615C33EBx^3'
+             '+0x31EBF24E498B8CEx^2+0xCBA1CE5756E111x+0xEB193678D19B58',
+    (7, 59): '0x6E892897B07F3B5x^6+0x572549389E7CCDEx^5'
+             '+0x14E65F137689808x^4+0x18237D61660A50Fx^3'
+             '+0x711C336A42F4942x^2+0x3D5DA9158BBF9E3x+0x4D8A8461EFC8B5C',
+    (7, 60): '0x7B961C835ABCE94x^6+0x1228F1466D5F9CEx^5'
+             '+0x600F54DA3500346x^4+0xC21032D3747FB30x^3'
+             '+0xE311C5F12E8627Ex^2+0xBF47E258D7C0588x+0x2F32F71A832B425',
+    (7, 61): '0x15807252A8EEC432x^6+0x91095B8DF100CC4x^5'
+             '+0x97B0838A7336EDEx^4+0x1844CD3191046397x^3'
+             '+0x1D7035B76893C031x^2+0x1FF5B038FAC1EA5Bx+0x6C05D6F93E9DC72',
+    (7, 62): '0x282235EE2250B681x^6+0x285077F7591C5925x^5'
+             '+0x2AE807CC0338F020x^4+0x2DED35D745049A69x^3'
+             '+0xE51AF6FA94DFC48x^2+0xF22C8F04E21D4ACx+0x356E483FBD3A318E',
+    (7, 63): '0x3FDC6B75D68AC265x^6+0x42B2CEF75BE05FFDx^5'
+             '+0x4C86EB86CC43D3B4x^4+0x26D42357D11FEA76x^3'
+             '+0xC019D0F4909C1C9x^2+0x100FD65FD19EECB4x+0x4A80F14E4C474ED0',
+    (7, 64): '0x960B7FF0A940523Bx^6+0x332EAA7EF4EE496Fx^5'
+             '+0x7DED00DA5F5D6760x^4+0xD98CFB752E4938BDx^3'
+             '+0xE3A0220877E113ABx^2+0xFDEC63880D79E95Fx'
+             '+0xBFEBCA56A057DCCD',
+    (8, 17): '0x17EC6x^7+0x3E3Bx^6+0x2832x^5+0xF271x^4+0x1C96x^3+0x352Ex^2'
+             '+0x11AA0x+0x1E08B',
+    (8, 18): '0x2412Ex^7+0x8D83x^6+0x1CF91x^5+0xC5D1x^4+0xE3B8x^3'
+             '+0x2346Fx^2+0x1EC38x+0x149E6',
+    (8, 19): '0x341B8x^7+0x49277x^6+0x29CC7x^5+0x5272Ex^4+0x421F6x^3'
+             '+0x2ABF7x^2+0x75744x+0x2D99A',
+    (8, 20): '0xD199Cx^7+0xD1742x^6+0x29D8Ax^5+0x973Bx^4+0x389C8x^3'
+             '+0x52912x^2+0xAC718x+0xF948F',
+    (8, 21): '0x1FCAFFx^7+0xB71D4x^6+0xC2638x^5+0x1C0907x^4+0x1D9F7Bx^3'
+             '+0x9B56Fx^2+0x1080Dx+0xAAD73',
+    (8, 22): '0x315A25x^7+0x34C042x^6+0x2FE9Cx^5+0x1FA129x^4+0x330984x^3'
+             '+0x89053x^2+0x234734x+0x810D7',
+    (8, 23): '0x746F4Ax^7+0x70FCA2x^6+0x2CEA55x^5+0x527162x^4+0x4582AEx^3'
+             '+0x64519Fx^2+0xFD347x+0x7D8048',
+    (8, 24): '0xA5758Ex^7+0x5360A2x^6+0x49CAB6x^5+0xC55AB7x^4+0xB11F2Dx^3'
+             '+0xBB74Ex^2+0x622819x+0x385E5B',
+    (8, 25): '0x11A097Fx^7+0x1F3ED4x^6+0x1C14DBx^5+0xF5CA2Dx^4'
+             '+0x1383568x^3+0x13B34DBx^2+0x102CE8Cx+0x1C41976',
+    (8, 26): '0x1422E26x^7+0x3F7CC6Ex^6+0x2A8D362x^5+0x32EA5A7x^4'
+             '+0x91BAA1x^3+0x3BD31DFx^2+0x3A4D884x+0x35AA336',
+    (8, 27): '0x30047A1x^7+0x4E41B60x^6+0x30D656Ex^5+0x5BE83C4x^4'
+             '+0x154D7DCx^3+0x627D319x^2+0x7781BE1x+0x7C2CEFF',
+    (8, 28): '0x5E6B0ECx^7+0x1BF81A0x^6+0xC05AD33x^5+0x773D9A8x^4'
+             '+0xEC9DFBAx^3+0xDE0A0A6x^2+0x1F0427Cx+0x41D692F',
+    (8, 29): '0x172711DFx^7+0x109D3019x^6+0x1BC99877x^5+0x40FBBB1x^4'
+             '+0x5D056A3x^3+0x155B4FA0x^2+0x1448F004x+0x15757479',
+    (8, 30): '0x38042F62x^7+0x2DD7D405x^6+0x2D8F3CF7x^5+0x4261023x^4'
+             '+0x1DD6A69Ex^3+0x31610128x^2+0x85A02D1x+0x336D9277',
+    (8, 31): '0x360E0FDAx^7+0x3DABEA79x^6+0x230780F0x^5+0x7F3CAE8Dx^4'
+             '+0xAA715EAx^3+0x711A6CEBx^2+0x33532402x+0x45E74657',
+    (8, 32): '0x6E6CEC1Bx^7+0x4BE06DF4x^6+0x7CA886B2x^5+0x4ABB5BCFx^4'
+             '+0x5DFEAD8Ex^3+0x2BC1E5B7x^2+0x4BD0E60Bx+0xCF32A9FE',
+    (8, 33): '0x918A86C4x^7+0x42400211x^6+0x1D41E8000x^5+0x15289D1ADx^4'
+             '+0x105106FAAx^3+0x96A3206Dx^2+0x1FA8CD852x+0x1E947B142',
+    (8, 34): '0x15A5A8A39x^7+0x2DCFC87D2x^6+0x4B000326x^5+0x2655C790Bx^4'
+             '+0x11DC6DE61x^3+0x18BDE7A9Ax^2+0xB360CD78x+0xD0C99C77',
+    (8, 35): '0x76497DFB0x^7+0x48BCEEC56x^6+0x38CC76A60x^5+0x3F210A804x^4'
+             '+0x61613B196x^3+0x149B125F4x^2+0x90DCA841x+0x5A9E9B512',
+    (8, 36): '0x36E09E0FCx^7+0x52095884Fx^6+0x8B461D3E6x^5+0xB26CA2096x^4'
+             '+0x8909745E2x^3+0xE34C185D3x^2+0xF233FF50Cx+0xEA69A7AC5',
+    (8, 37): '0x1751E69C5x^7+0x1408F70B61x^6+0x189202C302x^5'
+             '+0x1DE2366BF6x^4+0x1FF0867FB2x^3+0x5624912A5x^2+0x5A891CBFDx'
+             '+0x168270108C',
+    (8, 38): '0x24B0D6124Dx^7+0x332B331E8Bx^6+0x373CE10AFDx^5'
+             '+0x37773CD1E4x^4+0x13FBA59834x^3+0x6E28AE211x^2'
+             '+0x15E8FB00CDx+0x27CB48EC04',
+    (8, 39): '0x383DF7BFBCx^7+0x2BD4E583B4x^6+0x71FCD8FC76x^5'
+             '+0x5E73FAEC68x^4+0x7772174BC7x^3+0x7947823CB2x^2'
+             '+0x6E450A9298x+0x4510729ECF',
+    (8, 40): '0xB7DCCB3044x^7+0x36D8EEFD85x^6+0x75EB8164A8x^5'
+             '+0xD7989555C6x^4+0x1CC5778941x^3+0x2C9879FF38x^2'
+             '+0x90E9CC7AB0x+0xD8BD2E42D4',
+    (8, 41): '0x1F9CBF2DBEDx^7+0x1F5E3D115Bx^6+0xBE622C18FEx^5'
+             '+0x1D77042268Cx^4+0xE2DC8F52C6x^3+0x14FCD27A9EEx^2'
+             '+0x1A93BC74D52x+0x18365B2A74B',
+    (8, 42): '0x1CB010090B0x^7+0x30D8ED78E90x^6+0x324C337A5D3x^5'
+             '+0x1018C42D4F4x^4+0xB1760DB37Dx^3+0xC5FC44449Ex^2'
+             '+0x35574FE9A96x+0xAE24ABDDCA',
+    (8, 43): '0x5DF415E779Dx^7+0x52277886A4Cx^6+0xB66A5933B1x^5'
+             '+0x6B505679FA5x^4+0xEE628F9AB0x^3+0x68A4A65784Ex^2'
+             '+0x232474D577Bx+0x606DF5DDF0F',
+    (8, 44): '0xA145190E559x^7+0xE59CCB418BCx^6+0xDC3B483ED0Fx^5'
+             '+0xBEFB1472BF8x^4+0x2E86D31AE0Ex^3+0x659AA9BD79Cx^2'
+             '+0xD27BE348095x+0x2100BE6076E',
+    (8, 45): '0xE2A8563AC2Cx^7+0x11806A1C85EBx^6+0x2AD5BE16FFDx^5'
+             '+0x1DE799249138x^4+0xEBE1A7CA45Fx^3+0x14A640C1543Fx^2'
+             '+0x183CAE5F53F8x+0x473757FBBFF',
+    (8, 46): '0x2DF828FC1356x^7+0x42BB59819A9x^6+0x30D81534F847x^5'
+             '+0x37ABA4C0C4E5x^4+0x19E98619EF2Cx^3+0x3CD647D3AF52x^2'
+             '+0x308E654B3F21x+0x8551EFCF781',
+    (8, 47): '0x30F8F2B2C41Cx^7+0x26D8322AD38Cx^6+0x1D59E4F89A9Dx^5'
+             '+0x7D2750C1B7CFx^4+0x8D193B417EFx^3+0x6B5ADF98DC91x^2'
+             '+0x698B6F1747EBx+0x5666DA4263B7',
+    (8, 48): '0x5A6F42F24D5Ex^7+0xD2E9E01C677Ex^6+0x7D94F06CCED5x^5'
+             '+0xD85A4940F685x^4+0x6BA9DCEEC3F1x^3+0x402CAA357443x^2'
+             '+0xD08F98685B16x+0xEB6A2777BD19',
+    (8, 49): '0x13865DA80DACDx^7+0x9AB4953C8E80x^6+0x1AD350C0E846Ex^5'
+             '+0x1271100C480E0x^4+0xAF8344D778F6x^3+0x16546E2486727x^2'
+             '+0x1B5DCAFF13F73x+0x89AF97EA6C3D',
+    (8, 50): '0x15F15327CDE80x^7+0x1A60CB33F7FF4x^6+0x1C6C4B42FAEDx^5'
+             '+0x3A25BE439803Fx^4+0x2EC3AAF6855CFx^3+0x1B0A05F7B510Fx^2'
+             '+0x317CBD7ECA753x+0x8149D67D114D',
+    (8, 51): '0x3100EB07D9D9Ax^7+0x56CD7EC31CB73x^6+0x4604ACA6CD5CDx^5'
+             '+0x7CF63EA3189A9x^4+0x7D93C2A6B934Bx^3+0x5DA7BDB44BFx^2'
+             '+0x27B448A2335E1x+0x4D4EF28C67702',
+    (8, 52): '0xD187D9CE79354x^7+0x9A6993C42736Ex^6+0xEA2E655DDC1DBx^5'
+             '+0x73CC46A4A8F43x^4+0xC129E4724012Ex^3+0xAC8AE0E04E1ACx^2'
+             '+0xD85D8FFC7B345x+0xE1189CCE0B835',
+    (8, 53): '0x6768491A614F1x^7+0x13D69172AAFE85x^6+0x7969844C19DB1x^5'
+             '+0x12EBC5A3A8F2B5x^4+0x2F7370F75510Cx^3+0x16F292800119CFx^2'
+             '+0xAC4A4CB6C9380x+0x1AA7D846C9F05C',
+    (8, 54): '0x19A8A462FC6DC5x^7+0x26118052CE8228x^6+0x31FFC199F6DE7Cx^5'
+             '+0x371AB9BAA3BC4Dx^4+0x735F774F1116Ax^3+0x205AB0BD48E71Ax^2'
+             '+0x3FC58ACAF9FB3Ex+0x18A13F3EEE4D0C',
+    (8, 55): '0x76EDD73769CA6Dx^7+0x2324FE2C54DFC2x^6+0x4D27202BD9C36Dx^5'
+             '+0x606802A4E5F3F5x^4+0x3D22E8BF728D0Ax^3+0x5477AC20A6D964x^2'
+             '+0x1704CA5E20537Fx+0x52C1E927CC91CB',
+    (8, 56): '0x62239D82493696x^7+0x851C3EC33FB7C8x^6+0x975A0AE8596C8Bx^5'
+             '+0x327E3A18BA72C1x^4+0x4627F88D05C5E9x^3+0xCE08EB71DF69E8x^2'
+             '+0xB2F4930CC3CA0x+0x85D0872EE2330B',
+    (8, 57): '0x1EBC9C808CE6E17x^7+0x200CFEC3840289x^6+0x48AD27E029AD81x^5'
+             '+0x18E808D51170AA4x^4+0x4A738964C100AAx^3'
+             '+0x8670768C712229x^2+0x615D8045C68968x+0x6852DBC6E9F6B',
+    (8, 58): '0xC4DA9238B23EC8x^7+0x15E153C96AE79C4x^6+0x8D3ACD7238DF25x^5'
+             '+0x3FABA2DFE66C74Fx^4+0x2BE42B1621EB8Cx^3'
+             '+0x3AB33931079BD86x^2+0xBED82F1AAC4A8Fx+0xD8CF41640C57EA',
+    (8, 59): '0x4F1DDA07F62894Fx^7+0x478143FE2395574x^6'
+             '+0x7EA1089B6161787x^5+0x39AA135ED28724x^4'
+             '+0x4EBF7A6B5214BABx^3+0x340C46558FF4E28x^2'
+             '+0x2F691E9731D7576x+0x721B46ACE625A77',
+    (8, 60): '0x29D9C47E91E692Bx^7+0x14C3C4459CF54F3x^6'
+             '+0xEB70258D4E4041Cx^5+0xC97B15B8D38E227x^4'
+             '+0xFCF9D9777F29607x^3+0xECE034C2283C215x^2'
+             '+0xB99B926448CB214x+0x2406B3D3AAEE10D',
+    (8, 61): '0x19181051D89AC0E2x^7+0x153791ACA93BFA14x^6'
+             '+0x199F2372CC17ACA2x^5+0x165EA041566DEC3Fx^4'
+             '+0xE50DA839406A51Fx^3+0x7B6BFD53F35147Dx^2'
+             '+0x9B8DF75348FE485x+0x1DB973364842E0FB',
+    (8, 62): '0x1BF00A03A54FDDC8x^7+0x5258B63A75E3255x^6'
+             '+0xCE6DDDD75281A82x^5+0x3F05EF590F002F27x^4'
+             '+0x24E3B3CA464DF04Ax^3+0x1E0101009B506768x^2'
+             '+0x130FC7F566A7B9C5x+0x209D657AAE579AE9',
+    (8, 63): '0x5E0EBF29401ECF0Ax^7+0x46903A008C63AFC8x^6'
+             '+0xF6D54965FCE27E4x^5+0xF6F250DA42FB2F4x^4'
+             '+0x39C44CC797FA15D2x^3+0x37A64EF572EC37CCx^2'
+             '+0x4B21408637C147AAx+0x3E19CA13DDFD4619',
+    (8, 64): '0x99369F59BD53D323x^7+0xFFB462F8E40327A3x^6'
+             '+0x949A4C63D0184086x^5+0xA6EC42381EEC4F11x^4'
+             '+0x8FBDB5E3D32BE590x^3+0xF48009359772117Ex^2'
+             '+0x6733A4D91E0F2A36x+0x96189F012060AAC5',
+    (9, 2): 'x^8+x^7+0x2x^6+0x3x^5+x^4+0x2x^3+x^2+0x3x+1',
+    (9, 3): '0x6x^8+0x5x^7+0x4x^6+0x7x^5+x^4+0x3x^3+0x6x^2+0x2x+0x4',
+    (9, 4): '0xCx^8+0xBx^7+x^6+0x5x^5+0x6x^4+0xCx^3+0x2x^2+0x4x+0xE',
+    (9, 5): '0xAx^8+0x1Cx^7+0x14x^6+0x18x^5+0x10x^4+0xEx^3+0xDx^2+0xDx'
+            '+0xB',
+    (9, 6): '0x37x^8+0xDx^7+0x1Ex^6+0xBx^5+0x34x^4+0x8x^3+0x1Ax^2+0x34x'
+            '+0x8',
+    (9, 7): '0x5Dx^8+0x2Dx^7+0x7Ax^6+0x27x^5+0x37x^4+0x1Fx^3+0x28x^2'
+            '+0x73x+0x37',
+    (9, 8): '0xB0x^8+0x32x^7+0xF1x^6+0x7Ax^5+0x66x^4+0xEBx^3+0x5Fx^2+0x3x'
+            '+0x4F',
+    (9, 9): '0x87x^8+0x148x^7+0x1E4x^6+0x1E2x^5+0xB9x^4+0x165x^3+0x17Bx^2'
+            '+0x118x+0x3',
+    (9, 10): '0x9Ax^8+0x50x^7+0x3A3x^6+0xF4x^5+0x5Ex^4+0x46x^3+0x1CBx^2'
+             '+0x1FCx+0x1F2',
+    (9, 11): '0x314x^8+0x23Ax^7+0x1EDx^6+0x64Ex^5+0x181x^4+0x5D0x^3'
+             '+0x727x^2+0x35x+0x569',
+    (9, 12): '0x154x^8+0xFBFx^7+0x1EBx^6+0x76Dx^5+0xBBx^4+0xE83x^3'
+             '+0x684x^2+0xFE4x+0xD0B',
+    (9, 13): '0x6D8x^8+0x1AE1x^7+0x1227x^6+0x18EBx^5+0x1E4Ax^4+0x1FB1x^3'
+             '+0x16A6x^2+0xF16x+0x1085',
+    (9, 14): '0x2192x^8+0x2244x^7+0x1006x^6+0x663x^5+0x2820x^4+0xA26x^3'
+             '+0x19D9x^2+0x361Dx+0x2149',
+    (9, 15): '0x3102x^8+0x6F92x^7+0x7923x^6+0x393Fx^5+0x523Ax^4+0x44F2x^3'
+             '+0x7241x^2+0x45ABx+0xB2',
+    (9, 16): '0x6F28x^8+0x45ABx^7+0x8B7Ex^6+0x61Ax^5+0xC0F6x^4+0x7A56x^3'
+             '+0xC4BEx^2+0x5C2Cx+0x3E54',
+    (9, 17): '0x160E8x^8+0xDE57x^7+0x868Cx^6+0x63C7x^5+0xDCA5x^4+0xB83Cx^3'
+             '+0x1014Cx^2+0xD41Fx+0x197A5',
+    (9, 18): '0x3EDCEx^8+0xF63Fx^7+0x2E6F5x^6+0x2B1F2x^5+0x25B97x^4'
+             '+0x3FE0Bx^3+0x30CA7x^2+0x2A38Bx+0xAFED',
+    (9, 19): '0x350D3x^8+0x319C4x^7+0x13B83x^6+0x50131x^5+0x25B65x^4'
+             '+0x84x^3+0x7F0DBx^2+0x7A3DDx+0xD2F9',
+    (9, 20): '0xC41CCx^8+0x3BA7x^7+0x6CBC8x^6+0x50188x^5+0x6D5A6x^4'
+             '+0x9AA53x^3+0x47057x^2+0x82D8Cx+0xD11DD',
+    (9, 21): '0xB97ABx^8+0x19D809x^7+0x67E4x^6+0x1FCF81x^5+0x2635Dx^4'
+             '+0xBDD4Cx^3+0x76CE1x^2+0x143E63x+0x1FA613',
+    (9, 22): '0x2E22D0x^8+0xDB877x^7+0x2607DAx^6+0x3E4293x^5+0x24392Dx^4'
+             '+0xE3770x^3+0x255F42x^2+0x2EC7A2x+0x3F1A60',
+    (9, 23): '0x2A8048x^8+0x2D9D40x^7+0x1706EBx^6+0x5D981x^5+0x361307x^4'
+             '+0x4B3F0Ex^3+0x216E74x^2+0x6D34B1x+0x4D06B7',
+    (9, 24): '0xBD220Bx^8+0xA085A4x^7+0xF48E5x^6+0xFADB3Fx^5+0xBDFD2Cx^4'
+             '+0x13B608x^3+0x9CE520x^2+0xB9213x+0x1E2181',
+    (9, 25): '0x14A5A59x^8+0x1B1DDDBx^7+0x165F4DFx^6+0x1D3EE49x^5'
+             '+0x1C4018Fx^4+0x55C1E1x^3+0x17D9D84x^2+0xEC2EE5x+0x1309F49',
+    (9, 26): '0x186A6F2x^8+0x1B2694x^7+0x477803x^6+0x143691x^5'
+             '+0x136ACB1x^4+0x35E1C33x^3+0xCF870Ex^2+0x165B662x+0x139EE5',
+    (9, 27): '0x73B0E2Bx^8+0x6BC68D8x^7+0x5A5215Ax^6+0x6274EF2x^5'
+             '+0x2F291A3x^4+0x6DB8DF2x^3+0x5C387CDx^2+0x2ADE2Cx+0x5ADC415',
+    (9, 28): '0x5EF86A9x^8+0x5BE1295x^7+0xCE041F0x^6+0xC16CCCAx^5'
+             '+0x9BDC909x^4+0x38BE596x^3+0xA14D730x^2+0x3AE29CEx+0x9F973A8',
+    (9, 29): '0xEF789C5x^8+0xC9B6341x^7+0x1B83B509x^6+0x1A7101B1x^5'
+             '+0xBB3C843x^4+0x194A1A86x^3+0x173C8928x^2+0xDA2A657x'
+             '+0x503B676',
+    (9, 30): '0x37A89911x^8+0x15880476x^7+0x26A6CADAx^6+0x232C2041x^5'
+             '+0x182A71E1x^4+0x232047ACx^3+0x1099733Dx^2+0x3416A274x'
+             '+0x2FA33B18',
+    (9, 31): '0x7D096293x^8+0x711C7030x^7+0x4EE269EDx^6+0x6E3EFA90x^5'
+             '+0x589DE4D4x^4+0x29A608D5x^3+0x2EB61D91x^2+0x2E7386ECx'
+             '+0x445ABBC3',
+    (9, 32): '0xE0E8C0BDx^8+0xE6A777E5x^7+0xBF666F90x^6+0xEDA0128Fx^5'
+             '+0x7AB59F55x^4+0x82587B73x^3+0xB2B6B6BCx^2+0xA99CE1D3x'
+             '+0xA4E8A339',
+    (9, 33): '0x19DD25645x^8+0x1836E6641x^7+0xF42E33CAx^6+0x5BE0ADF2x^5'
+             '+0xB77DF174x^4+0x133C993A1x^3+0x125AE98EFx^2+0x169ADAAFDx'
+             '+0x1AB0327EE',
+    (9, 34): '0x3D768628Fx^8+0x3C3F10C7Dx^7+0x3D83D9EA4x^6+0x11417D47Fx^5'
+             '+0x1ACB3441Cx^4+0x30DBD64B2x^3+0x202C8838Fx^2+0xD7570267x'
+             '+0x384E21D9F',
+    (9, 35): '0x58C6E16F6x^8+0x28C5E256Cx^7+0x7F7B91DA9x^6+0x748A6310Bx^5'
+             '+0x3BB290A6Dx^4+0x3B98DB8D4x^3+0x786E2905x^2+0x167903183x'
+             '+0xE9BA28EE',
+    (9, 36): '0x56D83254Fx^8+0xC5E7C7F5x^7+0x3F4742F70x^6+0xD2CB953A2x^5'
+             '+0xC01B93B9Cx^4+0x58CE7FF4Ex^3+0xB956B2C15x^2+0x209148E16x'
+             '+0x86843F3A1',
+    (9, 37): '0x6C03AD20Ax^8+0x13D102A475x^7+0x140DD04D6x^6'
+             '+0x163DF2BCACx^5+0x15270D4C5Ex^4+0x1BCBCB966Cx^3'
+             '+0xCE3B3EFC9x^2+0xC6035C119x+0x3F8F4A5AB',
+    (9, 38): '0x2E6841194Ax^8+0x26FF61F868x^7+0x356FF8DC57x^6'
+             '+0x11268D17BFx^5+0x34E3012738x^4+0x1508D46531x^3'
+             '+0x27AA572837x^2+0x8E380DBF8x+0x9F4A553E9',
+    (9, 39): '0x5FC64F220x^8+0x18F7C9453Ax^7+0x51AE096677x^6'
+             '+0x6AA6DBBCD1x^5+0x59C31C872Ax^4+0x2E3DF2FF1Cx^3'
+             '+0x419F183FA4x^2+0x1180480615x+0x4DCD183512',
+    (9, 40): '0x6D2FEB625Bx^8+0xD5CA08EAA3x^7+0x859C29E59Dx^6'
+             '+0x80B701A641x^5+0xFDEB989B9x^4+0x948966B226x^3'
+             '+0x8CDAC551CCx^2+0xE34EDD94E3x+0x2388382069',
+    (9, 41): '0x31D4285FF4x^8+0x1E2385C7DF5x^7+0x4DB5CE7C8Dx^6'
+             '+0x16A26E0CC77x^5+0x17ECF752F25x^4+0x14E2F883D4Dx^3'
+             '+0xC1173CFF74x^2+0x2CA8D641B1x+0x1DC051B22F1',
+    (9, 42): '0x141DDD9EC54x^8+0x2D8D0C2388Fx^7+0x7ADAC779ADx^6'
+             '+0x2D5A53144E1x^5+0x3865CDC0176x^4+0x4B65C57816x^3'
+             '+0xAD8A521111x^2+0x22EE8157B2x+0x119E7479D35',
+    (9, 43): '0x3C9627D8D12x^8+0x2793C568D62x^7+0x26EF8DCE346x^6'
+             '+0x5E10E3AAA32x^5+0x10C6E2CD9D9x^4+0x79108DA5B35x^3'
+             '+0x69E6B9A8E0Cx^2+0xAF93DFE1A0x+0x179E4533D4C',
+    (9, 44): '0x7EC6CA562BCx^8+0x3B15CD7C6DFx^7+0x928DBC11468x^6'
+             '+0x75162476740x^5+0x10EDEB3B282x^4+0xC9FF86D4F31x^3'
+             '+0x4F8CB18FFA9x^2+0x1ADA8DE9D4Fx+0xEFA4AABE727',
+    (9, 45): '0x17A55F66A1C5x^8+0x995545B5E2Bx^7+0xD9897C2E933x^6'
+             '+0x1A5A909D60C3x^5+0x6B04FCF7ED5x^4+0x14CA9A26C60Ax^3'
+             '+0x134D7A4E38A9x^2+0x29A3A74E7F7x+0x1C24F2123679',
+    (9, 46): '0x238EC5C3F433x^8+0x22DB132ACA46x^7+0x11A972510595x^6'
+             '+0x11DD29F07965x^5+0x309DD8F59620x^4+0x38DFBA249CF0x^3'
+             '+0xDF1F58440F4x^2+0x317B755CDEBAx+0x14476B705B5D',
+    (9, 47): '0x7ED8F414D7E5x^8+0x43F309FDD44Bx^7+0x673071D2F294x^6'
+             '+0x221844581E9Ax^5+0x7F1FE849E42Ex^4+0x2144ED2A502Dx^3'
+             '+0x5AC4B3BCD8D8x^2+0x1B1CF5F6B6C9x+0x18EC8F093A24',
+    (9, 48): '0x3CB724FCDCE7x^8+0x3C2713C881Ax^7+0x235434E146A7x^6'
+             '+0x3D2CE4365743x^5+0x69237540E5D9x^4+0xB35047693759x^3'
+             '+0x57C1AE74FB1Bx^2+0x6D02A84EB82x+0x87A752915535',
+    (9, 49): '0x5E842DACAF5x^8+0x46D3B91A6DCAx^7+0x1C97E0517259Dx^6'
+             '+0x1FFC3B401C907x^5+0xBA831F7D7229x^4+0x1E1CACE0D9E0Ax^3'
+             '+0x19712F574B367x^2+0x124D29C213CE1x+0xB69186F4717D',
+    (9, 50): '0x59F57C2A5A25x^8+0x284A6045C112Dx^7+0x86CC05910141x^6'
+             '+0x32BD58781D68Ex^5+0x1886768018C57x^4+0x7CDF40F81B75x^3'
+             '+0x767444D7E0FDx^2+0x132AFF9C2C846x+0x29FE8AFBB0F7F',
+    (9, 51): '0x46E6DFBB9B84Ax^8+0x4CDAA569F0D97x^7+0x235B91F6980EBx^6'
+             '+0x50D2E28C3D9F9x^5+0x3CD2F0596C1ABx^4+0x2A182CDE2AB36x^3'
+             '+0x4A5008A018D22x^2+0x430FAAF2DC355x+0x4531728508D19',
+    (9, 52): '0xF733FEB53C01Dx^8+0x39F847DFAD7A7x^7+0xDD51D29C503DFx^6'
+             '+0xA2F457131105Ax^5+0x42CDCB5998D45x^4+0xD64C21D598E8Ax^3'
+             '+0xFF86B1B18EE43x^2+0xC03E82CB68E42x+0xBD5F227C5FFAE',
+    (9, 53): '0x36E0190BE705Fx^8+0x10374FAEA73CA8x^7+0x3320D0E503DF9x^6'
+             '+0x1C42270D66FE85x^5+0xF28E30AE753A1x^4+0x1E1CE919E862BBx^3'
+             '+0x16BC1786B7414Ex^2+0x1A1F07764747E2x+0xAF1ADB2068590',
+    (9, 54): '0xCF53FE0D7549Fx^8+0x2F77E56F7DAC27x^7+0x3DA09AA3041302x^6'
+             '+0x146F06B4917658x^5+0x3AC693E71A0C5Cx^4+0x66D65EF0947EEx^3'
+             '+0x24D103968481B7x^2+0x26211D8E1C174x+0x561E69188080C',
+    (9, 55): '0x1CDBD40B36EEAx^8+0x6A6FC0086CB6B6x^7+0x673AD3873C7EC8x^6'
+             '+0x270E1AD8268B39x^5+0x7858572DAFD372x^4+0x7EC45D712307ACx^3'
+             '+0x4D3B15636FCC4Fx^2+0x698320B2B8D65Ax+0x3C605E8DD98B8A',
+    (9, 56): '0xD46FBC8B07E601x^8+0xEDBEF23657029Ax^7+0xBEAB8CBF46A39Bx^6'
+             '+0x4F1B136686315Bx^5+0x1847457C7A5039x^4+0x53EE78D2EB8D2Ex^3'
+             '+0x1A8D85AEEE8E20x^2+0x28A998CD6153C2x+0xE049ACA43BB4CC',
+    (9, 57): '0x138BA56EB14FFC9x^8+0x1F85ABD2E4F14F8x^7'
+             '+0x1371B7A5ED1C604x^6+0x1683D117EE59016x^5'
+             '+0x1E93C92BA1D96C9x^4+0xC30AFA93AE4200x^3'
+             '+0xA1932002ECB670x^2+0xD566635CAE2F95x+0x1128E715A034865',
+    (9, 58): '0x4CDCE7E31BD179x^8+0x2EFBFF3D70DEBB8x^7'
+             '+0x1076F030976499Dx^6+0x8A0B8C94C7B0Fx^5+0x6F0AC2E595C9BEx^4'
+             '+0x19AD9EC46D026CEx^3+0x250729DF1DCD423x^2'
+             '+0x38993479BE45667x+0x1658F6E92C18247',
+    (9, 59): '0x508C695907A42Bx^8+0x3C9888D3CCDDF51x^7'
+             '+0x5F0BFA619A7AA1Dx^6+0x64323A862B39DECx^5'
+             '+0x47050E93987865Cx^4+0x50DB7BDBEB8AC83x^3'
+             '+0x6EE40485077315Bx^2+0x2CAC201FAE7E056x+0x3F334F635BE52B5',
+    (9, 60): '0x9C4925F9D2CD8FAx^8+0x1EC9709D6D237CBx^7'
+             '+0x4C8401AB4F14F4x^6+0xE4143A4B6A3858Ax^5'
+             '+0x8C6C2102A903E32x^4+0xE51199EE54369F5x^3'
+             '+0x217858190761987x^2+0x5E47CACC86959A3x+0x17462C73620BDAD',
+    (9, 61): '0x100AE1348D4B8A40x^8+0x1C0AC33BB5C01F76x^7'
+             '+0xD86FBF54AAF4649x^6+0x83ADEFCA9C57F65x^5'
+             '+0x14552666DEE7FED2x^4+0x198E367C08BD1724x^3'
+             '+0x1FBA6E4A14B3693Dx^2+0x14B9DFF9FD6A77BCx+0x52B6B2E6F1A46F',
+    (9, 62): '0x7C4E304DD14FF0Fx^8+0x306BAEF7EB22A82Bx^7'
+             '+0x3648F0B88D03ABC4x^6+0xE3661C53C45484x^5'
+             '+0x2559AF19287960A6x^4+0x233577BBE2ABBCA1x^3'
+             '+0x31AC5783CB2B39FCx^2+0x3C9549CF1FD65B18x'
+             '+0x3459D3C8EFB6AEC8',
+    (9, 63): '0x44DF5F91D51111CCx^8+0x27BB50AC374F0628x^7'
+             '+0x4F77739774591F6Ex^6+0x765697772044BC00x^5'
+             '+0x77DE626DE51615A9x^4+0x168C127EE9A4C9F0x^3'
+             '+0x3765BB29178D548Ex^2+0x7F384A77684A399x+0x286369B59639C4C6',
+    (9, 64): '0x7A1F14E69C8EC4F5x^8+0x4C93999C30BA56C0x^7'
+             '+0xAC766EA7449A7970x^6+0x7CB8E3C27D73C33Ex^5'
+             '+0x77991E55843A89F3x^4+0xCD7E47BE7FBFA997x^3'
+             '+0x3F2B2604DF857551x^2+0x1AA366212FB7EB05x+0x54CC05F6007B98B',
+    (10, 2): '0x2x^9+0x3x^8+x^7+0x2x^6+0x3x^5+x^4+0x3x^3+0x2x^2+0x2x+0x2',
+    (10, 3): '0x5x^9+0x4x^8+0x4x^7+x^6+0x3x^5+0x5x^4+0x3x^3+x^2+0x4x+0x7',
+    (10, 4): '0x2x^9+0x2x^8+0x5x^7+0xFx^6+0x8x^5+0x7x^4+x^3+0x5x^2+0x5x'
+             '+0x5',
+    (10, 5): '0x1Ax^9+0x14x^8+0x6x^7+0xDx^6+0x16x^5+0x12x^4+0x1Fx^3+0x9x^2'
+             '+0x1Bx+0x19',
+    (10, 6): '0x21x^9+0xFx^8+0x4x^7+0x12x^6+0x16x^5+0x30x^4+0x1Ex^3'
+             '+0x3Bx^2+0x5x+1',
+    (10, 7): '0x15x^9+0x39x^8+0x20x^7+0x36x^6+0x14x^5+0x67x^4+0x4x^3'
+             '+0x6Bx^2+0x29x+0x14',
+    (10, 8): '0x76x^9+0x39x^8+0xAAx^7+0x4Fx^6+0x6Bx^5+0xD4x^4+0x8Fx^3'
+             '+0x17x^2+0x64x+0x83',
+    (10, 9): '0x1A7x^9+0x159x^8+0x97x^7+0x17Dx^6+0x187x^5+0x13Bx^4+0x3x^3'
+             '+0x129x^2+0x163x+0x158',
+    (10, 10): '0x4Ax^9+0x346x^8+0x217x^7+0x195x^6+0x30Cx^5+0x35Bx^4+0x29x^3'
+              '+0x1EAx^2+0x24Ax+0x219',
+    (10, 11): '0x1F9x^9+0x34Dx^8+0x27Bx^7+0xDAx^6+0x6A4x^5+0x693x^4'
+              '+0x1E0x^3+0x7A1x^2+0x655x+0x583',
+    (10, 12): '0x1E1x^9+0xFFDx^8+0xA8x^7+0x9ABx^6+0xF91x^5+0x850x^4'
+              '+0x316x^3+0xA7Fx^2+0x3CAx+0x91B',
+    (10, 13): '0x1023x^9+0x11ECx^8+0xBFEx^7+0x1FB2x^6+0x69Dx^5+0x112Cx^4'
+              '+0x1D4Bx^3+0xAC6x^2+0xEBAx+0xAA9',
+    (10, 14): '0xC5Cx^9+0x3EE1x^8+0x3CD7x^7+0x3CBAx^6+0x3775x^5+0x1D9Ex^4'
+              '+0x147Ax^3+0x1265x^2+0x19E1x+0x107B',
+    (10, 15): '0x6485x^9+0x7AD4x^8+0x3EC8x^7+0x5750x^6+0x5E85x^5+0x17E5x^4'
+              '+0x1267x^3+0x5C8x^2+0x1931x+0x7615',
+    (10, 16): '0x35E8x^9+0xAA3Dx^8+0xFDA5x^7+0xCFE3x^6+0x3E18x^5+0x4C5Dx^4'
+              '+0x5DECx^3+0x1CE8x^2+0x79E7x+0xA234',
+    (10, 17): '0x7B4Ax^9+0x1598Ex^8+0x1C632x^7+0x176D7x^6+0xDE6Ax^5'
+              '+0xF7B1x^4+0x70FFx^3+0x128C2x^2+0x1C5F8x+0x45B2',
+    (10, 18): '0x3F3E6x^9+0x39ED8x^8+0x3C149x^7+0x155BBx^6+0x25016x^5'
+              '+0xFDC9x^4+0xC4CDx^3+0x3BD28x^2+0x1F08Ex+0x7442',
+    (10, 19): '0x7AA97x^9+0x53F98x^8+0x7EFBFx^7+0x1BCCEx^6+0x706C6x^5'
+              '+0x77F68x^4+0x7F095x^3+0x50E62x^2+0x71E90x+0x9944',
+    (10, 20): '0xA7897x^9+0x83180x^8+0xDF437x^7+0xC80Fx^6+0x80298x^5'
+              '+0x2D885x^4+0x85CEAx^3+0x301A5x^2+0x6EC2Dx+0xF9720',
+    (10, 21): '0x1A10AFx^9+0x123A86x^8+0xFEA5Cx^7+0x161CD6x^6+0xB9F51x^5'
+              '+0x154FB7x^4+0x16E2F6x^3+0xCE4B6x^2+0xDF8D2x+0x1E65A3',
+    (10, 22): '0x69A7Cx^9+0x33672Dx^8+0x1A2445x^7+0x3DD292x^6+0xF02F0x^5'
+              '+0x195744x^4+0x235DF8x^3+0x1A7D74x^2+0xE8FD7x+0x3692EB',
+    (10, 23): '0x4AFC14x^9+0x247616x^8+0x6738C7x^7+0xC123Ax^6+0x74D1F8x^5'
+              '+0x7F4203x^4+0x6BC14Ax^3+0xD4B2Ax^2+0x21F45Ex+0x3E6DF8',
+    (10, 24): '0xAE58BDx^9+0xCD55E9x^8+0xB78C75x^7+0xEAF1C3x^6+0x86CDE0x^5'
+              '+0x55C9CEx^4+0x31CC2Cx^3+0xAAC3E5x^2+0x29A2F3x+0x180569',
+    (10, 25): '0x29AE99x^9+0x1158542x^8+0x148CA17x^7+0x110DFFAx^6'
+              '+0x6F3E56x^5+0x1947FE7x^4+0xD322A1x^3+0x3018B9x^2+0x13F845Bx'
+              '+0x3E873',
+    (10, 26): '0x31E0829x^9+0x2D97981x^8+0x25B8AA4x^7+0x1FAB729x^6'
+              '+0xA6C9F1x^5+0x2425B3Cx^4+0x259C4DDx^3+0xDB9E97x^2+0xA93412x'
+              '+0x1E12F2',
+    (10, 27): '0x38CCA9Bx^9+0x341E29Dx^8+0xD099A2x^7+0x7486028x^6'
+              '+0x214270x^5+0x475397Ax^4+0x3667FA3x^3+0x253B516x^2'
+              '+0x35B7664x+0x63C8191',
+    (10, 28): '0x1E5542Cx^9+0xC067075x^8+0xA5A53A2x^7+0xCBE92DDx^6'
+              '+0x4DCF8A7x^5+0x62B84Cx^4+0x781EF4Ax^3+0xC708BBBx^2'
+              '+0x3839C4x+0x5C72773',
+    (10, 29): '0x6BA07x^9+0x1CAA0E66x^8+0xF73A171x^7+0x9758F44x^6'
+              '+0x5B5E45Bx^5+0x1645629Bx^4+0xCBDFA53x^3+0x1E6D94F1x^2'
+              '+0xC0176FAx+0x2215536',
+    (10, 30): '0x3145F090x^9+0x3C09340Dx^8+0x3921A118x^7+0x1AF1989Fx^6'
+              '+0x2A7B3B57x^5+0x30E444AAx^4+0x1EECDE0Cx^3+0x4C6683Ex^2'
+              '+0x29E38E55x+0x15EF89A9',
+    (10, 31): '0x7E522ADDx^9+0x210B5CB1x^8+0x1754A0D0x^7+0x25FF2BD8x^6'
+              '+0x5CCD499x^5+0x7E004B32x^4+0x1027E426x^3+0xE632DE3x^2'
+              '+0x455E2B0Bx+0x2DF99949',
+    (10, 32): '0x727B90F1x^9+0xA1AD0E2x^8+0x76720C7Ax^7+0x3B81C14x^6'
+              '+0xD3A622A6x^5+0xCCB80597x^4+0x1FC12E80x^3+0xC1071992x^2'
+              '+0x8798700x+0xAEBC260',
+    (10, 33): '0x27322928x^9+0xBAA9DA2x^8+0x1C0504FCDx^7+0xAACE24B7x^6'
+              '+0x119D1F9B9x^5+0x1EABBCFF6x^4+0x615F2A58x^3+0xDD2D090Ex^2'
+              '+0x974B2F22x+0x30CD4E08',
+    (10, 34): '0x1C98C74A0x^9+0x18FA961Ax^8+0x356B1A780x^7+0x39FABFCFBx^6'
+              '+0x38CD1968Ax^5+0x3D535A695x^4+0x3A0ABE0D9x^3+0xC7EEDE4Fx^2'
+              '+0x3F5335B4Ex+0x3A20E3725',
+    (10, 35): '0x45881E9A1x^9+0x3A7282A3Dx^8+0x67198C6EFx^7+0x1EFF1EC9Ex^6'
+              '+0x7909CD0E4x^5+0x5ACCCE410x^4+0x55DE9AF07x^3+0x11C1B9388x^2'
+              '+0x3AC24024Ax+0x59459E551',
+    (10, 36): '0x4A9387F5Fx^9+0xDC3BCF41Fx^8+0xE895BB4E7x^7+0xABD653D24x^6'
+              '+0xA938206Fx^5+0xF75ABB2C2x^4+0xBD9310EEx^3+0xD2C657C9Ax^2'
+              '+0xE3D7227DCx+0x9E8E93F74',
+    (10, 37): '0x12456836BBx^9+0x87A596160x^8+0xCCF37DD6x^7+0xE80722ED8x^6'
+              '+0x1E5C96C023x^5+0x1C63FDDFB6x^4+0x940493F04x^3'
+              '+0x3C7BDD82Fx^2+0xE7BB91549x+0x6592DD704',
+    (10, 38): '0xE2D6A775Cx^9+0x1AA60D6CD7x^8+0x163F6E0174x^7'
+              '+0x1B51DD11FDx^6+0x2724463669x^5+0x151E428BA2x^4'
+              '+0x19B62189A0x^3+0x31459DC6F5x^2+0x2603EB2021x+0x2CEE5F5054',
+    (10, 39): '0x5A96D8BB53x^9+0x4C23BBA613x^8+0x53BC96EF1x^7'
+              '+0x27598F8BAFx^6+0x13F2B0F3C7x^5+0x6C1A378AFx^4'
+              '+0x1E218B878x^3+0x5028761B11x^2+0x16E08CD2C2x+0x7FE7BFF975',
+    (10, 40): '0xD8F68F3208x^9+0x8EE5768047x^8+0x53B636D4F1x^7'
+              '+0xC1C3C96092x^6+0xC58919477Ex^5+0xB80D667FD9x^4'
+              '+0x4918408D1Bx^3+0xF5425905D8x^2+0x1255FAE28x+0xB80D47FA37',
+    (10, 41): '0xB4800774F9x^9+0x13BBA58A7A0x^8+0x20D63416F1x^7'
+              '+0x186B7E0F3Bx^6+0x132820C93B2x^5+0x1B0AD2389FCx^4'
+              '+0x124B82B37A6x^3+0x1C54715A6F4x^2+0xB348CB0DFEx'
+              '+0x177BB14061',
+    (10, 42): '0xDF42347D8Ex^9+0x2EA04146EC3x^8+0x2E3F16B60FFx^7'
+              '+0x2E45950D0Bx^6+0x1DFBE34F761x^5+0x20C1FF49E86x^4'
+              '+0x3127BEDD1CAx^3+0x201F0CDA1F5x^2+0x3529C8360F8x'
+              '+0x5F989033F9',
+    (10, 43): '0x63AC3D6587Ex^9+0x7363E14BDF5x^8+0x1E9E06B5D0Fx^7'
+              '+0x3C0D1F59CE1x^6+0x1DEBBBA742Bx^5+0x52F8B9423AFx^4'
+              '+0x65A4A240026x^3+0x3BC29F70DDDx^2+0x36D8C6E3CFEx'
+              '+0x1E4B3F52F90',
+    (10, 44): '0x1058B97D5ADx^9+0xFEA88D57B51x^8+0xC6905B99C3Cx^7'
+              '+0x9B39618D447x^6+0xD0FBDB65636x^5+0xBE26FB57636x^4'
+              '+0x97CFDD0C1B5x^3+0xBDEB1D7304Ex^2+0xCB2D844677Ax'
+              '+0xE02DCE4C651',
+    (10, 45): '0x77C4532E0AAx^9+0xBF8A974B2ABx^8+0x15F2F06F3941x^7'
+              '+0xC0F515BE3FCx^6+0x1B7247BE0467x^5+0x1D15DD72C595x^4'
+              '+0x1B51C72EE84Ax^3+0x11BDFF58780Bx^2+0x13369E34459Ax'
+              '+0x1D87F2DE0BF3',
+    (10, 46): '0x2A9BB22C59D2x^9+0x24176A388C7Dx^8+0x2E782699F44Ax^7'
+              '+0xD44309F4D9Dx^6+0x1792D0832192x^5+0x1E79DAFC6787x^4'
+              '+0x3C32C022858Ax^3+0x27CAF50F6BC9x^2+0x296C5D776B5Bx'
+              '+0x19627B2A7543',
+    (10, 47): '0x2BD8C059A7AAx^9+0x93124D07287x^8+0x3F273E0D4B6Cx^7'
+              '+0x17A2A7F62AAEx^6+0x1C225C6E783Cx^5+0x3174E6687A97x^4'
+              '+0x60388968F7D1x^3+0x4AA49E5ECC66x^2+0x4F0BEB9C1840x'
+              '+0x6FF7526E5CB2',
+    (10, 48): '0x6550BD97A8A2x^9+0x69BAC7E488ADx^8+0x63EFABD5FE8Dx^7'
+              '+0xEF043468B547x^6+0x4AA3E5EB4EF6x^5+0xD7551B24B491x^4'
+              '+0x7FAF87CDC8E1x^3+0x99C1616AD04x^2+0xD473FBDB79BDx'
+              '+0xD5110D83546B',
+    (10, 49): '0x1A7F1DCDC9B96x^9+0x1D5175BE375E8x^8+0x32992905C04Cx^7'
+              '+0x6BC2404A09D0x^6+0xD69AEC6A2DF8x^5+0x1413885A7A0Ax^4'
+              '+0x2CC69630FE37x^3+0x1DB08CA83DEA8x^2+0x1FD36CC3DDF0Bx'
+              '+0x266D7AE991E8',
+    (10, 50): '0x3826323E0DE6Fx^9+0xA2C6352A6C67x^8+0x3AE4AF976F0E8x^7'
+              '+0x2A2A50D3985A0x^6+0x30E9D777AD280x^5+0x3EC6B379663B4x^4'
+              '+0x187FB837C93AAx^3+0x3162E8EFBEEEEx^2+0x3AF66F7C1453Ex'
+              '+0x166CE65EAB724',
+    (10, 51): '0x23EE1EFE73DD0x^9+0xD6348B4AB036x^8+0x6883A3A9AA9B9x^7'
+              '+0x40B0666EB03F5x^6+0x25FAE2C0AE23Dx^5+0x3400AFDFECDBFx^4'
+              '+0x52969AC49BA0Fx^3+0x159AF12FD1326x^2+0x2D3F3F948EC44x'
+              '+0x59064F7C0A1ED',
+    (10, 52): '0x3EB23AD662194x^9+0x8B91342924F9x^8+0x6EB7CEDA4F40Dx^7'
+              '+0x7FAC239999533x^6+0x7AFA516147DA4x^5+0xCED84A6C99F3Ex^4'
+              '+0x65C2D71DF2397x^3+0x30323AFD5E950x^2+0x4EE0227D222BFx'
+              '+0xCE6D80555B429',
+    (10, 53): '0x17F165F5CBC1A3x^9+0xFC61D7D010BFx^8+0xFBF1A9E34CD10x^7'
+              '+0x33F07AE1D63B4x^6+0x34C655872FB83x^5+0x63A0D6615FB9Bx^4'
+              '+0x157A5B564B87ABx^3+0x10D97919B4BE35x^2+0x136379F7D9AAAEx'
+              '+0x1E34F5329F3DA0',
+    (10, 54): '0x2E981CC5ADA43Cx^9+0x1C058AB9280391x^8+0xF65484E1B6154x^7'
+              '+0x172E265562C36x^6+0x3C5478723BFA86x^5+0x1F5D27A2780565x^4'
+              '+0x6A6758428125Dx^3+0x3FA6555E45876Dx^2+0x2175208EB00260x'
+              '+0x1CFB411C07F24A',
+    (10, 55): '0x89E086A313473x^9+0x1D47B03C844979x^8+0x66A0704DFED148x^7'
+              '+0x118F13E1231A2Dx^6+0x56523438FAE9D9x^5+0xB062076F5BC8Ax^4'
+              '+0x3D2BB3EB961A35x^3+0x5C6670CF7C177x^2+0x62C52350B7FFE0x'
+              '+0x4CAEDBC7A39831',
+    (10, 56): '0xB1E318DC4FB74Dx^9+0xAA4B3D4E685494x^8+0x219EF25D66BC53x^7'
+              '+0x20791CA1FD9D02x^6+0x826492F6079A5Cx^5+0x64401491E7B5AFx^4'
+              '+0x7F132AB13C6242x^3+0x62D8FFA5707EE5x^2+0x529632514DA3Ax'
+              '+0x3DF8E75B6CCC8E',
+    (10, 57): '0x1558FDAE6AF8779x^9+0x94E7409C14BFD5x^8'
+              '+0x19580D95ABCF755x^7+0x554899F018189Ex^6'
+              '+0x1483A6EC9A6CD99x^5+0x1CE399D8219BF27x^4'
+              '+0x3CDF4A65A280E7x^3+0x1623B34812D1FCFx^2+0xB45782B7731972x'
+              '+0x193D70031A4E84B',
+    (10, 58): '0x1A685AFB5D9D6B5x^9+0x3FA6A993A31EAB2x^8'
+              '+0x3847A299A85E57Fx^7+0x391FD1542FA2C18x^6'
+              '+0x39A3FDF7E6A8FB8x^5+0x4F85132045D603x^4'
+              '+0x2EC08E996655AA6x^3+0x307759FB02D0CDx^2+0x22C9E1CEC7E7B4Bx'
+              '+0x26B20C7A8AFCC27',
+    (10, 59): '0x6093E587B3ECDC2x^9+0x5EF4FACC6616A0Ax^8'
+              '+0x64A477A22F46271x^7+0x5809736A0D26C20x^6'
+              '+0x28B022507F01DDCx^5+0x3CCA2B289498C82x^4'
+              '+0x63093875DD7FD1Cx^3+0x65ABB4DBB3E81EBx^2'
+              '+0x6F637DACBB8E80Ex+0x4AB21EC1E43725E',
+    (10, 60): '0x18B66B9525A17F8x^9+0x7AB90473748CBBCx^8'
+              '+0xAB52E423C55E497x^7+0xC004DA6BF40890Ax^6'
+              '+0x175EEDB7345492Cx^5+0xF41F5D3157BBF37x^4'
+              '+0x71FB4EF740211D4x^3+0x37DB431565CF1F3x^2'
+              '+0xD12DBEBE82A07E9x+0x1812397CD812B8F',
+    (10, 61): '0x45CE173BDDCD95Dx^9+0xFD12071D2B2E70Dx^8'
+              '+0x2F8296821A82806x^7+0x18996BF81753A65Cx^6'
+              '+0x1430365590645003x^5+0x1A4D87CB28DAB15Ex^4'
+              '+0xC18BEEE5B66C03Cx^3+0x1C8CFCCE2B309D38x^2'
+              '+0x1B715B0993C01859x+0xC6BC101A777C1F0',
+    (10, 62): '0x3BAB547D6C6A0F46x^9+0x3B25106A2E90FC5Ax^8'
+              '+0x3FF42A634BE174D2x^7+0x3904041440B9638Fx^6'
+              '+0x3BDBEA60472A133Ax^5+0x1744B87F376CC9B0x^4'
+              '+0x292E82647AEB4018x^3+0x108FB51735753479x^2'
+              '+0x2F0F334FBA5DC362x+0x253AB5AD1A916B90',
+    (10, 63): '0x28084AB0A6DA3156x^9+0x536499EEDCFC71D2x^8'
+              '+0x73B747AB70D272E1x^7+0x65B03E46765D6977x^6'
+              '+0x62AA16479A9A0EF5x^5+0x7D235A35A6CF14D2x^4'
+              '+0x5E0464CC09429CEFx^3+0x7CC2C42DE8D6EB02x^2'
+              '+0x72FC9A65BA1FCA9Dx+0x5EE1B07060561576',
+    (10, 64): '0xC6FC5051CAC57BABx^9+0xC9B48B92EF439A0Fx^8'
+              '+0x72ACC6BF3429935x^7+0x5FC1D6C8A393708Ax^6'
+              '+0x8F9E20D2AA442499x^5+0xF05BFBAB54B1C13Ex^4'
+              '+0x84CCA5263F4C878x^3+0x75A6F00E90E5AF86x^2'
+              '+0x5B034DBED0BE0367x+0x8A2EBF97548E98D5',
+    (11, 2): '0x3x^10+0x2x^9+x^8+0x3x^7+0x2x^6+0x2x^5+0x3x^4+0x3x^3+x^2'
+             '+0x2x+0x2',
+    (11, 3): '0x6x^10+0x2x^9+0x2x^8+0x5x^7+0x3x^6+0x4x^5+0x5x^4+0x3x^3'
+             '+0x5x^2+0x7x+0x2',
+    (11, 4): '0x8x^10+0xBx^9+0x6x^8+0x2x^7+0x8x^6+0xBx^5+0xAx^4+0xEx^3'
+             '+0xCx^2+0xCx+0xE',
+    (11, 5): '0xBx^10+0x1Dx^9+0x17x^8+0x1Dx^7+0xEx^6+0x1Fx^5+0x18x^4'
+             '+0x1Fx^3+0x10x^2+0x2x+0xD',
+    (11, 6): '0x16x^10+0x23x^9+0x2Cx^8+0xFx^7+0x22x^6+0x3Bx^5+0x24x^4'
+             '+0x32x^3+0xDx^2+0x3Ex+0x1F',
+    (11, 7): '0x12x^10+0x60x^9+0x39x^8+0x43x^7+0x45x^6+0x17x^5+0x3Ex^4'
+             '+0x5x^3+0x38x^2+0x40x+0x9',
+    (11, 8): '0xFx^10+0x37x^9+0xF9x^8+0x28x^7+0xF5x^6+0x91x^5+0xD3x^4'
+             '+0xC0x^3+0x91x^2+0x52x+0x6E',
+    (11, 9): '0xF5x^10+0x19Ax^9+0xB7x^8+0x108x^7+0x1EBx^6+0x1DEx^5'
+             '+0x1A3x^4+0x15Fx^3+0x34x^2+0x97x+0x1DF',
+    (11, 10): '0x79x^10+0x3FBx^9+0xB0x^8+0x3DBx^7+0x3A4x^6+0x299x^5'
+              '+0x10Fx^4+0x354x^3+0x25Dx^2+0x1FDx+0xE2',
+    (11, 11): '0x350x^10+0x190x^9+0x608x^8+0xEBx^7+0x4ADx^6+0x538x^5'
+              '+0x59Ax^4+0x347x^3+0x6F8x^2+0x8x+0x161',
+    (11, 12): '0xCD2x^10+0xE6Dx^9+0x85Dx^8+0xD25x^7+0xAF6x^6+0xE22x^5'
+              '+0x2A8x^4+0x472x^3+0x8B4x^2+0xD62x+0x647',
+    (11, 13): '0xC83x^10+0x13Fx^9+0x1C01x^8+0x1287x^7+0x1FDBx^6+0xA17x^5'
+              '+0x892x^4+0x133Cx^3+0xFAAx^2+0x131Bx+0x1393',
+    (11, 14): '0x35E9x^10+0x1FA2x^9+0x3B34x^8+0xC0Ax^7+0x2D65x^6+0x36B7x^5'
+              '+0x13D7x^4+0xDB8x^3+0x117Dx^2+0x33E2x+0x34FF',
+    (11, 15): '0x7C93x^10+0x22BFx^9+0x133Fx^8+0x3BADx^7+0x1CA2x^6+0x2F00x^5'
+              '+0x7D23x^4+0x6250x^3+0xF05x^2+0x4DE5x+0x49AD',
+    (11, 16): '0xF3A4x^10+0x9F5Ex^9+0x5E4x^8+0xBE3Ax^7+0x8236x^6+0x4557x^5'
+              '+0x14E5x^4+0xA4F0x^3+0x7EC0x^2+0xED94x+0xE749',
+    (11, 17): '0xA310x^10+0x17383x^9+0x161E8x^8+0x10CF5x^7+0x1645Ax^6'
+              '+0xF359x^5+0x1929x^4+0xF545x^3+0x19417x^2+0x258Cx+0x15CE0',
+    (11, 18): '0x89F0x^10+0x2B3C8x^9+0x248D7x^8+0x17272x^7+0x23D75x^6'
+              '+0x20C13x^5+0x158CFx^4+0x8ED1x^3+0x1D87Ax^2+0x3D711x+0x27495',
+    (11, 19): '0x6883Dx^10+0x401AEx^9+0x245D6x^8+0x11026x^7+0x650E6x^6'
+              '+0x6CE67x^5+0x3BB6Cx^4+0x4692Dx^3+0x39804x^2+0x73F0Ex'
+              '+0x28DBF',
+    (11, 20): '0x6F5CAx^10+0xF5507x^9+0xC7311x^8+0x1E8ECx^7+0x6BC89x^6'
+              '+0x67A47x^5+0x1C665x^4+0xD5C71x^3+0xF1C7Dx^2+0x43FFFx'
+              '+0xF5641',
+    (11, 21): '0x1E221Ex^10+0x9E308x^9+0x8984Ax^8+0x8170Cx^7+0x7F038x^6'
+              '+0x19353x^5+0x18DE88x^4+0x1B6E4Dx^3+0x134173x^2+0x134E6x'
+              '+0x10E5B1',
+    (11, 22): '0x3746BFx^10+0x689BDx^9+0x1CF5ECx^8+0x350CFFx^7+0x9CA5Dx^6'
+              '+0x31B2CCx^5+0x291B13x^4+0x3FDD0Cx^3+0x3A2909x^2+0x36CE1Cx'
+              '+0xE8135',
+    (11, 23): '0x35BB6Cx^10+0x3604F7x^9+0x488C84x^8+0x1FDAD8x^7+0x5D449Bx^6'
+              '+0x2670DFx^5+0xEB6EFx^4+0x7CD7FDx^3+0x63F14Bx^2+0x3270FFx'
+              '+0x41796D',
+    (11, 24): '0x4506Fx^10+0x7D52F7x^9+0x3329B4x^8+0xC32592x^7+0x5CE5A7x^6'
+              '+0x958B07x^5+0xE0A357x^4+0x3CB380x^3+0x8E8C15x^2+0x1D0365x'
+              '+0x1EB14A',
+    (11, 25): '0x1D76A3Bx^10+0x184688Cx^9+0x1C334CCx^8+0xED57E7x^7'
+              '+0xE80DCx^6+0x85926Ax^5+0x188F13Bx^4+0x1160A1Fx^3'
+              '+0x1D4B342x^2+0x188C08Dx+0x71B361',
+    (11, 26): '0x38424D3x^10+0x3834F84x^9+0x1A36AD2x^8+0x36AC1FFx^7'
+              '+0x38BB8CAx^6+0x8DF955x^5+0x31ECDFEx^4+0x2A46A05x^3'
+              '+0x146615x^2+0x24D53F2x+0xA12179',
+    (11, 27): '0x1BCA50Fx^10+0x61C2885x^9+0x7F3930Ex^8+0x6481DBAx^7'
+              '+0x3DA24F1x^6+0x37ED0BEx^5+0x3BF67F2x^4+0x6D00ABx^3'
+              '+0x58B6A0Ax^2+0x267F9E1x+0x49F3B02',
+    (11, 28): '0x562097Fx^10+0xD8FBEF4x^9+0xAFA1F0Ex^8+0xF79691Ax^7'
+              '+0x732FD29x^6+0xB5A1FB4x^5+0x5BBBE84x^4+0x6858CB7x^3'
+              '+0x1FECFB8x^2+0x20CBB6Ex+0xA5DD9A6',
+    (11, 29): '0xAC493A4x^10+0x1574E086x^9+0x1DA79914x^8+0x9F6A7EEx^7'
+              '+0x1F3A3905x^6+0x65B4E5Fx^5+0x128EDD1x^4+0x1103C086x^3'
+              '+0x1E55DDC2x^2+0x1830C381x+0x6261DC9',
+    (11, 30): '0x22A6080Ax^10+0x8B24B5Ax^9+0x1F1EA35Cx^8+0x3726F3A7x^7'
+              '+0x80F64DBx^6+0x356D8D42x^5+0x183CE0ACx^4+0x206EB3ADx^3'
+              '+0x8D017FAx^2+0x2D1736B2x+0x2D2D4BF9',
+    (11, 31): '0x2473F487x^10+0x6C11CC21x^9+0x6DB37333x^8+0x604B2772x^7'
+              '+0xE9A5DC8x^6+0x5080D8EDx^5+0x45A64AE9x^4+0x16B71Bx^3'
+              '+0x19F9282Fx^2+0x73FDCE4x+0x4F6031B4',
+    (11, 32): '0xE3F2654x^10+0x94AD1197x^9+0x4F0F8C68x^8+0x1A59E567x^7'
+              '+0x9984DAA2x^6+0x2B800602x^5+0x91FAD75Ax^4+0x94D6C746x^3'
+              '+0x6D63B4BAx^2+0xD4E29DFBx+0xC2CB61B8',
+    (11, 33): '0x1AFD8CB76x^10+0x92443D79x^9+0x17F752346x^8+0x13650F9D9x^7'
+              '+0x3C1CABDAx^6+0x12D0F240Bx^5+0x1ED54B4DBx^4+0xE1210D2Ex^3'
+              '+0x219EBF08x^2+0x1D55A55D7x+0x1AA424D05',
+    (11, 34): '0x51B8333Ax^10+0x28065EB4Dx^9+0x3C7CF3E69x^8+0x338BEB748x^7'
+              '+0x155516076x^6+0x312B3F31Dx^5+0x2D7E03609x^4+0x2AD60C30x^3'
+              '+0x374479EC7x^2+0x2F636929x+0x3BFD878F0',
+    (11, 35): '0x55075CE5Dx^10+0x572791ED4x^9+0x389381BFBx^8+0x654C1BEC4x^7'
+              '+0x4622E226Bx^6+0x1C67E335Fx^5+0x6FCECB0DEx^4+0xB27B2D7Dx^3'
+              '+0x6543C2528x^2+0x25EEA5D1Bx+0xF87D1CA4',
+    (11, 36): '0xE33B86679x^10+0xA10C1AED7x^9+0xA63698D47x^8+0xC32FA1293x^7'
+              '+0xEC615DCB7x^6+0xDB96BED7Fx^5+0x17DE281AAx^4+0x2CCC0D9DCx^3'
+              '+0xFB1014B65x^2+0xD81E69C39x+0x9EFB1422D',
+    (11, 37): '0x8971CD238x^10+0x62850F87Dx^9+0x15996577FAx^8'
+              '+0xAAB068E33x^7+0x1E4FD8A34Dx^6+0x864B4707Ex^5'
+              '+0xDB2621BE4x^4+0x1C87DB06A1x^3+0x5A8446A09x^2+0x16CD26C1C6x'
+              '+0xCCF16A729',
+    (11, 38): '0x32C1B1711Dx^10+0x1CA7872C12x^9+0x3F38EF04E5x^8'
+              '+0xB47E16B24x^7+0x703F140A5x^6+0x4973F4FB5x^5'
+              '+0x2872A7ECA1x^4+0xD5E43F1EDx^3+0x3E964CFDC0x^2'
+              '+0x3A30FF827Cx+0xC21C3D2B5',
+    (11, 39): '0x261537AD60x^10+0x2318E61CDCx^9+0x36E43BE623x^8'
+              '+0x2C79AD26D5x^7+0x531CC78148x^6+0x65FC08A882x^5'
+              '+0x5997AB7454x^4+0x6F913A2687x^3+0x21555F221Cx^2'
+              '+0x59E7D705Dx+0x6F22D34903',
+    (11, 40): '0xAAACEDFC6Bx^10+0xAC97688018x^9+0xD6359144A7x^8'
+              '+0x5A3DC3D17Dx^7+0x779905CE4Ax^6+0x9599CA36ADx^5'
+              '+0xE8449E9DD0x^4+0x59EDA85E7Ax^3+0x6496DDCEABx^2'
+              '+0xA6306E7D43x+0x9B467B1D4F',
+    (11, 41): '0x96858E0C8Bx^10+0x1E206A59759x^9+0x8CA47923AFx^8'
+              '+0x151B97D8958x^7+0x1F3CE7E22D7x^6+0x10DD05C84C8x^5'
+              '+0xDB2E360DE3x^4+0x10775F99AF5x^3+0x4C8F941023x^2'
+              '+0x1ED15EDEFD6x+0x171866B06DE',
+    (11, 42): '0x24D64D4F60Bx^10+0x13CDF12AA28x^9+0x3E462FC8C5Cx^8'
+              '+0x2C11A16329Bx^7+0x32ACAE227BAx^6+0x1CA454640F8x^5'
+              '+0x300186C32EBx^4+0x3A0D2313FAAx^3+0x15DCEE2D9BEx^2'
+              '+0x34D1CFB830Fx+0x15B1F34C07F',
+    (11, 43): '0x6FD0C91CA61x^10+0x5BB83970202x^9+0x4148E991861x^8'
+              '+0x5BF7BB2D202x^7+0x14FD32D3E87x^6+0x1D55D5C70C9x^5'
+              '+0x6976CD738CDx^4+0x21CCDE104E1x^3+0x4F43712C48Fx^2'
+              '+0x4640A399C91x+0x4D1174CD6C1',
+    (11, 44): '0x2D55D777F26x^10+0x7395AB81D97x^9+0x3D818A4B91Ex^8'
+              '+0x8483CCE13C0x^7+0x7138FF4EC76x^6+0xFF92AE51055x^5'
+              '+0xE03BB2DBFEAx^4+0x2D4C93009F6x^3+0x6534AEF0EEDx^2'
+              '+0x55FEC2EC998x+0x9732F0BA290',
+    (11, 45): '0xB7011619A9x^10+0xA38E7F672F8x^9+0x164E93AE9F2Ax^8'
+              '+0x16DD418CA2CBx^7+0x2508653DE34x^6+0x11F39FD9E837x^5'
+              '+0x636BA7BA5E2x^4+0x16360933E76Bx^3+0x15E8138C0BBDx^2'
+              '+0x12FB8FC504BEx+0x1145FFFD04C4',
+    (11, 46): '0x221D37CCB80Ax^10+0x23EBC961CEB0x^9+0x1EC6BE85BE0Ax^8'
+              '+0x9A6611FF70Bx^7+0x287C6E69E8AFx^6+0x332A0922AC62x^5'
+              '+0x28691240373x^4+0xEAF4F168715x^3+0x108DAF304471x^2'
+              '+0x39BAAF64909Ex+0x3B4137FC11AE',
+    (11, 47): '0x3B13755EE8C8x^10+0x471A6596FB43x^9+0x2856B55A3DC8x^8'
+              '+0x147C01E40259x^7+0x62936C891BBAx^6+0x627E814E7051x^5'
+              '+0x2E15373B1203x^4+0x6C059645C4EFx^3+0x7F6A0BAF0588x^2'
+              '+0x6E30DC5E412Ax+0x769C870A91DB',
+    (11, 48): '0xBE8E1451B468x^10+0x4E66580E059Bx^9+0x64C90BA1FAE9x^8'
+              '+0xF3FD064413A6x^7+0x3257DF89C81Ax^6+0xD0298CE31E82x^5'
+              '+0x2B9E11E40557x^4+0x3D2C7FB22009x^3+0x1D26CF9A453Cx^2'
+              '+0xBE3B7CCC9AB4x+0xA4F8BD9477CF',
+    (11, 49): '0x2F1752223065x^10+0x198A847276F30x^9+0x1C79CA8E914FCx^8'
+              '+0x1F647A5D4568Fx^7+0x76AABEB97416x^6+0x1203B21468B68x^5'
+              '+0xF5C19338E65Ax^4+0x3C9F594C1279x^3+0x169C4AD382F7Cx^2'
+              '+0x1506C3883A6DDx+0x1AC417BB2D43C',
+    (11, 50): '0x39DCB948AEBFEx^10+0x3C4612C7CE1EDx^9+0x1F9E4EFBDD5CBx^8'
+              '+0x1CC3C0862DB39x^7+0x3762CC90D51FCx^6+0xC5092CFC3FC4x^5'
+              '+0x4A02FFF0DD2Ex^4+0x284DC1B70160x^3+0x35F04F6714C1Bx^2'
+              '+0x3D210D8EC3406x+0x13D1FD75EA13',
+    (11, 51): '0x6063B018C919x^10+0x48730C31071A9x^9+0x2800468D3DA12x^8'
+              '+0x12B97DED3D439x^7+0x6AA5B4328F160x^6+0x69CB3172189CFx^5'
+              '+0x394B2DDD1783Cx^4+0x6EE7C9FC402F7x^3+0x23290558CA57x^2'
+              '+0x4FF9F25B160Dx+0x7A894163DD7C0',
+    (11, 52): '0xED369DA03BF79x^10+0xAF70C5A331260x^9+0x216495133BD21x^8'
+              '+0xF70CC479786ABx^7+0x554586984EAF5x^6+0x4F5E54B6BD92Ex^5'
+              '+0x6027A8057F81Cx^4+0x3FFD07D97E6B4x^3+0x6962219933929x^2'
+              '+0x56EA91D905DA0x+0x7F7F47F4D8290',
+    (11, 53): '0x114088CEC79C11x^10+0x124AFAB72533E0x^9+0xFB37EE6478B9Bx^8'
+              '+0x1DB350AD45C209x^7+0x9C30247952671x^6+0xF645194AAE97Ex^5'
+              '+0xBCD53D79D9E4Dx^4+0x1153990E681A26x^3+0x15FE3AEF1A7232x^2'
+              '+0x14BE3C5C220769x+0x6F861B6E2F104',
+    (11, 54): '0x131F3B789ADEB4x^10+0x10DB88AC63592Dx^9+0x20A68B736FEDD8x^8'
+              '+0x40A5FA746606Cx^7+0x3913EE84D32AC6x^6+0x5ACE3C8913E9Bx^5'
+              '+0x76AA2E65AD179x^4+0x36FB563A33E87Dx^3+0x1169DB0620D9B3x^2'
+              '+0x114A0A3514620Ax+0x3EB2A8118E4E61',
+    (11, 55): '0x3E4A8E7316FA34x^10+0x69565FBAC4BAE5x^9+0x4739009D0AEF73x^8'
+              '+0x5A9891E92EA77Dx^7+0x3330752BD8AEE3x^6+0x621BB358532F1Ex^5'
+              '+0x4CC044218F5848x^4+0x257C5022DF96C8x^3+0x120C619B31AC01x^2'
+              '+0x55B69EC05C41C0x+0x5ED2657DCD472C',
+    (11, 56): '0xED0CCFA71A8886x^10+0x4F5A9AC2F46753x^9+0xBDC740FB8B7815x^8'
+              '+0xA4DB4673A10B73x^7+0x820460D47655F9x^6+0x467950FD45050Bx^5'
+              '+0xCC75B538184F36x^4+0xB11347BC0BD44Dx^3+0xD390F3FEEBE718x^2'
+              '+0xC20E966BC9C212x+0xCFBDD9B44BFCA8',
+    (11, 57): '0x275505D4DAE20Bx^10+0x14487C89920DB79x^9'
+              '+0x163126C1C9FF4B1x^8+0x3DA7477504001Ex^7+0xA280158B02317x^6'
+              '+0x7EA3C9C7906B09x^5+0x17B6D4B562F1EC6x^4'
+              '+0x8448E078FC9185x^3+0x14C6FBEC0669A4x^2+0x1A0F79428D9D2A4x'
+              '+0x10BA2B342908FCF',
+    (11, 58): '0x3CB5908B05579BFx^10+0x631D482F36868Cx^9'
+              '+0x17602F7FA12734Ax^8+0x37F2A3A5E3FD1F7x^7'
+              '+0x22A45DA9594A04Cx^6+0x23400BDA55BC4BFx^5'
+              '+0x2DFF00406669099x^4+0x1F9DCE6370AEEB5x^3'
+              '+0x3DAE8135E22DC0Ex^2+0x18A501395C6DBA8x+0x33C03774842CCC',
+    (11, 59): '0x3E822693A9A76B5x^10+0x471BD2B774AB89Dx^9'
+              '+0xDFD4A6938F4AD0x^8+0x5F6424E9C2882A2x^7'
+              '+0x1DDC5A5B4646C9Ax^6+0x114B590DA28A187x^5'
+              '+0x3957A1F54099873x^4+0x47574F540F28BEEx^3'
+              '+0x3A746633470A5D7x^2+0x47CFF2C60A8CB4Cx+0x7C46E3EC71884CC',
+    (11, 60): '0x170293F42CE7DD1x^10+0xDE610255DDE5295x^9'
+              '+0x25259CBC927D6D3x^8+0x8AB8D98E87F4AADx^7'
+              '+0xE2F935B41A0D00Fx^6+0x70BB57E40CE8D57x^5'
+              '+0x10F53F8EDC9DD2Ax^4+0xD24B5B04B2B7792x^3'
+              '+0x5AB591605DA0C76x^2+0x4333074F368A83Ex+0x805FC0132A21A93',
+    (11, 61): '0x14511C2D4D80D912x^10+0x31D0EEC87349570x^9'
+              '+0xEE099D5848C79C2x^8+0x1EEF80ED01CCCD7Ax^7'
+              '+0x31BCA31F6C99393x^6+0x1719133F7F92E107x^5'
+              '+0xA3E049EF533315Cx^4+0x59440E7A473847Bx^3'
+              '+0x1BF55DFC2E989C1Ex^2+0x1B0A500349D7D026x'
+              '+0x1286D20E16DD0E5C',
+    (11, 62): '0x3F3EEEC690567148x^10+0x377F434EA9EB379Ex^9'
+              '+0x625F5E3BE100CE8x^8+0x1B3C80916D104E2Ex^7'
+              '+0xAA23D16C0D3226Cx^6+0x3CB651C3D76C5E45x^5'
+              '+0x1137F23AB0D702F7x^4+0xE4EE52CD7FC53E7x^3'
+              '+0x3BDC7440AAF22C8x^2+0x3C3C51E5BE3137D7x+0x29290F707AF3509A',
+    (11, 63): '0x5453580CDE4CD87Dx^10+0x2090A2127296BC76x^9'
+              '+0x483E021F0A19E1E0x^8+0x51B1D5B5600C8A89x^7'
+              '+0x761217C37C210A33x^6+0x5F5041C9B78124DCx^5'
+              '+0x2A0E7286377E626Bx^4+0x4454BD0FC56766ECx^3'
+              '+0x8A9CF66974CCDF6x^2+0x598367010DC19D2Ex+0x341D6B8F2B399ABE',
+    (11, 64): '0xEF5CFC9DA9EA509Fx^10+0x541301901F4CF5EFx^9'
+              '+0xE4F764CE2BFF87B8x^8+0xB767207A4518B836x^7'
+              '+0xA916F089F2A37276x^6+0x3DA86553744CE502x^5'
+              '+0x4C3DF200E901B453x^4+0x31CB411807D520F7x^3'
+              '+0x4854EF6D5FF3F9BCx^2+0x5433522ADC1819D3x'
+              '+0xDBEF151103C980DA',
+    (12, 2): '0x2x^11+0x3x^10+0x2x^9+0x3x^8+0x3x^7+x^6+0x3x^5+x^4+0x2x^3'
+             '+x^2+0x2x+0x3',
+    (12, 3): 'x^11+0x4x^10+x^9+0x7x^8+0x7x^7+0x4x^6+0x2x^5+x^4+0x5x^3'
+             '+0x2x^2+0x4x+0x7',
+    (12, 4): '0x8x^11+0xDx^10+0xAx^9+0x8x^8+0x6x^7+0xDx^6+0x4x^5+0x9x^4'
+             '+0xCx^3+0xFx^2+0x9x+0xD',
+    (12, 5): '0x1Bx^11+0x12x^10+0x3x^9+0x6x^8+0x19x^7+0x7x^6+0x17x^5'
+             '+0x14x^4+0x16x^3+0x11x^2+0x10x+0x5',
+    (12, 6): '0x14x^11+0x8x^10+0x11x^9+0x2Bx^8+0xAx^7+0x17x^6+0x3Dx^5'
+             '+0x12x^4+0x36x^3+0x1Ax^2+0x17x+0x2A',
+    (12, 7): '0x2Bx^11+0x4x^10+0x1Ex^9+0x26x^8+0x52x^7+0x15x^6+0x56x^5'
+             '+0xDx^4+0x78x^3+0x43x^2+0x51x+0x5B',
+    (12, 8): '0x9Ex^11+0x92x^10+0x2Ex^9+0x5Ax^8+0x91x^7+0xDFx^6+0xFx^5'
+             '+0x86x^4+0x47x^3+0x73x^2+0xA8x+0x9C',
+    (12, 9): '0x134x^11+0x150x^10+0x65x^9+0x197x^8+0x29x^7+0x17Dx^6'
+             '+0x1A7x^5+0x57x^4+0x5Fx^3+0x16Ex^2+0x167x+0x131',
+    (12, 10): '0x1CFx^11+0x1EFx^10+0x36x^9+0x20x^8+0x323x^7+0x170x^6'
+              '+0x103x^5+0x268x^4+0xCAx^3+0x9Cx^2+0x233x+0x31A',
+    (12, 11): '0x7ACx^11+0x320x^10+0x1BCx^9+0x13Bx^8+0x421x^7+0x56Ex^6'
+              '+0x2F3x^5+0xC7x^4+0x1A6x^3+0x347x^2+0x71x+0x47',
+    (12, 12): '0x8Ex^11+0x51x^10+0x76Ex^9+0xCE8x^8+0x63Dx^7+0x163x^6'
+              '+0x96Bx^5+0x4E8x^4+0x220x^3+0x6A4x^2+0x474x+0xAFA',
+    (12, 13): '0x175Ex^11+0xBB7x^10+0x1D9Dx^9+0x44Dx^8+0x46Ax^7+0xE42x^6'
+              '+0x1066x^5+0xDD3x^4+0x936x^3+0x57x^2+0x110Ex+0x138B',
+    (12, 14): '0x187Ax^11+0xEEBx^10+0x22E8x^9+0x2E7Dx^8+0x1895x^7+0x1AF5x^6'
+              '+0xCA3x^5+0x2EC5x^4+0x107Fx^3+0x3C8Dx^2+0xB82x+0x1D5',
+    (12, 15): '0x15C2x^11+0x484Ex^10+0x35E9x^9+0x5109x^8+0x4C1Cx^7'
+              '+0x3D13x^6+0x1ACFx^5+0x35ADx^4+0x7FF5x^3+0x14C5x^2+0x18D8x'
+              '+0x46D3',
+    (12, 16): '0x4F61x^11+0xF5A5x^10+0x6F8x^9+0xEC0Fx^8+0xB12Bx^7+0xA644x^6'
+              '+0xFF4Bx^5+0x8FCEx^4+0x2C14x^3+0xD1A3x^2+0xB7D3x+0xEB61',
+    (12, 17): '0x62C9x^11+0x19AB5x^10+0x18FD6x^9+0x16B21x^8+0x1025Bx^7'
+              '+0xE0Fx^6+0xA8DEx^5+0x19AD7x^4+0x18BF2x^3+0x18714x^2+0x66EEx'
+              '+0x17ADD',
+    (12, 18): '0x3BC96x^11+0x3E9E4x^10+0x34898x^9+0x34B94x^8+0x6764x^7'
+              '+0x5307x^6+0x770Fx^5+0x24F8Fx^4+0x34E1Cx^3+0x1B75x^2'
+              '+0x1A6ABx+0x15E14',
+    (12, 19): '0x6F615x^11+0x73313x^10+0x135CFx^9+0x12678x^8+0x2F442x^7'
+              '+0x389A0x^6+0x7A228x^5+0x123D4x^4+0x7D901x^3+0x2D42Dx^2'
+              '+0x7A18Ex+0x59DC7',
+    (12, 20): '0x5D53x^11+0xC8F69x^10+0x1D0D2x^9+0x49663x^8+0xB05D6x^7'
+              '+0x7D1A0x^6+0xD7C94x^5+0xF4F19x^4+0x6F8A9x^3+0xF78C1x^2'
+              '+0x68281x+0x76F08',
+    (12, 21): '0x1E2BCBx^11+0x69E9Cx^10+0x1A7A5Ex^9+0x1C9BE8x^8+0xAAE6Fx^7'
+              '+0x354D0x^6+0x1E5974x^5+0x1628EDx^4+0x13F510x^3+0xBA21Fx^2'
+              '+0x3C079x+0xF3F9D',
+    (12, 22): '0x3FAE55x^11+0x128D93x^10+0x85196x^9+0x3BAEEEx^8+0x27564Dx^7'
+              '+0x1488E7x^6+0x2824B7x^5+0x301475x^4+0x333CB4x^3+0x30AE91x^2'
+              '+0x12B083x+0x2EB835',
+    (12, 23): '0x5E09C2x^11+0x36AB00x^10+0x3674C5x^9+0x59F91Bx^8'
+              '+0x5836D1x^7+0x359AF4x^6+0x758A82x^5+0x406839x^4+0x1682DDx^3'
+              '+0x7FAAD1x^2+0x570965x+0x7C5CF1',
+    (12, 24): '0x7F3DC7x^11+0x413506x^10+0x3729Bx^9+0xF91D1Fx^8+0x66DC28x^7'
+              '+0xF013A4x^6+0xAA7886x^5+0x921272x^4+0xB7C4B9x^3+0xC157B2x^2'
+              '+0xA3EF24x+0xFD56D8',
+    (12, 25): '0x676BF5x^11+0x174962Fx^10+0x1F52DCFx^9+0x1D582Ex^8'
+              '+0xF5A8FEx^7+0x196A4A3x^6+0xA93E5Ex^5+0x1615555x^4'
+              '+0xA7F4D3x^3+0x1682BF8x^2+0x16DC571x+0x187CF13',
+    (12, 26): '0x192C625x^11+0x1CE3E66x^10+0x3061EC8x^9+0x25E5FB6x^8'
+              '+0x1A77772x^7+0x36C44Ex^6+0x48D634x^5+0x3B90745x^4'
+              '+0x39986Cx^3+0x27D3020x^2+0x2BB15BAx+0x27FBF9F',
+    (12, 27): '0x13D98ADx^11+0x35ED2x^10+0x5D0EF72x^9+0x7F571ACx^8'
+              '+0xE8A1x^7+0x21D0EEEx^6+0x679BC7Fx^5+0x7C25DCAx^4'
+              '+0x5A765AEx^3+0x19C82CFx^2+0x7DED5A1x+0x3031C53',
+    (12, 28): '0x735B040x^11+0x2228C5Ax^10+0xDD3BF9Ax^9+0xAD4181Fx^8'
+              '+0xE9B5DCCx^7+0x2062FCEx^6+0xE52542Fx^5+0x43440Bx^4'
+              '+0x39F4945x^3+0x3078BBEx^2+0x1DF67x+0x2ABBDA',
+    (12, 29): '0x19E4C64Dx^11+0x198FC474x^10+0x122B2097x^9+0x64C3ED9x^8'
+              '+0xF4A9628x^7+0x14B8D542x^6+0xEF3898Bx^5+0x14A9D2FEx^4'
+              '+0x1B76917Cx^3+0x783562Fx^2+0x1FA5D517x+0x166F575C',
+    (12, 30): '0x1784C0F0x^11+0x4A9D817x^10+0x2701BC97x^9+0x85C6BB5x^8'
+              '+0x22BB5A53x^7+0x15243993x^6+0x3F97C374x^5+0x30CD98F9x^4'
+              '+0x3F848830x^3+0x1BB05Dx^2+0x3CD65CD2x+0x27909755',
+    (12, 31): '0xCC2A38Fx^11+0x37A5CA38x^10+0x13B02629x^9+0x4DE64FBEx^8'
+              '+0xBAD7E22x^7+0x4AB8CE62x^6+0x5CCDF020x^5+0x2AEEC593x^4'
+              '+0x4AAA0856x^3+0xB31B91Ex^2+0x4A9A4B9Cx+0x66A69E32',
+    (12, 32): '0x854F72F2x^11+0xBED908FBx^10+0x516F86E3x^9+0x1960C086x^8'
+              '+0xDBDDC33Cx^7+0x512D0050x^6+0x6DF50DEEx^5+0x32B4C656x^4'
+              '+0x897F7264x^3+0x4C1D6EFBx^2+0x8C620131x+0xF7830A31',
+    (12, 33): '0x12DDCABB5x^11+0x19E956F58x^10+0x6C86188Ax^9+0x10A94C1F0x^8'
+              '+0x1D1A3CC6Dx^7+0x53E41161x^6+0x1FBC03B5Dx^5+0xE1047BFCx^4'
+              '+0xF2EDB698x^3+0x73860D9Fx^2+0x1715B077Bx+0x12256EC55',
+    (12, 34): '0x30A3DDE10x^11+0x2B39D16AFx^10+0x34E036D1Ex^9'
+              '+0x38EC33C0Fx^8+0x2977F7D00x^7+0x14934DFEBx^6+0x9E3D058Dx^5'
+              '+0x3B29AF04Ax^4+0x29CD1C783x^3+0x1F4FA5C85x^2+0x49E6B377x'
+              '+0xF600D2CF',
+    (12, 35): '0x7CFACCAFDx^11+0x614F144F5x^10+0x60E80Ax^9+0x263019B22x^8'
+              '+0x3910F28D5x^7+0x7F1FEFF95x^6+0x40664A1BDx^5+0x3151DDDDFx^4'
+              '+0x6B6CEFBD3x^3+0x7054F8E63x^2+0x6C02BF979x+0x309F040D8',
+    (12, 36): '0xBC55DB04Fx^11+0xE94830C2Bx^10+0x30C7CB082x^9'
+              '+0xACB8996A8x^8+0xD9EB360B1x^7+0x523CA40A6x^6+0x4B83F7300x^5'
+              '+0x1F6521C76x^4+0x4479F3A5Ex^3+0xE3C0E6C03x^2+0x2F182AF6Bx'
+              '+0xF3D213C50',
+    (12, 37): '0xE6852D219x^11+0xFEA11869Cx^10+0xDA3B0DA37x^9'
+              '+0x385863C4Ax^8+0x1D7FCA0376x^7+0xADBE45C82x^6'
+              '+0x1666E6F77Ex^5+0x19C8C86AB8x^4+0xFC1AA3D92x^3'
+              '+0x1AE503F016x^2+0xF5545FFC1x+0x154B106C53',
+    (12, 38): '0x1A98058213x^11+0x26AE07AC9Fx^10+0x1651D40207x^9'
+              '+0xF2691E7Cx^8+0x3CCD49CAC8x^7+0x1AACA8ED09x^6'
+              '+0x230FAFAAC7x^5+0x265E0CA3E9x^4+0x2362ECE4E2x^3'
+              '+0x5EFC19A21x^2+0x3449B35390x+0x20A2AB3B55',
+    (12, 39): '0x694292B233x^11+0x28FC32A625x^10+0x17C8BC5183x^9'
+              '+0x69D2A43E74x^8+0x258CACE9Cx^7+0x3895FF28C5x^6'
+              '+0x309F9B20A9x^5+0x37C0C62E55x^4+0x4241B6AE0Dx^3'
+              '+0x2DFC4C7208x^2+0x61AE89EB4Dx+0x10639E92B2',
+    (12, 40): '0x33648825A3x^11+0x2E55FE2367x^10+0x9C849F68D1x^9'
+              '+0x75C500D8E0x^8+0xFBDD8353DEx^7+0xEDD01B0ECBx^6'
+              '+0x9936801B65x^5+0xAD3BF1B0F5x^4+0xFCA1017A36x^3'
+              '+0x3FD5252550x^2+0xC5FC0129EBx+0x134452BDA0',
+    (12, 41): '0x4DA6FE6100x^11+0x1AD2BE48461x^10+0x1DAAD4214C4x^9'
+              '+0x1803AC52793x^8+0xE975C20AD1x^7+0x9441779F75x^6'
+              '+0x1453684448Ax^5+0xAD6CD9A23x^4+0x6B1284A5ECx^3'
+              '+0x1A7804150FDx^2+0x1D124AB0F73x+0x18520080808',
+    (12, 42): '0xC5D0AE1F95x^11+0x39A659D962Ax^10+0x2DD82553099x^9'
+              '+0x816434DB52x^8+0x41D5953AC5x^7+0x36490612D8x^6'
+              '+0x32FB0AF9B2Bx^5+0x26A730B8CC6x^4+0x1B1859700A7x^3'
+              '+0xA7EFAA66D8x^2+0x2E86631142Fx+0x1D726924F26',
+    (12, 43): '0x5779B7AC1B0x^11+0x7E632AE6185x^10+0x148E5FD3D85x^9'
+              '+0x571B014AB56x^8+0x377E1D867D6x^7+0x7E40B7896D0x^6'
+              '+0x6F87EC47737x^5+0x5345ACC0EABx^4+0x19B6F589A0Ax^3'
+              '+0x2F0BE8F718Fx^2+0x803DD0E4CFx+0x3F276A5EB1B',
+    (12, 44): '0xD66D0121199x^11+0x2978D6AA2A6x^10+0x8BDCE4B6C05x^9'
+              '+0x383B0331BAEx^8+0x2CFFC674487x^7+0xC5CB9663B2x^6'
+              '+0x7D5F36233Ex^5+0x89EB4EFF6BDx^4+0x5BE8D0D3FE5x^3'
+              '+0xCD7371AE5Ax^2+0x6E34ECF308Fx+0x1A2E8A66583',
+    (12, 45): '0x10B1E30B9C3x^11+0x108ADD36BA2x^10+0x6714F666854x^9'
+              '+0x103056E9CBAFx^8+0x1C8CFD4707A6x^7+0x1C9AA6E870FDx^6'
+              '+0x1B0C7284D1DEx^5+0x1AD010DEAFA8x^4+0x157D41C2E733x^3'
+              '+0x78D8A2261ACx^2+0x13410BD27AB6x+0x10359EC66B36',
+    (12, 46): '0x2E1E567BB71Cx^11+0x1744119BBCA9x^10+0xF64DBF0A933x^9'
+              '+0x21F8384302D6x^8+0x3ACC432F8Fx^7+0x1F37EA143DA4x^6'
+              '+0x6FB448437DCx^5+0x312DB10DDD7Dx^4+0x15DD6AF88B9x^3'
+              '+0x171500E830A0x^2+0x37F2FD64C8EDx+0x2EC0C7C0E1A3',
+    (12, 47): '0x7C42F9552A2Cx^11+0x4383965A405Cx^10+0x1D28860703BBx^9'
+              '+0x19CAD1C53549x^8+0x65014D5CBC81x^7+0x196B7EA10FC1x^6'
+              '+0x4B138C754DE1x^5+0x106219B4CC46x^4+0x42E16B3CC1F1x^3'
+              '+0x1619E4AC737Ax^2+0xED8490647F1x+0x5721AED94A1B',
+    (12, 48): '0x977BFCBF0394x^11+0x4E1C11A7F56Bx^10+0xE7EEBE716DC3x^9'
+              '+0xA0D0C455FD6Bx^8+0xC00C3CE4C9E0x^7+0x3B6C9D2915FBx^6'
+              '+0x3E60C8476306x^5+0x3EA03D41B028x^4+0xB3AC4B7DA8E2x^3'
+              '+0x6F86BAABF401x^2+0x6D5359B72F13x+0xFEF52A36E3BA',
+    (12, 49): '0x1D4F747308085x^11+0x3B23F76A9C14x^10+0x144ED46BC942Dx^9'
+              '+0x1CB1D9C052252x^8+0x18A139AE837CFx^7+0x11CEB9C558D00x^6'
+              '+0x1D737C253C1E8x^5+0xA3E2127D84EAx^4+0x44BC12F2C990x^3'
+              '+0x16546477E0F2x^2+0x1F1FF4B34095Ex+0x1AE310A1BB452',
+    (12, 50): '0x69C1D88FC22Ex^11+0x122EBFEF29F22x^10+0x8E3F77D1816Ax^9'
+              '+0x24CFACAAEE59Ax^8+0xE7F848C16B4x^7+0x33D324895AD1Bx^6'
+              '+0x34DCECAF3028Bx^5+0x6C9D18A818A2x^4+0x1272BBCC17186x^3'
+              '+0x6F9EBC058E7Bx^2+0x1572DC757F6E3x+0x202E3793B813',
+    (12, 51): '0x4F48A1F05A767x^11+0x53F069EF038ADx^10+0x7C455248D0C56x^9'
+              '+0x5723BF44635FBx^8+0x69AE9B7B1D5Fx^7+0x1477B227ABC9Ax^6'
+              '+0x2EBB96B1011F0x^5+0x605C24FC82068x^4+0x366A96CD73857x^3'
+              '+0x4F748ADD0874Cx^2+0x3622E34F123A5x+0x469592C8E4472',
+    (12, 52): '0x6E846760610Ex^11+0x783EB5910FCF7x^10+0x10F58435B8E1Bx^9'
+              '+0xB5BD9B51F5E23x^8+0x3F6BF5B202CD8x^7+0x97C71EE4E971x^6'
+              '+0x12CCB4051C5D2x^5+0x9B2D91D0031AFx^4+0xD208D4DD30250x^3'
+              '+0x50B964F4A3BABx^2+0x198503099DE4x+0x20B487F96E50B',
+    (12, 53): '0xB9BF1D4BA2022x^11+0x3038DE35E6CB1x^10+0xD1EB6BBC822C4x^9'
+              '+0x4E67B93CE53E5x^8+0xF15C6D6164301x^7+0x125F14B020FC21x^6'
+              '+0xFD5067A5D17C5x^5+0xDEE753F5E97CEx^4+0x8C65594AA3D48x^3'
+              '+0x12E66DE8395FC3x^2+0x10B8C2E277EA16x+0x1FC1837EA59352',
+    (12, 54): '0xE4ECA20D59AD1x^11+0x33370DEBF9C345x^10+0x1C8302C641F598x^9'
+              '+0xF12FB7621E5E8x^8+0x5227767887F18x^7+0x2B55FDCCADD47Ax^6'
+              '+0x388B155E6FD352x^5+0x6038248932033x^4+0x34B7050C03E22Ax^3'
+              '+0x2F044B6A32DE6Bx^2+0x61AB8E35F9EF5x+0x3949081A7C6FF8',
+    (12, 55): '0x11EBD802F98874x^11+0x5653C32A99955Bx^10'
+              '+0x6F2C8EFDA97CAEx^9+0x673E26F85143F5x^8+0x560C006D0CAD32x^7'
+              '+0x67CB5768367487x^6+0x63D2AE328C7DC1x^5+0x776BF3E1EEB81x^4'
+              '+0x103CA11383A477x^3+0x6DFFD8646B31F7x^2+0x27937A8BE31DBBx'
+              '+0x70D61FBB5DCFDA',
+    (12, 56): '0xD6FC4A9AD0CC7Ex^11+0x8081CF38CC70A5x^10'
+              '+0xEECEEE3CDCFFD2x^9+0x16B77C90E08022x^8+0xD9F2EE8C8E9AD0x^7'
+              '+0x861C52C5A0F528x^6+0x36AA07DB88FB5Dx^5+0x13E94C2ECDF8Ex^4'
+              '+0x660C6CA0845D10x^3+0xC9BBA103912857x^2+0x59778DCC9E8D70x'
+              '+0x20509AA004B9D3',
+    (12, 57): '0x197C612C5B4147Ax^11+0x98C10DD433D99x^10'
+              '+0x529C2C731D9AD7x^9+0x1D1F6077BF3F814x^8'
+              '+0x1C91FFA541E1854x^7+0x127AE5408127C19x^6'
+              '+0x627DAB90C204F0x^5+0x718017E9D4D2Fx^4+0x137F4ACC8966224x^3'
+              '+0x1ED31092D0A5A0Cx^2+0x314929E29609FDx+0xD493679E908E0A',
+    (12, 58): '0x24C5BF508499552x^11+0x3BDCE8F7E22138x^10'
+              '+0x1C6C294E65A46EFx^9+0xB55E75E508196Cx^8'
+              '+0x56B5A0BBA99B4Dx^7+0x1BC8A97BC4F5162x^6'
+              '+0x301CABE35B69937x^5+0x2CFBE213C03F9DAx^4'
+              '+0x288380A583A4DA7x^3+0xB68E3EF08AF07Fx^2+0x3185934EA956C3Ex'
+              '+0x3B61F4B98D47422',
+    (12, 59): '0x130D12FEF68D371x^11+0x69E0F4667A276D9x^10'
+              '+0x442BB5FFE97E3BCx^9+0xB1D2DB6D7EF8C5x^8'
+              '+0x1BA8497885387E5x^7+0x624ADC33B31BBF1x^6'
+              '+0x3D99236048407D8x^5+0x2D070B373BACC48x^4'
+              '+0x39D5D4BFB27FB9Ax^3+0x17443B2D2537169x^2'
+              '+0x74C69568F59A7EBx+0x66E21CBB1016089',
+    (12, 60): '0x96EECA0B031B453x^11+0xBE0E39668E2241Ex^10'
+              '+0x8202E8FE82291D7x^9+0xD602F7AAA74BBA2x^8'
+              '+0x3F646FEFC4BDB3Cx^7+0x61BF8EF5CB2BE5Bx^6'
+              '+0xECE9AAB34904774x^5+0x34A57202E67CBBBx^4'
+              '+0xBC35A4B07B874D5x^3+0x790C867E04C8670x^2'
+              '+0x2DED687FB75F86Ex+0x8C16D98B6BDD54A',
+    (12, 61): '0x124EAD26112BB4Cx^11+0xE7DFB6137AE8A5Ax^10'
+              '+0x1E1E9C4CDCC45430x^9+0x45587292EE16E5Fx^8'
+              '+0x8ABCA918F81DE0Dx^7+0x133E85EA155E2819x^6'
+              '+0x64930A0BEBA9028x^5+0x19D7913C45B75E36x^4'
+              '+0x1009A43137BA82C6x^3+0x220C5CFFBC68A17x^2'
+              '+0xED21968AE8D6ECDx+0xE55984E5627A32D',
+    (12, 62): '0x13E6E76C4457DE68x^11+0xCC491DCF0FC75A5x^10'
+              '+0x22674541AF13E8ABx^9+0x3F47053CFBFA79Ex^8'
+              '+0x1B1E45AFA2071A5Bx^7+0x3BA527A712919411x^6'
+              '+0x11A253CB3A2CB82Bx^5+0x191649091B6C4676x^4'
+              '+0x3C42ADA89248A6B3x^3+0x1F1A48B4F4103742x^2'
+              '+0x23BCCE70D4A5C99Bx+0x35B227CAA5ABDB3',
+    (12, 63): '0x4E5318BEC8E013C3x^11+0x31F161ECBEACE02Fx^10'
+              '+0x4131FAAF3B34DD9x^9+0xED778E32896CFFFx^8'
+              '+0x29F86A89DD2ABEC5x^7+0x5BE904661C21DE98x^6'
+              '+0x443BE22345363BE0x^5+0x1F26659033D9B97Ax^4'
+              '+0x19A9BB6BCFC3DBF0x^3+0x66D44B3714D9FDE1x^2'
+              '+0x46A1B4DDF37E1BB2x+0x7D2BE142B1688BB9',
+    (12, 64): '0x75EC397FB594EF68x^11+0xEF7A330652BC73Ex^10'
+              '+0x8F5CA7CE6525C673x^9+0x11A1AC8646694E8Ax^8'
+              '+0x6DE6E4FF973AA644x^7+0xDF5F3423CBEF4218x^6'
+              '+0x8499BE297B7FD4FDx^5+0x83F97FF8FF677A4Bx^4'
+              '+0xA1DE89309734E191x^3+0xC1CE4206A56CE6E3x^2'
+              '+0xB8D36CF33D29C0DAx+0x3B07D6F8683F1D7F',
+    (13, 2): '0x3x^12+0x2x^11+0x3x^10+x^9+0x2x^8+x^7+x^6+x^5+x^4+0x2x^3'
+             '+x^2+0x2x+0x3',
+    (13, 3): 'x^12+0x5x^11+x^10+0x4x^9+0x6x^8+0x5x^7+0x2x^6+0x2x^5+0x7x^4'
+             '+0x7x^3+0x6x^2+0x5x+0x2',
+    (13, 4): '0x3x^12+0xFx^11+0x8x^10+0x5x^9+x^8+0x8x^7+0xAx^6+0xFx^5'
+             '+0x3x^4+0xEx^3+0x2x^2+0x5x+0x3',
+    (13, 5): '0x8x^12+0xFx^11+0xFx^10+0x6x^9+0x1Dx^8+0x16x^7+0x5x^6+0xAx^5'
+             '+0x16x^4+0x1Ax^3+0x15x^2+0x1Bx+0x1E',
+    (13, 6): '0x2x^12+0x3Bx^11+0x3Bx^10+0x2Bx^9+0x1Ax^8+0x27x^7+0x7x^6'
+             '+0x21x^5+0x2Fx^4+0x7x^3+0x23x^2+0x8x+0x1C',
+    (13, 7): '0x4Dx^12+0x25x^11+0x3Bx^10+0x62x^9+0x31x^8+x^7+0x35x^6'
+             '+0x4Bx^5+0x10x^4+0x1Ex^3+0x30x^2+0xCx+0x3A',
+    (13, 8): '0x44x^12+0xCx^11+0xDFx^10+0x13x^9+0x17x^8+0x58x^7+0x58x^6'
+             '+0x71x^5+0xC0x^4+0x43x^3+0x45x^2+0xA4x+0xA7',
+    (13, 9): '0x157x^12+0x1C4x^11+0x22x^10+0x156x^9+0xF5x^8+0x15Bx^7'
+             '+0x45x^6+0x165x^5+0x16Fx^4+0x1C0x^3+0x1D4x^2+0x6Fx+0xB4',
+    (13, 10): '0x329x^12+0x3FEx^11+0x15x^10+0x2D2x^9+0x338x^8+0x271x^7'
+              '+0x365x^6+0x29Bx^5+0x32Dx^4+0x3Cx^3+0x314x^2+0x17Bx+0x334',
+    (13, 11): '0x9Ex^12+0x38Ax^11+0x547x^10+0x642x^9+0x59Bx^8+0x287x^7'
+              '+0xEDx^6+0x132x^5+0x4A6x^4+0x477x^3+0x73Fx^2+0x50Ax+0x510',
+    (13, 12): '0x990x^12+0x4F4x^11+0xC18x^10+0x1A7x^9+0x934x^8+0x493x^7'
+              '+0x619x^6+0x2DAx^5+0x888x^4+0x26Bx^3+0x5BFx^2+0x518x+0x317',
+    (13, 13): '0x544x^12+0xD8Ex^11+0x18DCx^10+0x1A0Ex^9+0x10D0x^8+0x288x^7'
+              '+0x1312x^6+0xC94x^5+0x1306x^4+0x1264x^3+0x174Fx^2+0x1BFx'
+              '+0x4FD',
+    (13, 14): '0x19A3x^12+0x2380x^11+0x2C68x^10+0x9BAx^9+0x34E3x^8'
+              '+0x28D3x^7+0x1E82x^6+0x33x^5+0x179Ax^4+0x2D9Bx^3+0x3BDAx^2'
+              '+0x335x+0x3C16',
+    (13, 15): '0x412Dx^12+0x7053x^11+0x5D31x^10+0x343Ax^9+0x538Ax^8'
+              '+0x1D7Bx^7+0x7D4x^6+0x7F77x^5+0x4890x^4+0x2539x^3+0x2B20x^2'
+              '+0x41A9x+0x55E',
+    (13, 16): '0x2E8Dx^12+0x3112x^11+0x1CBBx^10+0xB403x^9+0x86E2x^8'
+              '+0x9067x^7+0x3141x^6+0xC067x^5+0x76DAx^4+0x4E9Ex^3+0x6B55x^2'
+              '+0xB215x+0xAFE',
+    (13, 17): '0x609Ex^12+0xC76Bx^11+0x13679x^10+0x13FDDx^9+0x20Ex^8'
+              '+0x15E01x^7+0x1A28x^6+0xE998x^5+0x6DEDx^4+0x1F2E4x^3'
+              '+0x1412Cx^2+0x1DAE1x+0x60BB',
+    (13, 18): '0x15656x^12+0xB25Cx^11+0x192DAx^10+0x3089Dx^9+0x1AB55x^8'
+              '+0x1097x^7+0x2AB74x^6+0x306EDx^5+0x21D8Bx^4+0x2C21Ax^3'
+              '+0x312CAx^2+0x5033x+0x3CBEF',
+    (13, 19): '0x7D31Cx^12+0x53C83x^11+0x617EFx^10+0x21BC4x^9+0x63644x^8'
+              '+0xB3DBx^7+0x4F2BCx^6+0x6F607x^5+0x51BF8x^4+0x989Fx^3'
+              '+0x55FC6x^2+0x439D8x+0x40FB4',
+    (13, 20): '0x4222Ax^12+0xF6C38x^11+0xAA2C4x^10+0xD5FF1x^9+0xD432Bx^8'
+              '+0x701A5x^7+0x366BFx^6+0x417B9x^5+0x45152x^4+0x1B45Bx^3'
+              '+0x519C1x^2+0xAA92Ex+0x7C236',
+    (13, 21): '0x10E36Ax^12+0x9F83Ax^11+0x24A76x^10+0x1B9994x^9+0x148D91x^8'
+              '+0x195C23x^7+0x7FBEEx^6+0x53801x^5+0xB4F6x^4+0x1FFA24x^3'
+              '+0x1794F3x^2+0x5EA82x+0x1DFEDB',
+    (13, 22): '0x26E150x^12+0x3E0E21x^11+0x213553x^10+0x1081DDx^9'
+              '+0x2AC814x^8+0x3FF1ABx^7+0x2876F6x^6+0x11FB5x^5+0xD2067x^4'
+              '+0x1504FBx^3+0x3CB55Fx^2+0x35E96Fx+0x141582',
+    (13, 23): '0x608AC1x^12+0x5D9183x^11+0x74E3D2x^10+0x589503x^9'
+              '+0x42426Fx^8+0x4BC549x^7+0x2EFB09x^6+0x3985C7x^5+0x781C1Cx^4'
+              '+0x1AC213x^3+0x563B67x^2+0x1E62AAx+0x5E8362',
+    (13, 24): '0xBFBB1Dx^12+0xCE55Ex^11+0x5E2348x^10+0x6E7D9Ex^9'
+              '+0x12CE12x^8+0xCEAA92x^7+0x64F08Dx^6+0x2AB81Ax^5+0x91D260x^4'
+              '+0xE0F64Ax^3+0x7036A8x^2+0x3D4478x+0xAB8CF8',
+    (13, 25): '0x1FF0F67x^12+0x11E1B38x^11+0xF823Cx^10+0x160AECBx^9'
+              '+0xBF888Cx^8+0x187C3B5x^7+0x83F0A7x^6+0x1B16B33x^5'
+              '+0x5D7FB2x^4+0x1F5176Ax^3+0x136E96Dx^2+0x4B9146x+0x11CF364',
+    (13, 26): '0x1D6FD4Bx^12+0x296012Cx^11+0x3CA0119x^10+0x3280D36x^9'
+              '+0x38D26E3x^8+0xBB7A26x^7+0x3CEDB73x^6+0x1E749D9x^5'
+              '+0x1E8ACAEx^4+0x16A05AFx^3+0x3B0740Ex^2+0x2F4AF91x+0x4C8239',
+    (13, 27): '0x2295877x^12+0x46DDC6Fx^11+0x161EF02x^10+0x7481C99x^9'
+              '+0x68EB60Dx^8+0x3DF01D5x^7+0x340F163x^6+0x58762D2x^5'
+              '+0x6C2D377x^4+0x1FB982Ex^3+0x299C29Cx^2+0x73FC8A6x+0x996442',
+    (13, 28): '0xE6EB670x^12+0x3F9A81Cx^11+0x59849F4x^10+0xF3A2B0Ax^9'
+              '+0xA37B976x^8+0xA511E4Ax^7+0x64089Cx^6+0xB76ABC6x^5'
+              '+0x352145Bx^4+0x9CE37BAx^3+0x9DB065Fx^2+0xC44D5DDx+0x391500E',
+    (13, 29): '0x26569BBx^12+0x5AD3C76x^11+0x1FFAAF2Ax^10+0x17188B0Ax^9'
+              '+0x18996CA0x^8+0x1904766Bx^7+0x1B9AAEB2x^6+0x1AF9B6E0x^5'
+              '+0xC55D825x^4+0x98BD579x^3+0xB75CEF9x^2+0x167285AFx'
+              '+0x9CDB290',
+    (13, 30): '0x10A4DA07x^12+0x361E38FBx^11+0x1A64A09Cx^10+0x3D89E581x^9'
+              '+0x1EC52FD6x^8+0x17569F00x^7+0x1AD4B47Fx^6+0x3B25B496x^5'
+              '+0x3DBF2B31x^4+0x12533A52x^3+0x2C0121F2x^2+0xAC52B82x'
+              '+0x1A6489D7',
+    (13, 31): '0xA0783B8x^12+0x57196D1Cx^11+0x2F822AE7x^10+0x1B02C281x^9'
+              '+0x209F17F3x^8+0x3391C960x^7+0x57268585x^6+0x554D7BFFx^5'
+              '+0x52CA8F03x^4+0x5E812E60x^3+0x498C7AA7x^2+0x5F0E87B9x'
+              '+0x4593C8EA',
+    (13, 32): '0xCFF19F1Ex^12+0x1EF7894Ex^11+0x231F6BAEx^10+0x12A6EA51x^9'
+              '+0x635C7AA0x^8+0x185352CCx^7+0x9DCA1758x^6+0xB78CA669x^5'
+              '+0xCB6F3E09x^4+0x6CD3EF2Ax^3+0xF66BAEB7x^2+0x2B5B8DA1x'
+              '+0xA1EF00AE',
+    (13, 33): '0x93944E71x^12+0x847334A0x^11+0x13EC126F8x^10+0x2568B576x^9'
+              '+0xBAAA21AAx^8+0x18563EE3Cx^7+0x9D375CA8x^6+0xD457DB35x^5'
+              '+0x1B0B7E381x^4+0x1B506AB1Fx^3+0x19781F72Cx^2+0x17CC1F35Ex'
+              '+0x59952AB2',
+    (13, 34): '0x3B81D1261x^12+0x2D95D9EEEx^11+0x2EBC43A3Ax^10'
+              '+0x2081697D3x^9+0x33952CC54x^8+0x4C0C8521x^7+0x136EFC527x^6'
+              '+0x7B40B994x^5+0x483AD41x^4+0x3BDA80458x^3+0x375FA05AAx^2'
+              '+0x19D3AC95Ex+0x341596AB6',
+    (13, 35): '0x77E06CA08x^12+0x2D4162768x^11+0x7589BACA5x^10'
+              '+0x5AD39356Bx^9+0x4719B22A2x^8+0x2C952CC6Fx^7+0x148796C55x^6'
+              '+0x14733E32Dx^5+0x17F8DAFE6x^4+0x9140495Cx^3+0x5CEB98397x^2'
+              '+0x7DC1B32CBx+0x4BFF5F651',
+    (13, 36): '0xCDDD4BC77x^12+0xDCDC6A5DCx^11+0xE96C35B85x^10'
+              '+0xA44C679DFx^9+0xC7D174F46x^8+0x37A3830C2x^7+0x10543E2FBx^6'
+              '+0x47702D3E5x^5+0x29ABAC72x^4+0x6AB887852x^3+0x1A4ECE625x^2'
+              '+0xF7577C3E6x+0x27D8845DF',
+    (13, 37): '0x12F6016383x^12+0x16CA545092x^11+0x199CB05E19x^10'
+              '+0x1397EEAEA5x^9+0x10175BF20Bx^8+0x3977BF5D9x^7'
+              '+0x1A57E66E4Ax^6+0x4F3D443DCx^5+0x18B9757781x^4'
+              '+0x843E5B665x^3+0x1F4D84AEAEx^2+0x108056FFC8x+0x206D4967E',
+    (13, 38): '0x258A0C941Fx^12+0x21576C333Ax^11+0xE20F8483Cx^10'
+              '+0x990D697CAx^9+0x163DE56CDBx^8+0x1BD1D2C5Ex^7'
+              '+0x393C02C8E5x^6+0x3FA1D66C60x^5+0x21B52B8951x^4'
+              '+0x3CD111C2AFx^3+0x19373169BCx^2+0x1F429E175Cx+0x3BC47D1EB1',
+    (13, 39): '0x3F99C3E7E2x^12+0x4FDF41AC1Cx^11+0x74C0C29FC8x^10'
+              '+0x524FA173A5x^9+0x9562B249Dx^8+0x1388120A80x^7'
+              '+0x2E8E71B53Bx^6+0x5D90FFF27Fx^5+0x2D4AE4C1A7x^4'
+              '+0x7AAC1DCFB7x^3+0x42D79721BCx^2+0x614D1D5DC8x+0x6CE2EF5A7',
+    (13, 40): '0x5BD610E7F4x^12+0xE8AA1279D8x^11+0x1A7A27AC29x^10'
+              '+0xC66D451019x^9+0xEBE41986C8x^8+0xDF94B503CEx^7'
+              '+0x797BCE8AA4x^6+0x4E03CDB05Fx^5+0x5FC114928Fx^4'
+              '+0x520EB81C21x^3+0x1A098B4F75x^2+0xA793307204x+0xB932B98786',
+    (13, 41): '0xA0CC4D3997x^12+0x2428B82B29x^11+0x4C5007EFx^10'
+              '+0x6C6AE2BDA0x^9+0x1DB7B9A8965x^8+0x179931B25A1x^7'
+              '+0x1F4506C639Bx^6+0xFD3A14F2C1x^5+0x9031FFC2B7x^4'
+              '+0x15DD225A13Bx^3+0xEF954C718Ex^2+0x1AA444A449x+0x3B8E09384C',
+    (13, 42): '0x36AA3E01FDCx^12+0x3AA13BF228Bx^11+0x2E5EE84D05Bx^10'
+              '+0x1419434E88Bx^9+0x23E52C6546Ex^8+0x1CD933DDD57x^7'
+              '+0x19BA623FB71x^6+0x31A40079EAEx^5+0x810AF4C02x^4'
+              '+0x20EB34E92BDx^3+0xD75869BEB5x^2+0x26BCB4BD5EEx'
+              '+0x11290766995',
+    (13, 43): '0x35489CC541Cx^12+0x4E16EE2F191x^11+0x6E437F3BDD4x^10'
+              '+0x1836BA8B143x^9+0x60B56B1EE8Cx^8+0x67E464C6DF8x^7'
+              '+0x52C654092E2x^6+0x5DBD201B843x^5+0x47E60AFE396x^4'
+              '+0xA08837EE36x^3+0x3C2C9F8A98Ex^2+0x218A04778B1x'
+              '+0x1732FE914EF',
+    (13, 44): '0xD29FFD5561Ax^12+0xE1AC472797x^11+0x6A2AA89230Fx^10'
+              '+0xB197599FA91x^9+0x139931BBB7Dx^8+0x5CF37E95508x^7'
+              '+0x14EC899C086x^6+0x10A40B12A9Ax^5+0xB8DD757E65Bx^4'
+              '+0x9300EC0691Ex^3+0x21C717CF559x^2+0x7A77E497C5Ex'
+              '+0xF3CCFA47360',
+    (13, 45): '0x15E96989AE8Bx^12+0x12026E2BEA92x^11+0x90395B59F54x^10'
+              '+0x8E76BE8C0BFx^9+0x660F811A9D0x^8+0x1808842A4936x^7'
+              '+0x985CE3C7EEBx^6+0xB9F4BEEB07Ax^5+0x111AD7B5A909x^4'
+              '+0x1DE23E8EF1A4x^3+0x1B66C1D17D87x^2+0x8B812735E67x'
+              '+0xB180B787D77',
+    (13, 46): '0x15C691BF03BAx^12+0x286FDC430CDx^11+0xAF9D54AC1F7x^10'
+              '+0x14CCF5CCD18Dx^9+0x56EFDCE6E0Dx^8+0x198C791A23BFx^7'
+              '+0x1F1D87EE125Fx^6+0x1EF10EFFBC75x^5+0x15B0DA52B3Fx^4'
+              '+0x1574248121CDx^3+0x6868FE005E5x^2+0x24E5D03AEA47x'
+              '+0x370793F1F81A',
+    (13, 47): '0x55BF9BF5B35Ex^12+0x396D2F2968BAx^11+0x1C367ECA9934x^10'
+              '+0x498CDD707823x^9+0x55FC35F4349Ax^8+0x44C78809C466x^7'
+              '+0xE5D70C8DE72x^6+0x7A50DFC2C939x^5+0x3045770739E4x^4'
+              '+0x4F5BBBD8B8C0x^3+0x13FEC2C4EAF7x^2+0x72DC094BD01Ex'
+              '+0x18E79F9DB08',
+    (13, 48): '0xC78CCFCD0076x^12+0xF5BF77248BA1x^11+0xF138C91B5D65x^10'
+              '+0x882C25DC8829x^9+0x6ED93E48DC43x^8+0x69A84A8C66A9x^7'
+              '+0x4674481BEF6Bx^6+0xAFA211C955B8x^5+0x7DDCD5D6DEC6x^4'
+              '+0xE4FB6931D2B7x^3+0x4580180D291x^2+0x5301FC0436C1x'
+              '+0x11018999F1BC',
+    (13, 49): '0x7B4C18F7D86x^12+0x16FC7967DA3x^11+0xF94748944F5Ex^10'
+              '+0x95CF0F5DA4C6x^9+0x33F59678B4D4x^8+0xA4C87703A82Fx^7'
+              '+0x1F1B7DCD9952Ax^6+0x70941A9E8396x^5+0x11E211DAA12F7x^4'
+              '+0x1183708C04E38x^3+0x11EB62579F192x^2+0x13BB73971C3B9x'
+              '+0x12E330C9DFF00',
+    (13, 50): '0x165B228CB3735x^12+0x108216FB97C96x^11+0x19DEA55C8E380x^10'
+              '+0x365C1D9E74075x^9+0x312720512A5A8x^8+0x9999F8130D51x^7'
+              '+0x261C210BBE49Cx^6+0x3C4CDA0BFFFBCx^5+0x262D7160653Dx^4'
+              '+0x7C2E30CF9DADx^3+0x1CB8EB1597472x^2+0x25FC8B1EB9539x'
+              '+0x94DF9ACD6FCF',
+    (13, 51): '0x334473CB3FBF2x^12+0x1C07641EB0EA5x^11+0x3F1878159A068x^10'
+              '+0x5D19F225F1EADx^9+0x5C027ADFAEAA0x^8+0x4DEC0C5913E03x^7'
+              '+0x1535E39A75D1Cx^6+0x5DA112D4F6540x^5+0x4F24C640C4529x^4'
+              '+0xB5ED08CD5456x^3+0x5D30026CCB871x^2+0x493746E1F5289x'
+              '+0x7C1EFDA04C86',
+    (13, 52): '0x5CF178FB91056x^12+0x88FC388D41418x^11+0xE8E561EEA0D6Bx^10'
+              '+0x26673A19BC835x^9+0x688B13155B43x^8+0x45A4E9134874Bx^7'
+              '+0xA77D10FBEF052x^6+0x1061DA136C179x^5+0xD9289D53463CDx^4'
+              '+0x96EC40073A6BFx^3+0x731C1060D46EBx^2+0xF6D1C2AED1E11x'
+              '+0x2EC14CCF3F934',
+    (13, 53): '0x14EDE9063E4B3x^12+0x1087193D374145x^11+0xCDE25EC15B6Ax^10'
+              '+0x16C61FA01FB4E9x^9+0x1213C77E2853DFx^8+0x11F35AA3FE5C22x^7'
+              '+0x174B151F6472BFx^6+0xB1A3EE1940158x^5+0x1369F0ED45CB6Ax^4'
+              '+0x97FF8ED806E09x^3+0xE4CC88645F399x^2+0xCA9A16FA4E57Fx'
+              '+0x3E44902B53D18',
+    (13, 54): '0x2E78F77AD1D1D7x^12+0x2FF9C35963DC6Ex^11'
+              '+0x3CDFAED67A16A2x^10+0x28B2AE591FE5B7x^9+0xFBC1530B2535Cx^8'
+              '+0x2950E46E2B699Cx^7+0x1B5BFEB91492A7x^6+0x1D86AE3DE3974Fx^5'
+              '+0x1D819E20F1466x^4+0x388B035FD340ECx^3+0x37AB6E3D67D9Dx^2'
+              '+0x289B319E9439BCx+0x2CE18670DF4B2C',
+    (13, 55): '0x505C41B2401E03x^12+0x51CAA420621275x^11'
+              '+0xD318F9AA5BB4Cx^10+0x6F9B8F27A6D1EFx^9+0x52E6B64462A48Fx^8'
+              '+0xE4780C007C36Bx^7+0x1750DF9685FF33x^6+0x2514FE37C67676x^5'
+              '+0x78FBCB348114C3x^4+0x1DDB5B283D7FC2x^3+0x4C89BF14528062x^2'
+              '+0x5555F881809E78x+0x4439D3762B7D2D',
+    (13, 56): '0xBD71BAC2D3BD2Bx^12+0x49AD05EE6E2007x^11'
+              '+0xD2F88BA8ED91D4x^10+0x25ED1BEA873830x^9'
+              '+0x31FD3DA46600BCx^8+0xCF59AB0824340Bx^7+0x68C108BD5B9EF6x^6'
+              '+0x67433E832B3FE1x^5+0x2D095D0FCF7723x^4+0x402BD8933A563Bx^3'
+              '+0xB6BFF48A804FC2x^2+0x771DEBE2310272x+0x5C9B9D57CDC033',
+    (13, 57): '0x1100FBF2B313FB3x^12+0x1B1819B61AD2A8Cx^11'
+              '+0x6BFC9C74B1C751x^10+0x2A84A8337AD0DBx^9'
+              '+0x1697AD76041CF18x^8+0x3D95A3785F6B32x^7'
+              '+0x18932B330F2947Cx^6+0xB18FAAA5F6014Ex^5'
+              '+0x4C803ED5510EE8x^4+0x1D6D20BE856C7B6x^3'
+              '+0x13919C64AFC73E2x^2+0x1D58D713B4DBA3Fx+0x144BDA436FA8217',
+    (13, 58): '0x3FB2417509C6A4Fx^12+0x7C9DC6FEF80C4Dx^11'
+              '+0x38066EC5DB2E61Cx^10+0xAAE37364B5D780x^9'
+              '+0x3342923F4574411x^8+0x1A4D42CF9CE74F7x^7'
+              '+0x3B95E24A65E1318x^6+0x2454DE08E5DAA3Bx^5'
+              '+0x39C2455EFA890A4x^4+0x2CA80AF5687F0B0x^3'
+              '+0x1BF5904CA75F6CFx^2+0x2E95B1D9E51024Fx+0x20D353FFB649A00',
+    (13, 59): '0x4AF72FD334EC4F4x^12+0x657BDF04FDAD498x^11'
+              '+0x3800E0321136EBBx^10+0x520D04ABA84F909x^9'
+              '+0x395751C5F7FC78Bx^8+0x2FC645E306D29B9x^7'
+              '+0x56539E7DB61F1E7x^6+0x3EEE5BEA46160x^5'
+              '+0x5266AD55908603Cx^4+0x8F72AA4EA316FBx^3'
+              '+0x1DFC1D8941F508Cx^2+0x73E537D386FC48Ax+0x6DD49A47B6F362E',
+    (13, 60): '0x1420BBC0B3D95CFx^12+0x978141620766F4x^11'
+              '+0xFAB303C1E3FA50Ex^10+0x2C211D64E6E48DDx^9'
+              '+0x6E08B1343E6D18Ax^8+0x101291815C24181x^7'
+              '+0xDB320D7F273039x^6+0x1E0B93A8FF6BAC5x^5'
+              '+0xE3AF53CC42ECF68x^4+0x28DCD96A33AB8C0x^3'
+              '+0x1FACBFC1B64B63x^2+0x68B1639F02D408Ax+0x5C8B448021DE1FB',
+    (13, 61): '0x16F33A13AFF1A8BBx^12+0xABBC93AEF9D65C6x^11'
+              '+0x158563FE83E1967Ex^10+0xCE642FE76E7E3DAx^9'
+              '+0x120FECB1E6A98A21x^8+0xEED76943BBB4E65x^7'
+              '+0xCD8B9238746081Dx^6+0x4C1256907BDAC44x^5'
+              '+0x17FF44EF6AC506Ax^4+0x12A2A702C2ABABEBx^3'
+              '+0x855EFDC8D9413BAx^2+0x1F4BD34C7FEA398Ax+0x8CB431F30AB6E7A',
+    (13, 62): '0xB43FD25079808F5x^12+0x2FD3DA86A3CE6DBEx^11'
+              '+0x8660E783112712Ax^10+0xFDD196E47C4737Ax^9'
+              '+0x2D8DA3EEB5775B5Bx^8+0x286F1700F452ECEBx^7'
+              '+0xF97495F050193C3x^6+0x87F2BC5C6539E74x^5'
+              '+0x3658B88A518907B5x^4+0x1C64EB6C52B6CF06x^3'
+              '+0x2DFD578139775E3Bx^2+0x1E2331B16631FF7Cx'
+              '+0x30732E332BD56369',
+    (13, 63): '0x38937214B01DD34Ax^12+0x6C56A9C0F8647F0Ex^11'
+              '+0x5AF47CF0B1C590CEx^10+0x2426505C511468A4x^9'
+              '+0x3A174D470D11627Ax^8+0x2998849E49D12ECFx^7'
+              '+0x6CAA5642C0B5680Bx^6+0x184EB9C31B4A8411x^5'
+              '+0x2E45155978AA2FB1x^4+0x4B497D1895DD817Ex^3'
+              '+0x17D8CF58D91D5E66x^2+0x1F672210CE0D7AD5x'
+              '+0x120AF4F476FC7AAA',
+    (13, 64): '0x7757CD7924CBFCF0x^12+0xE8927FEB3A2ED89Ax^11'
+              '+0xAD495A53069DDB63x^10+0x7FA7FDA5CB580A56x^9'
+              '+0x56ADF39638BB6294x^8+0x251AD6E4B41EA313x^7'
+              '+0x70D4C637F0B37F80x^6+0x7C4FE5054F6DAF5Cx^5'
+              '+0xDA2593DC7A3E35C0x^4+0x855ECBC502B2F8EFx^3'
+              '+0xED84F1506F54459Fx^2+0x9B8CAE03E7AAAAE2x'
+              '+0x1D81262C224E8C9F',
+    (14, 2): 'x^13+0x3x^12+0x3x^11+0x3x^10+0x2x^9+x^8+0x3x^7+0x2x^6+0x2x^5'
+             '+0x3x^4+0x2x^3+0x2x^2+0x2x+1',
+    (14, 3): '0x6x^13+0x2x^12+0x2x^11+0x7x^10+0x5x^9+0x4x^8+x^7+0x2x^6'
+             '+0x4x^5+x^4+0x3x^3+x^2+x+0x4',
+    (14, 4): '0x7x^13+0x5x^12+0xFx^11+0xEx^10+0x2x^9+0xCx^8+x^7+0xCx^6'
+             '+0x2x^5+0xFx^4+0xDx^3+0x6x^2+0xCx+0xE',
+    (14, 5): '0x10x^13+0x8x^12+0x1Ex^11+0x16x^10+0x1Cx^9+0x1Fx^8+0xDx^7'
+             '+0x1Cx^6+0x18x^5+0x1Ex^4+0x14x^3+0x1Bx^2+0xAx+0x8',
+    (14, 6): '0x2Fx^13+0x36x^12+0x3Ax^11+0x11x^10+0x4x^9+0x9x^8+0x17x^7'
+             '+x^6+0xDx^5+0x38x^4+0x1Ex^3+0x1Bx^2+0x29x+0x3C',
+    (14, 7): '0x6Ex^13+0x12x^12+0x1Bx^11+0x32x^10+0x12x^9+0x38x^8+0x1Ex^7'
+             '+0x46x^6+0x53x^5+0x12x^4+0x27x^3+0x70x^2+0x44x+0x58',
+    (14, 8): '0x94x^13+0xC3x^12+0xF2x^11+0xEDx^10+0x82x^9+0x95x^8+0x57x^7'
+             '+0x4Dx^6+0xCFx^5+0x76x^4+0x3Bx^3+0xE8x^2+0x8Ax+0xBF',
+    (14, 9): '0x43x^13+0x1F0x^12+0x15Bx^11+0x126x^10+0x128x^9+0x124x^8'
+             '+0x107x^7+0x9x^6+0xA7x^5+0x1C7x^4+0x1E2x^3+0x136x^2+0x15Cx'
+             '+0x139',
+    (14, 10): '0x275x^13+0xCDx^12+0x2x^11+0x381x^10+0x1F8x^9+0x354x^8'
+              '+0x1FBx^7+0x10Dx^6+0x237x^5+0x34Dx^4+0x346x^3+0x12Dx^2'
+              '+0x33Bx+0x7',
+    (14, 11): '0x55Ex^13+0x233x^12+0x1AAx^11+0x7EFx^10+0x4E0x^9+0x97x^8'
+              '+0xDFx^7+0xB0x^6+0xB5x^5+0x555x^4+0x4DFx^3+0x9Ax^2+0x384x'
+              '+0x74',
+    (14, 12): '0x615x^13+0xA3Dx^12+0xB9x^11+0xA90x^10+0x2EAx^9+0xE12x^8'
+              '+0x493x^7+0x68Ex^6+0x8BAx^5+0x9B9x^4+0x20Dx^3+0x1A5x^2'
+              '+0x5ACx+0x278',
+    (14, 13): '0x4C4x^13+0x14CBx^12+0x125Bx^11+0xC35x^10+0x6Cx^9+0x1D25x^8'
+              '+0x114Cx^7+0x19D1x^6+0x411x^5+0xB10x^4+0x1FAAx^3+0x11C7x^2'
+              '+0x431x+0x1B7',
+    (14, 14): '0x3A8Bx^13+0x1FEFx^12+0x2804x^11+0x3E3x^10+0x789x^9+0x719x^8'
+              '+0x2AB2x^7+0x28FAx^6+0x2D6Bx^5+0x3FCFx^4+0x1092x^3+0x144Ex^2'
+              '+0x98Fx+0x3819',
+    (14, 15): '0x7E50x^13+0x6ACFx^12+0x2AAEx^11+0x2B6Ax^10+0x789Dx^9'
+              '+0x5FCBx^8+0x626Cx^7+0x6E8Cx^6+0x41C6x^5+0x897x^4+0x59ABx^3'
+              '+0x26E1x^2+0x6CA7x+0x6B14',
+    (14, 16): '0xC0D8x^13+0x7EB1x^12+0xA6AAx^11+0xC23x^10+0x3917x^9'
+              '+0x66Fx^8+0x2E80x^7+0x42B5x^6+0xE309x^5+0x14F7x^4+0x15C3x^3'
+              '+0xA3B7x^2+0x35Ex+0x87C',
+    (14, 17): '0x19325x^13+0x139AAx^12+0xDDB7x^11+0xF1A3x^10+0x586Fx^9'
+              '+0xDF96x^8+0x16AD1x^7+0x9555x^6+0xC849x^5+0xE3BFx^4'
+              '+0xFD2Ax^3+0xCE17x^2+0x3EE0x+0x4E31',
+    (14, 18): '0x259B0x^13+0x23540x^12+0x3F2C4x^11+0x3249Dx^10+0x3D764x^9'
+              '+0xB7DAx^8+0x320CFx^7+0x28724x^6+0x55A3x^5+0x7955x^4'
+              '+0x2C1DDx^3+0x260E0x^2+0x3BF44x+0x13E05',
+    (14, 19): '0x280DCx^13+0x109CEx^12+0xB59Dx^11+0x7FF18x^10+0x4DE58x^9'
+              '+0x6875Fx^8+0x48483x^7+0x13F31x^6+0x2467Fx^5+0x26281x^4'
+              '+0x5D9B5x^3+0x29293x^2+0x37861x+0x24301',
+    (14, 20): '0x3DECBx^13+0xE3D4Ex^12+0x83952x^11+0xCF3F8x^10+0x2E015x^9'
+              '+0xAE2DDx^8+0xE37CAx^7+0xE399Bx^6+0x12416x^5+0x764F6x^4'
+              '+0x4431Fx^3+0x3DA37x^2+0xA325Ax+0x8C508',
+    (14, 21): '0x9B2D4x^13+0x9B14x^12+0x38E7Dx^11+0xBFBE2x^10+0x8435x^9'
+              '+0x506D4x^8+0x141E8Ax^7+0x73250x^6+0xC316x^5+0xE9893x^4'
+              '+0x626C3x^3+0x45648x^2+0x12060Ex+0x33C9B',
+    (14, 22): '0xEEAEAx^13+0x14F234x^12+0x2DD5E5x^11+0x3D1D73x^10'
+              '+0x2C7A5Dx^9+0x189164x^8+0x304F42x^7+0x25483Cx^6+0x1B9B87x^5'
+              '+0x28ED7x^4+0xB9EAx^3+0x5460x^2+0x24ACEFx+0x297D6A',
+    (14, 23): '0x2CD964x^13+0x51408Ax^12+0x496088x^11+0x7D13A2x^10'
+              '+0x500BF4x^9+0x5F6579x^8+0x521FAEx^7+0x4C2BB7x^6+0x42D3E5x^5'
+              '+0x4CD42Cx^4+0x450B01x^3+0x4F7567x^2+0x319F40x+0x7A1554',
+    (14, 24): '0xDD167Fx^13+0x3EAB76x^12+0xBFE8FFx^11+0x456038x^10'
+              '+0x7E26Fx^9+0x2BBB59x^8+0x368858x^7+0x26443Cx^6+0xB4F2A4x^5'
+              '+0xAD4590x^4+0xCAC864x^3+0xB1BFCBx^2+0xD0650Ex+0x198FF1',
+    (14, 25): '0x184E110x^13+0x4A1D6Ax^12+0x20C900x^11+0x472A90x^10'
+              '+0xEBDF30x^9+0x19E3450x^8+0x2DA871x^7+0x1FCBCCx^6'
+              '+0x106024Bx^5+0x110A2ACx^4+0x15FF77Ex^3+0x1EE7E28x^2'
+              '+0xE0B8A5x+0x83FFD4',
+    (14, 26): '0x2C8247Fx^13+0x3BCA0D4x^12+0x38EE4D7x^11+0x126750Dx^10'
+              '+0x1CB2E66x^9+0x1E016F7x^8+0x1A3ED6Cx^7+0xD9E445x^6'
+              '+0xF6500Bx^5+0x281B550x^4+0x2B6FCFEx^3+0xA0ACB7x^2'
+              '+0x30ACC72x+0xACCDCD',
+    (14, 27): '0x7DCF4E8x^13+0x5AC4F4Ex^12+0x6EDAA0Ax^11+0x6A4DC09x^10'
+              '+0x6EEE9B4x^9+0x451AF67x^8+0x11EC076x^7+0x2C7B661x^6'
+              '+0x1893F41x^5+0x2874CCEx^4+0x794B074x^3+0x2CF59E7x^2'
+              '+0x7B923A0x+0x4C20DFF',
+    (14, 28): '0x93BDEACx^13+0xA648311x^12+0x821D31Cx^11+0x4C5F44Fx^10'
+              '+0xF67A4E0x^9+0xA1F5E1x^8+0x30FE1F3x^7+0xE5F743Ax^6'
+              '+0x73EF800x^5+0x4811CECx^4+0x5C96F35x^3+0x2152EDFx^2'
+              '+0xAB121E4x+0xC66EDA4',
+    (14, 29): '0x55EDFB0x^13+0x19A382C1x^12+0x11C6FC2Dx^11+0xBA3EEB6x^10'
+              '+0x12E0C81Dx^9+0x2A0C552x^8+0x19614300x^7+0xF791CF4x^6'
+              '+0x19CD0C3x^5+0x1A9987EFx^4+0x14A18126x^3+0x160CEF91x^2'
+              '+0x1E583A6Ax+0x1901BF68',
+    (14, 30): '0x39AB20A8x^13+0x2B9A4DAFx^12+0xDD778Cx^11+0x39E9E280x^10'
+              '+0x1C5A4669x^9+0x1E83F5AFx^8+0x1FD8B7E7x^7+0x35F70D57x^6'
+              '+0x11EF801Fx^5+0x196D7C91x^4+0x3A0A6B61x^3+0x1F47D0F2x^2'
+              '+0x3DD06284x+0x1A43FE0E',
+    (14, 31): '0x16354236x^13+0x24721F47x^12+0x50D7F817x^11+0x14DAAEA6x^10'
+              '+0x123E6763x^9+0x14A50675x^8+0x2390B508x^7+0x44681CC3x^6'
+              '+0x535E7BF4x^5+0x533D4C35x^4+0x15DFC322x^3+0x2DCA609Dx^2'
+              '+0x98DF73Cx+0x38A4E10F',
+    (14, 32): '0x3C8F006Bx^13+0x4684A127x^12+0xEADE5C92x^11+0x9204F971x^10'
+              '+0xB6C71B94x^9+0xB2355150x^8+0xEDFF0EB4x^7+0x49A8CCFBx^6'
+              '+0x8BCCEED8x^5+0x830FC76Ax^4+0x79A79700x^3+0x256D254Dx^2'
+              '+0x2A74243Ax+0xB10571E4',
+    (14, 33): '0x1A13113E0x^13+0x859E30EBx^12+0xFBC5DFDBx^11+0x73A3CAEEx^10'
+              '+0xF4D0B2A1x^9+0x17B239B0Dx^8+0x1E3CAB884x^7+0x7290AEA9x^6'
+              '+0x1750AEBDCx^5+0x7A2A23E0x^4+0xD8AAB499x^3+0x1615A4A14x^2'
+              '+0x1F1344F3x+0x1C4DFF58A',
+    (14, 34): '0x227F621B1x^13+0x38B2F7A30x^12+0x86A96977x^11'
+              '+0x354AC2E6Ax^10+0x167EFCFD3x^9+0x23835F63Dx^8'
+              '+0x30A74F2E8x^7+0x9AB2B113x^6+0x380DD9192x^5+0x1A82B4476x^4'
+              '+0x32293BB12x^3+0x1DD482BF6x^2+0x274755821x+0x60CF95B3',
+    (14, 35): '0x59D092FF6x^13+0x1460159D0x^12+0x7B852E573x^11'
+              '+0x604973E4Ax^10+0x761BB10D7x^9+0x6558DCC88x^8'
+              '+0x62E0B895Dx^7+0x731C40E4Ax^6+0x68F70B22Ex^5+0x50EA5D6EAx^4'
+              '+0x2D5485B9Ex^3+0x68A0F904Dx^2+0x2639D5B61x+0x1327A41E2',
+    (14, 36): '0xB86CDC38x^13+0x47A2AE7BAx^12+0x7CA58CD9Ex^11'
+              '+0xDE0C46EF3x^10+0x9C61AA747x^9+0xCE8502EF3x^8'
+              '+0xA0FB8D736x^7+0xF82B76B32x^6+0x32D375243x^5+0x2DA95D0AEx^4'
+              '+0xD648AD138x^3+0xF8295ED1x^2+0x329FA8E7Ex+0x4FE89CEF2',
+    (14, 37): '0x1D50C96037x^13+0x1D4B127F71x^12+0x1D085C16EFx^11'
+              '+0x12ED2F42E7x^10+0x13FE1028C7x^9+0x9249514Bx^8'
+              '+0x197EFC086Ex^7+0x1B7DF6127Ex^6+0x1D69C3A156x^5'
+              '+0x1092203AD2x^4+0x1EC5ED2E39x^3+0x6DD1C7F03x^2'
+              '+0x11993FF1DCx+0xBFF199841',
+    (14, 38): '0x14ED00A395x^13+0xFC5DCFFABx^12+0x1711EFA2F0x^11'
+              '+0x314AF7A5A0x^10+0x2F52634126x^9+0x38FB09B40Cx^8'
+              '+0x1B5F2EFD77x^7+0x633777AF1x^6+0x230D39B865x^5'
+              '+0x3BC97FD532x^4+0x171CB62FEBx^3+0x29FA996043x^2'
+              '+0xFC39D6426x+0x330483F0DB',
+    (14, 39): '0x3F16446F55x^13+0x340021DA97x^12+0x1C2543538Ax^11'
+              '+0x556F4B054x^10+0x4A3B6D75F8x^9+0x44EFC26BF6x^8'
+              '+0x5BF9B01C05x^7+0x2113813F8Fx^6+0x7A72FE049Bx^5'
+              '+0x4258304A69x^4+0x7A7CBAA747x^3+0x2BE9F9AC67x^2'
+              '+0x49B2868BB0x+0x7C2289ADF2',
+    (14, 40): '0x93AE820959x^13+0x7E90D525A9x^12+0xDD81833D76x^11'
+              '+0xF5B030272Dx^10+0x3FFFB51C1Ex^9+0x4B3A46D129x^8'
+              '+0x4371B14E6Ex^7+0xB98D31772Ex^6+0x6B061F92FEx^5'
+              '+0xE25EC2A809x^4+0x6B2481C30Ex^3+0x3881E72554x^2'
+              '+0xD9673F700Cx+0x64B8AD577D',
+    (14, 41): '0x1778BE401C5x^13+0x75FBF74671x^12+0xEBB3B43072x^11'
+              '+0x1E7A93FB097x^10+0x1F35DCF45E3x^9+0x17B37E8608x^8'
+              '+0xCC405616C5x^7+0x159FAB595AEx^6+0x29CEE16E5Ex^5'
+              '+0x1DEAD190676x^4+0x11FE45BB413x^3+0x132D78F2451x^2'
+              '+0xCACE60A698x+0x1F6ADB34EBA',
+    (14, 42): '0xE5EFAFBC44x^13+0x2334CDDF23Bx^12+0x2F7DF5D46ADx^11'
+              '+0x33543878FBAx^10+0xCEE12B00ECx^9+0x38904E133A9x^8'
+              '+0x252504A7FFDx^7+0x1174B4806EEx^6+0x2C8359AB91Dx^5'
+              '+0x3B0B876C385x^4+0x2C992BE1829x^3+0x379A47229EBx^2'
+              '+0x244A2CF1C5Cx+0x26383EA7FC4',
+    (14, 43): '0x2C8728EBBC1x^13+0x76C53C902D9x^12+0x156A83A9D9Ex^11'
+              '+0x37041FA6219x^10+0x39B39251E34x^9+0x3427848BE94x^8'
+              '+0x7DECA4ECE40x^7+0x69412558BB4x^6+0x1FA1BFACDD9x^5'
+              '+0x48B571D7198x^4+0x24539A23766x^3+0x53A93C30D1Bx^2'
+              '+0x780974E060Ex+0xBBBDD9C6ED',
+    (14, 44): '0x9D9DB9F55BFx^13+0x6663511FE8Dx^12+0x18B8DAF6CEFx^11'
+              '+0x1C5B2C42B5Fx^10+0xE8ACD3CA15Ex^9+0x5B320F07BF7x^8'
+              '+0xCDA4AABE423x^7+0x38FA697F59Ex^6+0x936FAE1D9B6x^5'
+              '+0x1491B3C89D9x^4+0xDB7F9434CCAx^3+0xE037C9C26A4x^2'
+              '+0x83F4A10F99Ax+0xEACED735FB4',
+    (14, 45): '0x1935BD85CD97x^13+0xDB5B1AFA7FFx^12+0x1BD2DE2A5614x^11'
+              '+0x1955BC83F90Cx^10+0x1B2A33CBE052x^9+0x1F9FB9B177C8x^8'
+              '+0xC6538C8FDEAx^7+0x21CC4F649D1x^6+0x139A15A10650x^5'
+              '+0x1B9D90F722EBx^4+0xEA66762CCCEx^3+0x4B0C5C17217x^2'
+              '+0x1143956874C8x+0x92248A5ADA8',
+    (14, 46): '0x2E5909F6B54x^13+0x252181342F1Cx^12+0x221CDAFBA7D4x^11'
+              '+0x384719A96CA5x^10+0xF234D0F3B7Dx^9+0x2D09BDDA9A9Bx^8'
+              '+0x1EDB1E587103x^7+0x23D28DCDD0D8x^6+0x1B53EBF38B26x^5'
+              '+0x26AFA61CB088x^4+0x3E546B863874x^3+0x245695927BCDx^2'
+              '+0x16ED460A6F0Bx+0x1B7497B5F4D5',
+    (14, 47): '0x405D9A26F2DBx^13+0x59D21307571Ax^12+0x12BB2703C141x^11'
+              '+0x6AFB9162842Dx^10+0x6B8A37E91BB0x^9+0x6B193578E7B4x^8'
+              '+0x421FA121D1D2x^7+0x7BD2B7355E49x^6+0x2E39E4DE5EFFx^5'
+              '+0x4100F8428F12x^4+0x5D2F2A888A95x^3+0x463097F3FAE0x^2'
+              '+0x5DED1382C5D9x+0x2BCAB94379D7',
+    (14, 48): '0x6A3D697E7B62x^13+0xC1DF25D22BD1x^12+0x2D68584F7A79x^11'
+              '+0x76F159FB833Cx^10+0x80165F32AF98x^9+0xFAD2F6C78B0Bx^8'
+              '+0xEAC76483D7A4x^7+0xBB37183F61DEx^6+0xA3D11BFEB45Cx^5'
+              '+0x91BAF6672D06x^4+0x1C3EA737F469x^3+0x3CFA717C307Bx^2'
+              '+0xD078AC209941x+0x1292FC4473CB',
+    (14, 49): '0x13A5B3D87BFA1x^13+0xB41998C728A0x^12+0xC1FC0B09ADC3x^11'
+              '+0x1A6154C0F39Cx^10+0xAC4742F1ED56x^9+0xF041EFC5A0D0x^8'
+              '+0x701654B1806x^7+0x1419174B00C1x^6+0x18FCB22905161x^5'
+              '+0x879351F8456Cx^4+0x104802021348x^3+0x114C3A6D83903x^2'
+              '+0xC96654DA2587x+0x17B9AB43F8A59',
+    (14, 50): '0xB5422D9C7DE3x^13+0x1B3FFC78D663Ex^12+0x120BAEFAF6E35x^11'
+              '+0xF6AA0E860EC1x^10+0x316CDC3EECE9Dx^9+0x1DEEC75432AC4x^8'
+              '+0x2989071A417A7x^7+0x29A944CA7B7BCx^6+0x27964290989A7x^5'
+              '+0x2EB208E82D5ECx^4+0x3AB242F6618A7x^3+0x3721AC16070D7x^2'
+              '+0x17E3625EE2E87x+0x1F194B6B73BD2',
+    (14, 51): '0x61E577DDF4BEDx^13+0x28A2CE206D443x^12+0x547804A24CEA2x^11'
+              '+0x3E2AFF08DA203x^10+0x6B2AF9A63C44Cx^9+0x2F66FC33A49ABx^8'
+              '+0x102F0603E04D2x^7+0x353AE7905A593x^6+0x6D28E49CD78B7x^5'
+              '+0x610C6AEFEB9B5x^4+0x69A0DDC354295x^3+0x47EEAFE753292x^2'
+              '+0x5E7A6CA4C6C92x+0x19F3674372017',
+    (14, 52): '0x909A450DAA13Dx^13+0x55DA61738F37Ax^12+0x40F81F70BF84Ex^11'
+              '+0x585EDB4BC77D2x^10+0x4CA49329D9571x^9+0x1EB2A145FA800x^8'
+              '+0xA72F4EB5315FBx^7+0x944174B86E057x^6+0x652E8D705C6E2x^5'
+              '+0x166767D147DC3x^4+0xA9FD5A8F97CE6x^3+0x84053EE1096F5x^2'
+              '+0xE575DAEF21471x+0x6776E9BD461A4',
+    (14, 53): '0x1E27F00B8EFCx^13+0xFB874A975799Fx^12+0x1665B61ED28356x^11'
+              '+0x13ACFE993FE10Dx^10+0x14E2B7D813CEFDx^9'
+              '+0x152B8BAE06B7C8x^8+0xE43077F6AD0EEx^7+0x149782C305E955x^6'
+              '+0xAC16E99741AC1x^5+0x1DE2287AC68803x^4+0xB6D6C5CE1E58x^3'
+              '+0x1C3B6DD9637DD6x^2+0x13ECD9ADDB29AAx+0x1128205C1B461E',
+    (14, 54): '0x3145C3225DE010x^13+0x1100317EFD7B90x^12'
+              '+0x34CB8AC42BF38Ax^11+0x229BC2AD1F5BF2x^10'
+              '+0xB78AD6B103566x^9+0x2900F2DE6CE92Fx^8+0x8850CD000433Bx^7'
+              '+0x92A86210271B8x^6+0x3375B092A01DFx^5+0xADA6F35A1B940x^4'
+              '+0x25A5192C9FA8C8x^3+0x108A07F20D89Ex^2+0x15FB5F049262B8x'
+              '+0x348B1ABFE51C7D',
+    (14, 55): '0x6ABE77BD543BB0x^13+0x34031EBA09A8E9x^12'
+              '+0x25682F7867ACCEx^11+0x27BBDAD59EA06Fx^10'
+              '+0x201FB895EFDB57x^9+0x2F8B9370965B47x^8+0x7DABE7E09D2357x^7'
+              '+0x782923EB5FE315x^6+0x44C73023A2BACx^5+0x121CA2636B9754x^4'
+              '+0x6725F889F29667x^3+0x7C2F4DD0D04F6Ax^2+0x408B3D1EB33B67x'
+              '+0x30FF38374E73FC',
+    (14, 56): '0x885E36866C100Bx^13+0xC7E4034378611Bx^12'
+              '+0xA8D46389FCD8FCx^11+0x8206D8B9993B6Dx^10'
+              '+0xFD322E0C005D02x^9+0x8BE22F4EF772CFx^8+0xA941136DE6F4CFx^7'
+              '+0x726ADDB4B9E17Fx^6+0xF4818A9BB66E26x^5+0x1AA5EBC9A5D25Bx^4'
+              '+0x8525B6B74B2437x^3+0xB3FD35834EF1F6x^2+0xC15E074CBA7F8Cx'
+              '+0x55400C67F998F0',
+    (14, 57): '0x1B941192E939A3Cx^13+0x9CCBFF1D7F3F58x^12'
+              '+0x13441B0012CCFE8x^11+0x1A0A3B2617FC39Ax^10'
+              '+0x5AF107CD5129A9x^9+0x1A89A9F772758F7x^8'
+              '+0x954AF2DCDF96DBx^7+0x7538FB6630FC43x^6'
+              '+0x1454C927C37F8D5x^5+0x8975E2831592E5x^4'
+              '+0x14D51E1FF2E3FB6x^3+0x147AEDD6A6450CFx^2+0xEF7D54A844DB20x'
+              '+0x1ADEACE9E11EC28',
+    (14, 58): '0x55BD927CF1594Dx^13+0x28CCB6CA6E24E4Fx^12'
+              '+0x223DDFCAEEB12Dx^11+0x2251AD5F9A481AAx^10'
+              '+0x3E6F97FDB74BA36x^9+0x2CF34912EBD1FDDx^8'
+              '+0x3F6FA6C2868EEB9x^7+0x284125BE66B4589x^6'
+              '+0x91905E8072B740x^5+0x29E9EB0FE40142Cx^4'
+              '+0x3643AA86553AC30x^3+0x1FFE28DB51C64DAx^2+0x7829C0BFD18F72x'
+              '+0x6B944C17D257EC',
+    (14, 59): '0x1A11AC1F618A741x^13+0x26231281DE946D7x^12'
+              '+0x769E89F92EE9C07x^11+0x2D68F4B4CC62994x^10'
+              '+0x5E4159E22021240x^9+0x12F3FD2FFC6E826x^8'
+              '+0x4FD521B857371D4x^7+0x7B7BA02EFF1A7EDx^6'
+              '+0x354D3BF38D94CAx^5+0x580D44DFAF8EB6Ax^4'
+              '+0x78CA5C4F9F0F95Bx^3+0x274BC88DFB84EFx^2+0x5C27C91AF9ADF5Cx'
+              '+0x29544E5D4620CED',
+    (14, 60): '0xAB6583E07255313x^13+0xCDF8F2FDDD0FA3Dx^12'
+              '+0x2E24E07A50E20A4x^11+0x8634911F35E4A85x^10'
+              '+0xDBBFE8419E3D72Ax^9+0x3BB8B9469F516D6x^8'
+              '+0x367F12767061565x^7+0x4F111D7B96D0608x^6'
+              '+0x1F0A6D706CAE870x^5+0x355533072BCFD73x^4'
+              '+0x8731A0777A4BF2Dx^3+0xBD2CB4342797B5Fx^2'
+              '+0x9B50D8E8D993DE6x+0xEA825A7B670DC2F',
+    (14, 61): '0x8FE4C81B76B1121x^13+0xF2D37FEFF05E4A1x^12'
+              '+0x6169FC7D8EABB0Fx^11+0xC22687B15D84E1Bx^10'
+              '+0x30E6687300A3639x^9+0x15B3931F4ABEC899x^8'
+              '+0x80FD17296E8A6BFx^7+0x12CDF1D895774B11x^6'
+              '+0x1B6E3862F9E22947x^5+0x41B5B667DB0ED35x^4'
+              '+0xC1BAE4894CF33F6x^3+0x6549AF38CCCD496x^2'
+              '+0x193AB1A0DD0CA2BAx+0x539E83B3BAF311C',
+    (14, 62): '0x3C544FF610AA4FBDx^13+0x3ED64E89A0F33419x^12'
+              '+0x181116D7707F9B01x^11+0xAAD0D3D7C8FC124x^10'
+              '+0x5518B61CC1E8DA3x^9+0x3ADE96726DDFA2D8x^8'
+              '+0x4EDA335E1DF5A83x^7+0x32CE9DF887E395D3x^6'
+              '+0xA962CB8CA02C369x^5+0x1E0347B70BFA6CCBx^4'
+              '+0x1C63413228DA8AAEx^3+0x343E742999E644E7x^2'
+              '+0x2404C4EF6191A8C8x+0x25C9E619EAD9A9CC',
+    (14, 63): '0x5193F461C9DD2BF3x^13+0x581460EF1C274762x^12'
+              '+0x66C5B71971764AAAx^11+0x464AFE850A0B46B0x^10'
+              '+0x3E4956719C99615x^9+0x47753F10ED661219x^8'
+              '+0x603E5D7022E2AE1Ex^7+0x7A0CB66BFDA70052x^6'
+              '+0x173DDCACFED9CC62x^5+0x6EE223E93E222A6Ax^4'
+              '+0x2693C021F76860F0x^3+0x3CEB57EFC2055AD5x^2'
+              '+0x7A39F485D7E44F3Bx+0x7CC43A206A5EAE1F',
+    (14, 64): '0xCCF5D81E3E659A09x^13+0xFE9AD01D8270E398x^12'
+              '+0xDF8B9C9B1127DAD8x^11+0xDF4DE02E9E4487Bx^10'
+              '+0x192B882EB113AA05x^9+0xBEC2A79060B0A09Fx^8'
+              '+0x1123EF2255D63BBEx^7+0x67CCC3EA0D885EDDx^6'
+              '+0x8AF01CC0161DEC71x^5+0xCB83720256E40662x^4'
+              '+0x17E552F26644101Dx^3+0xD0F1436790BCC22Fx^2'
+              '+0xEE48F8C12E53A6C6x+0x1E4C69AC8B0A8C4B',
+    (15, 2): '0x3x^14+0x2x^13+0x2x^12+x^11+x^10+x^9+0x3x^8+x^7+0x2x^6+x^5'
+             '+0x2x^4+x^3+0x2x^2+0x2x+0x3',
+    (15, 3): '0x4x^14+0x3x^13+0x7x^12+0x3x^11+0x2x^10+0x5x^9+0x2x^8+0x3x^7'
+             '+0x5x^6+0x7x^5+0x7x^4+0x6x^3+0x6x^2+0x3x+0x7',
+    (15, 4): '0x9x^14+x^13+0x7x^12+0xCx^11+0x3x^10+0xEx^9+0x2x^8+0xBx^7'
+             '+0x8x^6+0xDx^5+0x2x^4+0x5x^3+0x2x^2+0xDx+0xB',
+    (15, 5): '0x12x^14+0x1Ax^13+0x1Dx^12+0x12x^11+0xDx^10+0x15x^9+0x13x^8'
+             '+0xEx^7+0x5x^6+0x2x^5+0x11x^4+0xDx^3+0x1Dx^2+0x17x+1',
+    (15, 6): '0x2Bx^14+0x14x^13+0x30x^12+0x33x^11+0x26x^10+0x2x^9+0x22x^8'
+             '+0x3Fx^7+0x34x^6+0x3x^5+0x11x^4+0x8x^3+0x39x^2+0x3x+0x1D',
+    (15, 7): '0x2Ex^14+0x5x^13+0x68x^12+0x68x^11+0x2Bx^10+0x44x^9+0x63x^8'
+             '+0x1Ex^7+0x50x^6+0x3x^5+0xAx^4+0x35x^3+0x59x^2+0x75x+0x5',
+    (15, 8): '0x9Ex^14+0x75x^13+0xE7x^12+0x81x^11+0x5Cx^10+0x2Bx^9+0xD0x^8'
+             '+0xF9x^7+0xC7x^6+0xDAx^5+0xA0x^4+0x3Fx^3+0xA3x^2+0x4Bx+0x9D',
+    (15, 9): '0x5Fx^14+0xE7x^13+0xF9x^12+0xACx^11+0x3Cx^10+0x11Ex^9'
+             '+0x13Bx^8+0x1B7x^7+0x198x^6+0xBCx^5+0x1ADx^4+0x85x^3'
+             '+0x12Bx^2+0x43x+0x17B',
+    (15, 10): '0x2FDx^14+0x1D6x^13+0x3C6x^12+0x161x^11+0xF6x^10+0x15Dx^9'
+              '+0x78x^8+0x21Bx^7+0x4Ax^6+0x3E8x^5+0x31Fx^4+0x1E4x^3'
+              '+0x2CDx^2+0x39Ex+0x6',
+    (15, 11): '0x3Ex^14+0x697x^13+0x15Cx^12+0x762x^11+0x4E1x^10+0x39Dx^9'
+              '+0x555x^8+0x6E0x^7+0x335x^6+0x46Fx^5+0x5E5x^4+0x5C7x^3'
+              '+0x30x^2+0x61x+0x689',
+    (15, 12): '0x14Ex^14+0x5E9x^13+0x24Dx^12+0xBFEx^11+0x829x^10+0xA64x^9'
+              '+0x97Ax^8+0x7EBx^7+0xF89x^6+0x11Fx^5+0xDAEx^4+0xD07x^3'
+              '+0x82Fx^2+0xFBBx+0x831',
+    (15, 13): '0x7CCx^14+0x548x^13+0x1AEAx^12+0x535x^11+0x14A1x^10'
+              '+0x1AD8x^9+0x1EDEx^8+0x1FFDx^7+0x3C7x^6+0x469x^5+0x795x^4'
+              '+0x8BBx^3+0x6F2x^2+0x1259x+0x1873',
+    (15, 14): '0x3E93x^14+0x2F78x^13+0x1CC4x^12+0x25B9x^11+0x30AAx^10'
+              '+0x3359x^9+0x359Ex^8+0x3A7Dx^7+0x27A1x^6+0x18FEx^5+0xEFDx^4'
+              '+0x2898x^3+0xAAx^2+0x6C4x+0x35C9',
+    (15, 15): '0x3BA8x^14+0x7F87x^13+0x77E6x^12+0x69Fx^11+0xB8Ex^10'
+              '+0x193x^9+0x33B4x^8+0x79FFx^7+0x649Dx^6+0xA8Dx^5+0x2A81x^4'
+              '+0x706x^3+0x5332x^2+0x5570x+0x7FD7',
+    (15, 16): '0xBDD3x^14+0x3D42x^13+0x8E51x^12+0xADA7x^11+0xCAEEx^10'
+              '+0x50BCx^9+0x2723x^8+0x450Ex^7+0x236Ex^6+0xA645x^5+0x2033x^4'
+              '+0x8F7Bx^3+0x3707x^2+0xCD69x+0x3E1A',
+    (15, 17): '0x150B5x^14+0xAE9Dx^13+0xF4FCx^12+0x1FD4x^11+0x1EE63x^10'
+              '+0x1B4AFx^9+0x4BD7x^8+0xFE00x^7+0x1B1ACx^6+0x3945x^5'
+              '+0x8BCDx^4+0x1A69Bx^3+0x19528x^2+0x1BB5Dx+0x1FD10',
+    (15, 18): '0x2B937x^14+0x2F8ACx^13+0x27C1Fx^12+0x34965x^11+0x3AA67x^10'
+              '+0x26B2Dx^9+0x156C8x^8+0x33399x^7+0x32FB4x^6+0x25173x^5'
+              '+0xCE23x^4+0x22C29x^3+0x136F4x^2+0xEF15x+0x1E2A',
+    (15, 19): '0x7A6B0x^14+0x3BD5Cx^13+0x73E3Ax^12+0x47669x^11+0x2D804x^10'
+              '+0x553C0x^9+0x5B506x^8+0x20EAEx^7+0x26DA4x^6+0x2C346x^5'
+              '+0x119EDx^4+0x38583x^3+0x711D4x^2+0x335A8x+0x3F16F',
+    (15, 20): '0x432EEx^14+0xAFD29x^13+0xA598Bx^12+0x983C0x^11+0x47E0Bx^10'
+              '+0xFC89Fx^9+0x62224x^8+0xF2569x^7+0xDA30Ex^6+0x479Fx^5'
+              '+0xE05B1x^4+0x65466x^3+0xD293x^2+0x32270x+0xAB0AD',
+    (15, 21): '0xC5DC5x^14+0x102DADx^13+0x903BBx^12+0x1817F3x^11'
+              '+0xADC04x^10+0x9ACC6x^9+0xCAB06x^8+0x47C9Ex^7+0x1F69DCx^6'
+              '+0x15CEF6x^5+0xDC750x^4+0x3C532x^3+0x17A8F3x^2+0x110C64x'
+              '+0x1D7D23',
+    (15, 22): '0x2279ACx^14+0x1C4366x^13+0x164DE1x^12+0x2B515Dx^11'
+              '+0x39D410x^10+0x119B34x^9+0x1F14B1x^8+0x10BC6Cx^7'
+              '+0x204B06x^6+0x3DE4B6x^5+0x3DB124x^4+0x356D85x^3+0x66777x^2'
+              '+0x18A967x+0x33BAD3',
+    (15, 23): '0x27B29Cx^14+0x288C2Ax^13+0x2E47A1x^12+0x722061x^11'
+              '+0x39894Dx^10+0x236E60x^9+0x62F8CDx^8+0x6C77E3x^7'
+              '+0x26B9DEx^6+0x20837Dx^5+0x6395C9x^4+0x2B6F1Dx^3+0x39656Bx^2'
+              '+0x39ED30x+0x3BAF98',
+    (15, 24): '0x51F595x^14+0xAD095Ax^13+0x54CF2Fx^12+0xBCCFC8x^11'
+              '+0x782E6Dx^10+0x9C1A78x^9+0x3DC061x^8+0xB3CDB2x^7'
+              '+0x65AE7Ax^6+0xC19D9Cx^5+0x13BD9Bx^4+0x16B680x^3+0x29A112x^2'
+              '+0xBBACC2x+0x2EC3C3',
+    (15, 25): '0x1363218x^14+0xBF491Cx^13+0x113E2CBx^12+0x571F81x^11'
+              '+0xF6EA82x^10+0x1C80117x^9+0x1C7E32Dx^8+0x1E38693x^7'
+              '+0x7D2D08x^6+0x461A35x^5+0xC6E9E8x^4+0xA41E7Ax^3+0xA2D7Dx^2'
+              '+0x4F7F31x+0x1608124',
+    (15, 26): '0x352912Bx^14+0x3CD95C1x^13+0x2C3BA8Bx^12+0x37A551Bx^11'
+              '+0x1561780x^10+0x1E04C99x^9+0x2E1A4FAx^8+0x380D7ABx^7'
+              '+0x2B1E47Dx^6+0xE80D77x^5+0xCD46A3x^4+0x3FA8B72x^3'
+              '+0x2BC9769x^2+0x38F47D9x+0x1D41F49',
+    (15, 27): '0x13A6B76x^14+0x8B858Ex^13+0x47C251Dx^12+0x34533FFx^11'
+              '+0x55F9405x^10+0xFF23ECx^9+0x2CE5065x^8+0x52C3690x^7'
+              '+0x7D1A29Fx^6+0x5774CE1x^5+0x3073777x^4+0x1725EE9x^3'
+              '+0xCC7325x^2+0x1EF443Ex+0x2D156A7',
+    (15, 28): '0x1A82704x^14+0x6C257DEx^13+0xD16C7B5x^12+0x857E20Cx^11'
+              '+0x32D93A7x^10+0x3B2544x^9+0x153CDE2x^8+0xB9DA5A8x^7'
+              '+0x8061CE2x^6+0xD8A9186x^5+0x7E720F4x^4+0xEAA007Ex^3'
+              '+0x39C2Fx^2+0x1452154x+0x980CCB3',
+    (15, 29): '0x15153F81x^14+0x1AD16C7Fx^13+0x18EC0DACx^12+0x46E3A2Fx^11'
+              '+0x2845348x^10+0x14CCA6BCx^9+0x8087355x^8+0x12AF56E2x^7'
+              '+0x67F754x^6+0x1E0D0E0Bx^5+0x15F37776x^4+0xC52DA38x^3'
+              '+0x1D323697x^2+0x13104BB6x+0xD91CB38',
+    (15, 30): '0x3BCE01DFx^14+0x37A1529x^13+0x14C39BD2x^12+0xD0D58FDx^11'
+              '+0x341BC596x^10+0x30422814x^9+0x3EEA993Cx^8+0x260AB519x^7'
+              '+0xC7F0698x^6+0x389DE6A8x^5+0x1387F0D7x^4+0x7A83A54x^3'
+              '+0x1471A18x^2+0x17811B7Ex+0x102B62A4',
+    (15, 31): '0x2C44513Dx^14+0x37035E9Cx^13+0x7E70082Dx^12+0x31079B82x^11'
+              '+0x3C1C5493x^10+0x30D79E2Ax^9+0x281F10A0x^8+0x45B53034x^7'
+              '+0x37729F5Cx^6+0x32D90D6Dx^5+0x10FB95Bx^4+0x6649D0AEx^3'
+              '+0x2A4C69D7x^2+0x2672D953x+0x7BA76537',
+    (15, 32): '0xF7592CC4x^14+0x11F9116Fx^13+0x258FDEA4x^12+0x7CF4843x^11'
+              '+0xB30060B1x^10+0x40E03B87x^9+0x67E78C08x^8+0x2337005Fx^7'
+              '+0x24CAE932x^6+0x4E62F88Fx^5+0xAE524F57x^4+0xC5180E8Bx^3'
+              '+0x6D5AB65Fx^2+0xED453DB1x+0x83AD61FB',
+    (15, 33): '0x100788E55x^14+0x1EC2A971Fx^13+0x1F521798Cx^12'
+              '+0x1A6803516x^11+0x1F025CC62x^10+0xC5D48DDx^9+0x17A7A88FFx^8'
+              '+0x31EDABACx^7+0x4D72DD86x^6+0x9976F39Dx^5+0x9A886DA3x^4'
+              '+0x1A3021F9Cx^3+0x14DA1CF18x^2+0xA155A823x+0x1B309F7F0',
+    (15, 34): '0xF05CD886x^14+0x3AD62D63x^13+0x15CA72B85x^12'
+              '+0x33EFF1ECAx^11+0x36334890Ex^10+0x191BAAA03x^9'
+              '+0x3F7174957x^8+0x8BADEB64x^7+0x2522055E8x^6+0x35D3BF213x^5'
+              '+0x36E358E80x^4+0x10F1BA97Fx^3+0x37EC0E1B5x^2+0x25139D014x'
+              '+0x5F4A69C5',
+    (15, 35): '0xFC5A4606x^14+0x55452CBA6x^13+0x5B54747B0x^12'
+              '+0x3DCB37760x^11+0x9AF73ED2x^10+0x5DEF77CB7x^9'
+              '+0x3331E90F3x^8+0x77AB7200Dx^7+0x8A42E44Cx^6+0x5818125C4x^5'
+              '+0x87EE5795x^4+0xA8FA3193x^3+0xFFDB641x^2+0x4D56FAE3Cx'
+              '+0x5504F4A6D',
+    (15, 36): '0x53E2CB8CDx^14+0x184EF838Ex^13+0xF24AF6F67x^12'
+              '+0xBA2FDABCDx^11+0x8B2827C85x^10+0xEA4F6480x^9+0x8F3F505Ax^8'
+              '+0x7A0FF953Cx^7+0xD129AB7C0x^6+0x19B0BDA7Bx^5+0xD72919DDFx^4'
+              '+0x126C70252x^3+0xF5B2160B2x^2+0x2D5A0482x+0x283B2FB90',
+    (15, 37): '0x13B3535E75x^14+0x18F59C13FFx^13+0xAE550DECFx^12'
+              '+0x760005809x^11+0x3B92D26Fx^10+0x3926C793Fx^9'
+              '+0xCC17E2D70x^8+0x605B51C53x^7+0x16A1B7762Bx^6'
+              '+0xC210B643Bx^5+0x95380FB2Ax^4+0x8C51F360Fx^3+0xB22221CF2x^2'
+              '+0x15B56F158Cx+0x18E5A7BCC2',
+    (15, 38): '0x2250E52E37x^14+0x12A65310DCx^13+0x21BA79018Fx^12'
+              '+0xE18B74C0Ax^11+0x107BD5FA42x^10+0x5F52217FAx^9'
+              '+0x3D03EEE2E1x^8+0x369B2D9DF3x^7+0x36E4316BDBx^6'
+              '+0x3C20C6B5F3x^5+0x142452F711x^4+0x2E20D66D48x^3'
+              '+0x12253E97FAx^2+0x22643C4B4Dx+0x1F9C891936',
+    (15, 39): '0x2F836609FEx^14+0x6478E2DABFx^13+0x6A5025DCF3x^12'
+              '+0x63EDF0772Dx^11+0x5DF9AA7A20x^10+0x18B23DAAC7x^9'
+              '+0x63F6FAC9E0x^8+0x4977FAF914x^7+0x2C1E68120Ex^6'
+              '+0x326A57A2BCx^5+0xD7336B80Ex^4+0x2FB3E6088Ax^3'
+              '+0x333F126889x^2+0x55263D5C76x+0x113994BA1E',
+    (15, 40): '0x27FEB7BFAEx^14+0x1437D0510Cx^13+0x10B8B492AAx^12'
+              '+0x9B014DEB14x^11+0x88D59332DCx^10+0x1E7F0AAE85x^9'
+              '+0xCBD427A4C6x^8+0x6EF01A94EFx^7+0x73F42B4A6Fx^6'
+              '+0x925565D69Ax^5+0x936AE98E7Fx^4+0xDA1F469C75x^3'
+              '+0xDC00B03087x^2+0xF5DAF19FD4x+0xB0514A90ED',
+    (15, 41): '0x1D983355D39x^14+0x651EBAD3CBx^13+0xDBA26F6FFFx^12'
+              '+0x2A2D6AD846x^11+0x19BC642DF96x^10+0xD26D467CFBx^9'
+              '+0x1A763D3D6D7x^8+0xC12C05D75Cx^7+0x887343A9ACx^6'
+              '+0x64FB9D78A0x^5+0x58918EE779x^4+0x132827DADD0x^3'
+              '+0x1CF40E859CBx^2+0x1FEA107740Ex+0x1591EFA663A',
+    (15, 42): '0x3E041CE974x^14+0x1D917762968x^13+0x27E35EA1150x^12'
+              '+0x3395D22FAADx^11+0x3B85A5C6163x^10+0x18CD69850D7x^9'
+              '+0x2AF2D45D276x^8+0x2CDD5F9177Dx^7+0xABCB52F3D2x^6'
+              '+0x21D89B491FDx^5+0x24C69B56861x^4+0x294AEB5DFD0x^3'
+              '+0x24FFE8A14C9x^2+0x3BDA2D52597x+0x2733F1AEEA7',
+    (15, 43): '0x64E3EF828EBx^14+0x6BB7BE7098Bx^13+0x3FA4331BD45x^12'
+              '+0x326495AC790x^11+0x3B518630844x^10+0x7D43343FA87x^9'
+              '+0x7C0B36D3DEAx^8+0xC727D57898x^7+0x1ED7DF78BE3x^6'
+              '+0x703A3BCF966x^5+0x6729839F90Fx^4+0xD8A20CA19Ex^3'
+              '+0x2FD0E5C0B1Cx^2+0x6F8D8B7B3EEx+0x29324B58F25',
+    (15, 44): '0xFA829CC9D9Fx^14+0x11D3C3C7096x^13+0x37C6B25E013x^12'
+              '+0x88B92D47177x^11+0x6698CA4874Ax^10+0x3BA93D2380Cx^9'
+              '+0x55BD503F3CDx^8+0xFF26486E8DDx^7+0x4FFF01CEDD2x^6'
+              '+0xD22DB7FC0DBx^5+0xA71DC57809Ex^4+0xCFB9D5325E7x^3'
+              '+0x5DACC8128A9x^2+0xD939AD281B4x+0x5D599B0208D',
+    (15, 45): '0x19C6E6CAA021x^14+0x1B3E60414789x^13+0x7225BABC069x^12'
+              '+0x197C6215F616x^11+0x10AA1CFE762Bx^10+0x1F0F390BB3E9x^9'
+              '+0x1941704D9A6Bx^8+0x11AA46B9632Dx^7+0x1D9EE10252A1x^6'
+              '+0x1CFEE2595D83x^5+0xE8F73616005x^4+0xA1FC157CFA2x^3'
+              '+0x4657D4BA06Dx^2+0x2FE7599E0B4x+0x262330AD4B',
+    (15, 46): '0x3D640FA7D8DEx^14+0x107637F759EEx^13+0x19D418505C8Bx^12'
+              '+0x95B21651CA5x^11+0x2CEBA1FE2143x^10+0x724C94C1613x^9'
+              '+0x3A1D866EA5ABx^8+0x2C3A14E3CB01x^7+0x2E3DCF44F83Dx^6'
+              '+0x2C5DBAA6616Fx^5+0x2301FE338752x^4+0xAE9480F7BAAx^3'
+              '+0x424E43BE1D5x^2+0x2913898704Bx+0x2C586D83F6C5',
+    (15, 47): '0x15DB2890127Bx^14+0x197FE0429CCDx^13+0x312C456C1CDBx^12'
+              '+0xCFBFC77471Cx^11+0x5C23DFD9B992x^10+0x4754FE4C49EFx^9'
+              '+0x57BC62CF5739x^8+0x46A0C0B12E7Dx^7+0x2ED74D5982D9x^6'
+              '+0x32D20CFF96C6x^5+0x6334064C6FEAx^4+0x12D0E95C0A3Ax^3'
+              '+0x54C20074388Ax^2+0x5E517F41FD9Ax+0x50AAF01E0A5A',
+    (15, 48): '0x3031E323E9AFx^14+0xD2459A93E70Fx^13+0xFCA705B34A22x^12'
+              '+0xEB7729573F04x^11+0xDE1FA74EC620x^10+0x55607F0D290Ex^9'
+              '+0xAC8ABEDF8AE3x^8+0xDBA122F41FDx^7+0x97138AF48F9Bx^6'
+              '+0x9A11E7F6BA5Ex^5+0xC6EF5FF61E8Dx^4+0xA87146543E1Dx^3'
+              '+0x8F949CCB6207x^2+0xEB045F29A23Ax+0xE134D58F4552',
+    (15, 49): '0x1BFA269AB68DFx^14+0xCEE8E31716B3x^13+0xCC96C673091Fx^12'
+              '+0x39643E823F54x^11+0x1B2383D51962Ex^10+0xA779D2105305x^9'
+              '+0xB7EA0766F672x^8+0x5197258CEE2Dx^7+0x1A34F41EC027Ex^6'
+              '+0x1C8AD53CEF0Bx^5+0x1A08C5A1DC4DCx^4+0x15C3CD80F6A98x^3'
+              '+0x3DDCEA936392x^2+0x156BA894130x+0x120EE9D810A38',
+    (15, 50): '0x2F03CF5BD8DAAx^14+0x399D9585B8F42x^13+0x36123D0474400x^12'
+              '+0x288846E00E5B0x^11+0x27FFAFF159823x^10+0x3D28015B58F04x^9'
+              '+0x2455C8A14DDD2x^8+0x2F30E27F249CCx^7+0x123BEEA7F5751x^6'
+              '+0x33630918E5F93x^5+0x3D5A3C8D23A9x^4+0x82978CCBEC63x^3'
+              '+0x2731186D2F68Bx^2+0x14FDDD622CBAEx+0x19526CA5363E6',
+    (15, 51): '0x6DE5984731975x^14+0x57FF3CAFEBAAFx^13+0x6415BFD976B62x^12'
+              '+0x2FBF45661462x^11+0x42C09C4936BC4x^10+0x4F689494BC28x^9'
+              '+0x3553471640859x^8+0x7CF09F57953B4x^7+0x7360D2E1E32Dx^6'
+              '+0x7482BF7B73393x^5+0x120ED2DC6A8E7x^4+0x56571CD672D4x^3'
+              '+0x2CEDD5C00525Bx^2+0x4624A322D2107x+0x25950F166BABB',
+    (15, 52): '0xBF0744A1188C4x^14+0x12232BD7EBBEBx^13+0x9E81F8A54ED4Fx^12'
+              '+0xFB3F3C3E945DFx^11+0x7FD371B66F816x^10+0xFAC9398D19F9Dx^9'
+              '+0xCDAD9FE5443E8x^8+0xE12DC5E4EB90Ax^7+0x6CDADD5FB34BFx^6'
+              '+0x38892D548A70x^5+0x8FCA7EDE9581x^4+0xDA1CB8231AA8Dx^3'
+              '+0xF6A42A4037743x^2+0x20875A621F52Dx+0xB690966DA087C',
+    (15, 53): '0xC3805E903D734x^14+0xC77144BE14C6Bx^13+0x1FE1956BA6C303x^12'
+              '+0xDFDA4B5AB950Dx^11+0x1AD1C910D6EF4Fx^10'
+              '+0x1B21A82E6A961Bx^9+0x105AD4371C7370x^8+0x1487BBE27DA8D0x^7'
+              '+0x22D353E25EF2x^6+0x11823DDC28997Ax^5+0x1045A12310D9FFx^4'
+              '+0x82CFC95E91940x^3+0x2A4439D5B7552x^2+0x12C5F78DA42BF3x'
+              '+0x9EC1908D7F5D8',
+    (15, 54): '0x321EA4F2947EE3x^14+0x16ACC8CB59E60Dx^13'
+              '+0xA1815CC4C4189x^12+0x348A1BEB887CACx^11'
+              '+0x11F31A872EC271x^10+0x3EC3B4F0296DA9x^9+0xA04843EF9BAB9x^8'
+              '+0x37C04650C64414x^7+0x368A3784FF6DBDx^6+0xE99B91A1DD264x^5'
+              '+0x25892B96D2549Fx^4+0x1597B18E366172x^3+0x22AD6FA18E3F7Bx^2'
+              '+0x113E9ACC24BD18x+0x36F18C63D5EFF2',
+    (15, 55): '0x41322B6FAAB69Fx^14+0x2FCAB4A8F6823Ex^13'
+              '+0x77AE878FCCA186x^12+0x596E65D6EE5929x^11'
+              '+0x39F28F89F26C92x^10+0x24DD7E70BF69ACx^9'
+              '+0x73A37111540E8Ax^8+0x1D3C2D482A41E8x^7+0x540F124457DC9Bx^6'
+              '+0x1AD54B10C43133x^5+0x79E9B38A56DFA1x^4+0x22DCD2FEAD9863x^3'
+              '+0x6FC6EAFD2CAD44x^2+0x61C5008ECE4525x+0x5191653A94DF07',
+    (15, 56): '0x5D64ECFA335E25x^14+0x2E5F249ADE301Bx^13'
+              '+0x4A9450396A9468x^12+0xCC56F3479800D8x^11'
+              '+0xCDDE93978DBCFDx^10+0x1B657F8BFFF75Dx^9'
+              '+0x9FECAA44999586x^8+0x2495FFB9BC459x^7+0x668FE57E231EFEx^6'
+              '+0xB9E8C589E6CF4Ax^5+0x5F0D9A3166CAC4x^4+0x1B3E5F0B52C596x^3'
+              '+0x4211A873219E28x^2+0xFCAFB121E52428x+0xD1CD6276D956E9',
+    (15, 57): '0xE6718281D651BBx^14+0xC3FA5300319677x^13'
+              '+0x93F6F48C6954F9x^12+0xFD8E963057F1B2x^11'
+              '+0x18446F86960C329x^10+0x8A6E8D41CABEEx^9'
+              '+0x120A78470457E67x^8+0x14E231A4BCEFF3Ax^7'
+              '+0x7F9541A0FDB897x^6+0x903117CF7224F5x^5'
+              '+0x1FEFC70A53130BEx^4+0x96D05CE984B52x^3+0xA1FD5D36AE04C4x^2'
+              '+0x40F57FDE54E19Bx+0x879B6CACD700EF',
+    (15, 58): '0x12E2C48CB92AF4Dx^14+0x1F930F8DE2ADE26x^13'
+              '+0x1EEBEAFD26BCAE6x^12+0x2B7E765F517AB9Ex^11'
+              '+0x90240533EEDAA6x^10+0x1A425F89755900Dx^9'
+              '+0x3032B5E44D01040x^8+0x1B077087A3443C9x^7'
+              '+0x1D076AF145E83CCx^6+0x2A5CEEF47940AA5x^5'
+              '+0x1DEA2FF80BF2CD7x^4+0x3EF23EA0D88A445x^3'
+              '+0x1BE5AB735384765x^2+0x1AC43502CFD86CCx+0x212D772B038AB1E',
+    (15, 59): '0x7B9E92B3682314x^14+0x135482CCA54D690x^13'
+              '+0x2D14C1E1CA8C02Ax^12+0x510CD67A6C21CC1x^11'
+              '+0x38116D7BE798DFAx^10+0x3A16D6BEEBB09A1x^9'
+              '+0x64C73610728DA1x^8+0x535F6628B23207x^7'
+              '+0x618B105A22299C8x^6+0x3E1654199AAC22x^5'
+              '+0x573EA164C5A8BAx^4+0x4F38D3857258564x^3'
+              '+0x224677F38D94A4x^2+0x2C243A3B5333A66x+0x6FF607848E4226',
+    (15, 60): '0x5468CABF954DC35x^14+0x6E3CBB89BD9D75Ex^13'
+              '+0xB26B3DEFA4307F8x^12+0xEC5E7BC592B8324x^11'
+              '+0x327EA91ECD72B3Ex^10+0x69B0A4A3D87F606x^9'
+              '+0x8D1FDE885D62B87x^8+0x1A929D00803B753x^7'
+              '+0x667373A4433700x^6+0x8425B1899A1C43Ex^5'
+              '+0xB0D89FBE4EC8EC1x^4+0xADF740C71BC55FFx^3'
+              '+0x42DE5947E4A88C5x^2+0x38932147E2DC503x+0xBB12DC1CCDA38B5',
+    (15, 61): '0x1BEC819639616FD3x^14+0x7A39CC247761DC2x^13'
+              '+0x1BC94E81478224BBx^12+0xCEF9011E77CB9ACx^11'
+              '+0x175A4A42C8CA8FD5x^10+0x1C39DF3ADC5E2189x^9'
+              '+0xEB81890D5CD9536x^8+0x19A8F6453A60D16Fx^7'
+              '+0x1F74FF15DEC0746Dx^6+0xF6DCA73FA02AFDFx^5'
+              '+0x26F2ACE42E92D06x^4+0x18C7F1DE657BEE2x^3'
+              '+0x8CF20487CC043FFx^2+0x193E3D33F97063F9x+0x1E7258BBC713593C',
+    (15, 62): '0x3369A86547303FDFx^14+0x134A727F05E5D907x^13'
+              '+0x15EA0E57401E5E26x^12+0x2D92B56FFA0CC795x^11'
+              '+0x27E6B7D3700679AEx^10+0x16DE43A23E3ED1A8x^9'
+              '+0x3B422F01B1C9B036x^8+0x2AB68F04DCAD74D6x^7'
+              '+0x2F7997C5E36D14DAx^6+0x1A26D8495F6AFEF3x^5'
+              '+0x3E477762CAB1F236x^4+0x334B6FAAA3C974BAx^3'
+              '+0x2F60BC06FD909C5Cx^2+0x2C4F916B519A3048x'
+              '+0x3C76F555F9313102',
+    (15, 63): '0x664FE9469B69F2B4x^14+0x449236C3E84758B3x^13'
+              '+0x2E825477F1D37DCEx^12+0x1232E1B07E769F9x^11'
+              '+0x7F588AEB49E06DBCx^10+0x7FC5FB4603364B35x^9'
+              '+0x635082352C8DD81x^8+0x39312BCC7916681Ax^7'
+              '+0xF66E689FBAF8F3Fx^6+0x19EB7CDED550600Ax^5'
+              '+0x5664832ACB6B7847x^4+0x4394F1705E4A9E09x^3'
+              '+0x5B253FF796415FBAx^2+0x636CC1A00B99643Ax'
+              '+0x6DA1436E34DB7E55',
+    (15, 64): '0xAA7E528F96B8850x^14+0xEF82FDA16A2669E8x^13'
+              '+0x34082ACF4622BFD8x^12+0xA8DF66449AA5EEE9x^11'
+              '+0xE0B9E7D3DEC6185Bx^10+0xA9DE5F7AB3C801A7x^9'
+              '+0x7AC746C81F11E8E6x^8+0x100424C09D0169E4x^7'
+              '+0x25967D444FC7ED35x^6+0x821FA294C50A18E6x^5'
+              '+0x149BEAA918B70133x^4+0xC76411E7AAA9311Ex^3'
+              '+0xF12439D081E8131Fx^2+0xCCDEF020C8406153x'
+              '+0x686D19031BCD23EE',
+    (16, 2): '0x3x^15+0x2x^14+0x3x^13+0x3x^12+0x3x^11+0x2x^10+x^9+0x2x^8'
+             '+0x3x^7+0x3x^6+0x2x^5+x^4+0x2x^3+x^2+x+0x3',
+    (16, 3): 'x^15+0x7x^14+0x5x^13+0x7x^12+0x6x^11+0x6x^10+x^9+0x5x^8'
+             '+0x5x^7+0x7x^6+0x5x^5+0x2x^4+0x3x^3+0x5x^2+0x4x+0x3',
+    (16, 4): '0xDx^15+0x7x^14+x^13+0xEx^12+0x6x^11+0x3x^10+0xBx^9+0xDx^8'
+             '+0x4x^7+0x7x^6+0x5x^5+0xFx^4+0xEx^3+0x6x^2+0xCx+0x6',
+    (16, 5): '0x19x^15+0x1Dx^14+0x14x^13+0x5x^12+0x6x^11+0x11x^10+0xBx^9'
+             '+0x3x^8+0x11x^7+0x5x^6+0x13x^5+0x7x^4+0xDx^3+0xFx^2+0x10x'
+             '+0x1C',
+    (16, 6): '0x16x^15+0xBx^14+0x2Bx^13+0xCx^12+0x35x^11+0x35x^10+0xCx^9'
+             '+0x28x^8+0x39x^7+0x1Fx^6+0xFx^5+0x10x^4+0x19x^3+0x22x^2'
+             '+0x2Cx+0xF',
+    (16, 7): '0x37x^15+0x4Cx^14+0x34x^13+0x10x^12+0x6Cx^11+0x4Dx^10'
+             '+0x1Dx^9+0x49x^8+0x46x^7+0x6Bx^6+0x67x^5+0xCx^4+0x38x^3'
+             '+0x2Ex^2+0x72x+0x3C',
+    (16, 8): '0x8Fx^15+0x8Cx^14+0x39x^13+0x69x^12+0xC1x^11+0x1Bx^10'
+             '+0x17x^9+0x83x^8+0x5Fx^7+0xD4x^6+0x9Cx^5+0x5x^4+0x15x^3'
+             '+0x17x^2+0xFx+0xDC',
+    (16, 9): '0x1D7x^15+0x14Bx^14+0x53x^13+0x13Dx^12+0x1E3x^11+0x83x^10'
+             '+0x139x^9+0x142x^8+0x16x^7+0x1D0x^6+0x1Ax^5+0xCx^4+0x1C7x^3'
+             '+0x13x^2+0xA8x+0xE9',
+    (16, 10): '0x24Bx^15+0x1D4x^14+0x281x^13+0x3A9x^12+0x70x^11+0x24Ax^10'
+              '+0x83x^9+0x1D3x^8+0x3C7x^7+0x19Bx^6+0x2BAx^5+0x377x^4'
+              '+0x172x^3+0x38Dx^2+0xE6x+0x1B1',
+    (16, 11): '0x56Ex^15+0x4EDx^14+0x403x^13+0x5FCx^12+0xE9x^11+0x39Ax^10'
+              '+0x718x^9+0x7Ex^8+0x42Dx^7+0x783x^6+0x1C8x^5+0x33Dx^4'
+              '+0x9Bx^3+0x2F4x^2+0x136x+0x495',
+    (16, 12): '0x3DFx^15+0xD4Bx^14+0x232x^13+0xF70x^12+0xA33x^11+0xC8Fx^10'
+              '+0xF49x^9+0x23Dx^8+0x27Bx^7+0x2F8x^6+0xF8Ax^5+0xAA9x^4'
+              '+0x61Bx^3+0xD81x^2+0xD7Cx+0x680',
+    (16, 13): '0x1782x^15+0x199Fx^14+0xBF7x^13+0x1925x^12+0x1B0Cx^11'
+              '+0x49Bx^10+0x1232x^9+0x1A14x^8+0xE3Fx^7+0x875x^6+0x1BCAx^5'
+              '+0x4DCx^4+0x1E45x^3+0x168Fx^2+0x1945x+0x172A',
+    (16, 14): '0x6CAx^15+0x3272x^14+0x19Ex^13+0x15D2x^12+0x78Cx^11'
+              '+0x246Ax^10+0x2731x^9+0x38CDx^8+0x678x^7+0x379Dx^6+0x1CA1x^5'
+              '+0x3F9Dx^4+0x1377x^3+0x1283x^2+0xE7Ex+0x3712',
+    (16, 15): '0x68CCx^15+0x27B5x^14+0x73CFx^13+0x7F18x^12+0x5DA4x^11'
+              '+0x1C9Dx^10+0x1C8Ax^9+0x1AD8x^8+0x891x^7+0x2492x^6+0x4E2Bx^5'
+              '+0x6722x^4+0x5FD0x^3+0x76CCx^2+0x3ED7x+0x311B',
+    (16, 16): '0xFB9Cx^15+0xF964x^14+0x87F9x^13+0x5DD6x^12+0xFDB4x^11'
+              '+0xB51Dx^10+0x3F12x^9+0xAE69x^8+0x1345x^7+0xE6E9x^6'
+              '+0x160Ax^5+0x1087x^4+0x822Dx^3+0x67FCx^2+0xFA99x+0xC77A',
+    (16, 17): '0x2B14x^15+0x1FFC1x^14+0x5D6Fx^13+0xD941x^12+0xBA3x^11'
+              '+0x8515x^10+0x10A88x^9+0x1826Dx^8+0x13E55x^7+0x10FE8x^6'
+              '+0xED56x^5+0x1A719x^4+0x1E823x^3+0x2F35x^2+0x718Bx+0xB3D7',
+    (16, 18): '0x1BD51x^15+0x195D9x^14+0x1651x^13+0x3B679x^12+0x7FB2x^11'
+              '+0x201C8x^10+0x30345x^9+0xA2C3x^8+0x2F1FCx^7+0x88C0x^6'
+              '+0x197CCx^5+0xCAB1x^4+0x2D970x^3+0x3911Ex^2+0x26C88x+0x39D1A',
+    (16, 19): '0x28030x^15+0x48EC9x^14+0x7B115x^13+0x3272Ax^12+0x4DE28x^11'
+              '+0x3FC0Dx^10+0x13DD8x^9+0x65850x^8+0x67137x^7+0x67709x^6'
+              '+0x1F47Cx^5+0x19A3Ex^4+0x5C849x^3+0x6EFC4x^2+0x7A8EBx'
+              '+0x5CB9C',
+    (16, 20): '0xE13DDx^15+0x3A8D1x^14+0xF6709x^13+0x723FDx^12+0x8EA80x^11'
+              '+0xFC651x^10+0x57F1Ex^9+0x3018Dx^8+0x9CEF7x^7+0x74DAFx^6'
+              '+0xC85AFx^5+0xDC83Fx^4+0xCD493x^3+0x1079x^2+0x104A8x+0x59FFC',
+    (16, 21): '0x863A7x^15+0x133364x^14+0x2A76Bx^13+0x19DAA9x^12'
+              '+0x1FFB6Ax^11+0x9C013x^10+0x3B040x^9+0xF0078x^8+0x1C41E8x^7'
+              '+0x6F0EDx^6+0x7BE04x^5+0xAE43x^4+0x1446CFx^3+0x2EA05x^2'
+              '+0x15FCFEx+0x1E81DC',
+    (16, 22): '0x21B5D3x^15+0xC9CE9x^14+0x174E8Cx^13+0x36B39Fx^12'
+              '+0x3A7ACFx^11+0x71431x^10+0x2E2F4Dx^9+0x4D803x^8+0x664C3x^7'
+              '+0x3F3C18x^6+0x3BED7Ax^5+0x2DC122x^4+0x3BC60x^3+0x114E01x^2'
+              '+0xB86C2x+0x15C520',
+    (16, 23): '0x105E46x^15+0x3C30B4x^14+0x26D431x^13+0x4EE25x^12'
+              '+0x4C8CFBx^11+0x31A541x^10+0x13D371x^9+0x5B2EACx^8'
+              '+0x2341DCx^7+0x46C8F7x^6+0x176198x^5+0x1F0537x^4+0x6232Fx^3'
+              '+0x2FB012x^2+0x3F164Cx+0x2385DF',
+    (16, 24): '0xF89B92x^15+0xF22437x^14+0xEFB48Cx^13+0x57C219x^12'
+              '+0x6ED5D1x^11+0x967C1Dx^10+0xE811Ax^9+0x29C7BDx^8'
+              '+0x1E1833x^7+0x3B3D91x^6+0xCFC1F3x^5+0x5A0F34x^4+0x26AB9Bx^3'
+              '+0x801FB1x^2+0xB046CCx+0xED5087',
+    (16, 25): '0x81E43Bx^15+0xC719FCx^14+0x1225258x^13+0x1F23449x^12'
+              '+0xEDADF4x^11+0x16D2F0Fx^10+0x19F41F8x^9+0x9B5B6Cx^8'
+              '+0x139C708x^7+0x1B94D94x^6+0x1C1805Ax^5+0x193CEABx^4'
+              '+0x12A826Cx^3+0xB6771Dx^2+0x106F8DDx+0x1BDE433',
+    (16, 26): '0x10EC3A4x^15+0x10CDA45x^14+0x2AB0C8Bx^13+0x387C5C0x^12'
+              '+0x261D48Ex^11+0x1ABA0FDx^10+0x2A0D025x^9+0x26B57DFx^8'
+              '+0x25AB9A1x^7+0x33E8FFFx^6+0x3ADAA39x^5+0x16B1DC8x^4'
+              '+0x260B27Fx^3+0x3E991E2x^2+0x3A07F51x+0x36C3D43',
+    (16, 27): '0x1296133x^15+0x3EDDC78x^14+0x559BC38x^13+0x4AFFFA6x^12'
+              '+0x15CA038x^11+0x436367Cx^10+0x5847C33x^9+0x44AF02Cx^8'
+              '+0x7732DA4x^7+0x1F474BFx^6+0x3F63605x^5+0x672BE33x^4'
+              '+0x1BF2249x^3+0x10EA01Bx^2+0x6336A4Fx+0x1DF3E6F',
+    (16, 28): '0x44CCFADx^15+0x11EB5BCx^14+0x819120x^13+0xBA57BBDx^12'
+              '+0xFA69666x^11+0x687D2FAx^10+0xDCD2D9Ax^9+0xF2A9F16x^8'
+              '+0xC78FDBAx^7+0x23015D9x^6+0xDCE2ED8x^5+0x3413402x^4'
+              '+0x749E9D4x^3+0xDAD0858x^2+0xABF0B15x+0x11B4DDF',
+    (16, 29): '0x1DD05E54x^15+0x13DC0793x^14+0x3A600E7x^13+0x1B63BD49x^12'
+              '+0x20D080Bx^11+0x1BBA1E34x^10+0x17095DA6x^9+0x65161Ax^8'
+              '+0x140F427Bx^7+0x18D6A29Fx^6+0x13B96ADDx^5+0x14E0D872x^4'
+              '+0x101B4837x^3+0xA00E5EEx^2+0x65633A0x+0x976CD1A',
+    (16, 30): '0x241ECEC2x^15+0x867C396x^14+0x22647413x^13+0x2D38D7E0x^12'
+              '+0x3E67CAD5x^11+0x3802E686x^10+0x1ACDF777x^9+0x385E64E8x^8'
+              '+0x1DBEF478x^7+0x109C05B1x^6+0x30908830x^5+0x18768F79x^4'
+              '+0x37F83A1Ax^3+0x38F5EFADx^2+0x11526707x+0x293AB2F2',
+    (16, 31): '0x4E1384B1x^15+0x29225F26x^14+0x63A9B498x^13+0x3B733172x^12'
+              '+0x42CCDF06x^11+0x88B3546x^10+0x24917996x^9+0x66F019A0x^8'
+              '+0xE8E7156x^7+0x707B9396x^6+0xBD7344Dx^5+0x6C12301Cx^4'
+              '+0x3E3E489Dx^3+0x5D1D11B9x^2+0x6A71692Ex+0x2CB84F65',
+    (16, 32): '0x1459102Ax^15+0x86CA47F5x^14+0x735F008x^13+0x671EA690x^12'
+              '+0x5BA91199x^11+0x8AD96EDEx^10+0xD7301AC5x^9+0x2334980Bx^8'
+              '+0x6224B008x^7+0x1B7B0B51x^6+0x36E8088Ax^5+0x8550790Dx^4'
+              '+0x3BA9F8A4x^3+0x3C748E04x^2+0xEF7E695Bx+0xB4EA063E',
+    (16, 33): '0x5A92F195x^15+0x1F7141AA8x^14+0x1859172B0x^13'
+              '+0x442FE27Ax^12+0x1651B553Cx^11+0x10C18B361x^10'
+              '+0x12F06E320x^9+0x17C7B6CD4x^8+0x1DFA31FBEx^7+0x45C88E5Fx^6'
+              '+0xD3F7CB6Ex^5+0x1069CC396x^4+0x1396AAF7x^3+0x1258690D4x^2'
+              '+0xFFE632C4x+0x1A6D43E1D',
+    (16, 34): '0x1C1ABBEFDx^15+0x34C55584Ex^14+0xA3FB0A2Bx^13'
+              '+0x10F7D2ECEx^12+0x1B757B359x^11+0x91C10C49x^10'
+              '+0xECE54B36x^9+0xCC107E5Fx^8+0x1D4A83997x^7+0xCDBDEA2Cx^6'
+              '+0x3AF1E04FEx^5+0x257E470C4x^4+0x1F83DC845x^3+0xB6E102Ax^2'
+              '+0x1B2240300x+0x1DEE536C6',
+    (16, 35): '0x5BB2859CEx^15+0x694886E74x^14+0x39A064826x^13'
+              '+0x319726189x^12+0x3EBA8A85Fx^11+0x176E15863x^10'
+              '+0x1A671CD52x^9+0x4381DEDBAx^8+0x2598D122Fx^7+0x78DFDBE69x^6'
+              '+0x50D68E6D3x^5+0x62D416D0Cx^4+0x61677F4Cx^3+0x6A25B5739x^2'
+              '+0x6518857FAx+0x24FDD39CE',
+    (16, 36): '0x36FE7FC89x^15+0x391C202D7x^14+0x16DEC63E1x^13'
+              '+0xA246E9045x^12+0x692FFC5Fx^11+0x947B2C7C9x^10'
+              '+0x76705FC28x^9+0x31480A155x^8+0x77D2D0592x^7+0x13F0E94BBx^6'
+              '+0xB269650BCx^5+0xCB0DA2353x^4+0x7E7BBE878x^3+0x1582B5B74x^2'
+              '+0x1BA8DB938x+0xD1C009440',
+    (16, 37): '0x16DC18B93Dx^15+0x46011A4BDx^14+0xCA3664B9Ax^13'
+              '+0x156EFAFEB0x^12+0xF2818038Cx^11+0x1647160ACDx^10'
+              '+0xB8436F03Ax^9+0x3F7AA0642x^8+0xEE6BFF010x^7'
+              '+0x183FC0D1A8x^6+0x40C17ABD8x^5+0x14021F1F82x^4'
+              '+0x1E78EA58FBx^3+0x1C06CE99E9x^2+0x9B695590Cx+0x1BEDA8419E',
+    (16, 38): '0x3D70A867A5x^15+0x349B05FCF5x^14+0x286582BD23x^13'
+              '+0x17A6B53E26x^12+0x198512A80Ex^11+0xCDCFF5152x^10'
+              '+0x2131D2E7CDx^9+0xEC66B0AB5x^8+0xCE3F4BF3Ex^7'
+              '+0x1E921F72C0x^6+0x26D07233D2x^5+0x151C86742Dx^4'
+              '+0x3F071D79ABx^3+0x3E330C927x^2+0x761114C89x+0x184B34DE1F',
+    (16, 39): '0x46B07AE728x^15+0x6A6D3B07CCx^14+0x9D58A5079x^13'
+              '+0x161C86F0ABx^12+0x40394D81Bx^11+0x565484F6C0x^10'
+              '+0x1F350A62F9x^9+0x30B3A6402x^8+0x6CB7D51822x^7'
+              '+0x6CC7C28B7Cx^6+0x610801FCCDx^5+0x402F8C2F4Ax^4'
+              '+0x56F5B78380x^3+0x1E6557308x^2+0x3C1BF79C68x+0x4A0EEF6CEA',
+    (16, 40): '0xC145731556x^15+0x77272D9B3Fx^14+0x937A5B573Dx^13'
+              '+0x1A5D5F910Bx^12+0x3B6ED19928x^11+0xFC3A44A8F7x^10'
+              '+0xE9E8CD37EAx^9+0xD4C889D3B5x^8+0x7825F436E9x^7'
+              '+0x54354ED0C6x^6+0x64AA5BA4BFx^5+0x7C8506FE8Bx^4'
+              '+0x95BA1F176Fx^3+0x7B65F3B91Ex^2+0xC4FE63E768x+0x4A08CEE5EE',
+    (16, 41): '0x275E910912x^15+0x1CB18D75A1Ex^14+0x1AED28B057Ex^13'
+              '+0x117E4634F4Bx^12+0xBDD579C318x^11+0xF98AC1450Bx^10'
+              '+0x18951A6800Ex^9+0x5211581C5x^8+0x1F93B301770x^7'
+              '+0x96D945EF7x^6+0x119DF5593A3x^5+0x5D523AF62Ex^4'
+              '+0x3155374B32x^3+0x138257341B5x^2+0x140CB29D57Dx'
+              '+0x16BFFF7F79C',
+    (16, 42): '0x8E1B4E6022x^15+0x2CD6102DF8Cx^14+0x3FFF4381980x^13'
+              '+0x3FE3562C36Dx^12+0x9821EB251Cx^11+0x274986381A6x^10'
+              '+0xB66187A77Cx^9+0x28E1985F832x^8+0x8794B83557x^7'
+              '+0x3E0BA5C8432x^6+0x28459C0CCC8x^5+0x98D4F47EA7x^4'
+              '+0x25258AA136Fx^3+0x5B48A2F554x^2+0x34476768E42x'
+              '+0x434DC0E694',
+    (16, 43): '0xAEFF065FA4x^15+0x4F35D41B59Ax^14+0xD2F2B95BD5x^13'
+              '+0x38CE702D9CEx^12+0x3B5CFD0361Ax^11+0x581A19AB6C1x^10'
+              '+0x35FBA69A52Dx^9+0x81736766C0x^8+0xE2469B8BA5x^7'
+              '+0x77D40DA37FEx^6+0x119EACA89E5x^5+0x25D4FD054F3x^4'
+              '+0x499517E8BCx^3+0x57DC5ED112Fx^2+0x71DF43F3628x'
+              '+0x66428A59789',
+    (16, 44): '0x749E8EC766x^15+0xCD59887B02Ax^14+0x8621AF52B4Fx^13'
+              '+0xEC54FCCB8DDx^12+0xF2230A64727x^11+0x2B8B63A1B43x^10'
+              '+0x7404DBA1BC3x^9+0xA6B3F800DBx^8+0x1937C8DDAEx^7'
+              '+0xA7059D041D1x^6+0x44400582FAx^5+0xC2BFF26FACDx^4'
+              '+0xD443CA5FF72x^3+0xEDF00D07B4Bx^2+0xF76F2B340A7x'
+              '+0x7CB5A137483',
+    (16, 45): '0x19FFB4B95F5Ex^15+0xD528410189x^14+0xEDF2611D33Ex^13'
+              '+0x1E5E70EEAF8x^12+0x126F281F03D4x^11+0x1AA867ADBD34x^10'
+              '+0x130E83831755x^9+0x185721F20464x^8+0x1B09A1D01028x^7'
+              '+0x6A85762A619x^6+0x126F9D6CF23Dx^5+0xB43E0D3DA4Ax^4'
+              '+0x15464336CFD1x^3+0x1046651A7565x^2+0x106AA8BD645Dx'
+              '+0x10FE908BEBFD',
+    (16, 46): '0x1B8D55725BDCx^15+0x31BEF757B6F3x^14+0x2B0BDD2624F3x^13'
+              '+0x1345F0FB9E1Dx^12+0x24FA35AAD82Cx^11+0x3208992394E9x^10'
+              '+0x1132B71F45A0x^9+0x2C071B88BB90x^8+0x9B9152FA6ABx^7'
+              '+0x209DD9CD4CA5x^6+0xF34460BE459x^5+0x265D8ABA18FDx^4'
+              '+0x296206BF485Fx^3+0x2D9A69D33460x^2+0x1D604BDACADBx'
+              '+0x7E010BE7D71',
+    (16, 47): '0xD2624444499x^15+0x1AB4506637C0x^14+0x2A589F1D3089x^13'
+              '+0x17553E5D0933x^12+0x75EF75C52DABx^11+0x7C07851FC41Fx^10'
+              '+0x4F84E474180Ax^9+0xCF9CC50B41x^8+0x4C7FA9DE6E48x^7'
+              '+0x5EA076FDAC39x^6+0x3241D291E7FCx^5+0x2AAB54A0F50x^4'
+              '+0x1AD89EF3D16Cx^3+0x2652E915D8C7x^2+0x7C58150A670Fx'
+              '+0x27600C233D00',
+    (16, 48): '0x65CB945CE478x^15+0xBF8743E9BE2Bx^14+0x2F11C75CDF56x^13'
+              '+0x5FFC0866F34Dx^12+0xC08ECA5E177Cx^11+0x1E5C1FAD6664x^10'
+              '+0xA1B47FA582CCx^9+0xFC2CEC24C0Ex^8+0xDD0E562A3FD9x^7'
+              '+0x6A094AB74F79x^6+0xBCCBA1F40CC9x^5+0xD80BBD893096x^4'
+              '+0x8F7D5DD06C0Fx^3+0x14C9D4AC71AFx^2+0x17A5A0C98F2Dx'
+              '+0x13C3EA58B5BB',
+    (16, 49): '0x9985C001D364x^15+0xCE520CA7CACFx^14+0x1CB2CA836A6B4x^13'
+              '+0x180C491D176E5x^12+0x1D09DB7F416C3x^11+0x1A6033EE0BC64x^10'
+              '+0x1224DBD7A28E5x^9+0xC319BEE0EB1Fx^8+0x1BD3FE5A16420x^7'
+              '+0x1BD3097A55F49x^6+0x3F5C2B1FC081x^5+0x11E6CFA439A9Ax^4'
+              '+0x197019950ED16x^3+0x4F504BF55C31x^2+0x4F6A9E12EFC7x'
+              '+0x72146D92E1A6',
+    (16, 50): '0x329FA6FE9B6BDx^15+0x125A65EB76227x^14+0x4DE6BF5C2335x^13'
+              '+0x3899D9C009652x^12+0x130986D3A29AFx^11+0x2524553DD1C0Ex^10'
+              '+0x118A8AFB438A3x^9+0x208CFA0E85D09x^8+0x78B3FAB2AFF5x^7'
+              '+0x18564869E7508x^6+0x3DFF1A8B23DF8x^5+0x4EF8B0F1683Fx^4'
+              '+0x2BA7D43D9B3A4x^3+0x24378A1D75E5Bx^2+0x29809DD2C68BAx'
+              '+0x1A80833BD6496',
+    (16, 51): '0x506F636D46087x^15+0x4B5765466F040x^14+0x31B0A24BA4CEAx^13'
+              '+0x7532B277E76D1x^12+0xBAA85215D42Ex^11+0x554915CDEE27Ax^10'
+              '+0x337807CFFE60Ax^9+0x6184F6137EE0Ax^8+0x3EE17ACBD7901x^7'
+              '+0x28E7F163F4718x^6+0x39ECD36ED073Fx^5+0x7A113B66311B6x^4'
+              '+0x66B07C549CFF4x^3+0x1F62834F513A0x^2+0x66095A24270F6x'
+              '+0x582804BF75826',
+    (16, 52): '0xE192B7AB301Ax^15+0xA57F3A3A2D237x^14+0xBB672D5F432C5x^13'
+              '+0x98EFAA8C09016x^12+0x4B684B6F8AA65x^11+0x1F0A02AABA7Dx^10'
+              '+0x166B491477547x^9+0x710E52A773562x^8+0x856C909BB902Fx^7'
+              '+0xB4F8DC6CC4BA4x^6+0x6664C022B5A9Cx^5+0xD381258317AB4x^4'
+              '+0x9FEB50F04B884x^3+0x9BA07DA53365Ex^2+0x5A8EDA1DB37F1x'
+              '+0xD21F7E8DA7230',
+    (16, 53): '0x1975C557BCB657x^15+0x622DBFBD5C57Dx^14+0x9F9F5F986294Fx^13'
+              '+0x18A31A4A469893x^12+0x129DCE1EE7F37Cx^11'
+              '+0xF490D2CF2AD98x^10+0x10D0917C708C0Dx^9+0x16E210974AC2A6x^8'
+              '+0x89B1DD6E24A51x^7+0x19F0DB140F76C0x^6+0x16D1DFF1B2CF77x^5'
+              '+0x6A74EF1633BBCx^4+0x123DE2D20E972x^3+0x41F9E6EE6B1B5x^2'
+              '+0x141ED23DD66040x+0x13D452A5A3E23C',
+    (16, 54): '0x3A89D23915E7F7x^15+0xB618341427294x^14'
+              '+0x266334A982C12Ex^13+0x1112066C786C80x^12'
+              '+0xB7C356FF5B5C8x^11+0x3BF550D78643Cx^10+0x2490DA97E92085x^9'
+              '+0x147000881A161x^8+0x2C8CB54636FAD7x^7+0x3BD9572F970365x^6'
+              '+0x7EEF210F9D1FBx^5+0x56AB47CF6FBEDx^4+0x177625B62CB7EAx^3'
+              '+0x3555AB368DC94Ax^2+0x48DF033F3ED50x+0x16625C19ED08C5',
+    (16, 55): '0x6713192D117BA0x^15+0x14497C68995C02x^14'
+              '+0x3CD564CB5B7C2Cx^13+0x59598CB002B745x^12'
+              '+0x5F3DD58B5287A9x^11+0x18C50B55640ACFx^10'
+              '+0x4D62BC842468AFx^9+0x468B0B46270DFBx^8+0xDEBBC368B26E3x^7'
+              '+0x1AE4E15F3ED0B5x^6+0x58D191DA8DE3ACx^5+0x5A296D945F2C9x^4'
+              '+0x4105DC2789A4B0x^3+0xE11B0FF3026C7x^2+0x234965BF385D16x'
+              '+0x684454810F7878',
+    (16, 56): '0x9FD373D86846x^15+0xEF78C382DBE446x^14+0x8E890D5E3C3E8Ex^13'
+              '+0x5DFDF0150AB422x^12+0xB302E500A43095x^11'
+              '+0xF135B1477A4C7x^10+0xF481D57096BB28x^9+0x59337B08A205E8x^8'
+              '+0x7BE523F2E745CDx^7+0x22D09B99334A42x^6+0x7B0227D273ADA6x^5'
+              '+0xAB225E7EC1FA0Dx^4+0x691E4F93570D8Cx^3+0x1FC681864D769x^2'
+              '+0xFE8955DB871C12x+0xD616AB2BBD9F92',
+    (16, 57): '0x55830549ACAC5Fx^15+0x28402E081FEC2x^14'
+              '+0xCF3158034343BFx^13+0xB68907495C0181x^12'
+              '+0x15C7B3FC62A00D5x^11+0xF8AF4E7DC6F56Fx^10'
+              '+0x1E033AADE31E3CEx^9+0x1C778277F8CE06Ex^8'
+              '+0x1273794C2EDA3FDx^7+0xFF2122D2EE40F6x^6'
+              '+0x1CB31791B8568FEx^5+0x3B5BEB9ABB7123x^4'
+              '+0x1FBE01C296C2407x^3+0x12B4BCF81BD3620x^2+0x29891E468FA9FFx'
+              '+0x16633AB4B8D1E56',
+    (16, 58): '0x3248173257A0029x^15+0x1AEC30B6C016603x^14'
+              '+0xC73051D36F25F1x^13+0x24502B33009E014x^12'
+              '+0x8C220B647060CDx^11+0x1F7D91481C3AEF8x^10'
+              '+0x1BDC8DBFEA53745x^9+0x1FE9BD4E99A6AF8x^8'
+              '+0x37D610251A2F9x^7+0x397FA5EDAC8887x^6+0x396CE85756815BBx^5'
+              '+0x38ADDAB43986983x^4+0x360867CC0648423x^3'
+              '+0x121396C5F9C1537x^2+0x643298A3431BBx+0xF9F3BFBEFD0ABB',
+    (16, 59): '0x224B49D85B8E995x^15+0x541FE663AFF5218x^14'
+              '+0x6F3CE1C919B8D85x^13+0x3CEE3D1762675ECx^12'
+              '+0x72163E24246CDFDx^11+0x3E562A8536C12CFx^10'
+              '+0x524269C1842C44Ex^9+0x4BFDA03600E0D01x^8'
+              '+0x2F652600289E36Ex^7+0x69711D75010837Ex^6'
+              '+0x5690613DD6F7885x^5+0x2D7296DBF5BA820x^4'
+              '+0x6DC4D0F6CA9435Ax^3+0x62604E78B99B0BCx^2+0x14A812E66F211Bx'
+              '+0x33ADB5ED7A3D0F6',
+    (16, 60): '0x8A1F548D68713E3x^15+0x7FCD56F84A0DEF7x^14'
+              '+0x84EE4A0E5829C98x^13+0x50AF61BEFA29AC5x^12'
+              '+0x514A5F15069129Ex^11+0x5D14B3A3129BF6Bx^10'
+              '+0xEAF1455D522DC5Bx^9+0x879530CDC9C4A80x^8'
+              '+0xE28B8AC8C652DCCx^7+0x572157A12BF45FEx^6'
+              '+0x94223F754FFA935x^5+0x782F4DAD2091586x^4'
+              '+0xE03E0E38CCE44ABx^3+0x5E99780CC256E17x^2'
+              '+0x662DFB91BF94457x+0x60D8FFB3DA1CA2',
+    (16, 61): '0x7140DD46318A31Ax^15+0x11751494E7002618x^14'
+              '+0x357253A8EC91209x^13+0x7564FE27DFB081Cx^12'
+              '+0x182C50388546957Bx^11+0x2EF834353678EC6x^10'
+              '+0x566EA3A816DDFBAx^9+0x32EE41D4D39F884x^8'
+              '+0x18F5C8C432D1B2CFx^7+0x15394AFD6A6B64B4x^6'
+              '+0x1EEB4925A50EC30Ax^5+0x165955838436E67Dx^4'
+              '+0x19030CE881773301x^3+0x15A538BD2191DFD9x^2'
+              '+0x1524D9947143C457x+0x1DDAB7E534653CF',
+    (16, 62): '0x1B3CC3B4C079398Bx^15+0x2915648F9384C389x^14'
+              '+0x1AF77614C0A75400x^13+0x2D87FD4345B6D62Ax^12'
+              '+0x2D353C2714A1B940x^11+0x31E94138819807Cx^10'
+              '+0x25A54BED0475D587x^9+0x113D752067CF850Ex^8'
+              '+0x3B72D4075DFE1E77x^7+0x1695A0660D495D28x^6'
+              '+0x2A2F097A98087437x^5+0x39CE813A3AFC7DECx^4'
+              '+0x207AED24463E3E54x^3+0x4803C6987F0D93Fx^2'
+              '+0x1F52200074487000x+0x3BBF65F9ACA49633',
+    (16, 63): '0x6B8DC932A9E7EB67x^15+0x79325E05C48915FBx^14'
+              '+0x210517E0E43DDC04x^13+0x6E965AD46F922A59x^12'
+              '+0x789CCD7B720C4E85x^11+0x5800A75FFC25FBAEx^10'
+              '+0x543CA5D0D76E2D8Ax^9+0x5BD46CC145EF6DF3x^8'
+              '+0x5CA83A88678DFA65x^7+0x10AD4BB0D27335F3x^6'
+              '+0x1FC44ADCE12C8224x^5+0x1D1EF0616AEF2EEx^4'
+              '+0x6EC65E90A135938Dx^3+0x56121181C520B01Dx^2'
+              '+0x295D636829CEE68Fx+0x4005CF11E8357E49',
+    (16, 64): '0x317CC045E6AED18Ax^15+0xE547F87B2BA58C67x^14'
+              '+0x1B1E6AD0CE1F82EEx^13+0xC36A4AF999EB2295x^12'
+              '+0x207DD6A762D95C9x^11+0xB7C2B8498251C539x^10'
+              '+0x56C2F9DDD3D37B01x^9+0x604EDA25689BF074x^8'
+              '+0xF5BC3B15063C66FEx^7+0xAEF15B1484CDF94Bx^6'
+              '+0x1C45346B536ADD6Ex^5+0x5D6928BB934BCD9Ex^4'
+              '+0xD7AC5809B1DECAD7x^3+0x68FE838F301B49A4x^2'
+              '+0x5509C873ED2D4919x+0x24086B15A0A5FFE9',
+}
+# c(x) with the MDS property checked (False: only checked to be invertible).
+CxMDS = {
+    (2, 17): True,
+    (2, 18): True,
+    (2, 19): True,
+    (2, 20): True,
+    (2, 21): True,
+    (2, 22): True,
+    (2, 23): True,
+    (2, 24): True,
+    (2, 25): True,
+    (2, 26): True,
+    (2, 27): True,
+    (2, 28): True,
+    (2, 29): True,
+    (2, 30): True,
+    (2, 31): True,
+    (2, 32): True,
+    (2, 33): True,
+    (2, 34): True,
+    (2, 35): True,
+    (2, 36): True,
+    (2, 37): True,
+    (2, 38): True,
+    (2, 39): True,
+    (2, 40): True,
+    (2, 41): True,
+    (2, 42): True,
+    (2, 43): True,
+    (2, 44): True,
+    (2, 45): True,
+    (2, 46): True,
+    (2, 47): True,
+    (2, 48): True,
+    (2, 49): True,
+    (2, 50): True,
+    (2, 51): True,
+    (2, 52): True,
+    (2, 53): True,
+    (2, 54): True,
+    (2, 55): True,
+    (2, 56): True,
+    (2, 57): True,
+    (2, 58): True,
+    (2, 59): True,
+    (2, 60): True,
+    (2, 61): True,
+    (2, 62): True,
+    (2, 63): True,
+    (2, 64): True,
+    (3, 17): True,
+    (3, 18): True,
+    (3, 19): True,
+    (3, 20): True,
+    (3, 21): True,
+    (3, 22): True,
+    (3, 23): True,
+    (3, 24): True,
+    (3, 25): True,
+    (3, 26): True,
+    (3, 27): True,
+    (3, 28): True,
+    (3, 29): True,
+    (3, 30): True,
+    (3, 31): True,
+    (3, 32): True,
+    (3, 33): True,
+    (3, 34): True,
+    (3, 35): True,
+    (3, 36): True,
+    (3, 37): True,
+    (3, 38): True,
+    (3, 39): True,
+    (3, 40): True,
+    (3, 41): True,
+    (3, 42): True,
+    (3, 43): True,
+    (3, 44): True,
+    (3, 45): True,
+    (3, 46): True,
+    (3, 47): True,
+    (3, 48): True,
+    (3, 49): True,
+    (3, 50): True,
+    (3, 51): True,
+    (3, 52): True,
+    (3, 53): True,
+    (3, 54): True,
+    (3, 55): True,
+    (3, 56): True,
+    (3, 57): True,
+    (3, 58): True,
+    (3, 59): True,
+    (3, 60): True,
+    (3, 61): True,
+    (3, 62): True,
+    (3, 63): True,
+    (3, 64): True,
+    (4, 17): True,
+    (4, 18): True,
+    (4, 19): True,
+    (4, 20): True,
+    (4, 21): True,
+    (4, 22): True,
+    (4, 23): True,
+    (4, 24): True,
+    (4, 25): True,
+    (4, 26): True,
+    (4, 27): True,
+    (4, 28): True,
+    (4, 29): True,
+    (4, 30): True,
+    (4, 31): True,
+    (4, 32): True,
+    (4, 33): True,
+    (4, 34): True,
+    (4, 35): True,
+    (4, 36): True,
+    (4, 37): True,
+    (4, 38): True,
+    (4, 39): True,
+    (4, 40): True,
+    (4, 41): True,
+    (4, 42): True,
+    (4, 43): True,
+    (4, 44): True,
+    (4, 45): True,
+    (4, 46): True,
+    (4, 47): True,
+    (4, 48): True,
+    (4, 49): True,
+    (4, 50): True,
+    (4, 51): True,
+    (4, 52): True,
+    (4, 53): True,
+    (4, 54): True,
+    (4, 55): True,
+    (4, 56): True,
+    (4, 57): True,
+    (4, 58): True,
+    (4, 59): True,
+    (4, 60): True,
+    (4, 61): True,
+    (4, 62): True,
+    (4, 63): True,
+    (4, 64): True,
+    (5, 17): True,
+    (5, 18): True,
+    (5, 19): True,
+    (5, 20): True,
+    (5, 21): True,
+    (5, 22): True,
+    (5, 23): True,
+    (5, 24): True,
+    (5, 25): True,
+    (5, 26): True,
+    (5, 27): True,
+    (5, 28): True,
+    (5, 29): True,
+    (5, 30): True,
+    (5, 31): True,
+    (5, 32): True,
+    (5, 33): True,
+    (5, 34): True,
+    (5, 35): True,
+    (5, 36): True,
+    (5, 37): True,
+    (5, 38): True,
+    (5, 39): True,
+    (5, 40): True,
+    (5, 41): True,
+    (5, 42): True,
+    (5, 43): True,
+    (5, 44): True,
+    (5, 45): True,
+    (5, 46): True,
+    (5, 47): True,
+    (5, 48): True,
+    (5, 49): True,
+    (5, 50): True,
+    (5, 51): True,
+    (5, 52): True,
+    (5, 53): True,
+    (5, 54): True,
+    (5, 55): True,
+    (5, 56): True,
+    (5, 57): True,
+    (5, 58): True,
+    (5, 59): True,
+    (5, 60): True,
+    (5, 61): True,
+    (5, 62): True,
+    (5, 63): True,
+    (5, 64): True,
+    (6, 17): True,
+    (6, 18): True,
+    (6, 19): True,
+    (6, 20): True,
+    (6, 21): True,
+    (6, 22): True,
+    (6, 23): True,
+    (6, 24): True,
+    (6, 25): True,
+    (6, 26): True,
+    (6, 27): True,
+    (6, 28): True,
+    (6, 29): True,
+    (6, 30): True,
+    (6, 31): True,
+    (6, 32): True,
+    (6, 33): True,
+    (6, 34): True,
+    (6, 35): True,
+    (6, 36): True,
+    (6, 37): True,
+    (6, 38): True,
+    (6, 39): True,
+    (6, 40): True,
+    (6, 41): True,
+    (6, 42): True,
+    (6, 43): True,
+    (6, 44): True,
+    (6, 45): True,
+    (6, 46): True,
+    (6, 47): True,
+    (6, 48): True,
+    (6, 49): True,
+    (6, 50): True,
+    (6, 51): True,
+    (6, 52): True,
+    (6, 53): True,
+    (6, 54): True,
+    (6, 55): True,
+    (6, 56): True,
+    (6, 57): True,
+    (6, 58): True,
+    (6, 59): True,
+    (6, 60): True,
+    (6, 61): True,
+    (6, 62): True,
+    (6, 63): True,
+    (6, 64): True,
+    (7, 17): True,
+    (7, 18): True,
+    (7, 19): True,
+    (7, 20): True,
+    (7, 21): True,
+    (7, 22): True,
+    (7, 23): True,
+    (7, 24): True,
+    (7, 25): True,
+    (7, 26): True,
+    (7, 27): True,
+    (7, 28): True,
+    (7, 29): True,
+    (7, 30): True,
+    (7, 31): True,
+    (7, 32): True,
+    (7, 33): True,
+    (7, 34): True,
+    (7, 35): True,
+    (7, 36): True,
+    (7, 37): True,
+    (7, 38): True,
+    (7, 39): True,
+    (7, 40): True,
+    (7, 41): True,
+    (7, 42): True,
+    (7, 43): True,
+    (7, 44): True,
+    (7, 45): True,
+    (7, 46): True,
+    (7, 47): True,
+    (7, 48): True,
+    (7, 49): True,
+    (7, 50): True,
+    (7, 51): True,
+    (7, 52): True,
+    (7, 53): True,
+    (7, 54): True,
+    (7, 55): True,
+    (7, 56): True,
+    (7, 57): True,
+    (7, 58): True,
+    (7, 59): True,
+    (7, 60): True,
+    (7, 61): True,
+    (7, 62): True,
+    (7, 63): True,
+    (7, 64): True,
+    (8, 17): True,
+    (8, 18): True,
+    (8, 19): True,
+    (8, 20): True,
+    (8, 21): True,
+    (8, 22): True,
+    (8, 23): True,
+    (8, 24): True,
+    (8, 25): True,
+    (8, 26): True,
+    (8, 27): True,
+    (8, 28): True,
+    (8, 29): True,
+    (8, 30): True,
+    (8, 31): True,
+    (8, 32): True,
+    (8, 33): True,
+    (8, 34): True,
+    (8, 35): True,
+    (8, 36): True,
+    (8, 37): True,
+    (8, 38): True,
+    (8, 39): True,
+    (8, 40): True,
+    (8, 41): True,
+    (8, 42): True,
+    (8, 43): True,
+    (8, 44): True,
+    (8, 45): True,
+    (8, 46): True,
+    (8, 47): True,
+    (8, 48): True,
+    (8, 49): True,
+    (8, 50): True,
+    (8, 51): True,
+    (8, 52): True,
+    (8, 53): True,
+    (8, 54): True,
+    (8, 55): True,
+    (8, 56): True,
+    (8, 57): True,
+    (8, 58): True,
+    (8, 59): True,
+    (8, 60): True,
+    (8, 61): True,
+    (8, 62): True,
+    (8, 63): True,
+    (8, 64): True,
+    (9, 2): False,
+    (9, 3): False,
+    (9, 4): False,
+    (9, 5): False,
+    (9, 6): False,
+    (9, 7): False,
+    (9, 8): False,
+    (9, 9): False,
+    (9, 10): False,
+    (9, 11): False,
+    (9, 12): False,
+    (9, 13): False,
+    (9, 14): False,
+    (9, 15): False,
+    (9, 16): False,
+    (9, 17): False,
+    (9, 18): False,
+    (9, 19): False,
+    (9, 20): False,
+    (9, 21): False,
+    (9, 22): False,
+    (9, 23): False,
+    (9, 24): False,
+    (9, 25): False,
+    (9, 26): False,
+    (9, 27): False,
+    (9, 28): False,
+    (9, 29): False,
+    (9, 30): False,
+    (9, 31): False,
+    (9, 32): False,
+    (9, 33): False,
+    (9, 34): False,
+    (9, 35): False,
+    (9, 36): False,
+    (9, 37): False,
+    (9, 38): False,
+    (9, 39): False,
+    (9, 40): False,
+    (9, 41): False,
+    (9, 42): False,
+    (9, 43): False,
+    (9, 44): False,
+    (9, 45): False,
+    (9, 46): False,
+    (9, 47): False,
+    (9, 48): False,
+    (9, 49): False,
+    (9, 50): False,
+    (9, 51): False,
+    (9, 52): False,
+    (9, 53): False,
+    (9, 54): False,
+    (9, 55): False,
+    (9, 56): False,
+    (9, 57): False,
+    (9, 58): False,
+    (9, 59): False,
+    (9, 60): False,
+    (9, 61): False,
+    (9, 62): False,
+    (9, 63): False,
+    (9, 64): False,
+    (10, 2): False,
+    (10, 3): False,
+    (10, 4): False,
+    (10, 5): False,
+    (10, 6): False,
+    (10, 7): False,
+    (10, 8): False,
+    (10, 9): False,
+    (10, 10): False,
+    (10, 11): False,
+    (10, 12): False,
+    (10, 13): False,
+    (10, 14): False,
+    (10, 15): False,
+    (10, 16): False,
+    (10, 17): False,
+    (10, 18): False,
+    (10, 19): False,
+    (10, 20): False,
+    (10, 21): False,
+    (10, 22): False,
+    (10, 23): False,
+    (10, 24): False,
+    (10, 25): False,
+    (10, 26): False,
+    (10, 27): False,
+    (10, 28): False,
+    (10, 29): False,
+    (10, 30): False,
+    (10, 31): False,
+    (10, 32): False,
+    (10, 33): False,
+    (10, 34): False,
+    (10, 35): False,
+    (10, 36): False,
+    (10, 37): False,
+    (10, 38): False,
+    (10, 39): False,
+    (10, 40): False,
+    (10, 41): False,
+    (10, 42): False,
+    (10, 43): False,
+    (10, 44): False,
+    (10, 45): False,
+    (10, 46): False,
+    (10, 47): False,
+    (10, 48): False,
+    (10, 49): False,
+    (10, 50): False,
+    (10, 51): False,
+    (10, 52): False,
+    (10, 53): False,
+    (10, 54): False,
+    (10, 55): False,
+    (10, 56): False,
+    (10, 57): False,
+    (10, 58): False,
+    (10, 59): False,
+    (10, 60): False,
+    (10, 61): False,
+    (10, 62): False,
+    (10, 63): False,
+    (10, 64): False,
+    (11, 2): False,
+    (11, 3): False,
+    (11, 4): False,
+    (11, 5): False,
+    (11, 6): False,
+    (11, 7): False,
+    (11, 8): False,
+    (11, 9): False,
+    (11, 10): False,
+    (11, 11): False,
+    (11, 12): False,
+    (11, 13): False,
+    (11, 14): False,
+    (11, 15): False,
+    (11, 16): False,
+    (11, 17): False,
+    (11, 18): False,
+    (11, 19): False,
+    (11, 20): False,
+    (11, 21): False,
+    (11, 22): False,
+    (11, 23): False,
+    (11, 24): False,
+    (11, 25): False,
+    (11, 26): False,
+    (11, 27): False,
+    (11, 28): False,
+    (11, 29): False,
+    (11, 30): False,
+    (11, 31): False,
+    (11, 32): False,
+    (11, 33): False,
+    (11, 34): False,
+    (11, 35): False,
+    (11, 36): False,
+    (11, 37): False,
+    (11, 38): False,
+    (11, 39): False,
+    (11, 40): False,
+    (11, 41): False,
+    (11, 42): False,
+    (11, 43): False,
+    (11, 44): False,
+    (11, 45): False,
+    (11, 46): False,
+    (11, 47): False,
+    (11, 48): False,
+    (11, 49): False,
+    (11, 50): False,
+    (11, 51): False,
+    (11, 52): False,
+    (11, 53): False,
+    (11, 54): False,
+    (11, 55): False,
+    (11, 56): False,
+    (11, 57): False,
+    (11, 58): False,
+    (11, 59): False,
+    (11, 60): False,
+    (11, 61): False,
+    (11, 62): False,
+    (11, 63): False,
+    (11, 64): False,
+    (12, 2): False,
+    (12, 3): False,
+    (12, 4): False,
+    (12, 5): False,
+    (12, 6): False,
+    (12, 7): False,
+    (12, 8): False,
+    (12, 9): False,
+    (12, 10): False,
+    (12, 11): False,
+    (12, 12): False,
+    (12, 13): False,
+    (12, 14): False,
+    (12, 15): False,
+    (12, 16): False,
+    (12, 17): False,
+    (12, 18): False,
+    (12, 19): False,
+    (12, 20): False,
+    (12, 21): False,
+    (12, 22): False,
+    (12, 23): False,
+    (12, 24): False,
+    (12, 25): False,
+    (12, 26): False,
+    (12, 27): False,
+    (12, 28): False,
+    (12, 29): False,
+    (12, 30): False,
+    (12, 31): False,
+    (12, 32): False,
+    (12, 33): False,
+    (12, 34): False,
+    (12, 35): False,
+    (12, 36): False,
+    (12, 37): False,
+    (12, 38): False,
+    (12, 39): False,
+    (12, 40): False,
+    (12, 41): False,
+    (12, 42): False,
+    (12, 43): False,
+    (12, 44): False,
+    (12, 45): False,
+    (12, 46): False,
+    (12, 47): False,
+    (12, 48): False,
+    (12, 49): False,
+    (12, 50): False,
+    (12, 51): False,
+    (12, 52): False,
+    (12, 53): False,
+    (12, 54): False,
+    (12, 55): False,
+    (12, 56): False,
+    (12, 57): False,
+    (12, 58): False,
+    (12, 59): False,
+    (12, 60): False,
+    (12, 61): False,
+    (12, 62): False,
+    (12, 63): False,
+    (12, 64): False,
+    (13, 2): False,
+    (13, 3): False,
+    (13, 4): False,
+    (13, 5): False,
+    (13, 6): False,
+    (13, 7): False,
+    (13, 8): False,
+    (13, 9): False,
+    (13, 10): False,
+    (13, 11): False,
+    (13, 12): False,
+    (13, 13): False,
+    (13, 14): False,
+    (13, 15): False,
+    (13, 16): False,
+    (13, 17): False,
+    (13, 18): False,
+    (13, 19): False,
+    (13, 20): False,
+    (13, 21): False,
+    (13, 22): False,
+    (13, 23): False,
+    (13, 24): False,
+    (13, 25): False,
+    (13, 26): False,
+    (13, 27): False,
+    (13, 28): False,
+    (13, 29): False,
+    (13, 30): False,
+    (13, 31): False,
+    (13, 32): False,
+    (13, 33): False,
+    (13, 34): False,
+    (13, 35): False,
+    (13, 36): False,
+    (13, 37): False,
+    (13, 38): False,
+    (13, 39): False,
+    (13, 40): False,
+    (13, 41): False,
+    (13, 42): False,
+    (13, 43): False,
+    (13, 44): False,
+    (13, 45): False,
+    (13, 46): False,
+    (13, 47): False,
+    (13, 48): False,
+    (13, 49): False,
+    (13, 50): False,
+    (13, 51): False,
+    (13, 52): False,
+    (13, 53): False,
+    (13, 54): False,
+    (13, 55): False,
+    (13, 56): False,
+    (13, 57): False,
+    (13, 58): False,
+    (13, 59): False,
+    (13, 60): False,
+    (13, 61): False,
+    (13, 62): False,
+    (13, 63): False,
+    (13, 64): False,
+    (14, 2): False,
+    (14, 3): False,
+    (14, 4): False,
+    (14, 5): False,
+    (14, 6): False,
+    (14, 7): False,
+    (14, 8): False,
+    (14, 9): False,
+    (14, 10): False,
+    (14, 11): False,
+    (14, 12): False,
+    (14, 13): False,
+    (14, 14): False,
+    (14, 15): False,
+    (14, 16): False,
+    (14, 17): False,
+    (14, 18): False,
+    (14, 19): False,
+    (14, 20): False,
+    (14, 21): False,
+    (14, 22): False,
+    (14, 23): False,
+    (14, 24): False,
+    (14, 25): False,
+    (14, 26): False,
+    (14, 27): False,
+    (14, 28): False,
+    (14, 29): False,
+    (14, 30): False,
+    (14, 31): False,
+    (14, 32): False,
+    (14, 33): False,
+    (14, 34): False,
+    (14, 35): False,
+    (14, 36): False,
+    (14, 37): False,
+    (14, 38): False,
+    (14, 39): False,
+    (14, 40): False,
+    (14, 41): False,
+    (14, 42): False,
+    (14, 43): False,
+    (14, 44): False,
+    (14, 45): False,
+    (14, 46): False,
+    (14, 47): False,
+    (14, 48): False,
+    (14, 49): False,
+    (14, 50): False,
+    (14, 51): False,
+    (14, 52): False,
+    (14, 53): False,
+    (14, 54): False,
+    (14, 55): False,
+    (14, 56): False,
+    (14, 57): False,
+    (14, 58): False,
+    (14, 59): False,
+    (14, 60): False,
+    (14, 61): False,
+    (14, 62): False,
+    (14, 63): False,
+    (14, 64): False,
+    (15, 2): False,
+    (15, 3): False,
+    (15, 4): False,
+    (15, 5): False,
+    (15, 6): False,
+    (15, 7): False,
+    (15, 8): False,
+    (15, 9): False,
+    (15, 10): False,
+    (15, 11): False,
+    (15, 12): False,
+    (15, 13): False,
+    (15, 14): False,
+    (15, 15): False,
+    (15, 16): False,
+    (15, 17): False,
+    (15, 18): False,
+    (15, 19): False,
+    (15, 20): False,
+    (15, 21): False,
+    (15, 22): False,
+    (15, 23): False,
+    (15, 24): False,
+    (15, 25): False,
+    (15, 26): False,
+    (15, 27): False,
+    (15, 28): False,
+    (15, 29): False,
+    (15, 30): False,
+    (15, 31): False,
+    (15, 32): False,
+    (15, 33): False,
+    (15, 34): False,
+    (15, 35): False,
+    (15, 36): False,
+    (15, 37): False,
+    (15, 38): False,
+    (15, 39): False,
+    (15, 40): False,
+    (15, 41): False,
+    (15, 42): False,
+    (15, 43): False,
+    (15, 44): False,
+    (15, 45): False,
+    (15, 46): False,
+    (15, 47): False,
+    (15, 48): False,
+    (15, 49): False,
+    (15, 50): False,
+    (15, 51): False,
+    (15, 52): False,
+    (15, 53): False,
+    (15, 54): False,
+    (15, 55): False,
+    (15, 56): False,
+    (15, 57): False,
+    (15, 58): False,
+    (15, 59): False,
+    (15, 60): False,
+    (15, 61): False,
+    (15, 62): False,
+    (15, 63): False,
+    (15, 64): False,
+    (16, 2): False,
+    (16, 3): False,
+    (16, 4): False,
+    (16, 5): False,
+    (16, 6): False,
+    (16, 7): False,
+    (16, 8): False,
+    (16, 9): False,
+    (16, 10): False,
+    (16, 11): False,
+    (16, 12): False,
+    (16, 13): False,
+    (16, 14): False,
+    (16, 15): False,
+    (16, 16): False,
+    (16, 17): False,
+    (16, 18): False,
+    (16, 19): False,
+    (16, 20): False,
+    (16, 21): False,
+    (16, 22): False,
+    (16, 23): False,
+    (16, 24): False,
+    (16, 25): False,
+    (16, 26): False,
+    (16, 27): False,
+    (16, 28): False,
+    (16, 29): False,
+    (16, 30): False,
+    (16, 31): False,
+    (16, 32): False,
+    (16, 33): False,
+    (16, 34): False,
+    (16, 35): False,
+    (16, 36): False,
+    (16, 37): False,
+    (16, 38): False,
+    (16, 39): False,
+    (16, 40): False,
+    (16, 41): False,
+    (16, 42): False,
+    (16, 43): False,
+    (16, 44): False,
+    (16, 45): False,
+    (16, 46): False,
+    (16, 47): False,
+    (16, 48): False,
+    (16, 49): False,
+    (16, 50): False,
+    (16, 51): False,
+    (16, 52): False,
+    (16, 53): False,
+    (16, 54): False,
+    (16, 55): False,
+    (16, 56): False,
+    (16, 57): False,
+    (16, 58): False,
+    (16, 59): False,
+    (16, 60): False,
+    (16, 61): False,
+    (16, 62): False,
+    (16, 63): False,
+    (16, 64): False,
+}
@@ -0,0 +1,195 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+"""
+    Vectorized GF(2^w) arithmetic over NumPy integer arrays (numpy is an
+    optional dependency, only needed when this module is used). The
+    elements are the integer (bit) representation of the binary
+    polynomials, like the coefficients of BinaryExtensionModulo.
+
+    The kernels are table driven, then they stop at the word size of the
+    field tables (TABLES_MAX_WORDSIZE, w=16). Wider fields are only
+    available with the scalar BinaryExtensionModulo elements.
+
+    >>> from gRijndael.Polynomials.VectorizedFields import getVectorizedField
+    >>> field = getVectorizedField(8)
+    >>> field.multiply([0x57, 0x02], [0x83, 0x87])
+    array([193,  21])
+"""
+
+from threading import Lock as _Lock
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+from .BinaryPolynomials import getBinaryExtensionFieldModulo
+from .FieldTables import getFieldTables as _getFieldTables
+from .FieldTables import TABLES_MAX_WORDSIZE as _TABLES_MAX_WORDSIZE
+from .FieldTables import isIrreducible as _isIrreducible
+
+
+_vectorizedFields = {}
+_vectorizedFieldsLock = _Lock()
+# Up to this word size the product uses a full multiplication table
+# (2^w x 2^w elements), and over it the log/antilog tables.
+FULL_TABLE_MAX_WORDSIZE = 8
+
+
+def getVectorizedField(wordSize):
+    '''VectorizedField for the modulo that getBinaryExtensionFieldModulo()
+       gives for the word size.
+       Input: <integer> wordSize (up to TABLES_MAX_WORDSIZE)
+       Output: <_VectorizedField>
+    '''
+    if wordSize > _TABLES_MAX_WORDSIZE:
+        raise ValueError("The vectorized fields are table driven and the "
+                         "word size is limited to %d (not %d)"
+                         % (_TABLES_MAX_WORDSIZE, wordSize))
+    return VectorizedField(getBinaryExtensionFieldModulo(wordSize))
+
+
+def VectorizedField(modulo):
+    '''Memoized builder of the _VectorizedField for a field modulo.
+       Input: <integer> modulo (irreducible binary polynomial)
+       Output: <_VectorizedField>
+    '''
+    if _np is None:
+        raise ImportError("numpy is needed for the vectorized fields")
+    with _vectorizedFieldsLock:
+        if modulo not in _vectorizedFields:
+            _vectorizedFields[modulo] = _VectorizedField(modulo)
+        return _vectorizedFields[modulo]
+
+
+class _VectorizedField(object):
+    '''GF(2^w) operations element-wise over arrays (with the numpy
+       broadcasting rules). Inputs can be anything numpy.asarray() accepts
+       and the outputs are int64 arrays.
+    '''
+    def __init__(self, modulo):
+        super(_VectorizedField, self).__init__()
+        degree = modulo.bit_length()-1
+        if degree > _TABLES_MAX_WORDSIZE:
+            raise ValueError("The modulo %s has degree %d, over the %d "
+                             "supported by the field tables"
+                             % (hex(modulo), degree, _TABLES_MAX_WORDSIZE))
+        if not _isIrreducible(modulo):
+            raise ArithmeticError("The modulo %s is reducible, it doesn't "
+                                  "produce a field" % (hex(modulo)))
+        tables = _getFieldTables(modulo)
+        self._modulo = modulo
+        self._wordSize = modulo.bit_length()-1
+        self._order = (1 << self._wordSize)-1
+        log, exp = tables
+        self._log = _np.array(log, dtype=_np.int64)
+        self._exp = _np.array(exp, dtype=_np.int64)
+        if self._wordSize <= FULL_TABLE_MAX_WORDSIZE:
+            a = _np.arange(self._order+1)
+            logs = self._log[a]
+            table = self._exp[logs[:, None]+logs[None, :]]
+            table[0, :] = 0
+            table[:, 0] = 0
+            self._table = table
+        else:
+            self._table = None
+
+    @property
+    def modulo(self):
+        return self._modulo
+
+    @property
+    def wordSize(self):
+        return self._wordSize
+
+    def _asarray(self, a):
+        return _np.asarray(a, dtype=_np.int64)
+
+    def add(self, a, b):
+        '''a+b (and a-b): bitwise xor.'''
+        return _np.bitwise_xor(self._asarray(a), self._asarray(b))
+
+    subtract = add
+
+    def multiply(self, a, b):
+        '''a*b using the full table or the log/antilog tables.'''
+        a = self._asarray(a)
+        b = self._asarray(b)
+        if self._table is not None:
+            return self._table[a, b]
+        product = self._exp[self._log[a]+self._log[b]]
+        return _np.where((a == 0) | (b == 0), 0, product)
+
+    def inverse(self, a):
+        '''a^-1, with 0 mapped to 0 (like the SBox does).'''
+        a = self._asarray(a)
+        inverse = self._exp[self._order-self._log[a]]
+        return _np.where(a == 0, 0, inverse)
+
+    def power(self, a, n):
+        '''a^n, for integer exponents (negative ones use the inverse).'''
+        a = self._asarray(a)
+        n = self._asarray(n)
+        power = self._exp[(self._log[a]*n) % self._order]
+        return _np.where(a == 0, _np.where(n == 0, 1, 0), power)
+
+    def sum(self, a, axis=-1):
+        '''Addition of the elements along an axis.'''
+        return _np.bitwise_xor.reduce(self._asarray(a), axis=axis)
+
+    def matrixVector(self, matrix, vector):
+        '''Matrix (..., r, c) by vector (..., c) product.
+           Output: (..., r) array
+        '''
+        matrix = self._asarray(matrix)
+        vector = self._asarray(vector)
+        return self.sum(self.multiply(matrix, vector[..., None, :]))
+
+    def ringMultiply(self, a, b):
+        '''Product in the ring (GF(2^w))[x]/(x^n+1) as a cyclic convolution
+           over the last axis (the coefficients, Less Significant
+           Coefficient First).
+           Input: (..., n) arrays
+           Output: (..., n) array
+        '''
+        a = self._asarray(a)
+        b = self._asarray(b)
+        n = a.shape[-1]
+        if b.shape[-1] != n:
+            raise AssertionError("Both polynomials shall have %d "
+                                 "coefficients" % (n))
+        result = _np.zeros(_np.broadcast(a, b).shape, dtype=_np.int64)
+        for i in range(n):
+            result ^= self.multiply(a[..., i:i+1], _np.roll(b, i, axis=-1))
+        return result
+
+    def circulant(self, polynomial):
+        '''Matrix of the product by a polynomial in (GF(2^w))[x]/(x^n+1),
+           then ringMultiply(c, s) == matrixVector(circulant(c), s).
+           Input: (n,) array
+           Output: (n, n) array
+        '''
+        polynomial = self._asarray(polynomial)
+        n = polynomial.shape[-1]
+        return _np.stack([_np.roll(polynomial, j) for j in range(n)],
+                         axis=-1)
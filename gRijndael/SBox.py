@@ -22,108 +22,303 @@ __copyright__ = "Copyright 2013 Sergi Blanch-Torne"
 __license__ = "GPLv3+"
 __status__ = "development"
 
-from copy import deepcopy as _deepcopy
+from threading import Lock as _Lock
 from .Logger import Logger as _Logger
 from .Logger import XORctr as _XORctr
 from .Polynomials import getBinaryExtensionFieldModulo
 from .Polynomials import getBinaryExtensionRingModulo
 from .Polynomials import getMu, getNu
 from .Polynomials import BinaryExtensionModulo
+from .Polynomials.FieldTables import batchInverse as _batchInverse
+from .Polynomials.FieldTables import getFieldOperations as _getFieldOperations
+
+
+# Up to this word size the SBox can be a table (2^w entries).
+SBOX_TABLES_MAX_WORDSIZE = 16
+# the tables built in this process (by word size) and the ones attached
+# from shared memory (by block name), reused by all the SBox instances
+_sboxTables = {}
+_attachedTables = {}
+_sboxTablesLock = _Lock()
+
+
+def sboxTableChunk(wordSize, start, stop):
+    '''SBox images of the values in [start, stop): the inverses of the
+       whole chunk with Montgomery's trick (see FieldTables.batchInverse())
+       and the affine transformation as the linear map given by the images
+       of each bit.
+       Input: <integer> wordSize, <integer> start, <integer> stop
+       Output: <list> of integers
+    '''
+    product, inverse = \
+        _getFieldOperations(getBinaryExtensionFieldModulo(wordSize))
+    inverses = _batchInverse(list(range(start, stop)), product, inverse)
+    ring = BinaryExtensionModulo(getBinaryExtensionRingModulo(wordSize))
+    mu = ring(getMu(wordSize))
+    images = [(mu*ring(1 << i))._coefficients for i in range(wordSize)]
+    nu = getNu(wordSize)
+    table = []
+    for g in inverses:
+        b = nu
+        for image in images:
+            if g & 1:
+                b ^= image
+            g >>= 1
+        table.append(b)
+    return table
+
+
+def sboxTable(wordSize, processors=1):
+    '''Table of the SBox for a word size, built in chunks (see
+       sboxTableChunk()) that can be distributed in a pool of processes.
+       Input: <integer> wordSize
+              <integer> processors (0 for all, negative to leave some free)
+       Output: <list> of 2^w integers
+    '''
+    # the processes pool is imported only when the tables are built
+    import multiprocessing
+    if processors <= 0:
+        processors += multiprocessing.cpu_count()
+    processors = max(processors, 1)
+    size = 1 << wordSize
+    step = -(-size//processors)
+    chunks = [(wordSize, start, min(start+step, size))
+              for start in range(0, size, step)]
+    if len(chunks) == 1:
+        return sboxTableChunk(*chunks[0])
+    pool = multiprocessing.Pool(len(chunks))
+    try:
+        parts = pool.starmap(sboxTableChunk, chunks)
+    finally:
+        pool.close()
+        pool.join()
+    return [b for part in parts for b in part]
+
+
+def _cachedSBoxTable(wordSize, processors):
+    with _sboxTablesLock:
+        if wordSize not in _sboxTables:
+            _sboxTables[wordSize] = sboxTable(wordSize, processors)
+        return _sboxTables[wordSize]
+
+
+def _attachedSBoxTable(name, wordSize):
+    '''The table in the shared memory block with this name (attached once
+       in each process).
+    '''
+    with _sboxTablesLock:
+        if name not in _attachedTables:
+            from multiprocessing.shared_memory import SharedMemory
+            if not _attachedTables:
+                from atexit import register
+                register(_detachSBoxTables)
+            block = SharedMemory(name)
+            _attachedTables[name] = (block, _tableView(block, wordSize))
+        return _attachedTables[name][1]
+
+
+def _detachSBoxTables():
+    '''Release the views before the blocks (a block with views in use
+       can't be closed).
+    '''
+    with _sboxTablesLock:
+        for block, view in _attachedTables.values():
+            view.release()
+            block.close()
+        _attachedTables.clear()
+
+
+def _tableView(block, wordSize):
+    typecode = 'B' if wordSize <= 8 else 'H'
+    size = (1 << wordSize)*(1 if typecode == 'B' else 2)
+    return block.buf[:size].cast(typecode)
 
 
 class SBox(_Logger, _XORctr):
-    '''This class is used from the subBytes rijndael's transformation. But it
-       is using an auxiliar python source file who have stored the original
-       sbox and its inverse, for 8 bits word size, as well as it have two
-       other pairs of sboxes for word size 2 and 4 made on this development.
+    '''This class is used from the subBytes rijndael's transformation. It
+       can do the calculations for each cell (b(z) = mu(z)*a^-1(z)+nu(z)) or
+       use tables (up to SBOX_TABLES_MAX_WORDSIZE), that are built with
+       Montgomery's batch inversion (optionally in a pool of processes).
+       Over the tables word size, the inversions of the cells of a state
+       are also made together (one inversion per state).
+       The instances pickle as their parameters: the field elements and
+       the table are rebuilt (or reused from the ones in the process) when
+       unpickled, or attached from shared memory after shareTable().
     '''
-    def __init__(self, wordSize,
-                 # useCalc=True,
+    def __init__(self, wordSize, useCalc=True, processors=1,
                  *args, **kwargs):
         super(SBox, self).__init__(*args, **kwargs)
-        # TODO: this must be able to be modified to use a sbox as a table ----
-        #       or as the pure calculations
-        self._useCalc = True  # useCalc
+        if not useCalc and wordSize > SBOX_TABLES_MAX_WORDSIZE:
+            self._warning_stream("No SBox tables over %d bits, using the "
+                                 "calculations" % (SBOX_TABLES_MAX_WORDSIZE))
+            useCalc = True
+        self._useCalc = useCalc
         self.__wordSize = wordSize
-        if self._useCalc:
-            field_modulo = getBinaryExtensionFieldModulo(wordSize)
-            self._field = BinaryExtensionModulo(field_modulo)
-            ring_modulo = getBinaryExtensionRingModulo(wordSize)
-            self._ring = BinaryExtensionModulo(ring_modulo)
-#         else:
-#             if wordSize == 8:
-#                 self._sbox = sbox_word8b
-#                 self._sbox_inverted = sbox_word8b_inverted
-# #            elif  self.__wordSize == 4:
-# #                self._sbox = sbox_word4b
-# #                self._sbox_inverted = sbox_word4b_inverted
-# #            elif  self.__wordSize == 2:
-# #                self._sbox = sbox_word2b
-# #                self._sbox_inverted = sbox_word2b_inverted
-#             if not (hasattr(self, "_sbox") or \
-#                     hasattr(self, "_sbox_inverted")):
-#                 raise Exception("(__init__)",
-#                                 "There is no Sbox for %d wordsize"
-#                                 % (self.__wordSize))
+        self._shared = None
+        self._sharedOwner = False
+        self.__build(processors)
 
-    def getField(self):
+    def __build(self, processors):
+        '''The field and ring elements and the tables (what doesn't pickle).
+        '''
+        wordSize = self.__wordSize
+        field_modulo = getBinaryExtensionFieldModulo(wordSize)
+        self._field = BinaryExtensionModulo(field_modulo)
+        ring_modulo = getBinaryExtensionRingModulo(wordSize)
+        self._ring = BinaryExtensionModulo(ring_modulo)
+        # the affine transformation constants are built once (without
+        # interning, for the wide word sizes, each construction is a
+        # new element and ~mu an egcd)
+        self._mu = self._ring(getMu(wordSize))
+        self._nu = self._ring(getNu(wordSize))
+        # when the inversion is much more expensive than a product
+        # (Itoh-Tsujii) the cells are inverted in batch
+        self._batch = self._field._wideInverse is not None
         if self._useCalc:
-            return self._field
+            self._sbox = None
+        elif self._shared is not None:
+            self._sbox = _attachedSBoxTable(self._shared, wordSize)
         else:
-            return "z^8+z^4+z^3+z+1 (the Rijndael's original)"
+            self._sbox = _cachedSBoxTable(wordSize, processors)
+        # what is only needed to decipher (~mu or the inverse table) is
+        # built on the first inverse transformation
+        self._muInverse = None
+        self._sbox_inverted = None
+        self._inverseReady = False
+        self._inverseLock = _Lock()
 
-    def getRing(self):
+    def _buildInverse(self):
+        '''Build (once, even with concurrent callers) the parts of the
+           inverse transformation.
+        '''
+        with self._inverseLock:
+            if self._inverseReady:
+                return
+            if self._useCalc:
+                self._muInverse = ~self._mu
+            else:
+                inverted = [0]*len(self._sbox)
+                for a, b in enumerate(self._sbox):
+                    inverted[b] = a
+                self._sbox_inverted = inverted
+            self._inverseReady = True
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in ['_field', '_ring', '_mu', '_nu', '_batch', '_sbox',
+                     '_muInverse', '_sbox_inverted', '_inverseReady',
+                     '_inverseLock', '_sharedBlock']:
+            state.pop(name, None)
+        state['_sharedOwner'] = False
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__build(1)
+
+    def shareTable(self):
+        '''Copy the table to a block of shared memory (see
+           multiprocessing.shared_memory) that the copies pickled afterwards
+           attach to (once in each process) instead of building the table.
+           The block belongs to this instance: releaseTable() frees it, and
+           the processes using it shall be children of this one (they share
+           the resource tracker that frees the block if it is leaked).
+           Output: <string> name of the block
+        '''
         if self._useCalc:
-            return self._ring
-        else:
-            return "z^8+1 (the Rijndael's original)"
+            raise AssertionError("An SBox without tables has nothing to "
+                                 "share")
+        if self._shared is None:
+            from array import array
+            from multiprocessing.shared_memory import SharedMemory
+            typecode = 'B' if self.__wordSize <= 8 else 'H'
+            table = array(typecode, self._sbox)
+            block = SharedMemory(create=True,
+                                 size=len(table)*table.itemsize)
+            view = _tableView(block, self.__wordSize)
+            view[:] = table
+            self._sharedBlock = block
+            self._shared = block.name
+            self._sharedOwner = True
+            self._sbox = view
+        return self._shared
+
+    def releaseTable(self):
+        '''Stop using the shared memory: this instance takes a private copy
+           of the table, and the block is freed if it was created by
+           shareTable() in this instance.
+        '''
+        if self._shared is None:
+            return
+        view = self._sbox
+        self._sbox = list(view)
+        if self._sharedOwner:
+            view.release()
+            self._sharedBlock.close()
+            self._sharedBlock.unlink()
+            del self._sharedBlock
+        self._shared = None
+        self._sharedOwner = False
+
+    def getField(self):
+        return self._field
+
+    def getRing(self):
+        return self._ring
 
     def getMu(self):
-        if self._useCalc:
-            return self._ring(getMu(self.__wordSize))
-        else:
-            return "z^4+z^3+z^2+z+1 (the Rijndael's original)"
+        return self._mu
 
     def getNu(self):
-        if self._useCalc:
-            return self._ring(getNu(self.__wordSize))
-        else:
-            return "z^6+z^5+z+1 (the Rijndael's original)"
+        return self._nu
+
+    @property
+    def useCalc(self):
+        return self._useCalc
 
     def transform(self, state, invert=False):
-        '''Given the content of one cell of the state matrix, 'divide' in 2
-           halfs. The upper is understood as the row and the lower as the
-           column in the sbox. The sbox is a paramenter because the
-           transformation use one sbox or its invers, but the procedure is
-           the same.
-           Input:
-           Output:
+        '''Apply the SBox (or its inverse) to each cell of the state, that
+           can be a matrix (list of rows) or a list of words. With tables
+           each cell is a lookup, and with the calculations the inversions
+           can be made in batch (see __init__).
+           Input: <list> state
+                  <boolean> invert
+           Output: <list> with the same shape
         '''
-        output = _deepcopy(state)
-        if self._useCalc:
+        if invert and not self._inverseReady:
+            self._buildInverse()
+        values = []
+        for cell in state:
+            if type(cell) == list:
+                values += cell
+            else:
+                values.append(cell)
+        if not self._useCalc:
+            if invert:
+                sbox = self._sbox_inverted
+            else:
+                sbox = self._sbox
+            values = [sbox[value] for value in values]
+        elif self._batch:
+            if invert:
+                values = self._invertsbox_batch_(values)
+            else:
+                values = self._sbox_batch_(values)
+        else:
             if invert:
                 sbox = self._invertsbox_call_
             else:
                 sbox = self._sbox_call_
-            for i in range(len(output)):
-                if type(output[i]) == list:
-                    for j in range(len(output[i])):
-                        output[i][j] = sbox(output[i][j])
-                else:
-                    output[i] = sbox(output[i])
-#         else:
-#             if invert:
-#                 sbox = self._sbox_inverted
-#             else:
-#                 sbox = self._sbox
-#             for i in range(len(output)):
-#                 if type(output[i]) == list:
-#                     for j in range(len(output[i])):
-#                         r, c = self.__hexValue2MatrixCoords(output[i][j])
-#                         output[i][j] = sbox[r][c]
-#                 else:
-#                     r, c = self.__hexValue2MatrixCoords(output[i])
-#                     output[i] = sbox[r][c]
+            values = [sbox(value) for value in values]
+        output = []
+        i = 0
+        for cell in state:
+            if type(cell) == list:
+                output.append(values[i:i+len(cell)])
+                i += len(cell)
+            else:
+                output.append(values[i])
+                i += 1
         return output
 
 #     def __hexValue2MatrixCoords(self, value):
@@ -143,6 +338,8 @@ class SBox(_Logger, _XORctr):
 #         return r, c
 
     def _sbox_call_(self, value):
+        # field and ring elements accumulate the xors in their classes
+        xors = self._field.xors + self._ring.xors
         g = ~self._field(value)
         self._debug_stream("%s -> %s" % (value, g), operation="SBox")
         ax = self._ring(g._coefficients)
@@ -154,13 +351,40 @@ class SBox(_Logger, _XORctr):
                            % (mu, ax, nu, bx), operation="SBox")
         self._debug_stream("SBox(%s) -> %s" % (value, bx.coefficients),
                            operation="SBox")
-        self.xors = bx.xors + g.xors
+        self.xors = self._field.xors + self._ring.xors - xors
         return bx._coefficients
 
+    def _sbox_batch_(self, values):
+        xors = self._field.xors + self._ring.xors
+        inverses = self._field.batchInverse(values)
+        output = []
+        for value, g in zip(values, inverses):
+            bx = (self._mu * self._ring(g._coefficients)) + self._nu
+            self._debug_stream("SBox(%s) -> %s" % (value, bx.coefficients),
+                               operation="SBox")
+            output.append(bx._coefficients)
+        self.xors = self._field.xors + self._ring.xors - xors
+        return output
+
+    def _invertsbox_batch_(self, values):
+        xors = self._field.xors + self._ring.xors
+        affines = [(self._muInverse * (self._ring(value)-self._nu))
+                   ._coefficients for value in values]
+        output = []
+        for value, element in zip(values,
+                                  self._field.batchInverse(affines)):
+            self._debug_stream("SBox(%s) -> %s"
+                               % (value, element.coefficients),
+                               operation="~SBox")
+            output.append(element._coefficients)
+        self.xors = self._field.xors + self._ring.xors - xors
+        return output
+
     def _invertsbox_call_(self, value):
+        xors = self._field.xors + self._ring.xors
         bx = self._ring(value)
         self._debug_stream("%s -> %s" % (value, bx), operation="SBox")
-        inv_mu = ~self.getMu()
+        inv_mu = self._muInverse
         nu = self.getNu()
         ax = (inv_mu * (bx-nu))  # ax = inv_mu.__matrix_product__(bx-nu)
         element = ~self._field(ax._coefficients)
@@ -168,7 +392,7 @@ class SBox(_Logger, _XORctr):
                            % (inv_mu, bx, nu, ax), operation="SBox")
         self._debug_stream("SBox(%s) -> %s" % (value, element.coefficients),
                            operation="~SBox")
-        self.xors = element.xors + inv_mu.xors
+        self.xors = self._field.xors + self._ring.xors - xors
         return element._coefficients
 
 # # the sbox, with wordsize = 8
@@ -282,21 +506,20 @@ def main():
     '''Test the correct functionality of SBox transformations.
     '''
     wordSize = 8
-    loglevel = Logger._debug
-
-    # SBoxUsingTables = SBox(wordSize, loglevel=loglevel)
-    SBoxUsingCalculation = SBox(wordSize, loglevel=loglevel)  # , useCalc=True)
+    loglevel = _Logger._info
 
-    # TODO: loop with a bigger sample set.
-    bar = 0
-    # barUsingTables = SBoxUsingTables.transform([bar])[0]
-    barUsingCalculation = SBoxUsingCalculation.transform([bar])[0]
+    SBoxUsingTables = SBox(wordSize, useCalc=False, loglevel=loglevel)
+    SBoxUsingCalculation = SBox(wordSize, useCalc=True, loglevel=loglevel)
 
-#     if barUsingTables != barUsingCalculation:
-#         print("\n\tError: test not passed!\n\tFrom %d, using tables we get "
-#               "'%s' and using calculation has been '%s'\n"
-#               % (bar, barUsingTables, barUsingCalculation))
-    # TODO: check the inverse transformation.
+    values = list(range(2**wordSize))
+    barUsingTables = SBoxUsingTables.transform(values)
+    barUsingCalculation = SBoxUsingCalculation.transform(values)
+    if barUsingTables != barUsingCalculation:
+        print("\n\tError: test not passed!\n\tUsing tables we get '%s' "
+              "and using calculation has been '%s'\n"
+              % (barUsingTables, barUsingCalculation))
+    elif SBoxUsingTables.transform(barUsingTables, invert=True) != values:
+        print("\n\tError: the inverse transformation doesn't match!\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,243 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+"""
+    Ciphering of streams with bounded memory: a pipeline of generators
+    reads the input in chunks (one chunk ahead, in a background thread,
+    while the previous one is ciphered), passes them through a mode of
+    operation and writes the output.
+
+    >>> from gRijndael.Modes import CTR
+    >>> from gRijndael.Streams import cipherFile
+    >>> with open(plainName, 'rb') as source:
+    ...     with open(cipherName, 'wb') as destination:
+    ...         cipherFile(CTR(rijndael, counter), source, destination)
+
+    The memory used is a few chunks, whatever the size of the input. The
+    batch path is the one of the mode given: the blocks of a chunk go
+    together to the mode, then a ParallelCTR (or ParallelCBC and
+    ParallelCFB deciphering) cipher them in its pool of processes.
+
+    The asyncio counterpart is cipherStream(), over a StreamReader (or an
+    async iterable of bytes) and a StreamWriter, with the mode working in
+    an executor thread so it doesn't block the event loop:
+
+    >>> written = await cipherStream(CTR(rijndael, counter), reader, writer)
+"""
+
+from threading import Event as _Event
+from threading import Thread as _Thread
+from time import monotonic as _monotonic
+
+
+# Bytes read from the source at once.
+STREAM_CHUNK_BYTES = 1 << 16
+
+
+def readChunks(source, chunkSize=STREAM_CHUNK_BYTES):
+    '''Generator of the chunks of a binary file, read one chunk ahead in a
+       background thread (double buffering: the next chunk is read while
+       the consumer works with the current one). The errors reading are
+       raised by the generator. Closing the generator stops the thread.
+       Input: <file> source (with read()), <integer> chunkSize
+       Output: generator of <bytes>
+    '''
+    from queue import Queue
+    if chunkSize <= 0:
+        raise AssertionError("The chunk size shall be positive")
+    chunks = Queue(1)
+    stop = _Event()
+
+    def reader():
+        try:
+            while not stop.is_set():
+                chunk = source.read(chunkSize)
+                chunks.put(chunk)
+                if not chunk:
+                    return
+        except Exception as exception:
+            chunks.put(exception)
+
+    thread = _Thread(target=reader, name="gRijndael readChunks")
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if isinstance(chunk, Exception):
+                raise chunk
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        # unblock the reader if it waits to put a chunk
+        stop.set()
+        while thread.is_alive():
+            while not chunks.empty():
+                chunks.get_nowait()
+            thread.join(0.01)
+
+
+def cipherChunks(mode, chunks):
+    '''Generator of the output of a mode of operation for each chunk of the
+       input (it can be empty while the mode waits for a whole group of
+       blocks), and the one of mode.finalize() at the end.
+       Input: <_Mode> mode, iterable of <bytes-like> chunks
+       Output: generator of <bytes>
+    '''
+    for chunk in chunks:
+        yield mode.update(chunk)
+    yield mode.finalize()
+
+
+def cipherFile(mode, source, destination, chunkSize=STREAM_CHUNK_BYTES,
+               progress=None):
+    '''Cipher (or decipher, as the mode is built) the source file to the
+       destination. The progress callback, if given, is called after each
+       chunk with the bytes read, the bytes written and the seconds since
+       the start (the throughput is bytesRead/seconds).
+       Input: <_Mode> mode, <file> source (with read()), <file>
+              destination (with write()), <integer> chunkSize,
+              <callable> progress(bytesRead, bytesWritten, seconds)
+       Output: <integer> bytes written
+    '''
+    counter = _CountingChunks(readChunks(source, chunkSize))
+    start = _monotonic()
+    written = 0
+    try:
+        for output in cipherChunks(mode, counter):
+            if output:
+                destination.write(output)
+                written += len(output)
+            if progress is not None:
+                progress(counter.bytesRead, written, _monotonic()-start)
+    finally:
+        counter.close()
+    return written
+
+
+class _CountingChunks(object):
+    '''Pass through of the chunks that counts their bytes.'''
+    def __init__(self, chunks):
+        super(_CountingChunks, self).__init__()
+        self._chunks = chunks
+        self.bytesRead = 0
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            self.bytesRead += len(chunk)
+            yield chunk
+
+    def close(self):
+        self._chunks.close()
+
+
+async def readStreamChunks(reader, chunkSize=STREAM_CHUNK_BYTES):
+    '''Async generator of chunks of chunkSize bytes (the last one can be
+       shorter) from an asyncio.StreamReader.
+       Input: <StreamReader> reader, <integer> chunkSize
+       Output: async generator of <bytes>
+    '''
+    from asyncio import IncompleteReadError
+    if chunkSize <= 0:
+        raise AssertionError("The chunk size shall be positive")
+    while True:
+        try:
+            yield await reader.readexactly(chunkSize)
+        except IncompleteReadError as end:
+            if end.partial:
+                yield end.partial
+            return
+
+
+async def cipherAsyncChunks(mode, chunks, executor=None):
+    '''Async generator of the output of a mode of operation for each chunk
+       of an async iterable (and the one of mode.finalize() at the end).
+       The mode works in the executor (the default one of the loop if
+       None) while the next chunk is received, and the chunks are
+       processed in order. Only one chunk is received ahead: the
+       generator doesn't receive more until its output is consumed.
+       The mode keeps its state in this process, then the executor shall
+       be of threads: to use more processors use a ParallelCTR (or a
+       ParallelCBC or ParallelCFB deciphering), whose thread waits for
+       its pool.
+       Input: <_Mode> mode, async iterable of <bytes-like> chunks,
+              <Executor> executor
+       Output: async generator of <bytes>
+    '''
+    from asyncio import get_running_loop
+    from concurrent.futures import ProcessPoolExecutor
+    if isinstance(executor, ProcessPoolExecutor):
+        raise AssertionError("The modes can't work in other processes, "
+                             "use a thread executor and a parallel mode")
+    loop = get_running_loop()
+    iterator = chunks.__aiter__()
+    try:
+        chunk = await iterator.__anext__()
+    except StopAsyncIteration:
+        chunk = None
+    while chunk is not None:
+        update = loop.run_in_executor(executor, mode.update, chunk)
+        try:
+            chunk = await iterator.__anext__()
+        except StopAsyncIteration:
+            chunk = None
+        yield await update
+    yield await loop.run_in_executor(executor, mode.finalize)
+
+
+async def cipherStream(mode, reader, writer, chunkSize=STREAM_CHUNK_BYTES,
+                       executor=None, progress=None):
+    '''Cipher (or decipher, as the mode is built) what comes from the
+       reader to the writer without blocking the event loop. The writer
+       is drained after each write, that stops the reading while the
+       other end doesn't keep the pace. The progress callback is like the
+       one of cipherFile(). The writer is not closed.
+       Input: <_Mode> mode, <StreamReader> or async iterable of <bytes>
+              reader, <StreamWriter> writer, <integer> chunkSize,
+              <Executor> executor (see cipherAsyncChunks()),
+              <callable> progress(bytesRead, bytesWritten, seconds)
+       Output: <integer> bytes written
+    '''
+    if hasattr(reader, 'readexactly'):
+        reader = readStreamChunks(reader, chunkSize)
+    counter = _AsyncCountingChunks(reader)
+    start = _monotonic()
+    written = 0
+    async for output in cipherAsyncChunks(mode, counter, executor):
+        if output:
+            writer.write(output)
+            await writer.drain()
+            written += len(output)
+        if progress is not None:
+            progress(counter.bytesRead, written, _monotonic()-start)
+    return written
+
+
+class _AsyncCountingChunks(_CountingChunks):
+    '''Pass through of the chunks of an async iterable.'''
+    async def __aiter__(self):
+        async for chunk in self._chunks:
+            self.bytesRead += len(chunk)
+            yield chunk
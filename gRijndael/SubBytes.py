@@ -37,11 +37,12 @@ class SubBytes(_Logger, _XORctr):
        themselves specially to allow arbitrary word sizes and not only the
        original 8 bits and the two included here for 2 and 4 bits.
     '''
-    def __init__(self, wordSize, loglevel=_Logger._info,
-                 *args, **kwargs):
+    def __init__(self, wordSize, loglevel=_Logger._info, sboxCalc=True,
+                 sboxProcessors=1, *args, **kwargs):
         super(SubBytes, self).__init__(*args, **kwargs)
         self.__wordSize = wordSize
-        self.__sbox = SBox(wordSize, loglevel=loglevel)
+        self.__sbox = SBox(wordSize, useCalc=sboxCalc,
+                           processors=sboxProcessors, loglevel=loglevel)
         self.includeInstance(self.__sbox)
 
     def __str__(self):
@@ -74,12 +74,12 @@ class Long:
            Input: <integer>
            Output: <integer array>
         '''
-        if input > int('0b'+('1'*length), 2):
+        if input >> length:
             raise Exception("(long2array)", "Too big input for %d length"
                             % (length))
         o = []
         # cut the input blocs of the word size
-        mask = (int('0b'+('1'*self.__wordSize), 2) << (length-self.__wordSize))
+        mask = ((1 << self.__wordSize)-1) << (length-self.__wordSize)
         nBlocks = int(length/self.__wordSize)
         for i in range(nBlocks):
             e = (input & mask) >> (((nBlocks)-i-1)*self.__wordSize)
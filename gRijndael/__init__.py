@@ -23,13 +23,60 @@ __license__ = "GPLv3+"
 __status__ = "development"
 
 
-from .gRijndael import gRijndael
-from .KeyExpansion import KeyExpansion
-from .AddRoundKey import AddRoundKey
-from .MixColumns import MixColumns
-from .ShiftRows import ShiftRows
-from .SubBytes import SubBytes
-from .SBox import SBox
-from . import ThirdLevel as _ThirdLevel
-from . import Polynomials
-from .version import version, VERSION
+"""
+    The submodules are loaded on the first access to one of their names
+    (see __getattr__), then "import gRijndael" doesn't pay for the parts
+    (or the console interface) that a process doesn't use.
+"""
+
+from importlib import import_module as _import_module
+from sys import modules as _modules
+from types import ModuleType as _ModuleType
+
+
+# public name -> submodule where it is defined
+_lazyNames = {'gRijndael': 'gRijndael',
+              'KeyExpansion': 'KeyExpansion',
+              'AddRoundKey': 'AddRoundKey',
+              'MixColumns': 'MixColumns',
+              'ShiftRows': 'ShiftRows',
+              'SubBytes': 'SubBytes',
+              'SBox': 'SBox',
+              'version': 'version',
+              'VERSION': 'version',
+              'main': '__main__'}
+__all__ = sorted(set(_lazyNames.keys()) | set(['Polynomials']))
+
+
+def __getattr__(name):
+    if name in _lazyNames:
+        value = getattr(_import_module('.'+_lazyNames[name], __name__), name)
+        globals()[name] = value
+        return value
+    if not name.startswith('__'):
+        try:  # the other submodules (like Polynomials)
+            return _import_module('.'+name, __name__)
+        except ModuleNotFoundError as e:
+            if e.name != '%s.%s' % (__name__, name):
+                raise
+    raise AttributeError("module '%s' has no attribute '%s'"
+                         % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(_lazyNames.keys()))
+
+
+class _LazyPackage(_ModuleType):
+    '''Most of the submodules are named like the class they define. When
+       one is imported, the import machinery binds the module in the
+       package, and that would hide the class: those names are only bound
+       by __getattr__.
+    '''
+    def __setattr__(self, name, value):
+        if name in _lazyNames and isinstance(value, _ModuleType):
+            return
+        super(_LazyPackage, self).__setattr__(name, value)
+
+
+_modules[__name__].__class__ = _LazyPackage
@@ -0,0 +1,112 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+__author__ = "Sergi Blanch-Torne"
+__email__ = "srgblnchtrn@protonmail.ch"
+__copyright__ = "Copyright 2016 Sergi Blanch-Torne"
+__license__ = "GPLv3+"
+__status__ = "development"
+
+"""
+    Console execution of gRijndael (python -m gRijndael), out of the
+    package import path.
+"""
+
+import sys
+from optparse import OptionParser
+from .gRijndael import gRijndael
+from .Logger import levelFromMeaning as _levelFromMeaning
+from .version import version
+
+
+def understandInteger(value):
+    try:
+        if value.startswith('0x'):
+            return int(value, 16)
+        elif value.startswith('0b'):
+            return int(value, 2)
+        elif value.startswith('0'):  # first check hexadecimal and binary
+            return int(value, 8)
+        else:
+            return int(value)  # last try is to interpret as decimal
+    except Exception as e:
+        print("Cannot interpret %s as an integer (%e)" % (value, e))
+        return None
+
+
+def main():
+    # TODO: introduce parameters to:
+    #       - define parameters to use and use random input and key.
+    #       - allow to setup by params the input and/or the key, and
+    #       - operations to do: cipher and/or decipher
+    parser = OptionParser()
+    parser.add_option('', "--log-level", default="info",
+                      help="Set log level: error, warning, info, debug, trace")
+    parser.add_option('', "--rounds", type="int", default=10,
+                      help="Number of rounds")
+    parser.add_option('', "--rows", type="int", default=4,
+                      help="Number of rows")
+    parser.add_option('', "--columns", type="int", default=4,
+                      help="Number of columns")
+    parser.add_option('', "--wordsize", type="int", default=8,
+                      help="Bit size of the word")
+    parser.add_option('', "--kolumns", type="int", default=4,
+                      help="Number of columns of the key")
+    parser.add_option('', "--key", default="0",
+                      help="Key in numeric representation")
+    parser.add_option('', "--plainText", default="0",
+                      help="Plaintext in numeric representation")
+    parser.add_option('', "--only-keyexpansion", action="store_true",
+                      default=False,
+                      help="No [de]cipher operations. Made to test the PRG "
+                      "with the key as seed to generate each round subkeys.")
+    parser.add_option('', "--calculate-sbox", default=False,
+                      action="store_true",
+                      help="Instead of use the given Rijndael tables, do the "
+                      "polynomial calculations.")
+    # TODO: add options to only [de]cipher
+    #       (the will be also need a --cipherText)
+    (options, args) = parser.parse_args()
+    key = understandInteger(options.key)
+    if key is None:
+        print("\n\tError: It was not possible to understand the input key "
+              "'%s' as a number.\n" % (options.key))
+        sys.exit(-1)
+    gr = gRijndael(key=key,
+                   nRounds=options.rounds,
+                   nRows=options.rows,
+                   nColumns=options.columns,
+                   wordSize=options.wordsize,
+                   nKeyColumns=options.kolumns,
+                   sboxCalc=options.calculate_sbox,
+                   loglevel=_levelFromMeaning(options.log_level))
+    if not options.only_keyexpansion:
+        plainText = understandInteger(options.plainText)
+        if plainText is None:
+            print("\n\tError: It was not possible to understand the input "
+                  "plain text '%s' as a number.\n" % (options.plainText))
+            sys.exit(-2)
+        cipherText = gr.cipher(plainText)
+        if int(plainText) != gr.decipher(cipherText):
+            print("Error")
+        else:
+            print("Ok")
+        print("Release: %s" % (version()))
+
+if __name__ == "__main__":
+    main()
@@ -22,12 +22,9 @@ __copyright__ = "Copyright 2013 Sergi Blanch-Torne"
 __license__ = "GPLv3+"
 __status__ = "development"
 
-import sys
-
 from .Logger import Logger as _Logger
 from .Logger import XORctr as _XORctr
 from .Logger import debug, trace
-from .Logger import levelFromMeaning as _levelFromMeaning
 from .KeyExpansion import KeyExpansion as _KeyExpansion
 from .SubBytes import SubBytes as _SubBytes
 from .ShiftRows import ShiftRows as _ShiftRows
@@ -54,12 +51,19 @@ class gRijndael(_Logger, _XORctr):
         - kKeycolumns: <default:nColumns>
 
         Extra parameters:
-        - sboxCalc: <default:True>
+        - sboxCalc: <default:True> (False to use tables, up to 16 bits)
+        - sboxProcessors: <default:1> to build the SBox tables (0 for all)
         - loglevel:: <default:info>
+
+        The instances can be pickled (to send them to other processes): the
+        parameters and the expanded key, with the SBox, MixColumns and
+        KeyExpansion rebuilding what depends only on the parameters when
+        unpickled.
     '''
     def __init__(self, key,
                  nRounds=None, nRows=4, nColumns=4, wordSize=8,  # stardard aes
-                 nKeyColumns=None, loglevel=_Logger._info, *args, **kwargs):
+                 nKeyColumns=None, loglevel=_Logger._info, sboxCalc=True,
+                 sboxProcessors=1, *args, **kwargs):
         super(gRijndael, self).__init__(loglevel, *args, **kwargs)
         # Num of encryption rounds {10,12,14}
         if nRounds is None:
@@ -96,13 +100,12 @@ class gRijndael(_Logger, _XORctr):
                                               self.__wordSize,
                                               self.__nKeyColumns,
                                               loglevel)
-        self.__subBytesObj = _SubBytes(wordSize, loglevel)
+        self.__subBytesObj = _SubBytes(wordSize, loglevel, sboxCalc,
+                                       sboxProcessors)
         self.__shiftRowsObj = _ShiftRows(nRows, loglevel)
         self.__mixColumnsObj = _MixColumns(nRows, nColumns, wordSize, loglevel)
         self.__addRoundKeyObj = _AddRoundKey(nRows, nColumns, wordSize,
                                              loglevel)
-        self.__state = None  # FIXME: this memory is not protected and shall be
-        self.__round = None
         self.includeInstance(self.__keyExpanderObj)
         self.includeInstance(self.__subBytesObj)
         self.includeInstance(self.__mixColumnsObj)
@@ -118,6 +121,11 @@ class gRijndael(_Logger, _XORctr):
     def __repr__(self):
         return "%s" % (self.__str__())
 
+    def __getstate__(self):
+        # the complete key schedule goes with the instance
+        self.__keyExpanderObj.getKey()
+        return self.__dict__
+
     # Readonly configuration ----
 
     @property
@@ -166,19 +174,8 @@ class gRijndael(_Logger, _XORctr):
            Input: <integer> plainText
            Output: <integer> cipherText
         '''
-        self.__convertInput2State(plain)
-        self.__round = 0
-        self.__addRoundKey()  # w[0,Nb-1]
-        for self.__round in range(1, self.__nRounds):  # [1..Nr-1] step 1
-            self.__subBytes()
-            self.__shiftRows()
-            self.__mixColumns()
-            self.__addRoundKey()
-        self.__round = self.__nRounds
-        self.__subBytes()
-        self.__shiftRows()
-        self.__addRoundKey()
-        return self.__convertState2output()
+        state = self.__cipherRounds(self.__convertInput2State(plain))
+        return self.__convertState2output(state)
 
     def decipher(self, cipher):
         '''cipher (1d array) is copied to state matrix.
@@ -187,68 +184,160 @@ class gRijndael(_Logger, _XORctr):
            Input: <integer> cipherText
            Output: <integer> plainText
         '''
-        self.__convertInput2State(cipher)
-        self.__round = 0
-        self.__invAddRoundKey()
+        state = self.__decipherRounds(self.__convertInput2State(cipher))
+        return self.__convertState2output(state)
+
+    def rekey(self, key):
+        '''Change the key of the instance. Only the key schedule is made
+           again: the SBox, MixColumns (with its d(x)) and the rest of the
+           transformations don't depend on the key and they are reused.
+           Like the key schedule itself, it is not meant to be called while
+           other threads cipher with the instance.
+           Input: <integer> key
+        '''
+        self._debug_stream("rekey")
+        self.__keyExpanderObj.rekey(key)
+
+    def cipherBlock(self, plain):
+        '''Like cipher() but with the block as bytes (the same bits, most
+           significant first). The block size shall be a multiple of 8 bits.
+           Input: <bytes-like> plainText (one block)
+           Output: <bytes> cipherText
+        '''
+        output = bytearray(len(plain))
+        self.cipherInto(plain, output)
+        return bytes(output)
+
+    def decipherBlock(self, cipher):
+        '''Like decipher() but with the block as bytes (see cipherBlock()).
+           Input: <bytes-like> cipherText (one block)
+           Output: <bytes> plainText
+        '''
+        output = bytearray(len(cipher))
+        self.decipherInto(cipher, output)
+        return bytes(output)
+
+    def cipherInto(self, source, destination):
+        '''Cipher the consecutive blocks in the source buffer writing them
+           in the destination one. Both can be any object with the buffer
+           protocol (bytes, bytearray, memoryview, mmap, numpy arrays...)
+           and can be the same (in place). The blocks are taken as views,
+           without intermediate copies.
+           Input: <buffer> source (a multiple of the block size)
+                  <writable buffer> destination (at least as long as source)
+           Output: <integer> number of bytes written
+        '''
+        return self.__processInto(source, destination, self.__cipherRounds)
+
+    def decipherInto(self, source, destination):
+        '''Decipher the consecutive blocks in the source buffer writing them
+           in the destination one (see cipherInto()).
+           Input: <buffer> source (a multiple of the block size)
+                  <writable buffer> destination (at least as long as source)
+           Output: <integer> number of bytes written
+        '''
+        return self.__processInto(source, destination,
+                                  self.__decipherRounds)
+
+    # The state and the round are local to each call (arguments and return
+    # values of the operations), then an instance can be used by many
+    # threads at the same time.
+
+    def __cipherRounds(self, state):
+        state = self.__addRoundKey(state, 0)  # w[0,Nb-1]
+        for round in range(1, self.__nRounds):  # [1..Nr-1] step 1
+            state = self.__subBytes(state, round)
+            state = self.__shiftRows(state, round)
+            state = self.__mixColumns(state, round)
+            state = self.__addRoundKey(state, round)
+        state = self.__subBytes(state, self.__nRounds)
+        state = self.__shiftRows(state, self.__nRounds)
+        return self.__addRoundKey(state, self.__nRounds)
+
+    def __decipherRounds(self, state):
+        state = self.__invAddRoundKey(state, 0)
         # [Nr-1..1] step -1
-        for self.__round in range(1, self.__nRounds):  # [1..Nr-1] step 1
-            self.__invShiftRows()
-            self.__invSubBytes()
-            self.__invAddRoundKey()
-            self.__invMixColumns()
-        self.__round = self.__nRounds
-        self.__invShiftRows()
-        self.__invSubBytes()
-        self.__invAddRoundKey()
-        return self.__convertState2output()
+        for round in range(1, self.__nRounds):  # [1..Nr-1] step 1
+            state = self.__invShiftRows(state, round)
+            state = self.__invSubBytes(state, round)
+            state = self.__invAddRoundKey(state, round)
+            state = self.__invMixColumns(state, round)
+        state = self.__invShiftRows(state, self.__nRounds)
+        state = self.__invSubBytes(state, self.__nRounds)
+        return self.__invAddRoundKey(state, self.__nRounds)
+
+    def __processInto(self, source, destination, rounds):
+        if self.blockSize % 8 != 0:
+            raise AssertionError("A block of %d bits is not a number of "
+                                 "bytes" % (self.blockSize))
+        blockBytes = self.blockSize//8
+        source = memoryview(source).cast('B')
+        destination = memoryview(destination).cast('B')
+        if destination.readonly:
+            raise AssertionError("The destination buffer is not writable")
+        if len(source) % blockBytes != 0:
+            raise AssertionError("The source (%d bytes) is not a multiple of "
+                                 "the block size (%d bytes)"
+                                 % (len(source), blockBytes))
+        if len(destination) < len(source):
+            raise AssertionError("The destination (%d bytes) is smaller than "
+                                 "the source (%d bytes)"
+                                 % (len(destination), len(source)))
+        for start in range(0, len(source), blockBytes):
+            state = rounds(self.__convertBytes2State(
+                source[start:start+blockBytes]))
+            self.__convertState2Bytes(state,
+                                      destination[start:start+blockBytes])
+        return len(source)
 
     # Rijndael Operations ----
 
-    def __subBytes(self):
-        self.__state = self.__subBytesObj.do(self.__state)
-        self._debug_stream("state", self.__state, self.__round,
-                           "cipher->subBytes()\t")
-
-    def __invSubBytes(self):
-        self.__state = self.__subBytesObj.invert(self.__state)
-        self._debug_stream("state", self.__state, self.__round,
-                           "decipher->invSubBytes()\t")
-
-    def __shiftRows(self):
-        self.__state = self.__shiftRowsObj.do(self.__state)
-        self._debug_stream("state", self.__state, self.__round,
-                           "cipher->shiftRows()\t")
-
-    def __invShiftRows(self):
-        self.__state = self.__shiftRowsObj.invert(self.__state)
-        self._debug_stream("state", self.__state, self.__round,
-                           "decipher->invShiftRows()\t")
-
-    def __mixColumns(self):
-        self.__state = self.__mixColumnsObj.do(self.__state)
-        self._debug_stream("state", self.__state, self.__round,
-                           "cipher->mixColumns()\t")
-
-    def __invMixColumns(self):
-        self.__state = self.__mixColumnsObj.invert(self.__state)
-        self._debug_stream("state", self.__state, self.__round,
+    def __subBytes(self, state, round):
+        state = self.__subBytesObj.do(state)
+        self._debug_stream("state", state, round, "cipher->subBytes()\t")
+        return state
+
+    def __invSubBytes(self, state, round):
+        state = self.__subBytesObj.invert(state)
+        self._debug_stream("state", state, round, "decipher->invSubBytes()\t")
+        return state
+
+    def __shiftRows(self, state, round):
+        state = self.__shiftRowsObj.do(state)
+        self._debug_stream("state", state, round, "cipher->shiftRows()\t")
+        return state
+
+    def __invShiftRows(self, state, round):
+        state = self.__shiftRowsObj.invert(state)
+        self._debug_stream("state", state, round, "decipher->invShiftRows()\t")
+        return state
+
+    def __mixColumns(self, state, round):
+        state = self.__mixColumnsObj.do(state)
+        self._debug_stream("state", state, round, "cipher->mixColumns()\t")
+        return state
+
+    def __invMixColumns(self, state, round):
+        state = self.__mixColumnsObj.invert(state)
+        self._debug_stream("state", state, round,
                            "decipher->invMixColumns()\t")
+        return state
 
-    def __addRoundKey(self):
-        start = (self.__round)*self.__nColumns
-        end = (self.__round+1)*self.__nColumns
+    def __addRoundKey(self, state, round):
+        start = round*self.__nColumns
+        end = (round+1)*self.__nColumns
         subkey = self.__keyExpanderObj.getSubKey(start, end)
-        self.__state = self.__addRoundKeyObj.do(self.__state, subkey)
-        self._debug_stream("state", self.__state, self.__round,
-                           "cipher->addRoundKey()\t")
+        state = self.__addRoundKeyObj.do(state, subkey)
+        self._debug_stream("state", state, round, "cipher->addRoundKey()\t")
+        return state
 
-    def __invAddRoundKey(self):
-        start = (self.__nRounds-self.__round)*self.__nColumns
-        end = (self.__nRounds-self.__round+1)*self.__nColumns
+    def __invAddRoundKey(self, state, round):
+        start = (self.__nRounds-round)*self.__nColumns
+        end = (self.__nRounds-round+1)*self.__nColumns
         subkey = self.__keyExpanderObj.getSubKey(start, end)
-        self.__state = self.__addRoundKeyObj.do(self.__state, subkey)
-        self._debug_stream("state", self.__state, self.__round,
-                           "cipher->invAddRoundKey()\t")
+        state = self.__addRoundKeyObj.do(state, subkey)
+        self._debug_stream("state", state, round, "cipher->invAddRoundKey()\t")
+        return state
 
     # Data conversions ----
 
@@ -259,99 +348,33 @@ class gRijndael(_Logger, _XORctr):
                                                  self.__nColumns *
                                                  self.__nRows *
                                                  self.__wordSize)
-        self.__state = _State(self.__nRows, self.__nColumns, self._logLevel).\
+        return _State(self.__nRows, self.__nColumns, self._logLevel).\
             fromArray(anArray)
 
-    def __convertState2output(self):
+    def __convertBytes2State(self, view):
+        # s[r,c] = in[r+rc]
+        if self.__wordSize == 8:
+            return [list(view[r::self.__nRows]) for r in range(self.__nRows)]
+        else:
+            anArray = _Long(self.__wordSize).toArray(
+                int.from_bytes(view, 'big'), self.blockSize)
+            return [anArray[r::self.__nRows] for r in range(self.__nRows)]
+
+    def __convertState2Bytes(self, state, view):
+        # out[r+rc] = s[r,c]
+        anArray = [row[c] for c in range(self.__nColumns) for row in state]
+        if self.__wordSize == 8:
+            view[:] = bytes(anArray)
+        else:
+            view[:] = _Long(self.__wordSize).fromArray(
+                anArray, self.blockSize).to_bytes(len(view), 'big')
+
+    def __convertState2output(self, state):
         anArray = _State(self.__nRows, self.__nColumns,
-                         self._logLevel).toArray(self.__state)
+                         self._logLevel).toArray(state)
         argout = _Long(self.__wordSize).fromArray(anArray,
                                                   self.__nColumns *
                                                   self.__nRows *
                                                   self.__wordSize)
         self._debug_stream("argout: %s" % argout)
         return argout
-
-
-# Test and console execution area ----
-
-
-from optparse import OptionParser
-
-
-def understandInteger(value):
-    try:
-        if value.startswith('0x'):
-            return int(value, 16)
-        elif value.startswith('0b'):
-            return int(value, 2)
-        elif value.startswith('0'):  # first check hexadecimal and binary
-            return int(value, 8)
-        else:
-            return int(value)  # last try is to interpret as decimal
-    except Exception as e:
-        print("Cannot interpret %s as an integer (%e)" % (value, e))
-        return None
-
-
-def main():
-    # TODO: introduce parameters to:
-    #       - define parameters to use and use random input and key.
-    #       - allow to setup by params the input and/or the key, and
-    #       - operations to do: cipher and/or decipher
-    parser = OptionParser()
-    parser.add_option('', "--log-level", default="info",
-                      help="Set log level: error, warning, info, debug, trace")
-    parser.add_option('', "--rounds", type="int", default=10,
-                      help="Number of rounds")
-    parser.add_option('', "--rows", type="int", default=4,
-                      help="Number of rows")
-    parser.add_option('', "--columns", type="int", default=4,
-                      help="Number of columns")
-    parser.add_option('', "--wordsize", type="int", default=8,
-                      help="Bit size of the word")
-    parser.add_option('', "--kolumns", type="int", default=4,
-                      help="Number of columns of the key")
-    parser.add_option('', "--key", default="0",
-                      help="Key in numeric representation")
-    parser.add_option('', "--plainText", default="0",
-                      help="Plaintext in numeric representation")
-    parser.add_option('', "--only-keyexpansion", action="store_true",
-                      default=False,
-                      help="No [de]cipher operations. Made to test the PRG "
-                      "with the key as seed to generate each round subkeys.")
-    parser.add_option('', "--calculate-sbox", default=False,
-                      action="store_true",
-                      help="Instead of use the given Rijndael tables, do the "
-                      "polynomial calculations.")
-    # TODO: add options to only [de]cipher
-    #       (the will be also need a --cipherText)
-    (options, args) = parser.parse_args()
-    key = understandInteger(options.key)
-    if key is None:
-        print("\n\tError: It was not possible to understand the input key "
-              "'%s' as a number.\n" % (options.key))
-        sys.exit(-1)
-    gr = gRijndael(key=key,
-                   nRounds=options.rounds,
-                   nRows=options.rows,
-                   nColumns=options.columns,
-                   wordSize=options.wordsize,
-                   nKeyColumns=options.kolumns,
-                   sboxCalc=options.calculate_sbox,
-                   loglevel=_levelFromMeaning(options.log_level))
-    if not options.only_keyexpansion:
-        plainText = understandInteger(options.plainText)
-        if plainText is None:
-            print("\n\tError: It was not possible to understand the input "
-                  "plain text '%s' as a number.\n" % (options.plainText))
-            sys.exit(-2)
-        cipherText = gr.cipher(plainText)
-        if int(plainText) != gr.decipher(cipherText):
-            print("Error")
-        else:
-            print("Ok")
-        print("Release: %s" % (version()))
-
-if __name__ == "__main__":
-    main()